@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, BackgroundTasks
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, BackgroundTasks, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
-from app.models import Law, LawArticle, LawArticleRevision, Topic
+from app.models import Law, LawArticle, LawArticleRevision, LawMirror, Topic
 from app.schemas.law import (
     LawCreate, LawResponse,
     LawArticleCreate, LawArticleResponse,
@@ -12,91 +13,179 @@ from app.schemas.law import (
 from app.core.database import get_db
 from app.core.auth import verify_admin
 from app.core.container import get_services
+from app.services.law_revisions import enqueue_embeddings
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(verify_admin)])
 
 @router.post("/laws", response_model=LawResponse)
-def create_law(law: LawCreate, db: Session = Depends(get_db)):
+async def create_law(law: LawCreate, db: AsyncSession = Depends(get_db)):
     """새로운 법령의 기본 정보(법령명 등)를 DB에 등록합니다."""
     db_law = Law(**law.model_dump())
     db.add(db_law)
-    db.commit()
-    db.refresh(db_law)
+    await db.commit()
+    await db.refresh(db_law)
     return db_law
 
 @router.post("/articles", response_model=LawArticleResponse)
-def create_article(article: LawArticleCreate, db: Session = Depends(get_db)):
+async def create_article(article: LawArticleCreate, db: AsyncSession = Depends(get_db)):
     """특정 법령 하위에 새로운 조문(Article)을 추가합니다."""
     db_article = LawArticle(**article.model_dump())
     db.add(db_article)
-    db.commit()
-    db.refresh(db_article)
+    await db.commit()
+    # 응답 스키마가 topics를 포함하므로 비동기 세션에서 미리 로드
+    await db.refresh(db_article, attribute_names=["topics"])
     return db_article
 
 @router.post("/revisions", response_model=LawArticleRevisionResponse)
-def create_revision(revision: LawArticleRevisionCreate, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+async def create_revision(revision: LawArticleRevisionCreate, db: AsyncSession = Depends(get_db)):
     """
     특정 조문의 내용(Revision)을 생성합니다. 
-    생성 시 텍스트 임베딩을 백그라운드 태스크로 추가하여 벡터 스토어(검색용)에 등록합니다.
+    생성과 같은 트랜잭션에서 임베딩 아웃박스에 기록하여, 워커가 벡터 스토어(검색용)에 등록합니다.
     """
     db_revision = LawArticleRevision(**revision.model_dump())
     db.add(db_revision)
-    db.commit()
-    db.refresh(db_revision)
-    
-    article = db.query(LawArticle).filter(LawArticle.id == revision.article_id).first()
-    if article:
-        law = db.query(Law).filter(Law.id == article.law_id).first()
-        services = get_services()
-        background_tasks.add_task(services.checker.add_revisions, [{
-            "law_id": article.law_id,
-            "article_id": article.id,
-            "revision_id": db_revision.id,
-            "content": db_revision.content,
-            "law_name": law.name if law else "Unknown",
-            "article_number": article.article_number
-        }])
-    
+    await db.flush()
+    await enqueue_embeddings(db, [db_revision.id])
+    await db.commit()
+    # 응답 스키마가 explanation_caches를 포함하므로 비동기 세션에서 미리 로드
+    await db.refresh(db_revision, attribute_names=["explanation_caches"])
+    get_services().embedding_outbox.notify()
     return db_revision
 
 @router.post("/topics", response_model=TopicResponse)
-def create_topic(topic: TopicCreate, db: Session = Depends(get_db)):
+async def create_topic(topic: TopicCreate, db: AsyncSession = Depends(get_db)):
     """키워드나 카테고리 등 법률 팩트체크 시 활용할 새로운 토픽을 추가합니다."""
     db_topic = Topic(**topic.model_dump())
     db.add(db_topic)
-    db.commit()
-    db.refresh(db_topic)
+    await db.commit()
+    await db.refresh(db_topic)
     return db_topic
 
-@router.post("/laws/{law_id}/upload_pdf")
-async def upload_law_pdf(law_id: int, background_tasks: BackgroundTasks, file: UploadFile = File(...), db: Session = Depends(get_db)):
+@router.post("/laws/{law_id}/upload_pdf", status_code=202)
+async def upload_law_pdf(law_id: int, file: UploadFile = File(...), db: AsyncSession = Depends(get_db)):
     """
-    법률 PDF 파일을 업로드하면 LLM을 이용해 조문별로 텍스트를 분리하고 DB에 자동 삽입합니다.
+    법률 PDF 파일을 업로드하면 인제스트 작업을 큐에 등록하고 작업 ID를 바로 반환합니다.
+    워커가 텍스트 추출 → 조문 분리 → DB 저장 → 임베딩을 실행하며, 진행 상황은 GET /admin/jobs/{job_id}로 조회합니다.
     """
     if not file.filename.endswith(".pdf"):
         raise HTTPException(status_code=400, detail="Only PDF files are supported.")
         
-    law = db.query(Law).filter(Law.id == law_id).first()
+    law = await db.get(Law, law_id)
     if not law:
         raise HTTPException(status_code=404, detail="Law not found")
 
-    try:
-        services = get_services()
-        file_content = await file.read()
-        created_articles, embedded_revisions = await services.pdf_parser.process_pdf(db, law_id, file_content)
-        
-        # 벡터 스토어 업데이트
-        background_tasks.add_task(services.checker.add_revisions, embedded_revisions)
-        
-        return {
-            "message": f"Successfully parsed and inserted {len(created_articles)} articles.",
-            "articles": created_articles
+    file_content = await file.read()
+    job = await get_services().ingestion_jobs.enqueue_pdf(law_id, file.filename, file_content)
+    return {
+        "message": "PDF ingestion job queued.",
+        "job_id": job["id"],
+        "status": job["status"],
+    }
+
+@router.get("/jobs")
+async def list_ingestion_jobs(limit: int = 50):
+    """최근 인제스트 작업 목록을 조회합니다."""
+    return await get_services().ingestion_jobs.recent(limit)
+
+@router.get("/jobs/{job_id}")
+async def get_ingestion_job(job_id: int):
+    """인제스트 작업의 상태, 진행률, 단계별 소요 시간, 시도 횟수, 오류를 조회합니다."""
+    job = await get_services().ingestion_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+async def _sync_law_mirror(names: list[str] | None) -> None:
+    """법령 미러를 동기화합니다 (백그라운드 태스크). 새로 생긴 개정본은 임베딩 아웃박스를 거쳐 벡터 스토어에 반영됩니다."""
+    services = get_services()
+    await services.law_mirror.sync(names)
+    services.embedding_outbox.notify()
+
+@router.post("/laws/mirror/sync", status_code=202)
+async def sync_law_mirror(background_tasks: BackgroundTasks, names: list[str] | None = Query(None)):
+    """
+    국가법령정보센터에서 법령 전체 조문을 받아 로컬 미러 테이블을 갱신합니다.
+    names를 생략하면 LAW_MIRROR_LAWS 설정(없으면 등록된 모든 법령)을 대상으로 합니다.
+    """
+    targets = await get_services().law_mirror.target_law_names(names)
+    background_tasks.add_task(_sync_law_mirror, targets)
+    return {"message": "Law mirror sync started.", "laws": targets}
+
+@router.get("/embeddings/outbox")
+async def inspect_embedding_outbox(limit: int = 50):
+    """임베딩 아웃박스의 밀린 행 수(backlog), 가장 오래된 대기 행의 지연 시간(lag), 재시도 대기·dead 행을 조회합니다."""
+    outbox = get_services().embedding_outbox
+    return {"stats": await outbox.stats(), "dead_letters": await outbox.dead_letters(limit)}
+
+@router.post("/embeddings/outbox/retry")
+async def retry_embedding_outbox():
+    """dead 상태로 남은 임베딩 아웃박스 행을 다시 대기열에 넣습니다."""
+    return {"requeued": await get_services().embedding_outbox.retry_dead()}
+
+@router.get("/vectors/consistency")
+async def check_vector_consistency():
+    """SQL 개정본과 벡터 스토어를 비교하여 없는·어긋난·중복·고아 벡터 수와 예시 ID를 조회합니다 (변경 없음)."""
+    return await get_services().vector_consistency.run(repair=False)
+
+@router.post("/vectors/consistency/repair")
+async def repair_vector_consistency():
+    """
+    정합성 검사 후 차이를 증분 복구합니다. 없거나 어긋난 개정본은 임베딩 아웃박스에 기록하여 워커가 다시 임베딩하고,
+    중복·고아 벡터는 페이지 단위로 삭제합니다.
+    """
+    services = get_services()
+    report = await services.vector_consistency.run(repair=True)
+    services.embedding_outbox.notify()
+    return report
+
+@router.get("/laws/mirror")
+async def list_law_mirrors(db: AsyncSession = Depends(get_db)):
+    """미러링된 법령별 동기화 시각, 원격 시행일자, 조문 수를 조회합니다."""
+    rows = await db.execute(select(LawMirror, Law.name).join(Law, LawMirror.law_id == Law.id).order_by(Law.name))
+    return [
+        {
+            "law_id": mirror.law_id,
+            "law_name": name,
+            "source_law_id": mirror.source_law_id,
+            "source_effective_date": mirror.source_effective_date,
+            "article_count": mirror.article_count,
+            "synced_at": mirror.synced_at,
         }
-        
-    except Exception as e:
-        db.rollback()
-        logger.error(f"PDF upload failed for law_id={law_id}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        for mirror, name in rows.all()
+    ]
+
+
+@router.get("/cache/answers")
+def inspect_answer_cache(limit: int = 50):
+    """시맨틱 답변 캐시의 적중률 카운터와 최근 사용 순 항목 목록을 조회합니다."""
+    cache = get_services().answer_cache
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, "stats": cache.stats(), "entries": cache.entries()[:limit]}
+
+@router.delete("/cache/answers")
+def flush_answer_cache():
+    """시맨틱 답변 캐시의 모든 항목을 비웁니다 (법령 일괄 갱신 직후 등)."""
+    cache = get_services().answer_cache
+    if cache is None:
+        return {"enabled": False, "flushed": 0}
+    return {"enabled": True, "flushed": cache.flush()}
+
+@router.get("/cache/precedents")
+async def inspect_precedent_cache():
+    """판례 캐시의 검색어/상세 적중률 카운터와 보관 중인 판례·검색어 수를 조회합니다."""
+    cache = get_services().precedent_cache
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, "stats": await cache.stats()}
 
+@router.delete("/cache/precedents")
+async def flush_precedent_queries():
+    """판례 검색어 캐시를 비웁니다. 판례 상세는 바뀌지 않으므로 유지됩니다."""
+    cache = get_services().precedent_cache
+    if cache is None:
+        return {"enabled": False, "flushed": 0}
+    return {"enabled": True, "flushed": await cache.flush_queries()}
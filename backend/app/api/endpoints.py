@@ -2,10 +2,11 @@ import json
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc, func
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import desc, func, select
 
-from app.models import User, ChatSession, ChatMessage, ClaimCheck, LawArticleRevision, LawArticle, Law
+from app.models import User, ChatSession, ChatMessage, ClaimCheck
 from app.schemas import LoginPayload, UserResponse, CheckRequest, TemplateRequest, TemplateResponse
 from app.core.database import get_db
 from app.core.auth import get_current_user_id
@@ -33,61 +34,18 @@ def read_root():
     return {"status": "ok", "message": "Legal Fact Checker API is running"}
 
 @router.get("/search/articles")
-def search_articles(query: str = Query(..., description="검색할 키워드"), db: Session = Depends(get_db)):
-    """조문 키워드 검색 API (실시간 API 연동 하이브리드)"""
-    from app.plugins.law_db import search_law_articles
-    
-    api_results = search_law_articles(law_name=query, keyword="", limit=50)
-    
-    results = []
-    
-    is_api_error = False
-    if len(api_results) == 1 and api_results[0].get("조문번호") == "-":
-        is_api_error = True
-
-    if api_results and not is_api_error:
-        for idx, res in enumerate(api_results):
-            content_preview = f"[{res['조문제목']}] {res['조문내용']}"
-            if len(content_preview) > 500:
-                content_preview = content_preview[:500] + "..."
-                
-            results.append({
-                "law_name": res["법령명"],
-                "article_number": res["조문번호"],
-                "content": content_preview,
-                "revision_id": f"api_{idx}"
-            })
-    else:
-        # N+1 쿼리 해결: joinedload로 연관 엔티티를 미리 로드
-        revisions = (
-            db.query(LawArticleRevision)
-            .options(
-                joinedload(LawArticleRevision.article).joinedload(LawArticle.law)
-            )
-            .filter(LawArticleRevision.content.ilike(f"%{query}%"))
-            .limit(10)
-            .all()
-        )
-        for rev in revisions:
-            article = rev.article
-            law = article.law if article else None
-            results.append({
-                "law_name": law.name if law else "Unknown",
-                "article_number": article.article_number if article else "Unknown",
-                "content": rev.content[:200] + "...",
-                "revision_id": rev.id
-            })
-            
-    return {"results": results}
+async def search_articles(query: str = Query(..., description="검색할 키워드"), db: AsyncSession = Depends(get_db)):
+    """조문 키워드 검색 API (로컬 미러 우선, 미러링되지 않은 법령만 실시간 API 연동)"""
+    return await get_services().article_search.search(db, query)
 
 @router.post("/auth/login", response_model=UserResponse)
-def login(payload: LoginPayload, db: Session = Depends(get_db)):
+async def login(payload: LoginPayload, db: AsyncSession = Depends(get_db)):
     """
     구글 로그인을 처리하고 JWT 엑세스 토큰을 발급합니다.
     최초 로그인 시 DB에 회원 정보를 저장하고, 이후에는 기존 정보를 바탕으로 로그인합니다.
     """
     from app.core.auth import create_access_token
-    user = db.query(User).filter(User.email == payload.email).first()
+    user = await db.scalar(select(User).where(User.email == payload.email))
     if not user:
         user = User(
             email=payload.email,
@@ -97,46 +55,91 @@ def login(payload: LoginPayload, db: Session = Depends(get_db)):
             image_url=payload.image_url
         )
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        await db.refresh(user)
     
     user_response = UserResponse.model_validate(user)
     user_response.token = create_access_token(user.id)
     return user_response
 
-@router.post("/check")
-async def check_fact(
-    request: CheckRequest,
-    user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
-    check_service=Depends(_get_check_service),
-):
-    # Validate user
-    user = db.query(User).filter(User.id == user_id).first()
+async def _validate_check_request(db: AsyncSession, user_id: int, session_id: int | None) -> None:
+    """팩트체크 요청자의 사용자/세션 소유권을 검증합니다."""
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
 
-    session_id = request.session_id
     if session_id:
-        chat_session = db.query(ChatSession).filter(ChatSession.id == session_id).first()
+        chat_session = await db.get(ChatSession, session_id)
         if not chat_session or chat_session.user_id != user_id:
             raise HTTPException(status_code=403, detail="Invalid session")
 
+
+def _format_sse(event: str, data: dict) -> str:
+    """이벤트 이름과 데이터를 Server-Sent Events 프레임 문자열로 직렬화합니다."""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+@router.post("/check")
+async def check_fact(
+    request: CheckRequest,
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+    check_service=Depends(_get_check_service),
+):
+    await _validate_check_request(db, user_id, request.session_id)
+
     # 비즈니스 로직은 CheckService에 위임
     return await check_service.execute(
         db=db,
         user_id=user_id,
         query=request.query,
-        session_id=session_id,
+        session_id=request.session_id,
         image_data=getattr(request, "image_data", None),
+        as_of=request.as_of,
+    )
+
+@router.post("/check/stream")
+async def check_fact_stream(
+    request: CheckRequest,
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+    check_service=Depends(_get_check_service),
+):
+    """
+    팩트체크를 Server-Sent Events로 스트리밍합니다.
+    단계 완료(stage: 의도 분석, 도구 선택, 근거 검색 등), 답변 섹션 토큰(token),
+    저장까지 완료된 최종 응답(result, /check 응답과 동일한 형태) 순으로 이벤트를 전송합니다.
+    token은 교정 전 미리보기이며, 클라이언트는 result를 최종 답변으로 보고 화면의 섹션을 result 내용으로 교체해야 합니다
+    (result.corrected_sections: 교정으로 미리보기와 달라진 섹션).
+    """
+    await _validate_check_request(db, user_id, request.session_id)
+
+    async def event_stream():
+        async for event, data in check_service.execute_stream(
+            db=db,
+            user_id=user_id,
+            query=request.query,
+            session_id=request.session_id,
+            image_data=getattr(request, "image_data", None),
+            as_of=request.as_of,
+        ):
+            yield _format_sse(event, data)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 @router.get("/sessions")
-def get_user_sessions(user_id: int = Depends(get_current_user_id), db: Session = Depends(get_db)):
+async def get_user_sessions(user_id: int = Depends(get_current_user_id), db: AsyncSession = Depends(get_db)):
     """
     현재 인증된 사용자의 이전 팩트체크 대화(세션) 목록을 최근 수정일 순으로 조회합니다.
     """
-    sessions = db.query(ChatSession).filter(ChatSession.user_id == user_id).order_by(desc(ChatSession.updated_at)).all()
+    sessions = (await db.scalars(
+        select(ChatSession).where(ChatSession.user_id == user_id).order_by(desc(ChatSession.updated_at))
+    )).all()
     return {
         "sessions": [
             {
@@ -149,16 +152,20 @@ def get_user_sessions(user_id: int = Depends(get_current_user_id), db: Session =
     }
 
 @router.get("/sessions/{session_id}")
-def get_session_details(session_id: int, user_id: int = Depends(get_current_user_id), db: Session = Depends(get_db)):
+async def get_session_details(session_id: int, user_id: int = Depends(get_current_user_id), db: AsyncSession = Depends(get_db)):
     """
     특정 팩트체크 세션(id)의 전체 대화 내역(메시지 리스트)과 세션 상세 정보를 조회합니다.
     본인의 세션에만 접근할 수 있습니다.
     """
-    session = db.query(ChatSession).filter(ChatSession.id == session_id, ChatSession.user_id == user_id).first()
+    session = await db.scalar(
+        select(ChatSession).where(ChatSession.id == session_id, ChatSession.user_id == user_id)
+    )
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    messages = db.query(ChatMessage).filter(ChatMessage.session_id == session_id).order_by(ChatMessage.created_at).all()
+    messages = (await db.scalars(
+        select(ChatMessage).where(ChatMessage.session_id == session_id).order_by(ChatMessage.created_at)
+    )).all()
     
     formatted_messages = []
     for msg in messages:
@@ -179,40 +186,46 @@ def get_session_details(session_id: int, user_id: int = Depends(get_current_user
     }
 
 @router.post("/sessions/{session_id}/bookmark")
-def toggle_bookmark(session_id: int, user_id: int = Depends(get_current_user_id), db: Session = Depends(get_db)):
+async def toggle_bookmark(session_id: int, user_id: int = Depends(get_current_user_id), db: AsyncSession = Depends(get_db)):
     """
     특정 대화 세션에 북마크 표시를 하거나 해제(토글)합니다.
     """
-    session = db.query(ChatSession).filter(ChatSession.id == session_id, ChatSession.user_id == user_id).first()
+    session = await db.scalar(
+        select(ChatSession).where(ChatSession.id == session_id, ChatSession.user_id == user_id)
+    )
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
     session.is_bookmarked = not session.is_bookmarked
-    db.commit()
+    await db.commit()
     return {"id": session.id, "is_bookmarked": session.is_bookmarked}
 
 @router.delete("/sessions/{session_id}")
-def delete_session(session_id: int, user_id: int = Depends(get_current_user_id), db: Session = Depends(get_db)):
+async def delete_session(session_id: int, user_id: int = Depends(get_current_user_id), db: AsyncSession = Depends(get_db)):
     """
     특정 대화 세션을 삭제합니다. DB에서 세션 및 관련된 메시지가 모두 제거됩니다.
     """
-    session = db.query(ChatSession).filter(ChatSession.id == session_id, ChatSession.user_id == user_id).first()
+    session = await db.scalar(
+        select(ChatSession).where(ChatSession.id == session_id, ChatSession.user_id == user_id)
+    )
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    db.delete(session)
-    db.commit()
+    await db.delete(session)
+    await db.commit()
     return {"status": "ok", "message": "Session deleted"}
 
 @router.get("/claims/popular")
-def get_popular_claims(db: Session = Depends(get_db)):
+async def get_popular_claims(db: AsyncSession = Depends(get_db)):
     """
     전체 시스템에서 가장 많이 검색된 인기 팩트체크 키워드/질문 상위 5개를 반환합니다.
     """
-    popular = db.query(ClaimCheck.claim_text, func.count(ClaimCheck.id).label('count'))\
-                .group_by(ClaimCheck.claim_text)\
-                .order_by(desc(func.count(ClaimCheck.id)))\
-                .limit(5).all()
+    popular = (await db.execute(
+        select(ClaimCheck.claim_text, func.count(ClaimCheck.id).label('count'))
+        .group_by(ClaimCheck.claim_text)
+        .order_by(desc(func.count(ClaimCheck.id)))
+        .limit(5)
+    )).all()
     return {"popular_claims": [p.claim_text for p in popular]}
 
 @router.post("/claims/template", response_model=TemplateResponse)
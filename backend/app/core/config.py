@@ -28,6 +28,13 @@ class Settings:
         self.DATABASE_URL: str = os.getenv(
             "DATABASE_URL", "sqlite:///./legalcheck.db"
         )
+        # API 요청 경로에서 사용할 비동기 드라이버 URL (비워두면 DATABASE_URL에서 aiosqlite/psycopg로 유도)
+        self.ASYNC_DATABASE_URL: str = os.getenv("ASYNC_DATABASE_URL", "")
+        self.DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+        self.DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        self.DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+        self.DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+        self.DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
 
         # --- Auth ---
         self.ADMIN_API_KEY: str = os.getenv("ADMIN_API_KEY", "")
@@ -42,12 +49,97 @@ class Settings:
 
         # --- External APIs ---
         self.LAW_GO_KR_API_KEY: str = os.getenv("LAW_GO_KR_API_KEY", "")
+        self.LAW_GO_KR_BASE_URL: str = os.getenv("LAW_GO_KR_BASE_URL", "https://www.law.go.kr")
+        self.DATA_GO_KR_LAW_URL: str = os.getenv("DATA_GO_KR_LAW_URL", "https://apis.data.go.kr/1170000/law")
+        self.LAW_API_TIMEOUT_SECONDS: float = float(os.getenv("LAW_API_TIMEOUT_SECONDS", "5"))
+        self.LAW_API_MAX_CONNECTIONS: int = int(os.getenv("LAW_API_MAX_CONNECTIONS", "20"))
+        self.LAW_API_MAX_CONCURRENCY: int = int(os.getenv("LAW_API_MAX_CONCURRENCY", "8"))
 
         # --- Vector Store ---
         self.VECTOR_STORE_PATH: str = os.getenv("VECTOR_STORE_PATH", "chroma_db")
+        self.EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "text-embedding-ada-002")
+        # 문서 임베딩 디스크 캐시 경로 (본문+모델 해시 기준, 비워두면 캐시 미사용)
+        self.EMBEDDING_CACHE_PATH: str = os.getenv("EMBEDDING_CACHE_PATH", "embedding_cache")
+        # 벡터 스토어/SQL 정합성 검사 시 한 번에 비교하는 개정본·벡터 수
+        self.VECTOR_CHECK_PAGE_SIZE: int = int(os.getenv("VECTOR_CHECK_PAGE_SIZE", "500"))
+
+        # --- Retrieval (Hybrid BM25 + Vector) ---
+        # hybrid: 벡터 + BM25 후보를 RRF로 융합, dense: 벡터 유사도만 사용
+        self.RETRIEVAL_MODE: str = os.getenv("RETRIEVAL_MODE", "hybrid")
+        self.RETRIEVAL_TOP_K: int = int(os.getenv("RETRIEVAL_TOP_K", "3"))
+        self.RETRIEVAL_CANDIDATE_K: int = int(os.getenv("RETRIEVAL_CANDIDATE_K", "20"))
+        self.RRF_K: int = int(os.getenv("RRF_K", "60"))
+        self.RRF_DENSE_WEIGHT: float = float(os.getenv("RRF_DENSE_WEIGHT", "1.0"))
+        self.RRF_BM25_WEIGHT: float = float(os.getenv("RRF_BM25_WEIGHT", "1.0"))
+        # 의도 분석의 법 영역(law_domain)에 해당하는 법령(law_id)만 검색 (알 수 없음이면 전체 검색)
+        self.RETRIEVAL_LAW_PARTITIONING: bool = os.getenv("RETRIEVAL_LAW_PARTITIONING", "true").lower() == "true"
+
+        # --- Input Hook (Rule-based Fast Path) ---
+        # 기본값은 꺼짐: 규칙을 끈 상태로 수집한 INTENT_LOG_PATH 로그로 evaluate_intent_rules 리포트를 확인한 뒤 켤 것
+        self.INTENT_RULES_ENABLED: bool = os.getenv("INTENT_RULES_ENABLED", "false").lower() == "true"
+        self.INTENT_RULES_MIN_CONFIDENCE: float = float(os.getenv("INTENT_RULES_MIN_CONFIDENCE", "0.75"))
+        self.INTENT_LOG_PATH: str = os.getenv("INTENT_LOG_PATH", "")
+
+        # --- Intent + Routing ---
+        # two_call: InputAnalyzer → RoutingAgent 순차 호출, fused: 단일 구조화 호출, ab: 요청마다 무작위 배정
+        self.INTENT_ROUTING_MODE: str = os.getenv("INTENT_ROUTING_MODE", "two_call")
+        self.INTENT_ROUTING_FUSED_RATIO: float = float(os.getenv("INTENT_ROUTING_FUSED_RATIO", "0.5"))
+
+        # --- Semantic Answer Cache ---
+        self.SEMANTIC_CACHE_ENABLED: bool = os.getenv("SEMANTIC_CACHE_ENABLED", "true").lower() == "true"
+        self.SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+        self.SEMANTIC_CACHE_MAX_ENTRIES: int = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "512"))
+        self.SEMANTIC_CACHE_TTL_SECONDS: int = int(os.getenv("SEMANTIC_CACHE_TTL_SECONDS", "86400"))
+
+        # --- Precedent Cache ---
+        self.PRECEDENT_CACHE_ENABLED: bool = os.getenv("PRECEDENT_CACHE_ENABLED", "true").lower() == "true"
+        self.PRECEDENT_QUERY_CACHE_TTL_SECONDS: int = int(os.getenv("PRECEDENT_QUERY_CACHE_TTL_SECONDS", "604800"))
+
+        # --- Law Mirror ---
+        # 로컬에 미러링할 법령명 목록 (쉼표 구분, 비워두면 laws 테이블에 등록된 모든 법령)
+        self.LAW_MIRROR_LAWS: list[str] = [
+            name.strip() for name in os.getenv("LAW_MIRROR_LAWS", "").split(",") if name.strip()
+        ]
+        self.ARTICLE_SEARCH_LIMIT: int = int(os.getenv("ARTICLE_SEARCH_LIMIT", "50"))
+
+        # --- Ingestion Jobs (Local Queue) ---
+        # PDF 업로드를 처리하는 프로세스 내 워커 (외부 브로커 없이 DB 테이블을 큐로 사용)
+        self.INGEST_JOB_WORKER_ENABLED: bool = os.getenv("INGEST_JOB_WORKER_ENABLED", "true").lower() == "true"
+        self.INGEST_JOB_POLL_SECONDS: float = float(os.getenv("INGEST_JOB_POLL_SECONDS", "2"))
+        self.INGEST_JOB_MAX_ATTEMPTS: int = int(os.getenv("INGEST_JOB_MAX_ATTEMPTS", "3"))
+        self.INGEST_JOB_RETRY_DELAY_SECONDS: float = float(os.getenv("INGEST_JOB_RETRY_DELAY_SECONDS", "10"))
+        # 실행 중인 작업의 heartbeat가 이 시간 이상 끊기면 워커가 중단된 것으로 보고 다시 큐에 넣음
+        self.INGEST_JOB_LEASE_SECONDS: float = float(os.getenv("INGEST_JOB_LEASE_SECONDS", "120"))
+
+        # --- Embedding Outbox ---
+        # 개정본 저장과 같은 트랜잭션에 기록된 임베딩 대기열을 비우는 프로세스 내 워커
+        self.EMBEDDING_OUTBOX_WORKER_ENABLED: bool = os.getenv("EMBEDDING_OUTBOX_WORKER_ENABLED", "true").lower() == "true"
+        self.EMBEDDING_OUTBOX_BATCH_SIZE: int = int(os.getenv("EMBEDDING_OUTBOX_BATCH_SIZE", "64"))  # 임베딩 호출 1회에 묶는 개정본 수
+        self.EMBEDDING_OUTBOX_POLL_SECONDS: float = float(os.getenv("EMBEDDING_OUTBOX_POLL_SECONDS", "2"))
+        self.EMBEDDING_OUTBOX_MAX_ATTEMPTS: int = int(os.getenv("EMBEDDING_OUTBOX_MAX_ATTEMPTS", "5"))
+        self.EMBEDDING_OUTBOX_RETRY_DELAY_SECONDS: float = float(os.getenv("EMBEDDING_OUTBOX_RETRY_DELAY_SECONDS", "10"))
+        # processing 행의 임대 시간: 이 시간이 지나도록 끝나지 않은 배치는 워커가 중단된 것으로 보고 다시 대기열에 넣음
+        self.EMBEDDING_OUTBOX_LEASE_SECONDS: float = float(os.getenv("EMBEDDING_OUTBOX_LEASE_SECONDS", "600"))
+
+        # --- Explanation Cache ---
+        self.EXPLANATION_CACHE_MAX_AGE_DAYS: int = int(os.getenv("EXPLANATION_CACHE_MAX_AGE_DAYS", "30"))
 
         # --- Ingestion ---
+        # 규칙 기반 조문 분리기가 처리하지 못한 구간을 LLM에 보낼 때의 1회 최대 길이 (전문은 자르지 않음)
         self.PDF_MAX_TEXT_LENGTH: int = int(os.getenv("PDF_MAX_TEXT_LENGTH", "40000"))
+        # PDF 텍스트 추출 프로세스 풀 (0이면 풀을 쓰지 않고 스레드에서 추출)
+        self.PDF_EXTRACT_WORKERS: int = int(os.getenv("PDF_EXTRACT_WORKERS", str(min(4, os.cpu_count() or 1))))
+        self.PDF_PARALLEL_MIN_PAGES: int = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "16"))  # 이 쪽 수 이상일 때만 병렬 추출
+        self.PDF_PAGES_PER_TASK: int = int(os.getenv("PDF_PAGES_PER_TASK", "4"))
+        # ingest_data 청크 최대 길이 (조 단위로 나누고, 이보다 긴 조는 항 경계에서 나눔)
+        self.INGEST_ARTICLE_MAX_CHARS: int = int(os.getenv("INGEST_ARTICLE_MAX_CHARS", "1000"))
+        # ingest_data 청크 요약 동시 실행 수와 레이트 리밋(429)/일시 오류 재시도 횟수
+        self.INGEST_SUMMARY_CONCURRENCY: int = int(os.getenv("INGEST_SUMMARY_CONCURRENCY", "8"))
+        self.INGEST_SUMMARY_MAX_RETRIES: int = int(os.getenv("INGEST_SUMMARY_MAX_RETRIES", "5"))
+        # 이보다 짧은 청크(짧은 조문)는 요약 LLM을 호출하지 않고 원문을 그대로 임베딩
+        self.INGEST_SUMMARY_MIN_CHARS: int = int(os.getenv("INGEST_SUMMARY_MIN_CHARS", "300"))
+        # 완료된 청크 요약을 기록해 두는 체크포인트 파일 (중단 후 재실행 시 이어서 처리, 비워두면 미사용)
+        self.INGEST_CHECKPOINT_PATH: str = os.getenv("INGEST_CHECKPOINT_PATH", "ingest_checkpoint.jsonl")
 
 
 @lru_cache()
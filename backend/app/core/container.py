@@ -11,6 +11,15 @@ from app.services.vision_service import VisionAnalyzer
 from app.services.template_service import DocumentTemplateGenerator
 from app.services.check_service import CheckService
 from app.services.pdf_ingest_service import PDFLawParser
+from app.services.answer_cache import SemanticAnswerCache, register_revision_invalidation
+from app.services.precedent_cache import PrecedentCache
+from app.services.article_search_service import ArticleSearchService
+from app.services.law_mirror_service import LawMirrorService
+from app.services.job_queue import IngestionJobQueue
+from app.services.embedding_outbox import EmbeddingOutboxWorker
+from app.services.vector_consistency import VectorConsistencyChecker
+from app.core.database import AsyncSessionLocal
+from app.core.config import get_settings
 
 
 class ServiceContainer:
@@ -25,12 +34,58 @@ class ServiceContainer:
         self.template_generator = DocumentTemplateGenerator()
         self.pdf_parser = PDFLawParser()
 
+        settings = get_settings()
+        self.answer_cache = None
+        if settings.SEMANTIC_CACHE_ENABLED:
+            self.answer_cache = SemanticAnswerCache(
+                embeddings=self.checker.embeddings,
+                threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+                max_entries=settings.SEMANTIC_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.SEMANTIC_CACHE_TTL_SECONDS,
+            )
+            register_revision_invalidation(self.answer_cache)
+
+        self.precedent_cache = None
+        if settings.PRECEDENT_CACHE_ENABLED:
+            self.precedent_cache = PrecedentCache(
+                session_factory=AsyncSessionLocal,
+                ttl_seconds=settings.PRECEDENT_QUERY_CACHE_TTL_SECONDS,
+            )
+
+        self.article_search = ArticleSearchService(limit=settings.ARTICLE_SEARCH_LIMIT)
+        self.law_mirror = LawMirrorService(session_factory=AsyncSessionLocal)
+        self.ingestion_jobs = IngestionJobQueue(
+            session_factory=AsyncSessionLocal,
+            pdf_parser=self.pdf_parser,
+            max_attempts=settings.INGEST_JOB_MAX_ATTEMPTS,
+            retry_delay_seconds=settings.INGEST_JOB_RETRY_DELAY_SECONDS,
+            poll_seconds=settings.INGEST_JOB_POLL_SECONDS,
+            lease_seconds=settings.INGEST_JOB_LEASE_SECONDS,
+        )
+        self.embedding_outbox = EmbeddingOutboxWorker(
+            session_factory=AsyncSessionLocal,
+            checker=self.checker,
+            batch_size=settings.EMBEDDING_OUTBOX_BATCH_SIZE,
+            max_attempts=settings.EMBEDDING_OUTBOX_MAX_ATTEMPTS,
+            retry_delay_seconds=settings.EMBEDDING_OUTBOX_RETRY_DELAY_SECONDS,
+            poll_seconds=settings.EMBEDDING_OUTBOX_POLL_SECONDS,
+            lease_seconds=settings.EMBEDDING_OUTBOX_LEASE_SECONDS,
+            answer_cache=self.answer_cache,
+        )
+        self.vector_consistency = VectorConsistencyChecker(
+            session_factory=AsyncSessionLocal,
+            checker=self.checker,
+            page_size=settings.VECTOR_CHECK_PAGE_SIZE,
+        )
+
         self.check_service = CheckService(
             checker=self.checker,
             analyzer=self.analyzer,
             agent=self.agent,
             validator=self.validator,
             vision=self.vision,
+            answer_cache=self.answer_cache,
+            precedent_cache=self.precedent_cache,
         )
 
 
@@ -1,25 +1,64 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.config import get_settings
 
 settings = get_settings()
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-# Only use check_same_thread for SQLite
-connect_args = {}
-if SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
-    connect_args["check_same_thread"] = False
+# 동기 드라이버 URL → 비동기 드라이버 URL 매핑 (ASYNC_DATABASE_URL 미지정 시 사용)
+# Postgres는 모델 기본값의 timezone-aware datetime을 timestamp 컬럼에 그대로 받아주는 psycopg(3) 비동기 모드를 사용
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+psycopg",
+    "postgresql+psycopg2": "postgresql+psycopg",
+    "postgres": "postgresql+psycopg",
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+}
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args=connect_args
-)
+
+def to_async_url(url: str) -> str:
+    """동기 DB URL의 드라이버 부분을 같은 DB의 비동기 드라이버(aiosqlite, psycopg 등)로 바꿉니다."""
+    scheme, sep, rest = url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+
+def _engine_options(url: str) -> dict:
+    """
+    DB 종류에 맞는 엔진 옵션(커넥션 풀 포함)을 구성합니다.
+    SQLite 인메모리 DB는 커넥션마다 별도 DB가 생기므로 풀 설정을 적용하지 않습니다.
+    """
+    options: dict = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if url.startswith("sqlite"):
+        # Only use check_same_thread for SQLite
+        options["connect_args"] = {"check_same_thread": False}
+        if ":memory:" in url or url.rstrip("/").endswith(":"):
+            return options
+
+    options.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+    return options
+
+
+# 동기 엔진: 테이블 생성, 백그라운드 인제스트 등 이벤트 루프 밖에서 실행되는 작업용
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **_engine_options(SQLALCHEMY_DATABASE_URL))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진: API 요청 경로용 (느린 커밋이 이벤트 루프의 다른 LLM 코루틴을 막지 않도록)
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL or to_async_url(SQLALCHEMY_DATABASE_URL)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **_engine_options(ASYNC_DATABASE_URL))
+# 커밋 후 속성 접근이 암묵적 I/O(lazy refresh)를 일으키지 않도록 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -2,7 +2,8 @@
 LLM 인스턴스 중앙 관리 모듈
 모델명 변경 시 이 파일만 수정하면 됩니다.
 """
-from langchain_openai import ChatOpenAI
+from langchain_core.embeddings import Embeddings
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from app.core.config import get_settings
 
 
@@ -16,3 +17,24 @@ def get_mini_llm(temperature: float = 0, **kwargs) -> ChatOpenAI:
     """경량 LLM (gpt-4o-mini 기본) — 요약, 검증, 문서 생성 등"""
     settings = get_settings()
     return ChatOpenAI(model=settings.MINI_LLM_MODEL, temperature=temperature, **kwargs)
+
+
+def get_embeddings() -> Embeddings:
+    """
+    문서/질의 임베딩 모델. EMBEDDING_CACHE_PATH가 설정되어 있으면 문서 임베딩을
+    (모델명 + 본문 SHA-256) 키로 디스크에 캐시하여, 바뀌지 않은 본문은 임베딩 API로 다시 보내지 않습니다.
+    """
+    settings = get_settings()
+    embeddings = OpenAIEmbeddings(model=settings.EMBEDDING_MODEL)
+    if not settings.EMBEDDING_CACHE_PATH:
+        return embeddings
+
+    from langchain_classic.embeddings import CacheBackedEmbeddings
+    from langchain_classic.storage import LocalFileStore
+
+    return CacheBackedEmbeddings.from_bytes_store(
+        embeddings,
+        LocalFileStore(settings.EMBEDDING_CACHE_PATH),
+        namespace=settings.EMBEDDING_MODEL,
+        key_encoder="sha256",
+    )
@@ -8,8 +8,10 @@ load_dotenv()
 from app.core.config import get_settings
 
 from app.api.endpoints import router as api_router
-from app.core.database import engine
+from app.core.database import engine, async_engine
 from app.core.container import get_services
+from app.plugins.http_client import close_law_api_client
+from app.services.pdf_text import shutdown_pdf_pool
 from app.models import Base
 
 # Initialize DB tables
@@ -20,7 +22,19 @@ async def lifespan(app: FastAPI):
     # Load vector store on startup
     services = get_services()
     services.checker.initialize_vector_store()
+    # 법령 PDF 인제스트 작업 큐 워커 (외부 브로커 없이 같은 프로세스에서 실행)
+    if get_settings().INGEST_JOB_WORKER_ENABLED:
+        services.ingestion_jobs.start()
+    # 개정본 저장과 함께 기록된 임베딩 아웃박스를 벡터 스토어에 반영하는 워커
+    if get_settings().EMBEDDING_OUTBOX_WORKER_ENABLED:
+        services.embedding_outbox.start()
     yield
+    await services.ingestion_jobs.stop()
+    await services.embedding_outbox.stop()
+    shutdown_pdf_pool()
+    # 비동기 DB 엔진과 법령 API 클라이언트의 커넥션 풀 정리
+    await async_engine.dispose()
+    await close_law_api_client()
 
 app = FastAPI(title="Legal Fact Checker API", lifespan=lifespan)
 
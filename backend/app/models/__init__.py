@@ -11,8 +11,16 @@ from app.models.law import (
     Topic,
     ClaimCheck,
     ExplanationCache,
+    Precedent,
+    PrecedentQueryCache,
+    LawMirror,
+    ParentDocument,
+    IngestionJob,
+    EmbeddingOutbox,
     VerdictEnum
 )
+# 조문 본문 전문 검색 인덱스 (create_all / 개정본 변경 시 인덱스를 갱신하는 이벤트 등록)
+from app.models import fulltext  # noqa: F401
 
 class User(Base):
     __tablename__ = "users"
@@ -0,0 +1,175 @@
+"""
+조문 본문 전문 검색(Full-Text) 인덱스
+LawArticleRevision.content에 대한 DB별 전문 검색 인덱스를 정의하고, 검색 SQL을 구성합니다.
+
+- SQLite: FTS5 가상 테이블. 한국어는 조사가 붙어 띄어쓰기 단위 토큰으로는 검색되지 않으므로,
+  본문을 글자 2-gram(바이그램)으로 나눠 저장하고 검색어도 같은 방식으로 나눠 구(phrase) 검색합니다.
+  ORM 매퍼 이벤트로 개정본 추가/수정/삭제 시 함께 갱신하며, create_all 시 누락분을 다시 채웁니다.
+- PostgreSQL: pg_trgm GIN 인덱스. 인덱스가 테이블과 함께 자동 갱신되므로 별도 동기화가 필요 없습니다.
+- 그 외 DB: 인덱스 없이 LIKE 검색 (build_search_statement가 None 반환)
+"""
+import logging
+import re
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import attributes
+
+from app.core.database import Base
+from app.models.law import LawArticleRevision
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "law_article_revisions_fts"
+TRGM_INDEX = "ix_law_article_revisions_content_trgm"
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def to_ngrams(value: str, n: int = 2) -> str:
+    """
+    텍스트를 단어별 글자 n-gram 토큰 문자열로 변환합니다. (n보다 짧은 단어는 그대로 유지)
+    예: "임금은 통화로" → "임금 금은 통화 화로"
+    """
+    tokens = []
+    for word in WORD_PATTERN.findall(value.lower()):
+        if len(word) <= n:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + n] for i in range(len(word) - n + 1))
+    return " ".join(tokens)
+
+
+def search_terms(query: str) -> list[str]:
+    """검색어를 단어 목록으로 나눕니다. (하이라이트에도 같은 목록을 사용)"""
+    return WORD_PATTERN.findall(query.lower())
+
+
+def to_fts_query(query: str) -> str | None:
+    """
+    검색어를 FTS5 MATCH 식으로 변환합니다. 단어마다 n-gram 구(phrase)를 만들고 AND로 묶습니다.
+    한 글자 단어는 바이그램 색인으로 찾을 수 없으므로 None을 반환합니다 (LIKE 검색으로 대체).
+    """
+    terms = search_terms(query)
+    if not terms or any(len(term) < 2 for term in terms):
+        return None
+    return " AND ".join(f'"{to_ngrams(term)}"' for term in terms)
+
+
+def build_search_statement(dialect: str, query: str, limit: int, current_only: bool = True):
+    """
+    전문 검색 SQL을 구성합니다. 결과 컬럼은 (id, score)이며 score가 높을수록 관련도가 높습니다.
+
+    Args:
+        dialect (str): DB 방언 이름 (sqlite, postgresql 등)
+        query (str): 검색어
+        limit (int): 최대 결과 수
+        current_only (bool, optional): 현행 개정본(시행 종료일 없음)만 검색할지 여부. Defaults to True.
+
+    Returns:
+        TextClause | None: 전문 검색 SQL. 해당 DB/검색어로 인덱스를 쓸 수 없으면 None
+    """
+    current = " AND r.effective_end_date IS NULL" if current_only else ""
+    if dialect == "sqlite":
+        match = to_fts_query(query)
+        if match is None:
+            return None
+        return text(
+            f"SELECT r.id AS id, -bm25({FTS_TABLE}) AS score FROM {FTS_TABLE} "
+            f"JOIN law_article_revisions r ON r.id = {FTS_TABLE}.rowid "
+            f"WHERE {FTS_TABLE} MATCH :match{current} "
+            f"ORDER BY bm25({FTS_TABLE}) LIMIT :limit"
+        ).bindparams(match=match, limit=limit)
+
+    if dialect == "postgresql":
+        terms = search_terms(query)
+        if not terms:
+            return None
+        conditions = " AND ".join(f"r.content ILIKE :term{i}" for i in range(len(terms)))
+        params = {f"term{i}": f"%{term}%" for i, term in enumerate(terms)}
+        return text(
+            f"SELECT r.id AS id, word_similarity(:query, r.content) AS score FROM law_article_revisions r "
+            f"WHERE {conditions}{current} ORDER BY score DESC, r.id LIMIT :limit"
+        ).bindparams(query=query, limit=limit, **params)
+
+    return None
+
+
+def _fts_upsert(connection, revision_id: int, content: str) -> None:
+    connection.execute(text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :id"), {"id": revision_id})
+    connection.execute(
+        text(f"INSERT INTO {FTS_TABLE}(rowid, body) VALUES (:id, :body)"),
+        {"id": revision_id, "body": to_ngrams(content)},
+    )
+
+
+def index_revisions(connection, revisions: list[tuple[int, str]]) -> None:
+    """
+    매퍼 이벤트를 거치지 않는 ORM 대량 INSERT(insert().returning())로 추가한 개정본을 SQLite FTS 인덱스에 한 번에 반영합니다.
+    revisions는 (개정본 ID, 본문) 목록입니다. 다른 DB에서는 아무것도 하지 않습니다.
+    """
+    if connection.dialect.name != "sqlite" or not revisions:
+        return
+    connection.execute(text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :id"), [{"id": rid} for rid, _ in revisions])
+    connection.execute(
+        text(f"INSERT INTO {FTS_TABLE}(rowid, body) VALUES (:id, :body)"),
+        [{"id": rid, "body": to_ngrams(content)} for rid, content in revisions],
+    )
+
+
+def rebuild_fts_index(connection) -> int:
+    """SQLite FTS5 인덱스를 law_article_revisions 전체로부터 다시 만듭니다. 색인한 행 수를 반환합니다."""
+    connection.execute(text(f"DELETE FROM {FTS_TABLE}"))
+    rows = connection.execute(text("SELECT id, content FROM law_article_revisions")).all()
+    if rows:
+        connection.execute(
+            text(f"INSERT INTO {FTS_TABLE}(rowid, body) VALUES (:id, :body)"),
+            [{"id": row.id, "body": to_ngrams(row.content)} for row in rows],
+        )
+    return len(rows)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def ensure_fulltext_index(target, connection, **kw) -> None:
+    """
+    create_all 직후 전문 검색 인덱스를 만듭니다. 기존 DB에 처음 적용하거나
+    ORM을 거치지 않은 삽입으로 행 수가 어긋난 경우 SQLite FTS 인덱스를 다시 채웁니다.
+    """
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        connection.execute(text(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+            f"USING fts5(body, tokenize='unicode61 remove_diacritics 0')"
+        ))
+        indexed = connection.execute(text(f"SELECT count(*) FROM {FTS_TABLE}")).scalar()
+        total = connection.execute(text("SELECT count(*) FROM law_article_revisions")).scalar()
+        if indexed != total:
+            logger.info(f"Rebuilding article full-text index ({indexed} indexed / {total} revisions)")
+            rebuild_fts_index(connection)
+    elif dialect == "postgresql":
+        try:
+            with connection.begin_nested():
+                connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                connection.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS {TRGM_INDEX} "
+                    f"ON law_article_revisions USING gin (content gin_trgm_ops)"
+                ))
+        except Exception as e:
+            logger.warning(f"pg_trgm full-text index unavailable, falling back to LIKE scans: {e!r}")
+
+
+@event.listens_for(LawArticleRevision, "after_insert")
+def _index_inserted_revision(mapper, connection, target) -> None:
+    if connection.dialect.name == "sqlite":
+        _fts_upsert(connection, target.id, target.content)
+
+
+@event.listens_for(LawArticleRevision, "after_update")
+def _index_updated_revision(mapper, connection, target) -> None:
+    if connection.dialect.name == "sqlite" and attributes.get_history(target, "content").has_changes():
+        _fts_upsert(connection, target.id, target.content)
+
+
+@event.listens_for(LawArticleRevision, "after_delete")
+def _unindex_deleted_revision(mapper, connection, target) -> None:
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :id"), {"id": target.id})
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Date, Boolean, ForeignKey, Enum, Table
+from sqlalchemy import Column, Integer, String, Text, DateTime, Date, Boolean, ForeignKey, Enum, Table, LargeBinary
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 import enum
@@ -109,3 +109,96 @@ class ExplanationCache(Base):
     updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
 
     revision = relationship("LawArticleRevision", back_populates="explanation_caches")
+
+class Precedent(Base):
+    """판례 상세 캐시 (선고된 판례는 바뀌지 않으므로 판례일련번호 기준으로 계속 보관)"""
+    __tablename__ = "precedents"
+
+    id = Column(Integer, primary_key=True, index=True)
+    precedent_serial_no = Column(String(50), unique=True, index=True, nullable=False) # 판례일련번호
+    case_name = Column(Text, nullable=True)                         # 사건명
+    case_number = Column(String(255), nullable=True)                # 대법원 2020.01.01 선고 2019다1
+    summary = Column(Text, nullable=False)                          # 판결요지
+    fetched_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+class PrecedentQueryCache(Base):
+    """판례 검색어 → 검색 결과(판례일련번호 목록) 캐시 (TTL 적용)"""
+    __tablename__ = "precedent_query_caches"
+
+    id = Column(Integer, primary_key=True, index=True)
+    query = Column(String(500), unique=True, index=True, nullable=False)
+    precedent_serial_nos = Column(Text, nullable=False)             # JSON 배열 (API 응답 순서)
+    fetched_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+
+class LawMirror(Base):
+    """로컬 미러링된 법령의 동기화 상태 (조문 검색을 원격 API 대신 로컬 테이블에서 처리)"""
+    __tablename__ = "law_mirrors"
+
+    id = Column(Integer, primary_key=True, index=True)
+    law_id = Column(Integer, ForeignKey("laws.id"), unique=True, nullable=False)
+    source_law_id = Column(String(50), nullable=True)               # 국가법령정보센터 법령ID
+    source_effective_date = Column(Date, nullable=True)             # 원격 법령의 시행일자
+    article_count = Column(Integer, default=0)                      # 동기화된 조문 수
+    synced_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+
+    law = relationship("Law")
+
+class ParentDocument(Base):
+    """
+    인제스트 청크 원문 저장소 (부모 문서)
+    벡터 스토어에는 요약문만 임베딩하여 저장하고 원문은 청크 ID(parent_id)로 여기에 따로 보관합니다.
+    검색된 상위 k개 요약의 원문만 ID로 조회하여 답변 모델에 전달합니다.
+    """
+    __tablename__ = "parent_documents"
+
+    id = Column(String(64), primary_key=True)                      # 청크 키 (출처 + 쪽 + 원문 해시)
+    source = Column(String(500), nullable=True)                     # 원본 파일 경로
+    content = Column(Text, nullable=False)                          # 청크 원문
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+class IngestionJob(Base):
+    """
+    법령 PDF 인제스트 백그라운드 작업 (로컬 작업 큐)
+    업로드 요청은 작업만 등록하고 즉시 반환하며, 워커가 추출 → 조문 분리 → 저장 → 임베딩 단계를 실행합니다.
+    """
+    __tablename__ = "ingestion_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    law_id = Column(Integer, ForeignKey("laws.id"), nullable=False)
+    kind = Column(String(50), nullable=False, default="pdf_upload")
+    status = Column(String(20), index=True, nullable=False, default="queued")  # queued / running / succeeded / failed
+    filename = Column(String(255), nullable=True)
+    payload = Column(LargeBinary, nullable=True)                    # 업로드 원본 (완료 후 비움)
+    progress = Column(Integer, default=0)                           # 진행률 (%)
+    current_step = Column(String(50), nullable=True)
+    steps = Column(Text, nullable=True)                             # JSON 배열 [{name, status, seconds}]
+    result = Column(Text, nullable=True)                            # JSON (저장된 조문/임베딩 대상 개정본)
+    error = Column(Text, nullable=True)
+    attempts = Column(Integer, default=0)
+    max_attempts = Column(Integer, default=3)
+    next_attempt_at = Column(DateTime, nullable=True)               # 재시도 대기 중이면 다음 실행 시각
+    heartbeat_at = Column(DateTime, nullable=True)                  # 실행 중인 워커가 주기적으로 갱신 (끊기면 다시 큐로)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    law = relationship("Law")
+
+class EmbeddingOutbox(Base):
+    """
+    벡터 스토어 반영 대기열 (트랜잭셔널 아웃박스)
+    개정본을 저장하는 트랜잭션 안에서 함께 기록하므로, 프로세스가 재시작되거나 임베딩 호출이 실패해도
+    SQL에만 있고 벡터 스토어에는 없는 개정본이 생기지 않습니다. 워커가 묶어서 처리한 뒤 행을 삭제합니다.
+    """
+    __tablename__ = "embedding_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    revision_id = Column(Integer, ForeignKey("law_article_revisions.id"), index=True, nullable=False)
+    kind = Column(String(20), nullable=False, default="embed")     # embed(임베딩) / close(시행 종료 메타데이터만 갱신)
+    status = Column(String(20), index=True, nullable=False, default="pending")  # pending / processing / dead
+    attempts = Column(Integer, default=0)
+    next_attempt_at = Column(DateTime, nullable=True)               # 재시도 대기 중이면 다음 처리 시각
+    claimed_by = Column(String(32), nullable=True)                  # 처리 중인 워커 배치 토큰
+    claimed_at = Column(DateTime, nullable=True)                    # 처리 시작 시각 (임대 시간이 지나면 다시 대기열로)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
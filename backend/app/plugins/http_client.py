@@ -0,0 +1,100 @@
+"""
+법령/판례 Open API 공용 비동기 HTTP 클라이언트
+law.go.kr / data.go.kr 플러그인이 하나의 httpx.AsyncClient를 공유하여 Keep-Alive 커넥션을 재사용하고,
+호출마다 타임아웃을 적용하며, 동시에 나가는 요청 수를 세마포어로 제한합니다.
+"""
+import asyncio
+import logging
+
+import httpx
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class LawApiClient:
+    """
+    이벤트 루프별로 httpx.AsyncClient와 동시성 제한 세마포어를 보관하는 공용 클라이언트입니다.
+    httpx 커넥션 풀은 생성된 이벤트 루프에 묶이므로, 다른 루프(스크립트의 asyncio.run 반복 등)에서 호출되면 새로 만듭니다.
+    """
+
+    def __init__(self, timeout: float = 5.0, max_connections: int = 20, max_concurrency: int = 8):
+        """
+        Args:
+            timeout (float, optional): 요청 1건의 연결/읽기 타임아웃(초). Defaults to 5.0.
+            max_connections (int, optional): 커넥션 풀 최대 크기 (Keep-Alive 유지 수 포함). Defaults to 20.
+            max_concurrency (int, optional): 동시에 진행할 수 있는 최대 요청 수. Defaults to 8.
+        """
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_concurrency = max_concurrency
+        self._client: httpx.AsyncClient | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _ensure_client(self) -> tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        """현재 이벤트 루프에 맞는 클라이언트와 세마포어를 반환합니다 (없으면 생성)."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                follow_redirects=True,
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._client, self._semaphore
+
+    async def get_text(self, url: str, timeout: float | None = None) -> str:
+        """
+        GET 요청을 보내고 응답 본문을 UTF-8 문자열로 반환합니다.
+
+        Args:
+            url (str): 쿼리스트링까지 완성된 요청 URL (서비스 키가 이미 인코딩되어 있으므로 재인코딩하지 않음)
+            timeout (float | None, optional): 이 호출에만 적용할 타임아웃(초). 없으면 기본값 사용.
+
+        Returns:
+            str: 응답 본문
+
+        Raises:
+            httpx.HTTPError: 타임아웃, 연결 실패 또는 4xx/5xx 응답
+        """
+        client, semaphore = self._ensure_client()
+        async with semaphore:
+            response = await client.get(url, timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT)
+            response.raise_for_status()
+            return response.content.decode("utf-8")
+
+    async def aclose(self) -> None:
+        """현재 이벤트 루프의 클라이언트를 닫고 커넥션 풀을 정리합니다."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._semaphore = None
+        self._loop = None
+
+
+_client: LawApiClient | None = None
+
+
+def get_law_api_client() -> LawApiClient:
+    """설정값으로 생성한 공용 LawApiClient 싱글톤을 반환합니다."""
+    global _client
+    if _client is None:
+        settings = get_settings()
+        _client = LawApiClient(
+            timeout=settings.LAW_API_TIMEOUT_SECONDS,
+            max_connections=settings.LAW_API_MAX_CONNECTIONS,
+            max_concurrency=settings.LAW_API_MAX_CONCURRENCY,
+        )
+    return _client
+
+
+async def close_law_api_client() -> None:
+    """애플리케이션 종료 시 공용 클라이언트의 커넥션을 정리합니다."""
+    if _client is not None:
+        await _client.aclose()
@@ -1,9 +1,12 @@
+import asyncio
 import logging
-import urllib.request
 import urllib.parse
 import xml.etree.ElementTree as ET
 
+import httpx
+
 from app.core.config import get_settings
+from app.plugins.http_client import get_law_api_client
 
 logger = logging.getLogger(__name__)
 
@@ -11,83 +14,161 @@ API_KEY = get_settings().LAW_GO_KR_API_KEY
 if not API_KEY:
     logger.warning("LAW_GO_KR_API_KEY not set — law article search will not work.")
 
-def search_law_articles(law_name: str, keyword: str = "", limit: int = 3) -> list:
+
+async def _fetch_law_detail(law: ET.Element, root: ET.Element) -> ET.Element | None:
     """
-    국가법령정보센터 Open API를 사용하여 특정 법령(예: 근로기준법)의 내용을 검색하거나
-    키워드에 맞는 조문을 동적으로 추출합니다.
-    (law.go.kr 대신 스크린샷에 명시된 data.go.kr 엔드포인트 적용)
+    법령 목록의 한 항목에 대해 상세 XML(조문 전체)을 조회합니다.
+    상세링크가 없으면 None, 상세조회가 HTTP 오류로 실패하면 목록 XML을 반환합니다.
     """
+    # 법령 상세링크 추출 (data.go.kr 게이트웨이는 목록만 제공하므로 상세는 링크를 타고 들어감)
+    detail_link = law.findtext('법령상세링크')
+    if not detail_link:
+        return None
+
+    # 2. 법령 상세 조회 (제공된 링크에서 type을 XML로 변경)
+    detail_link = detail_link.replace('type=HTML', 'type=XML')
+    detail_url = f"{get_settings().LAW_GO_KR_BASE_URL}{detail_link}"
+
+    # 만약 상세조회 API 경로가 다를 수 있으므로 예외 처리
+    try:
+        detail_xml = await get_law_api_client().get_text(detail_url)
+        return ET.fromstring(detail_xml)
+    except (httpx.HTTPError, ET.ParseError) as e:
+        logger.warning(f"Law detail fetch failed for {detail_url}: {e!r}")
+        return root
+
+
+async def _search_law_list(law_name: str) -> ET.Element:
+    """법령정보 목록 조회 API를 호출하여 목록 XML의 루트 요소를 반환합니다."""
     encoded_law = urllib.parse.quote(law_name)
-    
+
     # 1. 법령 기본 정보 및 ID 조회 (스크린샷 NO 1: 법령정보 목록 조회 /lawSearchList.do)
-    base_url = "https://apis.data.go.kr/1170000/law"
+    base_url = get_settings().DATA_GO_KR_LAW_URL
     # 활용가이드 스크린샷에 명시된 필수 파라미터(numOfRows, pageNo) 추가
     search_url = f"{base_url}/lawSearchList.do?serviceKey={API_KEY}&target=law&type=XML&query={encoded_law}&numOfRows=5&pageNo=1"
-    
+    xml_data = await get_law_api_client().get_text(search_url)
+    return ET.fromstring(xml_data)
+
+
+def _article_number(jo: ET.Element) -> str:
+    """조문번호/조문가지번호를 '제36조', '제43조의2' 형식으로 변환합니다."""
+    number = (jo.findtext('조문번호') or '').strip()
+    branch = (jo.findtext('조문가지번호') or '').strip()
+    label = f"제{number}조"
+    if branch and branch != "0":
+        label += f"의{branch}"
+    return label
+
+
+def _article_text(jo: ET.Element) -> str:
+    """조문내용과 하위 항/호/목 내용을 문서 순서대로 합칩니다."""
+    parts = []
+    for node in jo.iter():
+        if node.tag in ('조문내용', '항내용', '호내용', '목내용') and node.text and node.text.strip():
+            parts.append(node.text.strip())
+    return "\n".join(parts)
+
+
+async def fetch_law_tree(law_name: str) -> dict | None:
+    """
+    로컬 미러 동기화용으로 법령 하나의 전체 조문 트리를 조회합니다.
+    목록 조회 결과 중 법령명이 정확히 일치하는 법령(없으면 첫 번째 법령)의 상세 XML에서
+    장/절 제목(조문여부='전문')을 제외한 모든 조문을 추출합니다. search_law_articles와 달리 오류를 그대로 전파합니다.
+
+    Args:
+        law_name (str): 미러링할 법령명 (예: 근로기준법)
+
+    Returns:
+        dict | None: 법령명/법령ID/시행일자/articles(조문번호, 조문제목, 조문내용 목록) 딕셔너리. 검색 결과가 없으면 None
+
+    Raises:
+        httpx.HTTPError, ET.ParseError: 목록 또는 상세 조회 실패
+    """
+    root = await _search_law_list(law_name)
+    laws = root.findall('.//law')
+    if not laws:
+        return None
+    law = next((l for l in laws if (l.findtext('법령명한글') or '').strip() == law_name), laws[0])
+
+    detail_link = law.findtext('법령상세링크')
+    if not detail_link:
+        return None
+    detail_url = f"{get_settings().LAW_GO_KR_BASE_URL}{detail_link.replace('type=HTML', 'type=XML')}"
+    detail_root = ET.fromstring(await get_law_api_client().get_text(detail_url))
+
+    articles = []
+    for jo in detail_root.findall('.//조문단위'):
+        if (jo.findtext('조문여부') or '조문').strip() != '조문':
+            continue
+        articles.append({
+            "조문번호": _article_number(jo),
+            "조문제목": (jo.findtext('조문제목') or '').strip(),
+            "조문내용": _article_text(jo),
+        })
+
+    return {
+        "법령명": (law.findtext('법령명한글') or law_name).strip(),
+        "법령ID": (law.findtext('법령ID') or '').strip(),
+        "시행일자": (law.findtext('시행일자') or detail_root.findtext('.//시행일자') or '').strip(),
+        "articles": articles,
+    }
+
+
+async def search_law_articles(law_name: str, keyword: str = "", limit: int = 3) -> list:
+    """
+    국가법령정보센터 Open API를 사용하여 특정 법령(예: 근로기준법)의 내용을 검색하거나
+    키워드에 맞는 조문을 동적으로 추출합니다.
+    (law.go.kr 대신 스크린샷에 명시된 data.go.kr 엔드포인트 적용)
+    검색된 법령들의 상세조회는 공용 HTTP 클라이언트로 동시에 요청하며, 결과는 목록 순서를 유지합니다.
+    """
     results = []
     try:
-        req = urllib.request.Request(search_url)
-        with urllib.request.urlopen(req) as response:
-            xml_data = response.read().decode('utf-8')
-            
-        root = ET.fromstring(xml_data)
-        
+        root = await _search_law_list(law_name)
+
         # 검색된 법령 중 상위 최대 3개까지의 본문을 순회합니다 (자주 나오는 법률, 시행령, 시행규칙 등 포괄)
         laws = root.findall('.//law')[:3]
         if not laws:
             return []
-            
-        for law in laws:
-            # 법령 상세링크 추출 (data.go.kr 게이트웨이는 목록만 제공하므로 상세는 링크를 타고 들어감)
-            detail_link = law.findtext('법령상세링크')
-            if not detail_link:
+
+        detail_roots = await asyncio.gather(*(_fetch_law_detail(law, root) for law in laws))
+
+        for law, detail_root in zip(laws, detail_roots):
+            if detail_root is None:
                 continue
-                
-            # 2. 법령 상세 조회 (제공된 링크에서 type을 XML로 변경)
-            detail_link = detail_link.replace('type=HTML', 'type=XML')
-            detail_url = f"https://www.law.go.kr{detail_link}"
-            
-            # 만약 상세조회 API 경로가 다를 수 있으므로 예외 처리
-            try:
-                with urllib.request.urlopen(detail_url) as detail_response:
-                    detail_xml = detail_response.read().decode('utf-8')
-                detail_root = ET.fromstring(detail_xml)
-            except urllib.error.HTTPError:
-                detail_root = root
 
             # 조문 태그(<조문단위>)를 순회하며 키워드가 포함된 조문 발췌
             jo_list = detail_root.findall('.//조문단위')
             law_results = []
-            
+
             for jo in jo_list:
                 jo_title = jo.findtext('조문제목', '')
                 jo_num = jo.findtext('조문번호', '')
                 jo_content = jo.findtext('조문내용', '')
-                
+
                 # 하위 항/권/호 텍스트들 합치기
                 hang_list = jo.findall('.//항내용')
                 ho_list = jo.findall('.//호내용')
-                
+
                 full_content = jo_content + "\n" + "\n".join([h.text for h in hang_list if h.text]) + "\n" + "\n".join([h.text for h in ho_list if h.text])
-                
+
                 if keyword and keyword not in full_content and keyword not in jo_title:
                     continue
-                    
+
                 law_results.append({
                     "법령명": law.findtext('법령명한글', law_name), # 실제 반환된 법령명 사용
                     "조문번호": jo_num,
                     "조문제목": jo_title,
                     "조문내용": full_content.strip()
                 })
-                
+
                 # 각 법령별로 limit(기본 30개 등)만큼만 발췌하여 부하 방지
                 if len(law_results) >= limit:
                     break
-            
+
             results.extend(law_results)
-                
+
     except Exception as e:
-        logger.error(f"Error fetching law info from DATA.GO.KR: {e}")
+        logger.error(f"Error fetching law info from DATA.GO.KR: {e!r}")
         # API 인증 대기(1~2시간) 혹은 네트워크 오류 시 Fallback
         results.append({
             "법령명": law_name,
@@ -95,5 +176,5 @@ def search_law_articles(law_name: str, keyword: str = "", limit: int = 3) -> lis
             "조문제목": "조문 확인 불가 (데이터포털 연동 중)",
             "조문내용": f"공공데이터포털 API 연동 중 오류 발생: {e}"
         })
-        
+
     return results
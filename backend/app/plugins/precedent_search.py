@@ -1,9 +1,12 @@
+import asyncio
 import logging
-import urllib.request
 import urllib.parse
 import xml.etree.ElementTree as ET
 
+import httpx
+
 from app.core.config import get_settings
+from app.plugins.http_client import get_law_api_client
 
 logger = logging.getLogger(__name__)
 
@@ -11,77 +14,111 @@ API_KEY = get_settings().LAW_GO_KR_API_KEY
 if not API_KEY:
     logger.warning("LAW_GO_KR_API_KEY not set — precedent search will not work.")
 
-def search_precedents(keywords: list) -> list:
+# API 인증 대기(1~2시간) 혹은 네트워크 오류 시 Fallback
+FALLBACK_RESULT = {
+    "사건명": "관련 판례를 일시적으로 불러올 수 없습니다.",
+    "사건번호": "-",
+    "판결요지": "현재 공공데이터포털(법원 판례) 서버와의 통신 지연으로 인해 일시적으로 유사 판례를 제공할 수 없습니다. 일반적인 법리적 해석을 바탕으로 판단해 주십시오."
+}
+
+
+def build_precedent_query(keywords: list) -> str:
+    """키워드 목록을 판례 검색 API의 검색어(및 검색 결과 캐시 키)로 변환합니다."""
+    return " ".join(k.strip() for k in keywords if k and k.strip())
+
+
+async def search_precedent_list(keywords: list) -> list[dict]:
+    """
+    판례 목록 API만 호출하여 각 판례의 일련번호, 사건 정보, 상세조회 URL을 반환합니다.
+    (상세조회는 fetch_precedent_summary로 별도 수행하므로, 캐시된 판례는 상세조회를 생략할 수 있습니다.)
+
+    Returns:
+        list[dict]: 판례일련번호/사건명/사건번호/detail_url 키를 가진 목록 (API 응답 순서)
+
+    Raises:
+        httpx.HTTPError, ET.ParseError: 목록 조회 실패
+    """
+    encoded_query = urllib.parse.quote(build_precedent_query(keywords))
+
+    # data.go.kr 법령 API는 target=law (공공데이터포털) 만 지원하므로
+    # 판례 검색은 기존 법제처 DRF API (sapphire_5 퍼블릭 아이디 사용)로 우회합니다.
+    law_go_kr = get_settings().LAW_GO_KR_BASE_URL
+    base_url = f"{law_go_kr}/DRF"
+
+    # 판례(prec) 호출
+    search_url = f"{base_url}/lawSearch.do?OC=sapphire_5&target=prec&type=XML&query={encoded_query}&display=3"
+    xml_data = await get_law_api_client().get_text(search_url)
+    root = ET.fromstring(xml_data)
+
+    items = []
+    for prec in root.findall('.//prec'):
+        prec_no = prec.findtext('판례일련번호')
+        court = prec.findtext('선고국가')
+        if not court:
+            court = prec.findtext('선고법원')
+        date = prec.findtext('선고일자')
+
+        # 상세조회 API (목록에 없을 경우 본문 활용)
+        detail_link = prec.findtext('판례상세링크')
+        if detail_link:
+            detail_link = detail_link.replace('type=HTML', 'type=XML')
+            detail_url = f"{law_go_kr}{detail_link}"
+        else:
+            detail_url = f"{base_url}/lawService.do?OC=sapphire_5&target=prec&ID={prec_no}&type=XML"
+
+        items.append({
+            "판례일련번호": prec_no,
+            "사건명": prec.findtext('사건명'),
+            "사건번호": f"{court} {date} 선고 {prec.findtext('사건번호')}",
+            "detail_url": detail_url,
+        })
+    return items
+
+
+async def fetch_precedent_summary(item: dict) -> str | None:
+    """
+    판례 상세조회 API를 호출하여 판결요지(없으면 판례내용)를 1000자 이내로 반환합니다.
+    상세조회가 실패하면 None을 반환하여, 호출 측이 해당 항목만 대체 문구로 처리하게 합니다.
+    """
+    try:
+        detail_xml = await get_law_api_client().get_text(item["detail_url"])
+        detail_root = ET.fromstring(detail_xml)
+    except (httpx.HTTPError, ET.ParseError) as e:
+        logger.warning(f"Precedent detail fetch failed for {item['판례일련번호']}: {e!r}")
+        return None
+
+    prec_info = detail_root.findtext('.//판결요지', '')
+    if not prec_info or prec_info.strip() == "":
+        prec_info = detail_root.findtext('.//판례내용', '')
+
+    if prec_info and len(prec_info) > 1000:
+        prec_info = prec_info[:1000] + "...(중략)"
+    return prec_info.strip() if prec_info else ""
+
+
+def format_precedent(item: dict, summary: str | None) -> dict:
+    """판례 목록 항목과 판결요지를 플러그인 결과 형식으로 조합합니다."""
+    return {
+        "사건명": item["사건명"],
+        "사건번호": item["사건번호"],
+        "판결요지": summary or "내용 없음"
+    }
+
+
+async def search_precedents(keywords: list) -> list:
     """
     국가법령정보센터(LAW.GO.KR) Open API를 활용하여 실제 판례/법령해석례를 검색합니다.
     (law.go.kr 대신 스크린샷에 명시된 data.go.kr 엔드포인트 적용)
+    목록 조회 후 각 판례의 상세조회는 공용 HTTP 클라이언트로 동시에 요청하며, 결과는 목록 순서를 유지합니다.
+    캐시를 거치는 검색은 app.services.precedent_cache.PrecedentCache를 사용하세요.
     """
     if not keywords:
         return []
-    
-    query = " ".join(keywords)
-    encoded_query = urllib.parse.quote(query)
-    
-    # data.go.kr 법령 API는 target=law (공공데이터포털) 만 지원하므로 
-    # 판례 검색은 기존 법제처 DRF API (sapphire_5 퍼블릭 아이디 사용)로 우회합니다.
-    base_url = "https://www.law.go.kr/DRF"
-    
-    # 판례(prec) 호출
-    search_url = f"{base_url}/lawSearch.do?OC=sapphire_5&target=prec&type=XML&query={encoded_query}&display=3"
-    
-    results = []
+
     try:
-        req = urllib.request.Request(search_url)
-        with urllib.request.urlopen(req) as response:
-            xml_data = response.read().decode('utf-8')
-            
-        root = ET.fromstring(xml_data)
-        
-        for prec in root.findall('.//prec'):
-            prec_no = prec.findtext('판례일련번호')
-            case_name = prec.findtext('사건명')
-            case_no = prec.findtext('사건번호')
-            court = prec.findtext('선고국가') 
-            if not court:
-                court = prec.findtext('선고법원')
-            date = prec.findtext('선고일자')
-            
-            # 상세조회 API (목록에 없을 경우 본문 활용)
-            detail_link = prec.findtext('판례상세링크')
-            
-            if detail_link:
-                detail_link = detail_link.replace('type=HTML', 'type=XML')
-                detail_url = f"https://www.law.go.kr{detail_link}"
-            else:
-                detail_url = f"{base_url}/lawService.do?OC=sapphire_5&target=prec&ID={prec_no}&type=XML"
-            
-            try:
-                with urllib.request.urlopen(detail_url) as detail_response:
-                    detail_xml = detail_response.read().decode('utf-8')
-                detail_root = ET.fromstring(detail_xml)
-            except urllib.error.HTTPError:
-                detail_root = root # Fallback
-            
-            prec_info = detail_root.findtext('.//판결요지', '')
-            if not prec_info or prec_info.strip() == "":
-                prec_info = detail_root.findtext('.//판례내용', '')
-                
-            if prec_info and len(prec_info) > 1000:
-                prec_info = prec_info[:1000] + "...(중략)"
-                
-            results.append({
-                "사건명": case_name,
-                "사건번호": f"{court} {date} 선고 {case_no}",
-                "판결요지": prec_info.strip() if prec_info else "내용 없음"
-            })
-            
+        items = await search_precedent_list(keywords)
+        summaries = await asyncio.gather(*(fetch_precedent_summary(item) for item in items))
+        return [format_precedent(item, summary) for item, summary in zip(items, summaries)]
     except Exception as e:
-        logger.error(f"Error fetching precedent from DATA.GO.KR: {e}")
-        # API 인증 대기(1~2시간) 혹은 네트워크 오류 시 Fallback
-        results.append({
-            "사건명": "관련 판례를 일시적으로 불러올 수 없습니다.",
-            "사건번호": "-",
-            "판결요지": "현재 공공데이터포털(법원 판례) 서버와의 통신 지연으로 인해 일시적으로 유사 판례를 제공할 수 없습니다. 일반적인 법리적 해석을 바탕으로 판단해 주십시오."
-        })
-            
-    return results
+        logger.error(f"Error fetching precedent from DATA.GO.KR: {e!r}")
+        return [dict(FALLBACK_RESULT)]
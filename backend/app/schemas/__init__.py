@@ -1,6 +1,6 @@
 from pydantic import BaseModel, EmailStr
 from typing import Optional, List
-from datetime import datetime
+from datetime import date, datetime
 
 # --- User Schemas ---
 class UserBase(BaseModel):
@@ -70,6 +70,7 @@ class CheckRequest(BaseModel):
     session_id: Optional[int] = None
     options: Optional[dict] = None
     image_data: Optional[str] = None # Base64 encoded image
+    as_of: Optional[date] = None # 기준일 (이 날짜에 시행 중인 조문으로 판단, 생략 시 오늘)
 
 # --- Law Models Export ---
 from .law import (
@@ -1,9 +1,13 @@
+import logging
+
 from pydantic import BaseModel, Field
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from app.services.hook_service import IntentResult
 from app.core.llm import get_main_llm
 
+logger = logging.getLogger(__name__)
+
 class AgentAction(BaseModel):
     """
     사용자의 질문 의도와 키워드 정보를 바탕으로, 이 질문에 대답하기 위해 어떤 외부 도구/플러그인이 필요한지 결정하는 에이전트
@@ -14,6 +18,11 @@ class AgentAction(BaseModel):
     requires_clarification: bool = Field(description="사용자의 질문이 너무 모호하거나 사실관계 판단을 위한 핵심 정보가 누락되어 되물어야 하는가?")
     reasoning: str = Field(description="위 도구들의 사용 필요성 여부를 결정한 논리적인 이유")
 
+class FusedDecision(BaseModel):
+    """의도 분석(Input Hook)과 도구 결정(Agent)을 한 번의 호출로 반환하는 통합 스키마"""
+    intent: IntentResult = Field(description="사용자 질문의 의도 분석 결과")
+    action: AgentAction = Field(description="의도 분석 결과를 바탕으로 결정한 도구 사용 여부")
+
 class RoutingAgent:
     """
     사용자의 질문에 답변하기 위해 어떤 외부 도구/플러그인(법령 검색, 판례 검색, 계산기 등)이
@@ -59,16 +68,17 @@ class RoutingAgent:
             recent_history = chat_history[-5:]
             user_message_content += f"\n\n이전 대화 맥락(History): {recent_history}"
 
+        # 의도 분석 딕셔너리의 중괄호가 템플릿 변수로 해석되지 않도록 변수로 전달
         prompt = ChatPromptTemplate.from_messages([
             ("system", system_prompt),
-            ("user", user_message_content)
+            ("user", "{content}")
         ])
 
         chain = prompt | self.llm | self.parser
         
         try:
             result = await chain.ainvoke({
-                "intent_data": str(intent_data),
+                "content": user_message_content,
                 "format_instructions": self.parser.get_format_instructions()
             })
             return result
@@ -81,3 +91,59 @@ class RoutingAgent:
                 "requires_clarification": False,
                 "reasoning": "분석 오류 발생. 기본적으로 법령 검색만 수행합니다."
             }
+
+    async def analyze_and_decide(self, query: str, chat_history: list[dict] = None) -> tuple[dict, dict]:
+        """
+        의도 분석과 도구 결정을 단일 구조화 호출(Fused mode)로 수행합니다.
+        반환되는 두 딕셔너리는 InputAnalyzer.analyze_query / decide_action의 결과와 동일한 키를 가지므로
+        build_plugin_context, 역질문 분기 등 하위 로직을 그대로 사용할 수 있습니다.
+
+        Args:
+            query (str): 사용자의 원본 텍스트
+            chat_history (list[dict], optional): 이전 대화 내역. Defaults to None.
+
+        Returns:
+            tuple[dict, dict]: IntentResult 형태의 의도 분석 결과와 AgentAction 형태의 도구 결정 결과
+
+        Raises:
+            Exception: LLM 호출 또는 파싱 실패 시 (호출 측에서 2단계 경로로 폴백)
+        """
+        system_prompt = """당신은 법률 팩트체커 시스템의 '의도 분석 및 도구 결정' 단계를 한 번에 수행하는 분석기입니다.
+사용자의 입력을 분석하여 intent(의도 분석)와 action(도구 결정)을 함께 반환하세요.
+
+**intent 작성 규칙:**
+1. 감정적 표현은 제거하고 사실 관계와 핵심 질문만 추출하세요.
+2. 법률 기반의 팩트체크가 필요한 질문인지, 단순한 인사말/장난인지 구분하세요 (`is_legal_question`).
+3. 일반적인 '정보 요청'인지, 자신의 특수한 상황에 대한 '상담 요청'인지 파악하세요 (`is_counseling_request`).
+4. 적용 법 영역(예: 근로기준법, 남녀고용평등법 등)을 기재하고, 확실하지 않으면 '알 수 없음'으로 기재하세요.
+5. 법령 DB나 판례 검색에 사용할 핵심 명사형 키워드를 2~5개 추출하세요.
+
+**action 결정 규칙:**
+1. requires_law_db_search: 법률 질문이면 True, 법률과 무관하면 False.
+2. requires_precedent_search: '부당해고', '직장내 괴롭힘' 등 실제 판정 사례를 참고해야 하면 True. 단순한 법령 문의는 False.
+3. requires_calculator: 수당, 퇴직금, 월급 등 금액 계산이 들어가는 질문이면 True.
+4. requires_clarification: 기간, 사업장 규모 등 필수 요건이 심각하게 누락되어 팩트체크가 불가능하면 True.
+   *중요*: 이전 대화 맥락(History)에서 이미 핵심 정보를 제공했다면 False로 설정하세요.
+
+반드시 아래의 지시사항에 따라 JSON 형태로만 응답하세요.
+
+{format_instructions}
+"""
+        user_message_content = f"사용자 입력: {query}"
+        if chat_history:
+            user_message_content += f"\n\n이전 대화 맥락(History): {chat_history[-5:]}"
+
+        prompt = ChatPromptTemplate.from_messages([
+            ("system", system_prompt),
+            ("user", "{content}")
+        ])
+        parser = JsonOutputParser(pydantic_object=FusedDecision)
+        chain = prompt | self.llm | parser
+
+        result = await chain.ainvoke({
+            "content": user_message_content,
+            "format_instructions": parser.get_format_instructions()
+        })
+        intent = {key: result["intent"][key] for key in IntentResult.model_fields}
+        action = {key: result["action"][key] for key in AgentAction.model_fields}
+        return intent, action
@@ -0,0 +1,185 @@
+"""
+시맨틱 답변 캐시 모듈
+표현만 다른 동일한 질문("월급 2개월 안 줘도 되나" 등)에 대해 전체 팩트체크 파이프라인을 다시 실행하지 않도록,
+질의 임베딩의 코사인 유사도를 기준으로 최종 답변을 재사용합니다.
+대화 맥락(History)이 없는 단발성 질문에만 적용되며, 답변이 인용한 조문 리비전이 수정/삭제되면 해당 항목을 무효화합니다.
+"""
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+from sqlalchemy import event
+from sqlalchemy.orm import object_session
+
+from app.models import LawArticleRevision
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticAnswerCache:
+    """
+    질의 임베딩 기반의 LRU/TTL 답변 캐시입니다.
+    관리자 API(스레드풀)와 이벤트 루프에서 동시에 접근할 수 있으므로 내부 상태는 Lock으로 보호합니다.
+    """
+
+    def __init__(self, embeddings, threshold: float = 0.95, max_entries: int = 512, ttl_seconds: int = 86400):
+        """
+        Args:
+            embeddings: 질의 임베딩에 사용할 LangChain Embeddings 객체 (aembed_query 지원)
+            threshold (float, optional): 캐시 적중으로 판단할 최소 코사인 유사도. Defaults to 0.95.
+            max_entries (int, optional): 최대 보관 항목 수. 초과 시 가장 오래 사용되지 않은 항목부터 제거합니다.
+            ttl_seconds (int, optional): 항목 유효 시간(초). Defaults to 86400.
+        """
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: OrderedDict[int, dict] = OrderedDict()
+        self._next_id = 1
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "invalidations": 0}
+
+    async def embed(self, query: str) -> np.ndarray:
+        """질의를 임베딩하여 L2 정규화된 벡터로 반환합니다."""
+        vector = np.asarray(await self.embeddings.aembed_query(query), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    async def lookup(self, query: str) -> dict:
+        """
+        질의와 가장 유사한 유효 캐시 항목을 찾습니다.
+
+        Args:
+            query (str): 사용자의 원본 질문
+
+        Returns:
+            dict: 적중 시 캐시된 응답 사본(response)과 유사도(similarity), 그리고 이후 store()에 재사용할 질의 임베딩(embedding)
+        """
+        vector = await self.embed(query)
+        with self._lock:
+            self._expire()
+            best_id, best_score = None, -1.0
+            for entry_id, entry in self._entries.items():
+                score = float(np.dot(entry["embedding"], vector))
+                if score > best_score:
+                    best_id, best_score = entry_id, score
+
+            if best_id is not None and best_score >= self.threshold:
+                entry = self._entries[best_id]
+                self._entries.move_to_end(best_id)
+                entry["hits"] += 1
+                self._counters["hits"] += 1
+                return {
+                    "response": copy.deepcopy(entry["response"]),
+                    "similarity": round(best_score, 4),
+                    "embedding": vector,
+                }
+
+            self._counters["misses"] += 1
+            return {"response": None, "similarity": None, "embedding": vector}
+
+    def store(self, query: str, embedding: np.ndarray, response: dict, revision_ids: list[int]) -> None:
+        """
+        파이프라인이 생성한 최종 응답을 캐시에 저장합니다.
+
+        Args:
+            query (str): 사용자의 원본 질문
+            embedding (np.ndarray): lookup()에서 계산한 정규화된 질의 임베딩
+            response (dict): 캐시할 응답 (result, sources, revision_ids, intent_analysis, agent_decision)
+            revision_ids (list[int]): 응답이 인용한 조문 리비전 ID 목록 (무효화 기준)
+        """
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = {
+                "query": query,
+                "embedding": embedding,
+                "response": copy.deepcopy(response),
+                "revision_ids": {int(rid) for rid in revision_ids if rid is not None},
+                "created_at": time.time(),
+                "hits": 0,
+            }
+            self._counters["stores"] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def invalidate_revisions(self, revision_ids: list[int]) -> int:
+        """주어진 리비전 중 하나라도 인용한 캐시 항목을 제거하고, 제거된 항목 수를 반환합니다."""
+        targets = set(revision_ids)
+        with self._lock:
+            stale = [eid for eid, entry in self._entries.items() if entry["revision_ids"] & targets]
+            for eid in stale:
+                del self._entries[eid]
+            self._counters["invalidations"] += len(stale)
+        if stale:
+            logger.info(f"Invalidated {len(stale)} cached answers for revisions {sorted(targets)}")
+        return len(stale)
+
+    def flush(self) -> int:
+        """모든 캐시 항목을 제거하고, 제거된 항목 수를 반환합니다."""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+        return count
+
+    def stats(self) -> dict:
+        """적중률 등 캐시 카운터와 현재 설정값을 반환합니다."""
+        with self._lock:
+            self._expire()
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                **self._counters,
+                "size": len(self._entries),
+                "hit_rate": round(self._counters["hits"] / lookups, 4) if lookups else 0.0,
+                "threshold": self.threshold,
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+    def entries(self) -> list[dict]:
+        """관리자 점검용으로 캐시 항목 요약 목록(최근 사용 순)을 반환합니다."""
+        with self._lock:
+            return [
+                {
+                    "id": eid,
+                    "query": entry["query"],
+                    "verdict": entry["response"].get("result", {}).get("verdict"),
+                    "revision_ids": sorted(entry["revision_ids"]),
+                    "hits": entry["hits"],
+                    "age_seconds": round(time.time() - entry["created_at"], 1),
+                }
+                for eid, entry in reversed(self._entries.items())
+            ]
+
+    def _expire(self) -> None:
+        """TTL이 지난 항목을 제거합니다. 호출자가 Lock을 잡고 있어야 합니다."""
+        deadline = time.time() - self.ttl_seconds
+        expired = [eid for eid, entry in self._entries.items() if entry["created_at"] < deadline]
+        for eid in expired:
+            del self._entries[eid]
+        self._counters["evictions"] += len(expired)
+
+
+def register_revision_invalidation(cache: SemanticAnswerCache) -> None:
+    """
+    LawArticleRevision 행이 ORM을 통해 수정/삭제될 때 해당 리비전을 인용한 캐시 항목을 무효화하도록
+    SQLAlchemy 매퍼 이벤트를 등록합니다.
+    """
+
+    def _invalidate(mapper, connection, target) -> None:
+        if target.id is not None:
+            cache.invalidate_revisions([target.id])
+
+    def _invalidate_on_change(mapper, connection, target) -> None:
+        # ClaimCheck 연결(claim_checks 컬렉션) 변경만으로도 after_update가 호출되므로 실제 컬럼 변경만 반영
+        session = object_session(target)
+        if session is None or session.is_modified(target, include_collections=False):
+            _invalidate(mapper, connection, target)
+
+    event.listen(LawArticleRevision, "after_update", _invalidate_on_change)
+    event.listen(LawArticleRevision, "after_delete", _invalidate)
@@ -0,0 +1,208 @@
+"""
+조문 검색 서비스 (/search/articles)
+로컬 미러(LawMirror)에 등록된 법령은 로컬 테이블에서 바로 응답하고,
+미러링되지 않은 법령명 검색만 국가법령정보센터 API를 호출합니다.
+"""
+import html
+import logging
+import re
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from app.models import Law, LawArticle, LawArticleRevision, LawMirror
+from app.models.fulltext import build_search_statement, search_terms
+from app.plugins.law_db import search_law_articles
+
+logger = logging.getLogger(__name__)
+
+# "근로기준법 제36조", "제43조의2" 등에서 조문번호를 추출
+ARTICLE_NUMBER_PATTERN = re.compile(r"제\s*(\d+)\s*조(?:\s*의\s*(\d+))?")
+# 법령명으로 보이는 검색어 (미러에 없는 법령이면 원격 API로 조회)
+LAW_NAME_PATTERN = re.compile(r"(법|법률|령|규칙)$")
+
+
+def highlight(content: str, terms: list[str], width: int = 160, tag: str = "mark") -> str:
+    """
+    본문에서 첫 번째로 일치하는 검색어 주변을 잘라내고, 일치 구간을 <mark> 태그로 감쌉니다.
+    (본문은 HTML 이스케이프하므로 프론트엔드에서 그대로 렌더링해도 안전합니다.)
+    """
+    suffix = "..." if len(content) > width else ""
+    if not terms:
+        return html.escape(content[:width]) + suffix
+    pattern = re.compile("|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+    match = pattern.search(content)
+    start = max(0, match.start() - width // 4) if match else 0
+    snippet = content[start:start + width]
+
+    parts, last = [], 0
+    for found in pattern.finditer(snippet):
+        parts.append(html.escape(snippet[last:found.start()]))
+        parts.append(f"<{tag}>{html.escape(found.group())}</{tag}>")
+        last = found.end()
+    parts.append(html.escape(snippet[last:]))
+
+    prefix = "..." if start > 0 else ""
+    suffix = "..." if start + width < len(content) else ""
+    return prefix + "".join(parts) + suffix
+
+
+def _preview(title: str | None, content: str, limit: int = 500) -> str:
+    text = f"[{title}] {content}" if title else content
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+class ArticleSearchService:
+    """로컬 우선 조문 검색을 담당합니다. 요청의 AsyncSession을 받아 사용합니다."""
+
+    def __init__(self, limit: int = 50):
+        """
+        Args:
+            limit (int, optional): 한 번에 반환할 최대 조문 수. Defaults to 50.
+        """
+        self.limit = limit
+
+    async def search(self, db: AsyncSession, query: str) -> dict:
+        """
+        검색어를 로컬 미러 → (키워드인 경우) 로컬 본문 검색 → 원격 API → 로컬 본문 검색 순으로 처리합니다.
+
+        Args:
+            db (AsyncSession): 요청 DB 세션
+            query (str): 법령명(+조문번호) 또는 본문 키워드
+
+        Returns:
+            dict: results(law_name/article_number/content/revision_id 목록, 본문 검색은 highlight/score 포함)와
+                  응답 출처 source(mirror/api/local)
+        """
+        query = query.strip()
+        law = await self._find_mirrored_law(db, query)
+        if law is not None:
+            return {"results": await self._list_articles(db, law, query), "source": "mirror"}
+
+        # 법령명이 아닌 키워드는 로컬 본문에서 먼저 찾고, 결과가 없을 때만 원격 API로 넘어감
+        if not LAW_NAME_PATTERN.search(query.split()[0] if query else ""):
+            local_results = await self._search_content(db, query)
+            if local_results:
+                return {"results": local_results, "source": "local"}
+
+        api_results = await self._search_remote(query)
+        if api_results:
+            return {"results": api_results, "source": "api"}
+        return {"results": await self._search_content(db, query), "source": "local"}
+
+    async def _search_remote(self, query: str) -> list[dict]:
+        """미러링되지 않은 법령을 원격 API로 조회합니다. API 오류 시 빈 목록을 반환합니다."""
+        api_results = await search_law_articles(law_name=query, keyword="", limit=self.limit)
+        if len(api_results) == 1 and api_results[0].get("조문번호") == "-":
+            return []
+        return self._format_api_results(api_results)
+
+    async def _find_mirrored_law(self, db: AsyncSession, query: str) -> Law | None:
+        """검색어에 법령명(또는 약칭)이 포함되거나 검색어가 법령명의 일부인 미러링 법령을 찾습니다."""
+        if not query:
+            return None
+        laws = (await db.scalars(select(Law).join(LawMirror, LawMirror.law_id == Law.id))).all()
+        # 긴 이름을 먼저 비교하여 "근로기준법 시행령"이 "근로기준법"보다 우선하도록 함
+        for law in sorted(laws, key=lambda l: len(l.name), reverse=True):
+            names = [law.name] + ([law.short_name] if law.short_name else [])
+            if any(name in query for name in names) or query in law.name:
+                return law
+        return None
+
+    async def _list_articles(self, db: AsyncSession, law: Law, query: str) -> list[dict]:
+        """미러링 법령의 현행 조문을 조문 순서대로 반환합니다. 검색어에 조문번호가 있으면 해당 조문만 반환합니다."""
+        stmt = (
+            select(LawArticleRevision)
+            .join(LawArticle)
+            .options(joinedload(LawArticleRevision.article))
+            .where(
+                LawArticle.law_id == law.id,
+                LawArticle.is_active.is_(True),
+                LawArticleRevision.effective_end_date.is_(None),
+            )
+            .order_by(LawArticle.id)
+        )
+        match = ARTICLE_NUMBER_PATTERN.search(query)
+        if match:
+            number = f"제{match.group(1)}조" + (f"의{match.group(2)}" if match.group(2) else "")
+            stmt = stmt.where(LawArticle.article_number == number)
+
+        revisions = (await db.scalars(stmt.limit(self.limit))).all()
+        return [
+            {
+                "law_name": law.name,
+                "article_number": rev.article.article_number,
+                "content": _preview(rev.article.title, rev.content),
+                "revision_id": rev.id,
+            }
+            for rev in revisions
+        ]
+
+    async def _search_content(self, db: AsyncSession, query: str) -> list[dict]:
+        """
+        현행 개정본 본문에서 키워드를 검색합니다. 전문 검색 인덱스(SQLite FTS5 / Postgres pg_trgm)로
+        관련도 순 정렬하고, 인덱스를 쓸 수 없는 DB/검색어는 LIKE 검색으로 대체합니다.
+        """
+        scores = await self._fulltext_scores(db, query)
+        stmt = (
+            select(LawArticleRevision)
+            # N+1 쿼리 해결: joinedload로 연관 엔티티를 미리 로드
+            .options(
+                joinedload(LawArticleRevision.article).joinedload(LawArticle.law)
+            )
+        )
+        if scores is None:
+            stmt = stmt.where(
+                LawArticleRevision.content.ilike(f"%{query}%"),
+                LawArticleRevision.effective_end_date.is_(None),
+            ).limit(self.limit)
+        elif not scores:
+            return []
+        else:
+            stmt = stmt.where(LawArticleRevision.id.in_(list(scores)))
+        revisions = (await db.scalars(stmt)).unique().all()
+        if scores is not None:
+            revisions = sorted(revisions, key=lambda rev: scores[rev.id], reverse=True)
+
+        terms = search_terms(query)
+        results = []
+        for rev in revisions:
+            article = rev.article
+            law = article.law if article else None
+            results.append({
+                "law_name": law.name if law else "Unknown",
+                "article_number": article.article_number if article else "Unknown",
+                "content": _preview(None, rev.content, 200),
+                "highlight": highlight(rev.content, terms),
+                "score": round(scores[rev.id], 4) if scores is not None else None,
+                "revision_id": rev.id
+            })
+        return results
+
+    async def _fulltext_scores(self, db: AsyncSession, query: str) -> dict[int, float] | None:
+        """전문 검색 인덱스로 개정본 ID → 관련도 점수를 구합니다. 인덱스를 쓸 수 없으면 None"""
+        stmt = build_search_statement(db.get_bind().dialect.name, query, self.limit)
+        if stmt is None:
+            return None
+        try:
+            rows = (await db.execute(stmt)).all()
+        except SQLAlchemyError as e:
+            # FTS 테이블/pg_trgm 확장이 없는 DB 등
+            logger.warning(f"Full-text article search failed, falling back to LIKE: {e!r}")
+            await db.rollback()
+            return None
+        return {row.id: float(row.score or 0.0) for row in rows}
+
+    @staticmethod
+    def _format_api_results(api_results: list[dict]) -> list[dict]:
+        return [
+            {
+                "law_name": res["법령명"],
+                "article_number": res["조문번호"],
+                "content": _preview(res["조문제목"], res["조문내용"]),
+                "revision_id": f"api_{idx}"
+            }
+            for idx, res in enumerate(api_results)
+        ]
@@ -0,0 +1,214 @@
+"""
+규칙 기반 조문 분리기
+국가법령정보센터 PDF에서 추출한 법령 텍스트를 줄 단위로 한 번만 훑어(선형 시간) 제N조 / 제N조의M 단위로 나눕니다.
+ArticleSplitter는 쪽 텍스트를 추출되는 대로 받아 처리하므로 PDF 추출이 끝나기 전에 분리를 시작할 수 있습니다.
+- 조 제목줄: "제N조(제목) 본문", "제N조의M(제목) 본문", 삭제된 조 "제N조 삭제 <2019. 1. 15.>"
+- 항(①②…)·호(1. 2. …)·목(가. 나. …) 줄은 해당 조의 본문에 그대로 이어 붙임
+- 쪽 머리글("법제처 N 국가법령정보센터" + 법령명), 장/절 제목줄, 법령 머리말은 제거
+- "부칙 <제20520호,...>" 이후의 조문은 부칙 조문으로 구분 (번호가 제1조부터 다시 시작)
+- 시행 예정 개정문이 같은 조 번호로 한 번 더 실린 경우("[시행일: 2025. 10. 23.] 제37조"),
+  기준일에 시행 중인 판을 고름
+규칙으로 나눌 수 없는 구간(조 제목줄이 전혀 없거나, 조 번호가 건너뛰어 제목줄이 깨진 것으로 보이는 구간)은
+분리하지 않고 따로 돌려주어 호출 측에서 LLM으로 처리하도록 합니다.
+"""
+import re
+from datetime import date
+
+ARTICLE_HEADING = re.compile(
+    r"^제\s*(?P<number>\d+)\s*조(?:\s*의\s*(?P<branch>\d+))?"
+    r"(?:\s*\((?P<title>[^\n]*?)\)(?=\s|$)|\s*(?P<deleted>삭제)\b)"
+)
+SUPPLEMENTARY_HEADING = re.compile(r"^부\s*칙\s*(?:<(?P<label>[^>]*)>)?\s*(?:\([^)]*\))?$")
+STRUCTURE_HEADING = re.compile(r"^제\s*\d+\s*(?:편|장|절|관)(?:\s*의\s*\d+)?\s+\S[^.。]{0,60}$")
+PAGE_HEADER = re.compile(r"^법제처\s+\d+\s+국가법령정보센터$")
+LAW_EFFECTIVE_DATE = re.compile(r"^\[시행\s+(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.?\]")
+EFFECTIVE_MARKER = re.compile(r"^\[시행일\s*:\s*(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.?\]")
+ARTICLE_NUMBER = re.compile(r"제\s*(\d+)\s*조(?:\s*의\s*(\d+))?")
+PARAGRAPH_MARK = re.compile(r"^[\u2460-\u2473]")  # 항 번호 ①~⑳
+
+
+def article_sort_key(article_number: str) -> tuple:
+    """"제43조의2" → (0, 43, 2). 부칙 조문은 본칙 뒤, 번호를 해석할 수 없으면 맨 뒤로 정렬"""
+    match = ARTICLE_NUMBER.search(article_number)
+    if not match:
+        return (2, 0, 0, article_number)
+    section = 1 if article_number.startswith("부칙") else 0
+    return (section, int(match.group(1)), int(match.group(2) or 0), article_number)
+
+
+def _select_versions(versions: list[dict], as_of: date) -> dict:
+    """같은 조 번호로 실린 판들 중 as_of에 시행 중인 마지막 판을 고릅니다 (시행일 표시가 없는 판은 현행)."""
+    in_force = [v for v in versions if v["effective_date"] is None or v["effective_date"] <= as_of]
+    return in_force[-1] if in_force else versions[0]
+
+
+class ArticleSplitter:
+    """
+    조문 분리기의 점진(streaming) 버전입니다. PDF 쪽 텍스트를 추출되는 대로 feed()로 넣고,
+    마지막에 finish()로 결과를 받습니다. 줄 단위 상태만 유지하므로 전문을 한 번에 들고 있을 필요가 없습니다.
+    """
+
+    def __init__(self, include_supplementary: bool = False, as_of: date | None = None):
+        self.include_supplementary = include_supplementary
+        self.as_of = as_of or date.today()
+        self.articles: list[dict] = []
+        self.unparsed: list[str] = []
+        self._preamble: list[str] = []  # 첫 조 제목줄 전까지의 줄 (조문이 전혀 없으면 전체를 LLM에 넘김)
+        self._current: dict | None = None
+        self._section = ""        # "" = 본칙, 그 외 = 부칙 이름
+        self._last_number = 0     # 현재 구간(본칙/부칙)의 마지막 조 번호
+        self._page_title: str | None = None
+        self.effective_date: date | None = None  # 머리말의 법령 시행일 ("[시행 2025. 2. 23.]")
+        self._after_page_header = False
+
+    def feed(self, text: str) -> None:
+        """텍스트(한 쪽 또는 전문)를 줄 단위로 처리합니다. 줄이 쪽 경계에 걸치지 않는다고 가정합니다."""
+        for line in text.splitlines():
+            line = line.strip()
+            # 쪽 머리글(법제처 N 국가법령정보센터)과 바로 다음 줄의 반복 법령명 제거
+            if PAGE_HEADER.match(line):
+                self._after_page_header = True
+                continue
+            if self._after_page_header:
+                self._after_page_header = False
+                if self._page_title is None:
+                    self._page_title = line
+                if line == self._page_title:
+                    continue
+            if line:
+                self._feed_line(line)
+
+    def _close_current(self) -> None:
+        if self._current is not None:
+            self._current["content"] = "\n".join(self._current.pop("lines"))
+            self._current = None
+
+    def _feed_line(self, line: str) -> None:
+        supplementary = SUPPLEMENTARY_HEADING.match(line)
+        if supplementary:
+            self._close_current()
+            label = (supplementary.group("label") or "").split(",")[0].strip()
+            self._section = f"부칙({label})" if label else "부칙"
+            self._last_number = 0
+            return
+
+        heading = ARTICLE_HEADING.match(line)
+        if heading:
+            number = int(heading.group("number"))
+            if number < self._last_number:
+                heading = None  # 줄바꿈으로 행 첫머리에 온 조문 인용 ("제2조(정의)에 따른 …")
+            elif not self._section and self._last_number and number > self._last_number + 1:
+                # 본칙의 조 번호가 건너뜀 → 앞 조 본문 안에 제목줄이 깨진 조문이 섞여 있을 수 있으므로 LLM에 맡김
+                # (부칙은 타법개정 부칙처럼 일부 조만 싣는 경우가 많아 검사하지 않음)
+                if self._current is not None:
+                    suspect = self._current
+                    self._close_current()
+                    self.articles.remove(suspect)
+                    self.unparsed.append(suspect["content"])
+        if heading:
+            self._close_current()
+            number = int(heading.group("number"))
+            branch = heading.group("branch")
+            article_number = f"제{number}조" + (f"의{branch}" if branch else "")
+            if self._section:
+                article_number = f"{self._section} {article_number}"
+            self._current = {
+                "article_number": article_number,
+                "title": (heading.group("title") or "").strip(),
+                "lines": [line],
+                "effective_date": None,
+                "deleted": bool(heading.group("deleted")),
+                "supplementary": bool(self._section),
+            }
+            self.articles.append(self._current)
+            self._last_number = number
+            return
+
+        if self._current is None:
+            # 법령 머리말 (제명, 시행일, 소관 부처)과 첫 조 앞의 장 제목
+            if not self.articles:
+                self._preamble.append(line)
+                law_date = LAW_EFFECTIVE_DATE.match(line)
+                if law_date and self.effective_date is None:
+                    self.effective_date = date(*(int(part) for part in law_date.groups()))
+            return
+        if STRUCTURE_HEADING.match(line):
+            return
+        marker = EFFECTIVE_MARKER.match(line)
+        if marker:
+            self._current["effective_date"] = date(*(int(part) for part in marker.groups()))
+        self._current["lines"].append(line)
+
+    def finish(self) -> tuple[list[dict], list[str]]:
+        """
+        Returns:
+            tuple[list[dict], list[str]]: (article_number/title/content/effective_date/deleted 키를 가진 조문 목록 (조 번호순),
+                규칙으로 분리하지 못한 텍스트 구간 목록). effective_date는 조별 시행일, 없으면 법령 시행일
+        """
+        self._close_current()
+        if not self.articles:
+            body = "\n".join(self._preamble)
+            return [], [body] if body else []
+
+        versions: dict[str, list[dict]] = {}
+        for article in self.articles:
+            if self.include_supplementary or not article["supplementary"]:
+                versions.setdefault(article["article_number"], []).append(article)
+        selected = [_select_versions(group, self.as_of) for group in versions.values()]
+        for article in selected:
+            del article["supplementary"]
+            # 조별 시행일 표시가 없으면 법령 시행일부터 시행된 본문으로 봄
+            article["effective_date"] = article["effective_date"] or self.effective_date
+        selected.sort(key=lambda a: article_sort_key(a["article_number"]))
+        return selected, list(self.unparsed)
+
+
+def split_articles(
+    text: str, include_supplementary: bool = False, as_of: date | None = None
+) -> tuple[list[dict], list[str]]:
+    """
+    법령 전문 텍스트를 조 단위로 분리합니다.
+
+    Args:
+        text (str): PDF에서 추출한 법령 전문
+        include_supplementary (bool, optional): 부칙 조문("부칙 제1조" 형식 번호)도 포함할지 여부. Defaults to False.
+        as_of (date | None, optional): 시행 예정 개정문이 함께 실린 조에서 판을 고르는 기준일. Defaults to 오늘.
+
+    Returns:
+        tuple[list[dict], list[str]]: (article_number/title/content/effective_date/deleted 키를 가진 조문 목록 (조 번호순),
+            규칙으로 분리하지 못한 텍스트 구간 목록). effective_date는 조별 시행일, 없으면 법령 시행일
+    """
+    splitter = ArticleSplitter(include_supplementary=include_supplementary, as_of=as_of)
+    splitter.feed(text)
+    return splitter.finish()
+
+
+def split_paragraphs(content: str, max_chars: int) -> list[str]:
+    """
+    조 본문을 항(①②…) 경계에서 나누어 max_chars 이하의 묶음으로 합칩니다. max_chars 이하인 조는 그대로 한 묶음입니다.
+    항 중간은 자르지 않으므로 한 항이 max_chars보다 길면 그 항만 따로 한 묶음이 됩니다.
+
+    Args:
+        content (str): 조 본문 (조 제목줄 포함, 줄 단위)
+        max_chars (int): 묶음 하나의 최대 길이
+
+    Returns:
+        list[str]: 원래 순서대로의 본문 묶음 (이어 붙이면 원문과 같음)
+    """
+    if len(content) <= max_chars:
+        return [content]
+    paragraphs: list[list[str]] = [[]]
+    for line in content.split("\n"):
+        if PARAGRAPH_MARK.match(line) and paragraphs[-1]:
+            paragraphs.append([])
+        paragraphs[-1].append(line)
+    groups: list[str] = []
+    current = ""
+    for paragraph in ("\n".join(lines) for lines in paragraphs):
+        if current and len(current) + 1 + len(paragraph) > max_chars:
+            groups.append(current)
+            current = paragraph
+        else:
+            current = f"{current}\n{paragraph}" if current else paragraph
+    groups.append(current)
+    return groups
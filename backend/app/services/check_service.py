@@ -3,23 +3,67 @@
 endpoints.py의 God Function(check_fact)에서 비즈니스 로직을 분리하여
 HTTP 레이어와 비즈니스 로직의 관심사를 분리합니다.
 """
+import asyncio
 import json
 import logging
-from sqlalchemy.orm import Session
+import random
+from datetime import date, datetime, timedelta, timezone
+from typing import AsyncIterator, Callable
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 
 from app.models import ChatSession, ChatMessage, ClaimCheck, LawArticleRevision, ExplanationCache
 from app.core.llm import get_main_llm
+from app.core.config import get_settings
 from app.services.rag_service import LegalFactChecker
 from app.services.hook_service import InputAnalyzer, OutputValidator
 from app.services.agent_service import RoutingAgent
 from app.services.vision_service import VisionAnalyzer
 from app.services.verdict_utils import parse_verdict
+from app.services.pipeline_scheduler import StageScheduler
+from app.services.answer_cache import SemanticAnswerCache
+from app.services.precedent_cache import PrecedentCache
 from app.plugins.precedent_search import search_precedents
 
 logger = logging.getLogger(__name__)
 
+# 파이프라인 단계 안에서 호출되므로 이벤트를 큐에 넣기만 하고 바로 반환하는 동기 콜백
+EventCallback = Callable[[str, dict], None]
+
+
+def _is_stale(cache: ExplanationCache) -> bool:
+    """ExplanationCache 행이 updated_at 기준 갱신 주기를 넘겼는지 확인합니다."""
+    if cache.updated_at is None:
+        return True
+    updated_at = cache.updated_at
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    max_age = timedelta(days=get_settings().EXPLANATION_CACHE_MAX_AGE_DAYS)
+    return datetime.now(timezone.utc) - updated_at > max_age
+
+
+def _primary_revision_id(revision_ids: list) -> int | None:
+    """ExplanationCache의 키가 되는 대표 조문 리비전 ID (검색 순위상 첫 번째 리비전 문서). 읽기/쓰기가 함께 사용합니다."""
+    ids = [rid for rid in revision_ids if rid is not None]
+    return int(ids[0]) if ids else None
+
+
+def _stage_event_payload(name: str, value) -> dict:
+    """스트리밍 'stage' 이벤트에 실어 보낼 단계별 요약 데이터를 만듭니다."""
+    if name == "semantic_cache":
+        return {"cache_hit": value["response"] is not None}
+    if name == "intent":
+        return {"intent_analysis": value}
+    if name == "routing":
+        return {"agent_decision": value}
+    if name == "explanation_cache":
+        return {"explanation_cached": value is not None}
+    if name == "retrieval":
+        return {"sources": [d.metadata.get("source", "Unknown") for d in value]}
+    return {}
+
 
 class CheckService:
     """팩트체크 요청의 전체 파이프라인을 관리하는 서비스"""
@@ -31,23 +75,53 @@ class CheckService:
         agent: RoutingAgent,
         validator: OutputValidator,
         vision: VisionAnalyzer,
+        answer_cache: SemanticAnswerCache | None = None,
+        precedent_cache: PrecedentCache | None = None,
     ):
         """
         CheckService 초기화 메서드.
         팩트체크 파이프라인의 각 단계에서 사용되는 서비스 객체들을 의존성 주입받습니다.
+        answer_cache가 주어지면 세션 없이 들어온(대화 맥락이 없는) 질문에 대해 시맨틱 답변 캐시를 조회합니다.
+        precedent_cache가 주어지면 판례 검색은 DB 판례 캐시를 거칩니다.
         """
         self.checker = checker
         self.analyzer = analyzer
         self.agent = agent
         self.validator = validator
         self.vision = vision
+        self.answer_cache = answer_cache
+        self.precedent_cache = precedent_cache
+
+        settings = get_settings()
+        self.intent_routing_mode = settings.INTENT_ROUTING_MODE
+        self.fused_ratio = settings.INTENT_ROUTING_FUSED_RATIO
+        self.law_partitioning = settings.RETRIEVAL_LAW_PARTITIONING
+
+    def choose_intent_routing_mode(self) -> str:
+        """
+        이번 요청에서 사용할 의도 분석/도구 결정 방식을 정합니다.
+        INTENT_ROUTING_MODE가 'ab'이면 INTENT_ROUTING_FUSED_RATIO 비율로 'fused'를 무작위 배정하여
+        두 방식의 지연 시간을 pipeline 리포트로 비교할 수 있게 합니다.
+
+        Returns:
+            str: 'fused' 또는 'two_call'
+        """
+        if self.intent_routing_mode == "ab":
+            return "fused" if random.random() < self.fused_ratio else "two_call"
+        return "fused" if self.intent_routing_mode == "fused" else "two_call"
+
+    async def search_precedents(self, keywords: list) -> list:
+        """판례 캐시가 있으면 캐시를 거쳐, 없으면 판례 검색 API를 직접 호출하여 관련 판례를 검색합니다."""
+        if self.precedent_cache is not None:
+            return await self.precedent_cache.search(keywords)
+        return await search_precedents(keywords)
 
-    def get_or_create_session(self, db: Session, user_id: int, session_id: int | None, query: str) -> tuple[int, ChatSession]:
+    async def get_or_create_session(self, db: AsyncSession, user_id: int, session_id: int | None, query: str) -> tuple[int, ChatSession]:
         """
         사용자의 채팅 세션을 조회하거나, 세션이 없을 경우 새로 생성하여 반환합니다.
 
         Args:
-            db (Session): 데이터베이스 세션
+            db (AsyncSession): 데이터베이스 세션
             user_id (int): 사용자 ID
             session_id (int | None): 기존 세션 ID (없으면 None)
             query (str): 채팅 세션의 제목으로 사용될 사용자 쿼리 질문
@@ -58,39 +132,83 @@ class CheckService:
         if not session_id:
             chat_session = ChatSession(user_id=user_id, title=query[:50])
             db.add(chat_session)
-            db.commit()
-            db.refresh(chat_session)
+            await db.commit()
+            await db.refresh(chat_session)
             return chat_session.id, chat_session
         else:
-            chat_session = db.query(ChatSession).filter(ChatSession.id == session_id).first()
+            chat_session = await db.get(ChatSession, session_id)
             return session_id, chat_session
 
-    def load_chat_history(self, db: Session, session_id: int) -> list[dict]:
+    async def load_chat_history(self, db: AsyncSession, session_id: int) -> list[dict]:
         """
         특정 세션 ID의 과거 채팅 내역을 조회하여 LLM이 처리하기 쉬운 딕셔너리 포맷 리스트로 반환합니다.
 
         Args:
-            db (Session): 데이터베이스 세션
+            db (AsyncSession): 데이터베이스 세션
             session_id (int): 조회할 채팅 세션 ID
 
         Returns:
             list[dict]: "role" (user/ai)과 "content" 정보를 포함한 채팅 메시지 리스트
         """
-        messages = db.query(ChatMessage).filter(
-            ChatMessage.session_id == session_id
-        ).order_by(ChatMessage.created_at).all()
+        messages = (await db.scalars(
+            select(ChatMessage)
+            .where(ChatMessage.session_id == session_id)
+            .order_by(ChatMessage.created_at)
+        )).all()
         return [{"role": msg.role, "content": msg.content} for msg in messages]
 
-    async def build_plugin_context(self, query: str, intent_analysis: dict, agent_decision: dict, image_data: str | None = None) -> tuple[str, str]:
+    async def load_cached_explanation(self, db: AsyncSession, revision_ids: list) -> dict | None:
+        """
+        대표 조문 리비전(검색 순위상 첫 번째 리비전 문서)에 대한 ExplanationCache를 조회합니다 (Read-through).
+        save_results도 같은 대표 리비전(_primary_revision_id)에 해설을 기록하므로, 읽기와 쓰기가 같은 키를 사용합니다.
+        캐시가 없거나 갱신 주기(EXPLANATION_CACHE_MAX_AGE_DAYS)를 넘긴 경우 None을 반환하여
+        전체 답변을 새로 생성하게 하고, 생성 결과는 save_results에서 캐시에 반영됩니다.
+        주장과 무관한 조문 설명과 주의사항만 돌려주며, 나머지 검색 문서는 그대로 답변 Context로 전달되어
+        판정과 현실 적용 예시(주장마다 새로 생성)에 사용됩니다.
+
+        Args:
+            db (AsyncSession): 데이터베이스 세션
+            revision_ids (list): 검색된 문서들의 조문 리비전 ID 목록 (검색 순위 순, 리비전이 아닌 문서는 None)
+
+        Returns:
+            dict | None: plain_summary/caution_note 키를 가진 캐시 해설 또는 None
+        """
+        primary_revision_id = _primary_revision_id(revision_ids)
+        if primary_revision_id is None:
+            return None
+
+        cache = await db.scalar(
+            select(ExplanationCache).where(ExplanationCache.article_revision_id == primary_revision_id)
+        )
+        if not cache or _is_stale(cache) or not cache.plain_summary:
+            return None
+
+        return {
+            "plain_summary": cache.plain_summary,
+            "caution_note": cache.caution_note,
+        }
+
+    async def build_plugin_context(
+        self,
+        query: str,
+        intent_analysis: dict,
+        agent_decision: dict,
+        image_data: str | None = None,
+        vision_result: str | None = None,
+        precedents: list | None = None,
+    ) -> tuple[str, str]:
         """
         비전 API 분석, 사전 키워드 추출, 판례 검색 메타데이터, 계산기 공식 등 외부 플러그인의 결과물을 조합하여 
         LLM 판단의 정확도를 높이는 추가 문맥(Context)과 RAG 검색용 쿼리를 생성합니다.
+        비전 분석/판례 검색 결과가 이미 (병렬 단계에서) 계산되어 전달되면 해당 호출을 다시 수행하지 않습니다.
 
         Args:
             query (str): 사용자의 원본 질문
             intent_analysis (dict): Input Hook에서 추출된 의도 분석 결과
             agent_decision (dict): Agent 단계에서 판단한 도구 사용 여부 및 목적
             image_data (str | None, optional): 참조 이미지 데이터 (Base64). Defaults to None.
+            vision_result (str | None, optional): 미리 계산된 비전 분석 결과. Defaults to None.
+            precedents (list | None, optional): 미리 조회된 판례 검색 결과. Defaults to None.
 
         Returns:
             tuple[str, str]: 확장된 참고 문맥(plugin_context) 문자열 및 RAG 검색에 활용할 최종 질의어(search_query) 문자열
@@ -99,8 +217,9 @@ class CheckService:
         search_query = query
 
         # Vision API
-        if image_data:
+        if vision_result is None and image_data:
             vision_result = await self.vision.extract_text_from_image(image_data)
+        if vision_result:
             plugin_context += "\n[사용자 첨부 이미지 분석 결과 (Vision AI)]\n" + vision_result + "\n"
             search_query += " " + vision_result[:200]
 
@@ -109,8 +228,9 @@ class CheckService:
             search_query += " " + " ".join(intent_analysis["keywords"])
 
         # 판례 검색
-        if agent_decision.get("requires_precedent_search") and intent_analysis.get("keywords"):
-            precedents = search_precedents(intent_analysis["keywords"])
+        if precedents is None and agent_decision.get("requires_precedent_search") and intent_analysis.get("keywords"):
+            precedents = await self.search_precedents(intent_analysis["keywords"])
+        if precedents:
             plugin_context += "\n[관련 판례/재결례 정보]\n" + json.dumps(precedents, ensure_ascii=False) + "\n"
 
         # 수당 계산기
@@ -124,9 +244,9 @@ class CheckService:
 
         return plugin_context, search_query
 
-    def save_results(
+    async def save_results(
         self,
-        db: Session,
+        db: AsyncSession,
         session_id: int,
         query: str,
         parsed_result: dict,
@@ -137,7 +257,7 @@ class CheckService:
         사용자와 AI 간의 채팅 메시지로 저장합니다.
 
         Args:
-            db (Session): 데이터베이스 세션
+            db (AsyncSession): 데이터베이스 세션
             session_id (int): 현재 처리 중인 채팅 세션 ID
             query (str): 팩트체크 대상이 되는 사용자의 질문 (클레임)
             parsed_result (dict): Output Validator를 거쳐 교정된 최종 AI 답변 초안 딕셔너리
@@ -154,21 +274,22 @@ class CheckService:
                 content=json.dumps(parsed_result, ensure_ascii=False)
             )
             db.add(ai_msg)
-            db.commit()
+            await db.commit()
             return
 
         # ExplanationCache
-        revision_ids = [rid for rid in result.get("revision_ids", []) if rid is not None]
-        primary_revision_id = int(revision_ids[0]) if revision_ids else None
+        primary_revision_id = _primary_revision_id(result.get("revision_ids", []))
 
         explanation = parsed_result.get("section_2_law_explanation", "")
         example_case = parsed_result.get("section_3_real_case_example", "")
         caution_note = parsed_result.get("section_4_caution", "")
 
-        if primary_revision_id:
-            cache = db.query(ExplanationCache).filter(
-                ExplanationCache.article_revision_id == primary_revision_id
-            ).first()
+        # 캐시 해설로 생성된 답변은 다시 기록하지 않고, 새로 생성된 답변만 없는/오래된 캐시를 채웁니다.
+        # 파싱에 실패한 답변(ERROR)의 섹션은 오류 문구이므로 캐시에 남기지 않습니다.
+        if primary_revision_id and not result.get("explanation_cached") and verdict_str != "ERROR":
+            cache = await db.scalar(
+                select(ExplanationCache).where(ExplanationCache.article_revision_id == primary_revision_id)
+            )
             if not cache:
                 new_cache = ExplanationCache(
                     article_revision_id=primary_revision_id,
@@ -177,23 +298,23 @@ class CheckService:
                     caution_note=caution_note
                 )
                 db.add(new_cache)
+            elif _is_stale(cache) and explanation:
+                cache.plain_summary = explanation
+                cache.example_case = example_case
+                cache.caution_note = caution_note
 
         # ClaimCheck
         verdict_enum = parse_verdict(verdict_str)
+        # 새 객체의 컬렉션에 append하면 비동기 세션에서 lazy load가 일어나므로 생성 시점에 연결
+        rev_obj = await db.get(LawArticleRevision, primary_revision_id) if primary_revision_id else None
         claim_check = ClaimCheck(
             claim_text=query,
             verdict=verdict_enum,
-            explanation=explanation
+            explanation=explanation,
+            revisions=[rev_obj] if rev_obj else [],
         )
         db.add(claim_check)
 
-        if primary_revision_id:
-            rev_obj = db.query(LawArticleRevision).filter(
-                LawArticleRevision.id == primary_revision_id
-            ).first()
-            if rev_obj:
-                claim_check.revisions.append(rev_obj)
-
         # AI 메시지 저장
         ai_msg = ChatMessage(
             session_id=session_id,
@@ -201,7 +322,7 @@ class CheckService:
             content=json.dumps(parsed_result, ensure_ascii=False)
         )
         db.add(ai_msg)
-        db.commit()
+        await db.commit()
 
     async def _generate_clarification_question(self, query: str, agent_decision: dict, history: list[dict]) -> dict:
         """
@@ -245,40 +366,338 @@ class CheckService:
                 "section_4_caution": ""
             }
 
-    async def execute(self, db: Session, user_id: int, query: str, session_id: int | None = None, image_data: str | None = None) -> dict:
+    def build_pipeline(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        query: str,
+        session_id: int | None,
+        image_data: str | None,
+        on_event: EventCallback | None = None,
+        intent_routing_mode: str = "two_call",
+        as_of: date | None = None,
+    ) -> StageScheduler:
         """
-        단일 사용자의 팩트체크 요청을 처리하는 전체 파이프라인 로직을 관장하고 실행합니다.
-        세션 생성, Intent 분석(Hook), 플러그인 도구 결정(Agent), RAG 검색 및 판정, 답변 교정(Output Hook), DB 기록 단계로 구성됩니다.
+        팩트체크 파이프라인을 단계(Stage) 의존성 그래프로 구성합니다.
+        의도 분석, 비전 분석, 세션/히스토리 로드는 서로 독립적이므로 동시에 실행되고,
+        원본 질의 기반 벡터 검색도 의도 분석과 겹쳐서(Speculative) 미리 수행됩니다.
+        법령 파티셔닝(RETRIEVAL_LAW_PARTITIONING)이 켜져 있어도 원본 질의 검색은 전체 법령을 대상으로 미리 수행하고,
+        의도 분석이 끝난 뒤 retrieval 단계에서 법 영역(law_domain)에 해당하는 법령의 문서만 남깁니다.
+        남은 문서가 줄어들었거나 질의가 보강되었으면 그 법령만 대상으로 다시 검색하여 채웁니다.
+        세션 없이 들어온(대화 맥락이 없는) 이미지 없는 질문은 시맨틱 답변 캐시를 다른 단계와 동시에 조회하며,
+        적중 시 의도 분석·검색·라우팅 이후 단계를 모두 건너뜁니다 (캐시를 조회하지 않는 요청은 기다림 없이 바로 진행).
+        'fused' 모드에서는 의도 분석과 도구 결정을 단일 호출(fused_decision)로 수행하고, intent/routing 단계는 그 결과를 나눠 전달합니다.
+        AsyncSession은 동시 사용이 불가능하므로 DB를 쓰는 단계(session → history, explanation_cache)는 의존성으로 서로 겹치지 않게 배치합니다.
+        벡터 검색은 기준일(as_of)에 시행 중인 조문만 대상으로 하며, 과거 시점 질의는 현행 기준 답변 캐시를 사용하지 않습니다.
 
         Args:
-            db (Session): 데이터베이스 세션
+            db (AsyncSession): 데이터베이스 세션
+            user_id (int): 사용자 ID
+            query (str): 사용자 질문
+            session_id (int | None): 기존 세션 ID
+            image_data (str | None): 첨부 이미지 (Base64)
+            on_event (EventCallback | None, optional): 답변 섹션 토큰 스트리밍 이벤트를 받을 콜백
+            intent_routing_mode (str, optional): 'fused' 또는 'two_call'. Defaults to "two_call".
+            as_of (date | None, optional): 판단 기준일. Defaults to None (오늘).
+
+        Returns:
+            StageScheduler: 실행 준비가 완료된 스케줄러
+        """
+        as_of = as_of or date.today()
+        point_in_time = as_of != date.today()
+
+        def cache_hit(r: dict) -> bool:
+            return bool(r["semantic_cache"] and r["semantic_cache"]["response"] is not None)
+
+        def proceeds(r: dict) -> bool:
+            return not cache_hit(r) and not r["routing"].get("requires_clarification")
+
+        async def semantic_cache_stage(r):
+            return await self.answer_cache.lookup(query)
+
+        async def session_stage(r):
+            return (await self.get_or_create_session(db, user_id, session_id, query))[0]
+
+        async def history_stage(r):
+            history = await self.load_chat_history(db, r["session"])
+            db.add(ChatMessage(session_id=r["session"], role="user", content=query))
+            await db.commit()
+            return history
+
+        async def fused_decision_stage(r):
+            # 규칙 분류기가 확신하면 의도 분석은 LLM 없이 끝나므로 단일 호출로 합칠 필요가 없음
+            if self.analyzer.classify_with_rules(query) is not None:
+                return None
+            try:
+                return await self.agent.analyze_and_decide(query, r["history"])
+            except Exception as e:
+                logger.error(f"Fused intent/routing failed, falling back to two calls: {e}")
+                return None
+
+        async def intent_stage(r):
+            if r["fused_decision"]:
+                return r["fused_decision"][0]
+            return await self.analyzer.analyze_query(query)
+
+        async def vision_stage(r):
+            return await self.vision.extract_text_from_image(image_data)
+
+        def law_domain(r) -> str | None:
+            return (r["intent"] or {}).get("law_domain") if self.law_partitioning else None
+
+        async def raw_retrieval_stage(r):
+            # 의도 분석을 기다리지 않도록 전체 법령을 대상으로 미리 검색하고, 법령 파티션은 retrieval 단계에서 적용
+            return await self.checker.retrieve_documents(query, r["history"], as_of=as_of)
+
+        async def routing_stage(r):
+            if r["fused_decision"]:
+                return r["fused_decision"][1]
+            return await self.agent.decide_action(r["intent"], r["history"])
+
+        async def clarification_stage(r):
+            return await self._generate_clarification_question(query, r["routing"], r["history"])
+
+        async def precedent_stage(r):
+            return await self.search_precedents(r["intent"]["keywords"])
+
+        async def plugin_context_stage(r):
+            return await self.build_plugin_context(
+                query, r["intent"], r["routing"], image_data,
+                vision_result=r["vision"], precedents=r["precedents"],
+            )
+
+        async def retrieval_stage(r):
+            _, search_query = r["plugin_context"]
+            docs = list(r["raw_retrieval"])
+            law_ids = await self.checker.resolve_law_ids(law_domain(r)) if self.law_partitioning else None
+            if law_ids:
+                docs = [d for d in docs if d.metadata.get("law_id") in law_ids]
+            # 원본 질의 결과가 모두 해당 법령 안에 있으면 다시 검색할 필요가 없음
+            if search_query == query and len(docs) == len(r["raw_retrieval"]):
+                return docs
+            # 보강 질의 결과를 앞에 두고 원본 질의 결과로 채우되, 답변 프롬프트에는 RETRIEVAL_TOP_K개까지만 전달
+            enriched = await self.checker.retrieve_documents(
+                search_query, r["history"], as_of=as_of, law_domain=law_domain(r)
+            )
+            seen = {d.page_content for d in enriched}
+            merged = enriched + [d for d in docs if d.page_content not in seen]
+            return merged[: self.checker.retrieval_top_k]
+
+        async def explanation_cache_stage(r):
+            return await self.load_cached_explanation(
+                db, [d.metadata.get("revision_id") for d in r["retrieval"]]
+            )
+
+        async def answer_stage(r):
+            plugin_context, search_query = r["plugin_context"]
+            on_section_delta = None
+            if on_event is not None:
+                async def on_section_delta(section: str, delta: str) -> None:
+                    on_event("token", {"section": section, "delta": delta})
+            return await self.checker.answer_with_documents(
+                search_query, r["history"], r["retrieval"], plugin_context,
+                on_section_delta=on_section_delta,
+                cached_explanation=r["explanation_cache"],
+            )
+
+        async def validation_stage(r):
+            return await self.validator.validate_and_correct(r["answer"]["result"])
+
+        scheduler = StageScheduler()
+        scheduler.add("session", session_stage)
+        scheduler.add("history", history_stage, deps=("session",))
+        # 세션 없는 요청은 대화 이력이 없으므로 이력 조회를 기다리지 않고 바로 캐시를 조회
+        scheduler.add(
+            "semantic_cache", semantic_cache_stage,
+            condition=lambda r: self.answer_cache is not None and not image_data and session_id is None and not point_in_time,
+        )
+        # 적중 시 캐시된 intent_analysis를 반환하므로 의도 분석(LLM 호출)은 캐시 조회 결과를 보고 실행
+        scheduler.add(
+            "fused_decision", fused_decision_stage, deps=("history", "semantic_cache"),
+            condition=lambda r: not cache_hit(r) and intent_routing_mode == "fused",
+        )
+        scheduler.add(
+            "intent", intent_stage, deps=("fused_decision", "semantic_cache"),
+            condition=lambda r: not cache_hit(r),
+        )
+        scheduler.add("vision", vision_stage, condition=lambda r: bool(image_data))
+        scheduler.add(
+            "raw_retrieval", raw_retrieval_stage,
+            deps=("history", "semantic_cache"),
+            condition=lambda r: not cache_hit(r),
+        )
+        scheduler.add(
+            "routing", routing_stage, deps=("intent", "history", "semantic_cache"),
+            condition=lambda r: not cache_hit(r),
+        )
+        scheduler.add(
+            "clarification", clarification_stage, deps=("routing",),
+            condition=lambda r: not cache_hit(r) and bool(r["routing"].get("requires_clarification")),
+        )
+        scheduler.add(
+            "precedents", precedent_stage, deps=("intent", "routing"),
+            condition=lambda r: proceeds(r)
+            and bool(r["routing"].get("requires_precedent_search"))
+            and bool(r["intent"].get("keywords")),
+        )
+        scheduler.add(
+            "plugin_context", plugin_context_stage, deps=("intent", "routing", "vision", "precedents"),
+            condition=proceeds,
+        )
+        scheduler.add(
+            "retrieval", retrieval_stage, deps=("plugin_context", "raw_retrieval"),
+            condition=proceeds,
+        )
+        # 캐시 해설은 주장과 무관한 조문 설명/주의사항뿐이고, 판례·이미지 분석이 반영되는 현실 적용 예시는 매번 새로 생성
+        scheduler.add("explanation_cache", explanation_cache_stage, deps=("retrieval",), condition=proceeds)
+        scheduler.add("answer", answer_stage, deps=("retrieval", "explanation_cache"), condition=proceeds)
+        scheduler.add("validation", validation_stage, deps=("answer",), condition=proceeds)
+        return scheduler
+
+    async def execute(self, db: AsyncSession, user_id: int, query: str, session_id: int | None = None, image_data: str | None = None, as_of: date | None = None) -> dict:
+        """
+        단일 사용자의 팩트체크 요청을 처리하고 최종 결과를 한 번에 반환합니다 (Blocking 경로).
+        실제 파이프라인 로직은 _run()에 있으며, 스트리밍 경로(execute_stream)와 동일하게 공유됩니다.
+
+        Args:
+            db (AsyncSession): 데이터베이스 세션
             user_id (int): 팩트체크를 요청한 사용자의 식별 ID
             query (str): 팩트체크 대상이 되는 질문 또는 주장문
             session_id (int | None, optional): 기존 채팅방의 세션 ID. 생성 시엔 None. Defaults to None.
             image_data (str | None, optional): 첨부된 이미지 데이터(Base64 문자열). Defaults to None.
+            as_of (date | None, optional): 판단 기준일 (이 날짜에 시행 중인 조문만 근거로 사용). Defaults to None (오늘).
 
         Returns:
-            dict: 세션 ID, 최종 판정 결과, 참고 자료 출처 및 AI 파이프라인 로깅 데이터
+            dict: 세션 ID, 최종 판정 결과, 참고 자료 출처, AI 파이프라인 로깅 데이터 및 단계별 실행 리포트(pipeline)
+        """
+        return await self._run(db, user_id, query, session_id, image_data, as_of=as_of)
+
+    async def execute_stream(self, db: AsyncSession, user_id: int, query: str, session_id: int | None = None, image_data: str | None = None, as_of: date | None = None) -> AsyncIterator[tuple[str, dict]]:
+        """
+        팩트체크 파이프라인을 실행하면서 진행 상황을 (이벤트 이름, 데이터) 튜플로 순차 방출하는 비동기 제너레이터입니다.
+        단계 완료 시 'stage', 답변 생성 중 섹션별 토큰은 'token', 저장까지 끝난 최종 응답은 'result',
+        실패 시 'error' 이벤트를 방출합니다. 결과 저장은 Blocking 경로와 동일하게 save_results를 거칩니다.
+        'token'은 Output Hook 교정 전의 미리보기이고, 마지막 'result'가 교정된 최종 답변이므로
+        클라이언트는 'result'를 받으면 토큰으로 그린 섹션을 'result'의 내용으로 교체해야 합니다.
+        'result'에는 미리보기와 달라진 섹션 키 목록(corrected_sections)이 함께 실립니다.
+
+        Args:
+            db (AsyncSession): 데이터베이스 세션
+            user_id (int): 팩트체크를 요청한 사용자의 식별 ID
+            query (str): 팩트체크 대상이 되는 질문 또는 주장문
+            session_id (int | None, optional): 기존 채팅방의 세션 ID. Defaults to None.
+            image_data (str | None, optional): 첨부된 이미지 데이터(Base64 문자열). Defaults to None.
+            as_of (date | None, optional): 판단 기준일. Defaults to None (오늘).
+
+        Yields:
+            tuple[str, dict]: 이벤트 이름과 JSON 직렬화 가능한 이벤트 데이터
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        streamed: dict[str, str] = {}
+
+        def on_event(event: str, data: dict) -> None:
+            if event == "token":
+                streamed[data["section"]] = streamed.get(data["section"], "") + data["delta"]
+            # 무제한 큐이므로 단계/토큰 처리를 막지 않음
+            queue.put_nowait((event, data))
+
+        async def produce() -> None:
+            try:
+                result = await self._run(db, user_id, query, session_id, image_data, on_event=on_event, as_of=as_of)
+                final = result["result"]
+                result["corrected_sections"] = sorted(
+                    key for key, text in streamed.items() if final.get(key) != text
+                )
+                await queue.put(("result", result))
+            except Exception as e:
+                logger.error(f"Streaming fact check failed: {e}")
+                await queue.put(("error", {"detail": str(e)}))
+            finally:
+                await queue.put(done)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                yield item
+        finally:
+            if not producer.done():
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+
+    async def _run(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        query: str,
+        session_id: int | None = None,
+        image_data: str | None = None,
+        on_event: EventCallback | None = None,
+        as_of: date | None = None,
+    ) -> dict:
         """
-        # 1. 세션 관리
-        session_id, chat_session = self.get_or_create_session(db, user_id, session_id, query)
+        단일 사용자의 팩트체크 요청을 처리하는 전체 파이프라인 로직을 관장하고 실행합니다.
+        세션 생성, Intent 분석(Hook), 플러그인 도구 결정(Agent), RAG 검색 및 판정, 답변 교정(Output Hook), DB 기록 단계로 구성되며,
+        각 단계는 build_pipeline()이 만든 의존성 그래프에 따라 가능한 한 동시에 실행됩니다.
 
-        # 2. 히스토리 로드 & 사용자 메시지 저장
-        history = self.load_chat_history(db, session_id)
-        user_msg = ChatMessage(session_id=session_id, role="user", content=query)
-        db.add(user_msg)
-        db.commit()
+        Args:
+            db (AsyncSession): 데이터베이스 세션
+            user_id (int): 팩트체크를 요청한 사용자의 식별 ID
+            query (str): 팩트체크 대상이 되는 질문 또는 주장문
+            session_id (int | None, optional): 기존 채팅방의 세션 ID. 생성 시엔 None. Defaults to None.
+            image_data (str | None, optional): 첨부된 이미지 데이터(Base64 문자열). Defaults to None.
+            on_event (EventCallback | None, optional): 스트리밍용 이벤트 콜백 (단계 완료/토큰). Defaults to None.
+            as_of (date | None, optional): 판단 기준일. Defaults to None (오늘).
 
-        # 3. Input Hook & Agent
-        intent_analysis = await self.analyzer.analyze_query(query)
-        agent_decision = await self.agent.decide_action(intent_analysis, history)
+        Returns:
+            dict: 세션 ID, 최종 판정 결과, 참고 자료 출처, AI 파이프라인 로깅 데이터 및 단계별 실행 리포트(pipeline)
+        """
+        intent_routing_mode = self.choose_intent_routing_mode()
+        scheduler = self.build_pipeline(db, user_id, query, session_id, image_data, on_event, intent_routing_mode, as_of)
+
+        on_stage_done = None
+        if on_event is not None:
+            def on_stage_done(name: str, value, timing: dict) -> None:
+                payload = {"stage": name, "duration_ms": timing["duration_ms"]}
+                payload.update(_stage_event_payload(name, value))
+                on_event("stage", payload)
+
+        stages, pipeline_report = await scheduler.run(on_stage_done=on_stage_done)
+        pipeline_report["intent_routing_mode"] = intent_routing_mode
+
+        session_id = stages["session"]
+        cache_lookup = stages["semantic_cache"]
+
+        # Semantic Cache Hit (동일 취지의 질문에 대한 기존 답변 재사용)
+        if cache_lookup and cache_lookup["response"] is not None:
+            cached = cache_lookup["response"]
+            await self.save_results(db, session_id, query, cached["result"], {
+                "result": cached["result"],
+                "revision_ids": cached["revision_ids"],
+            })
+            return {
+                "session_id": session_id,
+                "result": cached["result"],
+                "sources": cached["sources"],
+                "intent_analysis": cached["intent_analysis"],
+                "agent_decision": cached["agent_decision"],
+                "cache_hit": True,
+                "pipeline": pipeline_report,
+            }
 
-        # 3.5 Clarification Branch (역질문이 필요한 경우 RAG 스킵)
+        intent_analysis = stages["intent"]
+        agent_decision = stages["routing"]
+
+        # Clarification Branch (역질문이 필요한 경우 RAG 결과는 사용하지 않음)
         if agent_decision.get("requires_clarification"):
-            clarification_result = await self._generate_clarification_question(query, agent_decision, history)
+            clarification_result = stages["clarification"]
             clarification_result["is_clarification"] = True
             
-            self.save_results(db, session_id, query, clarification_result, {
+            await self.save_results(db, session_id, query, clarification_result, {
                 "result": clarification_result,
                 "revision_ids": []
             })
@@ -288,33 +707,34 @@ class CheckService:
                 "result": clarification_result,
                 "sources": [],
                 "intent_analysis": intent_analysis,
-                "agent_decision": agent_decision
+                "agent_decision": agent_decision,
+                "cache_hit": False,
+                "pipeline": pipeline_report,
             }
 
-        # 4. 플러그인 컨텍스트 빌드
-        plugin_context, search_query = await self.build_plugin_context(
-            query, intent_analysis, agent_decision, image_data
-        )
-
-        # 5. RAG 팩트체크
-        result = await self.checker.check_fact_with_history(
-            query=search_query,
-            chat_history=history,
-            plugin_context=plugin_context
-        )
-
-        # 6. Output Hook
-        raw_parsed_result = result["result"]
-        parsed_result = await self.validator.validate_and_correct(raw_parsed_result)
+        result = stages["answer"]
+        parsed_result = stages["validation"]
         parsed_result["is_clarification"] = False
 
-        # 7. DB 저장
-        self.save_results(db, session_id, query, parsed_result, result)
+        # DB 저장
+        await self.save_results(db, session_id, query, parsed_result, result)
+
+        # 시맨틱 캐시 저장 (정상 판정된 단발성 질문만)
+        if cache_lookup and parsed_result.get("verdict", "ERROR").upper() != "ERROR":
+            self.answer_cache.store(query, cache_lookup["embedding"], {
+                "result": parsed_result,
+                "sources": result.get("sources", []),
+                "revision_ids": result.get("revision_ids", []),
+                "intent_analysis": intent_analysis,
+                "agent_decision": agent_decision,
+            }, result.get("revision_ids", []))
 
         return {
             "session_id": session_id,
             "result": parsed_result,
             "sources": result.get("sources", []),
             "intent_analysis": intent_analysis,
-            "agent_decision": agent_decision
+            "agent_decision": agent_decision,
+            "cache_hit": False,
+            "pipeline": pipeline_report,
         }
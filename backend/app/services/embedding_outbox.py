@@ -0,0 +1,288 @@
+"""
+임베딩 아웃박스 워커
+개정본 저장과 같은 트랜잭션에 기록된 embedding_outbox 행을 묶어서 벡터 스토어에 반영합니다.
+SQL에 저장된 개정본은 프로세스가 재시작되거나 임베딩 호출이 실패하더라도 아웃박스에 남아 있으므로 결국 벡터 스토어에 반영되고,
+끝내 실패한 행은 dead 상태로 남아 관리자 화면에서 확인할 수 있습니다.
+
+- 한 배치(EMBEDDING_OUTBOX_BATCH_SIZE행)의 개정본을 checker.add_revisions 한 번(임베딩 API 호출 한 번)으로 처리
+- 같은 개정본의 행이 여러 개면 하나로 합침 (embed가 있으면 close는 생략: 임베딩 시 현재 시행 기간이 함께 저장됨)
+- 일시적 오류는 지수 백오프로 다시 시도하고, 그 외 오류는 개정본별로 나눠 다시 시도하여 원인 행만 dead로 보냄
+- 성공한 행은 삭제하므로 pending 행 수가 곧 밀린 작업 수(backlog)
+- 반영한 개정본을 인용한 시맨틱 답변 캐시 항목은 무효화 (벡터 스토어와 캐시 답변이 어긋나지 않도록)
+"""
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select, update
+
+from app.models import EmbeddingOutbox, Law, LawArticle, LawArticleRevision
+from app.services.ingest_service import is_transient_error
+from app.services.law_revisions import closed_payload, revision_payload
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow() -> datetime:
+    # DateTime 컬럼은 timezone 정보 없이 저장되므로 naive UTC로 비교
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class EmbeddingOutboxWorker:
+    """
+    embedding_outbox 테이블을 비우는 단일 워커입니다.
+    여러 프로세스가 같은 DB를 쓰더라도 배치 토큰(claimed_by)을 조건부 UPDATE로 기록하여 한 행은 한 워커만 처리하며,
+    처리 시작 시각(claimed_at)이 임대 시간(lease_seconds)을 넘긴 행만 중단된 배치로 보고 다시 대기열에 넣으므로
+    다른 프로세스가 처리 중인 행을 가로채지 않습니다.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        checker,
+        batch_size: int = 64,
+        max_attempts: int = 5,
+        retry_delay_seconds: float = 10.0,
+        poll_seconds: float = 2.0,
+        lease_seconds: float = 600.0,
+        answer_cache=None,
+    ):
+        self.session_factory = session_factory
+        self.checker = checker
+        self.answer_cache = answer_cache
+        self.lease_seconds = lease_seconds
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_delay_seconds = retry_delay_seconds
+        self.poll_seconds = poll_seconds
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    # --- Admin ---
+
+    async def stats(self) -> dict:
+        """밀린 행 수(backlog), 재시도 대기 행 수, dead 행 수, 가장 오래된 대기 행의 지연 시간(초)을 반환합니다."""
+        async with self.session_factory() as db:
+            rows = dict((await db.execute(
+                select(EmbeddingOutbox.status, func.count()).group_by(EmbeddingOutbox.status)
+            )).all())
+            retrying = await db.scalar(
+                select(func.count()).where(EmbeddingOutbox.status == "pending", EmbeddingOutbox.attempts > 0)
+            )
+            oldest = await db.scalar(
+                select(func.min(EmbeddingOutbox.created_at)).where(EmbeddingOutbox.status.in_(["pending", "processing"]))
+            )
+        if oldest is not None and oldest.tzinfo is not None:
+            oldest = oldest.astimezone(timezone.utc).replace(tzinfo=None)
+        return {
+            "backlog": rows.get("pending", 0) + rows.get("processing", 0),
+            "processing": rows.get("processing", 0),
+            "retrying": retrying or 0,
+            "dead": rows.get("dead", 0),
+            "oldest_pending_at": oldest,
+            "lag_seconds": round((_utcnow() - oldest).total_seconds(), 3) if oldest else 0.0,
+        }
+
+    async def dead_letters(self, limit: int = 50) -> list[dict]:
+        async with self.session_factory() as db:
+            rows = await db.scalars(
+                select(EmbeddingOutbox).where(EmbeddingOutbox.status == "dead").order_by(EmbeddingOutbox.id).limit(limit)
+            )
+            return [
+                {
+                    "id": row.id,
+                    "revision_id": row.revision_id,
+                    "kind": row.kind,
+                    "attempts": row.attempts,
+                    "last_error": row.last_error,
+                    "created_at": row.created_at,
+                }
+                for row in rows
+            ]
+
+    async def retry_dead(self) -> int:
+        """dead 행을 다시 대기열에 넣습니다 (원인을 해결한 뒤 관리자가 실행)."""
+        async with self.session_factory() as db:
+            result = await db.execute(
+                update(EmbeddingOutbox)
+                .where(EmbeddingOutbox.status == "dead")
+                .values(status="pending", attempts=0, next_attempt_at=None)
+            )
+            await db.commit()
+        self.notify()
+        return result.rowcount
+
+    # --- Worker ---
+
+    def notify(self) -> None:
+        """새 행이 기록되었음을 워커에 알려 폴링 간격을 기다리지 않고 처리하게 합니다."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def start(self) -> None:
+        """이벤트 루프에서 워커 태스크를 시작합니다 (앱 lifespan 시작 시)."""
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run_forever(self) -> None:
+        await self.requeue_interrupted()
+        while True:
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Embedding outbox worker error: {e!r}")
+                processed = 0
+            if processed:
+                continue
+            try:
+                # 다른 프로세스가 처리 도중 중단된 배치도 임대 시간이 지나면 이어받음
+                await self.requeue_interrupted()
+            except Exception as e:
+                logger.error(f"Embedding outbox requeue error: {e!r}")
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def drain(self) -> int:
+        """
+        지금 처리할 수 있는 행이 없을 때까지 배치를 처리하고 처리한 행 수를 반환합니다.
+        서버 워커 없이 실행되는 스크립트(init_laws, sync_law_mirror --embed)에서 사용합니다.
+        """
+        total = 0
+        while processed := await self.run_once():
+            total += processed
+        return total
+
+    async def requeue_interrupted(self) -> int:
+        """
+        처리 시작 후 임대 시간(lease_seconds)이 지나도록 processing으로 남은 행을 다시 대기열에 넣습니다.
+        처리 도중 종료된 프로세스의 행만 대상이며, 다른 프로세스가 지금 처리 중인 행은 건드리지 않습니다.
+        """
+        expired = _utcnow() - timedelta(seconds=self.lease_seconds)
+        async with self.session_factory() as db:
+            result = await db.execute(
+                update(EmbeddingOutbox)
+                .where(
+                    EmbeddingOutbox.status == "processing",
+                    EmbeddingOutbox.claimed_at.is_(None) | (EmbeddingOutbox.claimed_at <= expired),
+                )
+                .values(status="pending", claimed_by=None, claimed_at=None)
+            )
+            await db.commit()
+        if result.rowcount:
+            logger.warning(f"Requeued {result.rowcount} interrupted embedding outbox rows")
+        return result.rowcount
+
+    async def _claim(self) -> list[EmbeddingOutbox]:
+        """처리할 수 있는 가장 오래된 행부터 개정본 batch_size개 이하의 행을 processing으로 바꾸고 반환합니다."""
+        now, token = _utcnow(), uuid.uuid4().hex
+        async with self.session_factory() as db:
+            due = (EmbeddingOutbox.status == "pending") & (
+                EmbeddingOutbox.next_attempt_at.is_(None) | (EmbeddingOutbox.next_attempt_at <= now)
+            )
+            revision_ids = set(await db.scalars(
+                select(EmbeddingOutbox.revision_id).where(due).order_by(EmbeddingOutbox.id).limit(self.batch_size)
+            ))
+            if not revision_ids:
+                return []
+            # 같은 개정본의 다른 대기 행도 함께 가져와 한 번에 처리
+            await db.execute(
+                update(EmbeddingOutbox)
+                .where(due, EmbeddingOutbox.revision_id.in_(revision_ids))
+                .values(status="processing", claimed_by=token, claimed_at=now, attempts=EmbeddingOutbox.attempts + 1)
+            )
+            await db.commit()
+            rows = list(await db.scalars(select(EmbeddingOutbox).where(EmbeddingOutbox.claimed_by == token)))
+        return rows
+
+    async def run_once(self) -> int:
+        """배치 하나를 처리합니다. 처리할 행이 없으면 0을 반환합니다."""
+        rows = await self._claim()
+        if not rows:
+            return 0
+
+        # 개정본별로 합침: 임베딩할 개정본과 시행 종료일만 반영할 개정본
+        groups: dict[int, list[EmbeddingOutbox]] = {}
+        for row in rows:
+            groups.setdefault(row.revision_id, []).append(row)
+        try:
+            await self._publish(groups)
+        except Exception as e:
+            if is_transient_error(e) or len(groups) == 1:
+                await self._fail([row for group in groups.values() for row in group], e)
+            else:
+                # 배치 중 어떤 개정본이 원인인지 알 수 없으므로 개정본별로 다시 시도
+                logger.warning(f"Embedding outbox batch failed ({e!r}), retrying {len(groups)} revisions one by one")
+                for revision_id, group in groups.items():
+                    try:
+                        await self._publish({revision_id: group})
+                    except Exception as single_error:
+                        await self._fail(group, single_error)
+                    else:
+                        await self._delete([row.id for row in group])
+            return len(rows)
+
+        await self._delete([row.id for row in rows])
+        logger.info(f"Embedding outbox: published {len(groups)} revisions ({len(rows)} rows)")
+        return len(rows)
+
+    async def _publish(self, groups: dict[int, list[EmbeddingOutbox]]) -> None:
+        """합쳐진 개정본을 벡터 스토어에 반영합니다. 삭제되어 DB에 없는 개정본은 건너뜁니다."""
+        embed_ids = [rid for rid, group in groups.items() if any(row.kind == "embed" for row in group)]
+        close_ids = [rid for rid in groups if rid not in embed_ids]
+        async with self.session_factory() as db:
+            rows = (await db.execute(
+                select(LawArticleRevision, LawArticle, Law)
+                .join(LawArticle, LawArticleRevision.article_id == LawArticle.id)
+                .join(Law, LawArticle.law_id == Law.id)
+                .where(LawArticleRevision.id.in_(list(groups)))
+                .order_by(LawArticleRevision.id)
+            )).all()
+        revisions = [revision_payload(law, article, revision) for revision, article, law in rows if revision.id in embed_ids]
+        closed = [closed_payload(revision) for revision, _, _ in rows if revision.id in close_ids]
+
+        if closed:
+            # Chroma 메타데이터 갱신은 동기 I/O이므로 이벤트 루프 밖에서 실행 (add_revisions도 임베딩/쓰기를 스레드에서 수행)
+            await asyncio.to_thread(self.checker.close_revisions, closed)
+        if revisions:
+            await self.checker.add_revisions(revisions)
+        if self.answer_cache is not None and rows:
+            # 시행 기간이 닫혔거나 새로 임베딩된 개정본을 인용한 캐시 답변은 더 이상 검색 결과와 맞지 않음
+            self.answer_cache.invalidate_revisions([revision.id for revision, _, _ in rows])
+
+    async def _delete(self, ids: list[int]) -> None:
+        async with self.session_factory() as db:
+            await db.execute(delete(EmbeddingOutbox).where(EmbeddingOutbox.id.in_(ids)))
+            await db.commit()
+
+    async def _fail(self, rows: list[EmbeddingOutbox], error: Exception) -> None:
+        """일시적 오류는 남은 시도 횟수만큼 백오프 후 다시 대기열에 넣고, 그 외에는 dead로 보냅니다."""
+        dead = 0
+        async with self.session_factory() as db:
+            for row in rows:
+                values = {"claimed_by": None, "claimed_at": None, "last_error": repr(error)}
+                if is_transient_error(error) and row.attempts < self.max_attempts:
+                    delay = self.retry_delay_seconds * 2 ** (row.attempts - 1)
+                    values.update(status="pending", next_attempt_at=_utcnow() + timedelta(seconds=delay))
+                else:
+                    values.update(status="dead")
+                    dead += 1
+                await db.execute(update(EmbeddingOutbox).where(EmbeddingOutbox.id == row.id).values(**values))
+            await db.commit()
+        if dead:
+            logger.error(f"Embedding outbox: {dead} rows dead-lettered ({error!r})")
+        if len(rows) > dead:
+            logger.warning(f"Embedding outbox: {len(rows) - dead} rows will be retried ({error!r})")
@@ -6,6 +6,8 @@ import json
 import logging
 
 from app.core.llm import get_main_llm, get_mini_llm
+from app.core.config import get_settings
+from app.services.intent_rules import RuleBasedIntentClassifier
 
 logger = logging.getLogger(__name__)
 
@@ -24,13 +26,19 @@ class InputAnalyzer:
         """
         InputAnalyzer의 생성자입니다.
         주요(Main) LLM 모델을 초기화하고, IntentResult 포맷을 위한 JSON 파서를 설정합니다.
+        INTENT_RULES_ENABLED가 켜져 있으면 LLM 앞단에서 동작할 규칙 기반 사전 분류기도 준비합니다.
         """
+        settings = get_settings()
         self.llm = get_main_llm()
         self.parser = JsonOutputParser(pydantic_object=IntentResult)
+        self.rules = RuleBasedIntentClassifier() if settings.INTENT_RULES_ENABLED else None
+        self.min_rule_confidence = settings.INTENT_RULES_MIN_CONFIDENCE
+        self.log_path = settings.INTENT_LOG_PATH
 
     async def analyze_query(self, query: str) -> dict:
         """
         주어진 사용자 질문(query)을 분석하여 핵심 의도 및 키워드를 JSON 형태로 추출합니다.
+        규칙 기반 분류기의 확신도가 INTENT_RULES_MIN_CONFIDENCE 이상이면 LLM을 호출하지 않고 그 결과를 반환합니다.
 
         Args:
             query (str): 사용자의 원본 텍스트 (질문, 하소연 등)
@@ -39,6 +47,47 @@ class InputAnalyzer:
             dict: 추출된 의도(intent), 적용 법 영역(law_domain), 키워드 리스트(keywords),
                   법률 질문 여부(is_legal_question), 상담 요청 여부(is_counseling_request) 정보
         """
+        rule_result = self.classify_with_rules(query)
+        if rule_result is not None:
+            return rule_result
+
+        result = await self._analyze_with_llm(query)
+        self._log_intent(query, result)
+        return result
+
+    def classify_with_rules(self, query: str) -> dict | None:
+        """
+        규칙 기반 분류기가 확신하는 경우에만 그 결과를 반환하고, 그렇지 않으면 None을 반환합니다.
+
+        Args:
+            query (str): 사용자의 원본 텍스트
+
+        Returns:
+            dict | None: IntentResult 형태의 분석 결과 또는 None
+        """
+        if self.rules is None:
+            return None
+        rule_result, confidence = self.rules.classify(query)
+        if confidence < self.min_rule_confidence:
+            return None
+        logger.info(f"Intent resolved by rules (confidence={confidence}): {rule_result['intent']}")
+        return rule_result
+
+    def _log_intent(self, query: str, result: dict) -> None:
+        """
+        INTENT_LOG_PATH가 설정된 경우 LLM 의도 분석 결과를 JSONL로 기록합니다.
+        이 기록은 scripts/evaluate_intent_rules.py에서 규칙 분류기의 정밀도/재현율을 측정하는 기준 데이터로 사용됩니다.
+        """
+        if not self.log_path or result.get("intent") == "분석 오류":
+            return
+        try:
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"query": query, "intent_analysis": result}, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.warning(f"Failed to write intent log: {e}")
+
+    async def _analyze_with_llm(self, query: str) -> dict:
+        """규칙 분류기가 확신하지 못한 질문을 메인 LLM으로 분석합니다."""
         system_prompt = """당신은 법률 팩트체커 시스템의 '첫 번째 단계(Input Hook)'를 담당하는 분석기입니다.
 사용자의 입력(질문, 주장, 하소연 등)을 받아서 아래의 규칙에 따라 철저히 분석하고 구조화된 데이터를 반환해야 합니다.
 
@@ -0,0 +1,263 @@
+"""
+하이브리드 검색 모듈 (BM25 + 벡터 유사도, Reciprocal Rank Fusion)
+벡터 검색은 "해고예고수당", "제26조"처럼 정확한 법률 용어/조문번호가 들어간 질의에서 놓치는 경우가 많아,
+같은 문서 집합에 대한 어휘(BM25) 색인을 함께 두고 두 순위를 RRF로 합칩니다.
+BM25 토큰은 조문 전문 검색 인덱스와 같은 글자 바이그램을 사용하여 조사가 붙은 어절도 일치시킵니다.
+"""
+import hashlib
+import logging
+import math
+import threading
+from collections import Counter
+from datetime import date
+
+from langchain_core.callbacks import AsyncCallbackManagerForRetrieverRun, CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+from pydantic import ConfigDict
+
+from app.models.fulltext import to_ngrams
+
+logger = logging.getLogger(__name__)
+
+
+# 시행 종료일이 없는(현행) 개정본의 effective_end 값. Chroma 메타데이터는 None을 저장할 수 없음
+OPEN_END = 99991231
+
+
+def date_to_int(value: date | None, default: int) -> int:
+    """날짜를 Chroma 메타데이터 범위 필터($lte/$gt)에 쓸 수 있는 YYYYMMDD 정수로 변환합니다."""
+    return int(value.strftime("%Y%m%d")) if value else default
+
+
+def effective_date_metadata(start: date | None, end: date | None) -> dict:
+    """벡터에 함께 저장할 시행 기간 메타데이터 (시작일 포함, 종료일 미포함)"""
+    return {"effective_start": date_to_int(start, 0), "effective_end": date_to_int(end, OPEN_END)}
+
+
+def effective_date_filter(as_of: date) -> dict:
+    """as_of 시점에 시행 중인 벡터만 남기는 Chroma where 필터"""
+    day = date_to_int(as_of, 0)
+    return {"$and": [{"effective_start": {"$lte": day}}, {"effective_end": {"$gt": day}}]}
+
+
+def retrieval_filter(as_of: date | None = None, law_ids: list[int] | None = None) -> dict | None:
+    """
+    시점 필터와 법령 파티션 필터(law_id)를 하나의 Chroma where 필터로 합칩니다.
+    law_ids가 주어지면 해당 법령의 벡터만 후보로 삼으므로 ANN 탐색 범위가 전체 컬렉션이 아니라 그 법령으로 줄어듭니다.
+    """
+    conditions = []
+    if as_of is not None:
+        conditions += effective_date_filter(as_of)["$and"]
+    if law_ids:
+        conditions.append({"law_id": {"$in": list(law_ids)}})
+    if not conditions:
+        return None
+    return conditions[0] if len(conditions) == 1 else {"$and": conditions}
+
+
+def is_effective(metadata: dict, as_of: date) -> bool:
+    """effective_date_filter와 같은 조건을 메타데이터 딕셔너리에 적용합니다 (BM25 색인용)."""
+    day = date_to_int(as_of, 0)
+    return metadata.get("effective_start", 0) <= day < metadata.get("effective_end", OPEN_END)
+
+
+def document_key(doc: Document) -> str:
+    """RRF에서 같은 문서를 식별하는 키 (revision_id나 인제스트 청크의 parent_id가 있으면 사용, 없으면 출처 + 본문)"""
+    revision_id = doc.metadata.get("revision_id")
+    if revision_id is not None:
+        return f"revision:{revision_id}"
+    parent_id = doc.metadata.get("parent_id")
+    if parent_id is not None:
+        return f"parent:{parent_id}"
+    return f"{doc.metadata.get('source', '')}\n{doc.page_content}"
+
+
+def vector_id(doc: Document) -> str:
+    """
+    벡터 스토어에 저장할 결정적 문서 ID. 개정본은 revision_id로, 인제스트 청크는 parent_id(원문 청크 키) 해시로,
+    그 외 문서는 출처 + 본문 해시로 정해지므로
+    같은 문서를 다시 넣으면 새 벡터가 추가되지 않고 기존 벡터를 덮어씁니다(upsert).
+    """
+    revision_id = doc.metadata.get("revision_id")
+    if revision_id is not None:
+        return f"revision-{revision_id}"
+    digest = hashlib.sha256(document_key(doc).encode("utf-8")).hexdigest()
+    return f"doc-{digest}"
+
+
+def content_hash(content: str) -> str:
+    """벡터 메타데이터에 저장하는 본문 해시 (정합성 검사에서 SQL 본문과 비교)"""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _tokenize(doc: Document) -> list[str]:
+    # 출처("근로기준법 제26조")도 함께 색인하여 조문번호 질의가 일치하도록 함
+    return to_ngrams(f"{doc.metadata.get('source', '')} {doc.page_content}").split()
+
+
+class BM25Index:
+    """
+    메모리 내 Okapi BM25 색인입니다. 벡터 스토어와 같은 문서를 add로 추가하며,
+    같은 키(revision_id)의 문서를 다시 추가하면 기존 문서를 대체합니다.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.Lock()
+        self._docs: dict[str, Document] = {}
+        self._term_freqs: dict[str, Counter] = {}
+        self._doc_freqs: Counter = Counter()
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, docs: list[Document]) -> None:
+        """문서를 색인에 추가합니다 (같은 키의 기존 문서는 대체)."""
+        with self._lock:
+            for doc in docs:
+                key = document_key(doc)
+                if key in self._docs:
+                    self._remove(key)
+                freqs = Counter(_tokenize(doc))
+                self._docs[key] = doc
+                self._term_freqs[key] = freqs
+                self._doc_freqs.update(freqs.keys())
+                self._total_length += sum(freqs.values())
+
+    def _remove(self, key: str) -> None:
+        freqs = self._term_freqs.pop(key)
+        del self._docs[key]
+        self._doc_freqs.subtract(freqs.keys())
+        self._total_length -= sum(freqs.values())
+
+    def update_metadata(self, revision_id: int, updates: dict) -> None:
+        """색인된 개정본 문서의 메타데이터(시행 기간 등)를 갱신합니다. 토큰은 바뀌지 않으므로 재색인하지 않습니다."""
+        with self._lock:
+            doc = self._docs.get(f"revision:{revision_id}")
+            if doc is not None:
+                doc.metadata.update(updates)
+
+    def remove_revisions(self, revision_ids: list[int]) -> None:
+        """벡터 스토어에서 지운 개정본 문서를 색인에서도 뺍니다."""
+        with self._lock:
+            for revision_id in revision_ids:
+                if f"revision:{revision_id}" in self._docs:
+                    self._remove(f"revision:{revision_id}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._docs.clear()
+            self._term_freqs.clear()
+            self._doc_freqs.clear()
+            self._total_length = 0
+
+    def search(
+        self, query: str, k: int, as_of: date | None = None, law_ids: list[int] | None = None
+    ) -> list[tuple[Document, float]]:
+        """
+        질의와 BM25 점수가 높은 순으로 최대 k개의 (문서, 점수)를 반환합니다. 일치 토큰이 없는 문서는 제외합니다.
+        as_of가 주어지면 그 시점에 시행 중인 문서만, law_ids가 주어지면 그 법령의 문서만 점수를 매깁니다 (상위 k개를 고르기 전에 거름).
+        """
+        allowed = set(law_ids) if law_ids else None
+        terms = set(to_ngrams(query).split())
+        with self._lock:
+            total = len(self._docs)
+            if not terms or not total:
+                return []
+            avg_length = self._total_length / total
+            idf = {
+                term: math.log(1 + (total - self._doc_freqs[term] + 0.5) / (self._doc_freqs[term] + 0.5))
+                for term in terms if self._doc_freqs[term] > 0
+            }
+            scores = []
+            for key, freqs in self._term_freqs.items():
+                metadata = self._docs[key].metadata
+                if allowed is not None and metadata.get("law_id") not in allowed:
+                    continue
+                if as_of is not None and not is_effective(metadata, as_of):
+                    continue
+                length = sum(freqs.values())
+                score = 0.0
+                for term, weight in idf.items():
+                    tf = freqs.get(term, 0)
+                    if tf:
+                        score += weight * tf * (self.k1 + 1) / (tf + self.k1 * (1 - self.b + self.b * length / avg_length))
+                if score > 0:
+                    scores.append((key, score))
+            scores.sort(key=lambda item: item[1], reverse=True)
+            return [(self._docs[key], score) for key, score in scores[:k]]
+
+
+def reciprocal_rank_fusion(rankings: list[list[Document]], weights: list[float], k: int = 60) -> list[Document]:
+    """
+    여러 순위 목록을 Reciprocal Rank Fusion으로 합칩니다: score(d) = Σ weight_i / (k + rank_i(d))
+
+    Args:
+        rankings (list[list[Document]]): 검색기별 순위 목록 (앞쪽이 상위)
+        weights (list[float]): 검색기별 가중치
+        k (int, optional): 순위 완화 상수. 클수록 하위 순위의 기여가 커집니다. Defaults to 60.
+
+    Returns:
+        list[Document]: 융합 점수 순으로 정렬된 중복 없는 문서 목록 (metadata["rrf_score"] 포함)
+    """
+    scores: dict[str, float] = {}
+    docs: dict[str, Document] = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, doc in enumerate(ranking, start=1):
+            key = document_key(doc)
+            scores[key] = scores.get(key, 0.0) + weight / (k + rank)
+            docs.setdefault(key, doc)
+    ordered = sorted(scores, key=scores.get, reverse=True)
+    return [
+        Document(page_content=docs[key].page_content, metadata={**docs[key].metadata, "rrf_score": round(scores[key], 6)})
+        for key in ordered
+    ]
+
+
+class HybridRetriever(BaseRetriever):
+    """
+    벡터 스토어 유사도 검색과 BM25 검색의 후보를 각각 candidate_k개씩 뽑아 RRF로 합친 뒤 상위 top_k개를 반환합니다.
+    as_of가 주어지면 두 검색 모두 그 시점에 시행 중인 조문(effective_start <= as_of < effective_end)만 대상으로 하고,
+    law_ids가 주어지면 두 검색 모두 해당 법령 파티션(law_id)의 조문만 대상으로 합니다.
+    LangChain Retriever 인터페이스를 따르므로 create_history_aware_retriever에 그대로 사용할 수 있습니다.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    vector_store: object
+    bm25_index: BM25Index
+    top_k: int = 3
+    candidate_k: int = 20
+    rrf_k: int = 60
+    dense_weight: float = 1.0
+    bm25_weight: float = 1.0
+    as_of: date | None = None
+    law_ids: list[int] | None = None
+
+    def _dense_kwargs(self) -> dict:
+        # 시점·법령 필터는 검색 후가 아니라 벡터 스토어 질의 안에서 적용하여 후보 수(k)를 낭비하지 않음
+        kwargs = {"k": self.candidate_k}
+        where = retrieval_filter(self.as_of, self.law_ids)
+        if where is not None:
+            kwargs["filter"] = where
+        return kwargs
+
+    def _fuse(self, dense: list[Document], query: str) -> list[Document]:
+        lexical = [doc for doc, _ in self.bm25_index.search(
+            query, self.candidate_k, as_of=self.as_of, law_ids=self.law_ids
+        )]
+        fused = reciprocal_rank_fusion([dense, lexical], [self.dense_weight, self.bm25_weight], k=self.rrf_k)
+        return fused[:self.top_k]
+
+    def _get_relevant_documents(self, query: str, *, run_manager: CallbackManagerForRetrieverRun) -> list[Document]:
+        dense = self.vector_store.similarity_search(query, **self._dense_kwargs()) if self.dense_weight > 0 else []
+        return self._fuse(dense, query)
+
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun
+    ) -> list[Document]:
+        dense = await self.vector_store.asimilarity_search(query, **self._dense_kwargs()) if self.dense_weight > 0 else []
+        return self._fuse(dense, query)
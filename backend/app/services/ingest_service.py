@@ -1,31 +1,302 @@
 import os
+import re
+import json
+import time
+import random
+import hashlib
 import logging
 from langchain_community.document_loaders import PyPDFLoader, TextLoader
 from langchain_chroma import Chroma
-from langchain_openai import OpenAIEmbeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.documents import Document
 
-from app.core.llm import get_mini_llm
+from app.core.llm import get_embeddings, get_mini_llm
 from app.core.config import get_settings
+from app.services.article_splitter import ArticleSplitter, split_paragraphs
+from app.services.hybrid_retriever import vector_id
+from app.services.parent_store import ParentDocumentStore
 
 logger = logging.getLogger(__name__)
 
 
 import asyncio
 
-async def ingest_data(file_paths: list[str]):
+# 재시도할 일시적 오류의 HTTP 상태 (레이트 리밋, 서버 과부하)
+TRANSIENT_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+def chunk_key(doc: Document) -> str:
+    """체크포인트에서 청크를 식별하는 키 (출처 + 페이지 + 본문 해시). 청크 순서가 바뀌어도 같은 청크면 같은 키"""
+    raw = f"{doc.metadata.get('source', '')}\n{doc.metadata.get('page', '')}\n{doc.page_content}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def is_transient_error(error: Exception) -> bool:
+    """레이트 리밋(429)·타임아웃·연결 오류·5xx·DB 연결 오류처럼 다시 시도하면 성공할 수 있는 오류인지 판단합니다."""
+    import httpx
+    import openai
+    from sqlalchemy.exc import OperationalError
+
+    transient = (
+        openai.APITimeoutError, openai.APIConnectionError, httpx.TransportError, OperationalError,
+        asyncio.TimeoutError, TimeoutError, ConnectionError,
+    )
+    if isinstance(error, transient):
+        return True
+    return getattr(error, "status_code", None) in TRANSIENT_STATUS_CODES
+
+
+def _retry_after(error: Exception) -> float | None:
+    """429 응답의 Retry-After 헤더(초)가 있으면 반환합니다."""
+    response = getattr(error, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class SummaryCheckpoint:
+    """
+    완료된 청크 요약을 JSON Lines 파일에 한 줄씩 추가 기록합니다.
+    수집이 중간에 중단되어도 다시 실행하면 기록된 청크는 LLM을 호출하지 않고 이어서 처리하며,
+    전체 수집이 끝나면 clear()로 파일을 지웁니다. path가 비어 있으면 아무것도 기록하지 않습니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.summaries: dict[str, str] = {}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # 기록 도중 중단된 마지막 줄
+                    self.summaries[entry["key"]] = entry["summary"]
+        self._file = open(path, "a", encoding="utf-8") if path else None
+
+    def get(self, key: str) -> str | None:
+        return self.summaries.get(key)
+
+    def record(self, key: str, summary: str) -> None:
+        self.summaries[key] = summary
+        if self._file is not None:
+            self._file.write(json.dumps({"key": key, "summary": summary}, ensure_ascii=False) + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def clear(self) -> None:
+        self.close()
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+async def summarize_chunks(
+    chain,
+    splits: list[Document],
+    checkpoint: SummaryCheckpoint,
+    concurrency: int = 8,
+    max_retries: int = 5,
+    base_delay: float = 1.0,
+    min_chars: int = 0,
+) -> tuple[list[Document], dict]:
+    """
+    청크별 요약을 최대 concurrency개씩 동시에 생성하고, 입력 순서대로 요약 문서를 조립합니다.
+    레이트 리밋 등 일시적 오류는 지수 백오프(Retry-After 헤더 우선)로 max_retries회까지 재시도하고,
+    그래도 실패하거나 일시적이지 않은 오류면 기존처럼 원문을 그대로 사용합니다.
+    체크포인트에 요약이 있는 청크는 LLM을 호출하지 않으며, 새로 생성한 요약은 즉시 체크포인트에 기록합니다.
+    min_chars보다 짧은 청크(짧은 조문)는 요약문과 길이가 비슷하므로 LLM을 호출하지 않고 원문을 그대로 사용합니다.
+
+    Args:
+        chain: {"text": 원문}을 받아 요약 문자열을 반환하는 Runnable
+        splits (list[Document]): 요약할 청크 목록
+        checkpoint (SummaryCheckpoint): 완료된 요약 기록
+        concurrency (int, optional): 동시에 실행할 요약 호출 수. Defaults to 8.
+        max_retries (int, optional): 일시적 오류 재시도 횟수. Defaults to 5.
+        base_delay (float, optional): 첫 재시도 대기 시간(초). 시도마다 두 배. Defaults to 1.0.
+        min_chars (int, optional): 이보다 짧은 청크는 요약하지 않음. Defaults to 0 (모두 요약).
+
+    Returns:
+        tuple[list[Document], dict]: (요약을 page_content로, 원문 청크 키(chunk_key)를 metadata["parent_id"]로 가진 문서 목록,
+            처리 통계 {chunks, summarized, resumed, fallbacks, short, retries, calls, elapsed_seconds, chunks_per_second})
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    stats = {"chunks": len(splits), "summarized": 0, "resumed": 0, "fallbacks": 0, "short": 0, "retries": 0, "calls": 0}
+    done = 0
+
+    async def summarize(i: int, split: Document) -> Document:
+        nonlocal done
+        original_text = split.page_content
+        key = chunk_key(split)
+        # 원문은 메타데이터에 싣지 않고 부모 문서 저장소에 청크 키로 따로 보관
+        new_metadata = {**split.metadata, "parent_id": key}
+
+        if len(original_text) < min_chars:
+            stats["short"] += 1
+            done += 1
+            return Document(page_content=original_text, metadata=new_metadata)
+        summary = checkpoint.get(key)
+        if summary is not None:
+            stats["resumed"] += 1
+        else:
+            async with semaphore:
+                for attempt in range(max_retries + 1):
+                    try:
+                        stats["calls"] += 1
+                        summary = await chain.ainvoke({"text": original_text})
+                        break
+                    except Exception as e:
+                        if attempt == max_retries or not is_transient_error(e):
+                            logger.error(f"Error processing chunk {i}: {e}")
+                            break
+                        stats["retries"] += 1
+                        delay = _retry_after(e) or base_delay * 2 ** attempt * (1 + random.random() * 0.5)
+                        logger.warning(f"Chunk {i} hit a transient error ({e!r}), retrying in {delay:.1f}s")
+                        await asyncio.sleep(delay)
+            if summary is not None:
+                checkpoint.record(key, summary)
+                stats["summarized"] += 1
+
+        done += 1
+        if done % 10 == 0:
+            logger.info(f"Processed {done}/{len(splits)} chunks")
+        if summary is None:
+            # Fallback to original text if summary generation fails
+            stats["fallbacks"] += 1
+            return Document(page_content=original_text, metadata=new_metadata)
+        return Document(page_content=summary, metadata=new_metadata)
+
+    started = time.perf_counter()
+    # gather는 입력 순서대로 결과를 돌려주므로 완료 순서와 무관하게 원래 청크 순서가 유지됨
+    summary_docs = await asyncio.gather(*(summarize(i, split) for i, split in enumerate(splits)))
+    elapsed = time.perf_counter() - started
+    stats["elapsed_seconds"] = round(elapsed, 3)
+    stats["chunks_per_second"] = round(len(splits) / elapsed, 2) if elapsed > 0 else 0.0
+    return list(summary_docs), stats
+
+
+def law_name_from_source(source: str) -> str:
+    """국가법령정보센터 파일명("근로기준법(법률)(제20520호)(20250223).pdf")에서 법령명을 꺼냅니다."""
+    stem = os.path.splitext(os.path.basename(source))[0]
+    return re.split(r"[(（]", stem, maxsplit=1)[0].strip() or stem
+
+
+def article_chunks(documents: list[Document], max_chars: int = 1000) -> list[Document]:
+    """
+    로더가 읽은 쪽 문서들을 출처(파일)별로 모아 조 단위 청크로 나눕니다.
+    조 하나가 청크 하나이고, max_chars보다 긴 조만 항(①②…) 경계에서 나눕니다. 청크끼리 겹치는 부분은 없습니다.
+    두 번째 이후 청크에는 조 제목줄("제74조(임산부의 보호)")을 앞에 붙여 요약·검색 시 어느 조인지 알 수 있게 합니다.
+    삭제된 조는 건너뛰고, 조문 구조가 없는 문서와 규칙으로 나누지 못한 구간은 기존 글자 수 기준 분할을 사용합니다.
+
+    Args:
+        documents (list[Document]): PyPDFLoader/TextLoader가 읽은 문서 (metadata에 source, page)
+        max_chars (int, optional): 청크 하나의 최대 길이 (항 하나가 이보다 길면 예외). Defaults to 1000.
+
+    Returns:
+        list[Document]: 조문 청크 (metadata에 source, page(조가 시작하는 쪽), law_name, article_number, article_title,
+            chunk_index, chunk_count)와 조문 구조가 없는 구간의 일반 청크
+    """
+    fallback = RecursiveCharacterTextSplitter(chunk_size=max_chars, chunk_overlap=max_chars // 5)
+    by_source: dict[str, list[Document]] = {}
+    for doc in documents:
+        by_source.setdefault(doc.metadata.get("source", ""), []).append(doc)
+
+    chunks = []
+    for source, pages in by_source.items():
+        splitter = ArticleSplitter(include_supplementary=True)
+        start_pages: dict[int, int] = {}
+        for page in pages:
+            splitter.feed(page.page_content)
+            for article in splitter.articles:
+                start_pages.setdefault(id(article), page.metadata.get("page", 0))
+        articles, unparsed = splitter.finish()
+        if not articles:
+            chunks.extend(fallback.split_documents(pages))
+            continue
+
+        law_name = law_name_from_source(source)
+        for article in articles:
+            if article["deleted"]:
+                continue
+            heading = article["article_number"] + (f"({article['title']})" if article["title"] else "")
+            parts = split_paragraphs(article["content"], max_chars)
+            for i, part in enumerate(parts):
+                chunks.append(Document(
+                    page_content=part if i == 0 else f"{heading}\n{part}",
+                    metadata={
+                        "source": source,
+                        "page": start_pages.get(id(article), 0),
+                        "law_name": law_name,
+                        "article_number": article["article_number"],
+                        "article_title": article["title"],
+                        "chunk_index": i,
+                        "chunk_count": len(parts),
+                    },
+                ))
+        for segment in unparsed:
+            chunks.extend(fallback.split_documents([Document(page_content=segment, metadata={"source": source})]))
+    return chunks
+
+
+async def attach_law_ids(chunks: list[Document]) -> int:
+    """
+    laws 테이블에 같은 이름의 법령이 있으면 조문 청크 메타데이터에 law_id를 채웁니다.
+    law_id가 있어야 법 영역별 파티션 검색(RETRIEVAL_LAW_PARTITIONING)의 대상이 됩니다.
+
+    Returns:
+        int: law_id를 채운 청크 수
+    """
+    from sqlalchemy import select
+    from sqlalchemy.exc import SQLAlchemyError
+
+    from app.core.database import AsyncSessionLocal
+    from app.models import Law
+
+    names = {doc.metadata["law_name"] for doc in chunks if "law_name" in doc.metadata}
+    if not names:
+        return 0
+    try:
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(select(Law.id, Law.name).where(Law.name.in_(names)))).all()
+    except SQLAlchemyError as e:
+        logger.warning(f"Law lookup failed, storing chunks without law_id: {e!r}")
+        return 0
+    law_ids = {row.name: row.id for row in rows}
+    attached = 0
+    for doc in chunks:
+        law_id = law_ids.get(doc.metadata.get("law_name"))
+        if law_id is not None:
+            doc.metadata["law_id"] = law_id
+            attached += 1
+    return attached
+
+
+async def ingest_data(file_paths: list[str]) -> dict:
     """
     제공된 PDF 및 텍스트 문서를 수집(Ingest)하여 메인 벡터 데이터베이스에 저장하는 파이프라인 함수입니다.
-    문서를 파싱하고 일정한 크기의 청크(Chunk)로 나눈 후, 성능 향상을 위해 각 청크별 세부 요약본(Summary)을 생성하여
-    로컬 ChromaDB에 임베딩 데이터와 함께 영구 저장합니다.
+    문서를 파싱하고 조(條) 단위 청크로 나눈 후(긴 조는 항 경계에서 분할), 성능 향상을 위해 각 청크별 세부 요약본(Summary)을 생성하여
+    로컬 ChromaDB에 임베딩 데이터와 함께 영구 저장합니다. 청크 원문은 벡터 메타데이터가 아니라
+    부모 문서 저장소(parent_documents)에 청크 키로 저장하며, 검색 시 상위 k개 요약의 원문만 ID로 조회합니다.
+    요약은 INGEST_SUMMARY_CONCURRENCY개씩 동시에 생성하며, 완료된 요약은 체크포인트 파일에 기록되어
+    중간에 중단되더라도 다시 실행하면 남은 청크부터 이어서 처리합니다.
 
     Args:
         file_paths (list[str]): 수집 대상이 되는 로컬 PDF 또는 순수 텍스트 문서들의 파일 절대 경로 리스트
+
+    Returns:
+        dict: 요약 단계 처리 통계 (청크 수, 재개/대체 수, chunks_per_second, 전체 소요 시간 total_seconds,
+            조문 청크 수 article_chunks, 새로 저장한 원문 수 parent_documents)
     """
-    VECTOR_STORE_PATH = get_settings().VECTOR_STORE_PATH
+    started = time.perf_counter()
+    settings = get_settings()
+    VECTOR_STORE_PATH = settings.VECTOR_STORE_PATH
     documents = []
     for path in file_paths:
         if path.endswith(".pdf"):
@@ -34,8 +305,8 @@ async def ingest_data(file_paths: list[str]):
             loader = TextLoader(path)
         documents.extend(loader.load())
 
-    text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
-    splits = text_splitter.split_documents(documents)
+    splits = article_chunks(documents, settings.INGEST_ARTICLE_MAX_CHARS)
+    await attach_law_ids(splits)
 
     llm = get_mini_llm()
     
@@ -46,37 +317,53 @@ async def ingest_data(file_paths: list[str]):
     
     chain = prompt | llm | StrOutputParser()
     
-    summary_docs = []
-    logger.info(f"Generating summaries for {len(splits)} chunks...")
-    for i, split in enumerate(splits):
-        try:
-            original_text = split.page_content
-            # Generate summary
-            summary = await chain.ainvoke({"text": original_text})
-            
-            # Create a new document with summary as page_content and original text in metadata
-            new_metadata = split.metadata.copy()
-            new_metadata["original_text"] = original_text
-            
-            summary_docs.append(Document(page_content=summary, metadata=new_metadata))
-            if (i+1) % 10 == 0:
-                logger.info(f"Processed {i+1}/{len(splits)} chunks")
-        except Exception as e:
-            logger.error(f"Error processing chunk {i}: {e}")
-            # Fallback to original text if summary generation fails
-            new_metadata = split.metadata.copy()
-            new_metadata["original_text"] = split.page_content
-            summary_docs.append(Document(page_content=split.page_content, metadata=new_metadata))
+    checkpoint = SummaryCheckpoint(settings.INGEST_CHECKPOINT_PATH)
+    logger.info(
+        f"Generating summaries for {len(splits)} chunks "
+        f"(concurrency={settings.INGEST_SUMMARY_CONCURRENCY}, {len(checkpoint.summaries)} in checkpoint)..."
+    )
+    try:
+        summary_docs, stats = await summarize_chunks(
+            chain,
+            splits,
+            checkpoint,
+            concurrency=settings.INGEST_SUMMARY_CONCURRENCY,
+            max_retries=settings.INGEST_SUMMARY_MAX_RETRIES,
+            min_chars=settings.INGEST_SUMMARY_MIN_CHARS,
+        )
+    finally:
+        checkpoint.close()
+    logger.info(
+        f"Summarized {stats['chunks']} chunks in {stats['elapsed_seconds']:.1f}s ({stats['chunks_per_second']} chunks/sec, "
+        f"{stats['calls']} LLM calls, {stats['short']} short chunks kept as-is, {stats['resumed']} resumed, "
+        f"{stats['retries']} retries, {stats['fallbacks']} fallbacks)"
+    )
+
+    # 벡터가 원문 없는 parent_id를 가리키지 않도록 원문을 먼저 저장
+    from app.core.database import AsyncSessionLocal
+
+    stats["parent_documents"] = await ParentDocumentStore(AsyncSessionLocal).put([
+        {"id": chunk_key(split), "content": split.page_content, "source": split.metadata.get("source")}
+        for split in splits
+    ])
 
     logger.info("Storing summary documents into Vector Store...")
+    # 원문 청크 키(parent_id)로 ID를 정하여 같은 문서를 다시 수집하면 요약이 달라져도 기존 벡터를 덮어씀
     vector_store = Chroma.from_documents(
         documents=summary_docs,
-        embedding=OpenAIEmbeddings(),
+        embedding=get_embeddings(),
+        ids=[vector_id(doc) for doc in summary_docs],
         persist_directory=VECTOR_STORE_PATH
     )
-    logger.info(f"Ingested {len(splits)} chunks into {VECTOR_STORE_PATH}")
+    # 벡터 저장까지 끝났으므로 체크포인트는 더 이상 필요 없음
+    checkpoint.clear()
+    stats["article_chunks"] = sum(1 for doc in splits if "article_number" in doc.metadata)
+    stats["total_seconds"] = round(time.perf_counter() - started, 3)
+    logger.info(f"Ingested {len(splits)} chunks into {VECTOR_STORE_PATH} in {stats['total_seconds']:.1f}s")
+    return stats
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     current_dir = os.path.dirname(os.path.abspath(__file__))
     # __file__ is backend/app/services/ingest_service.py
     # dir: backend/app/services
@@ -96,6 +383,11 @@ if __name__ == "__main__":
     ]
     
     if pdf_files:
+        from app.core.database import engine
+        from app.models import Base
+
+        # Make sure tables exist (parent_documents)
+        Base.metadata.create_all(bind=engine)
         logger.info(f"Found {len(pdf_files)} PDF files: {pdf_files}")
         asyncio.run(ingest_data(pdf_files))
     else:
@@ -0,0 +1,273 @@
+"""
+규칙 기반 의도 사전 분류기 (Input Hook Fast Path)
+법률 용어 사전(법령명, 조문 번호, 자주 쓰이는 노동/임대차 용어)을 다중 패턴 매처(Aho-Corasick)로 한 번에 스캔하여,
+인사말/무관한 잡담과 용어가 분명한 법률 질문은 LLM 호출 없이 IntentResult와 동일한 형태로 분류합니다.
+확신도가 낮은 입력만 InputAnalyzer의 LLM 분석으로 넘깁니다.
+"""
+import re
+from collections import Counter, deque
+
+UNKNOWN_DOMAIN = "알 수 없음"
+
+# 법령명 → 법 영역 (띄어쓰기 변형은 매칭 전 공백 제거로 흡수)
+LAW_NAMES = {
+    "근로기준법": "근로기준법",
+    "근기법": "근로기준법",
+    "주택임대차보호법": "주택임대차보호법",
+    "주임법": "주택임대차보호법",
+    "상가건물임대차보호법": "상가건물 임대차보호법",
+    "최저임금법": "최저임금법",
+    "근로자퇴직급여보장법": "근로자퇴직급여 보장법",
+    "퇴직급여법": "근로자퇴직급여 보장법",
+    "남녀고용평등법": "남녀고용평등법",
+    "산업안전보건법": "산업안전보건법",
+    "산업재해보상보험법": "산업재해보상보험법",
+    "산재보험법": "산업재해보상보험법",
+    "임금채권보장법": "임금채권보장법",
+    "고용보험법": "고용보험법",
+}
+
+# 법률 용어 → (법 영역, 주제)
+LEGAL_TERMS = {
+    "월급": ("근로기준법", "임금 지급"),
+    "급여": ("근로기준법", "임금 지급"),
+    "임금": ("근로기준법", "임금 지급"),
+    "체불": ("근로기준법", "임금 체불"),
+    "임금체불": ("근로기준법", "임금 체불"),
+    "통상임금": ("근로기준법", "임금 지급"),
+    "해고": ("근로기준법", "해고"),
+    "부당해고": ("근로기준법", "해고"),
+    "잘렸": ("근로기준법", "해고"),
+    "짤렸": ("근로기준법", "해고"),
+    "해고예고": ("근로기준법", "해고 예고"),
+    "해고예고수당": ("근로기준법", "해고 예고"),
+    "권고사직": ("근로기준법", "해고"),
+    "수습": ("근로기준법", "수습 근로"),
+    "근로계약서": ("근로기준법", "근로계약"),
+    "근로계약": ("근로기준법", "근로계약"),
+    "연장근로": ("근로기준법", "근로시간"),
+    "야근": ("근로기준법", "근로시간"),
+    "야간수당": ("근로기준법", "가산수당"),
+    "휴일수당": ("근로기준법", "가산수당"),
+    "연장수당": ("근로기준법", "가산수당"),
+    "주휴수당": ("근로기준법", "주휴수당"),
+    "휴게시간": ("근로기준법", "휴게"),
+    "연차": ("근로기준법", "연차휴가"),
+    "연차수당": ("근로기준법", "연차휴가"),
+    "직장내괴롭힘": ("근로기준법", "직장 내 괴롭힘"),
+    "괴롭힘": ("근로기준법", "직장 내 괴롭힘"),
+    "5인미만": ("근로기준법", "적용 범위"),
+    "상시근로자": ("근로기준법", "적용 범위"),
+    "근로자": ("근로기준법", "근로관계"),
+    "사용자": ("근로기준법", "근로관계"),
+    "노동청": ("근로기준법", "권리 구제"),
+    "진정서": ("근로기준법", "권리 구제"),
+    "노동위원회": ("근로기준법", "권리 구제"),
+    "퇴직금": ("근로자퇴직급여 보장법", "퇴직금"),
+    "퇴직연금": ("근로자퇴직급여 보장법", "퇴직금"),
+    "최저임금": ("최저임금법", "최저임금"),
+    "최저시급": ("최저임금법", "최저임금"),
+    "시급": ("최저임금법", "최저임금"),
+    "육아휴직": ("남녀고용평등법", "육아휴직"),
+    "출산휴가": ("근로기준법", "출산휴가"),
+    "성희롱": ("남녀고용평등법", "직장 내 성희롱"),
+    "산재": ("산업재해보상보험법", "산업재해"),
+    "산업재해": ("산업재해보상보험법", "산업재해"),
+    "실업급여": ("고용보험법", "실업급여"),
+    "보증금": ("주택임대차보호법", "보증금 반환"),
+    "전세": ("주택임대차보호법", "주택임대차"),
+    "월세": ("주택임대차보호법", "주택임대차"),
+    "집주인": ("주택임대차보호법", "주택임대차"),
+    "임대인": ("주택임대차보호법", "주택임대차"),
+    "임차인": ("주택임대차보호법", "주택임대차"),
+    "세입자": ("주택임대차보호법", "주택임대차"),
+    "계약갱신": ("주택임대차보호법", "계약갱신"),
+    "확정일자": ("주택임대차보호법", "대항력/우선변제"),
+    "전입신고": ("주택임대차보호법", "대항력/우선변제"),
+}
+
+# 구어체 표현 → 검색용 표준 키워드
+CANONICAL_KEYWORDS = {
+    "잘렸": "해고",
+    "짤렸": "해고",
+    "야근": "연장근로",
+    "체불": "임금체불",
+    "최저시급": "최저임금",
+    "집주인": "임대인",
+    "세입자": "임차인",
+    "5인미만": "5인 미만 사업장",
+    "직장내괴롭힘": "직장 내 괴롭힘",
+}
+
+# 당사자를 가리키는 일반 용어: 법 영역 판단에는 쓰지만 법률 질문이라는 확신의 근거로는 보지 않음
+GENERIC_TERMS = {"근로자", "사용자"}
+
+# 인사말: 메시지 전체가 인사말 토큰으로만 이루어진 경우에만 인사로 분류
+GREETING_TOKEN = re.compile(
+    r"(?:안녕(?:하세요|하십니까)?|하이|ㅎㅇ|반가워요?|반갑습니다|고마워요?|고맙습니다|감사합니다|감사해요|테스트|ㅋ+|ㅎ+)+"
+)
+ASCII_GREETINGS = {"hello", "hi", "hey", "thanks", "thank", "you", "test"}
+
+OFF_TOPIC = [
+    "날씨", "밥먹었", "맛집", "점심메뉴", "저녁메뉴", "게임", "노래추천", "영화추천", "농담", "심심",
+    "뭐해", "누구야", "이름이뭐",
+]
+
+# 자신의 구체적인 상황을 설명하는 표현 (상담 요청 여부 판단)
+COUNSELING_MARKERS = [
+    "저는", "제가", "저희", "내가", "나는", "우리회사", "우리사장", "사장님이", "사장이", "회사에서",
+    "당했", "받았는데", "못받", "안줘", "안주", "안돌려", "못돌려", "어떻게해야", "신고가능", "신고할수",
+]
+
+ARTICLE_PATTERN = re.compile(r"제\s*(\d+)\s*조(?:\s*의\s*(\d+))?")
+
+
+class AhoCorasickMatcher:
+    """여러 패턴을 입력 길이에 선형인 시간으로 한 번에 찾는 Aho-Corasick 다중 패턴 매처입니다."""
+
+    def __init__(self, patterns: list[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[str]] = [[]]
+
+        for pattern in patterns:
+            node = 0
+            for ch in pattern:
+                if ch not in self._goto[node]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                    self._goto[node][ch] = len(self._goto) - 1
+                node = self._goto[node][ch]
+            self._out[node].append(pattern)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(ch, 0)
+                self._out[child].extend(self._out[self._fail[child]])
+
+    def find_all(self, text: str) -> list[str]:
+        """텍스트에 등장하는 모든 패턴을 등장 순서대로(중복 포함) 반환합니다."""
+        found = []
+        node = 0
+        for ch in text:
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            found.extend(self._out[node])
+        return found
+
+
+class RuleBasedIntentClassifier:
+    """
+    사전 기반 의도 분류기입니다. classify()는 IntentResult와 동일한 키를 가진 딕셔너리와 확신도(0~1)를 반환하며,
+    호출 측(InputAnalyzer)은 확신도가 임계값 이상일 때만 LLM 분석을 생략합니다.
+    """
+
+    def __init__(self):
+        self._law_matcher = AhoCorasickMatcher(list(LAW_NAMES))
+        self._term_matcher = AhoCorasickMatcher(list(LEGAL_TERMS))
+        self._off_topic_matcher = AhoCorasickMatcher(OFF_TOPIC)
+        self._counseling_matcher = AhoCorasickMatcher(COUNSELING_MARKERS)
+
+    def classify(self, query: str) -> tuple[dict, float]:
+        """
+        질문을 사전 기반으로 분류합니다.
+
+        Args:
+            query (str): 사용자의 원본 텍스트
+
+        Returns:
+            tuple[dict, float]: IntentResult 형태의 분석 결과와 확신도
+        """
+        compact = re.sub(r"\s+", "", query).lower()
+
+        laws = _dedupe(self._law_matcher.find_all(compact))
+        terms = _longest_only(_dedupe(self._term_matcher.find_all(compact)))
+        articles = _dedupe(
+            f"제{m.group(1)}조" + (f"의{m.group(2)}" if m.group(2) else "")
+            for m in ARTICLE_PATTERN.finditer(query)
+        )
+
+        if not laws and not terms and not articles:
+            return self._classify_non_legal(query, compact)
+
+        domain_votes = Counter()
+        for law in laws:
+            domain_votes[LAW_NAMES[law]] += 2
+        for term in terms:
+            domain_votes[LEGAL_TERMS[term][0]] += 1
+
+        ranked = domain_votes.most_common(2)
+        law_domain = ranked[0][0] if ranked else UNKNOWN_DOMAIN
+        topics = _dedupe(LEGAL_TERMS[t][1] for t in terms if LEGAL_TERMS[t][0] == law_domain)
+
+        specific_terms = [t for t in terms if t not in GENERIC_TERMS]
+        confidence = 0.55 + 0.1 * min(len(specific_terms), 3)
+        if laws:
+            confidence += 0.2
+        if articles:
+            confidence += 0.1
+        if len(ranked) > 1 and ranked[1][1] >= ranked[0][1]:
+            # 법 영역이 경합하면 LLM 판단에 맡김
+            confidence -= 0.3
+        if not ranked:
+            law_domain = UNKNOWN_DOMAIN
+            confidence = 0.5
+
+        keywords = _dedupe(laws + articles + [CANONICAL_KEYWORDS.get(t, t) for t in terms])[:5]
+        intent = f"{topics[0]} 관련 문의" if topics else f"{law_domain} 관련 문의"
+
+        return {
+            "intent": intent,
+            "law_domain": law_domain,
+            "keywords": keywords,
+            "is_legal_question": True,
+            "is_counseling_request": bool(self._counseling_matcher.find_all(compact)),
+        }, round(min(confidence, 0.99), 2)
+
+    def _classify_non_legal(self, query: str, compact: str) -> tuple[dict, float]:
+        """법률 용어가 전혀 없는 입력을 인사말/잡담 여부에 따라 분류합니다."""
+        result = {
+            "intent": "일반 대화",
+            "law_domain": UNKNOWN_DOMAIN,
+            "keywords": [],
+            "is_legal_question": False,
+            "is_counseling_request": False,
+        }
+        if _is_greeting(query):
+            return result, 0.95
+        if self._off_topic_matcher.find_all(compact) and not self._counseling_matcher.find_all(compact):
+            return result, 0.85
+        # 용어 사전에 없는 표현의 법률 질문일 수 있으므로 LLM에 맡김
+        return result, 0.3
+
+
+def _dedupe(items) -> list[str]:
+    """등장 순서를 유지하며 중복을 제거합니다."""
+    return list(dict.fromkeys(items))
+
+
+def _is_greeting(query: str) -> bool:
+    """
+    메시지 전체가 인사말인지 확인합니다. 문장부호를 뺀 모든 단어가 인사말이어야 하며,
+    영문 인사말은 단어 단위로만 비교합니다('this' 안의 'hi'는 인사말이 아님).
+    """
+    words = re.findall(r"[a-z]+|[^\sa-z]+", re.sub(r"[^\w\s]", " ", query.lower()))
+    if not words:
+        return False
+    return all(
+        word in ASCII_GREETINGS if word.isascii() else GREETING_TOKEN.fullmatch(word) is not None
+        for word in words
+    )
+
+
+def _longest_only(terms: list[str]) -> list[str]:
+    """다른 매칭 용어에 포함되는 짧은 용어(예: '해고예고수당' 안의 '해고')를 제거합니다."""
+    return [t for t in terms if not any(t != other and t in other for other in terms)]
@@ -0,0 +1,281 @@
+"""
+법령 PDF 인제스트 작업 큐
+외부 브로커 없이 ingestion_jobs 테이블을 큐로 사용하고, 같은 프로세스의 asyncio 워커가 작업을 하나씩 꺼내 실행합니다.
+업로드 요청은 PDF 원본을 작업 행에 저장한 뒤 바로 작업 ID를 반환하므로, 큰 법령도 프록시 타임아웃에 걸리지 않습니다.
+
+작업은 추출·규칙 분리(extract) → 남은 구간 LLM 파싱(parse) → 저장(save) 단계로 실행되며,
+단계마다 진행률과 소요 시간을 기록합니다. 일시적 오류는 지수 백오프로 다시 큐에 넣습니다.
+저장 단계는 개정본과 임베딩 아웃박스 행을 한 트랜잭션으로 커밋하고, 벡터 스토어 반영은 아웃박스 워커(embedding_outbox)가 맡습니다.
+이미 등록된 법령의 개정판을 올리면 저장 단계가 바뀐 조문만 새 개정본으로 만들므로 그 개정본만 임베딩됩니다.
+실행 중인 워커는 작업의 heartbeat_at을 주기적으로 갱신하며, 프로세스가 실행 중에 종료되어
+heartbeat가 임대 시간(lease_seconds) 이상 끊긴 running 작업은 다른(또는 재시작한) 워커가 다시 큐에 넣습니다.
+"""
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, update
+
+from app.models import IngestionJob, Law
+from app.services.ingest_service import is_transient_error
+
+logger = logging.getLogger(__name__)
+
+# (단계 이름, 단계 완료 시 진행률 %)
+PDF_STEPS = [("extract", 30), ("parse", 60), ("save", 100)]
+
+
+def _utcnow() -> datetime:
+    # DateTime 컬럼은 timezone 정보 없이 저장되므로 naive UTC로 비교
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def job_to_dict(job: IngestionJob) -> dict:
+    """작업 상태 응답 (GET /admin/jobs/{id})"""
+    result = json.loads(job.result) if job.result else {}
+    return {
+        "id": job.id,
+        "law_id": job.law_id,
+        "kind": job.kind,
+        "filename": job.filename,
+        "status": job.status,
+        "progress": job.progress or 0,
+        "current_step": job.current_step,
+        "steps": json.loads(job.steps) if job.steps else [],
+        "attempts": job.attempts or 0,
+        "max_attempts": job.max_attempts,
+        "error": job.error,
+        "articles": result.get("articles", []),
+        "embedded_revisions": len(result.get("revision_ids", [])),   # 임베딩 아웃박스에 기록된 새 개정본 수
+        "closed_revisions": len(result.get("closed_ids", [])),
+        "article_counts": {key: result[key] for key in ("created", "updated", "unchanged", "removed") if key in result},
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+        "next_attempt_at": job.next_attempt_at,
+    }
+
+
+class IngestionJobQueue:
+    """
+    DB 테이블 기반 로컬 작업 큐와 단일 워커입니다.
+    여러 프로세스가 같은 DB를 쓰더라도 queued → running 전환을 조건부 UPDATE로 처리하여 한 작업은 한 워커만 실행하고,
+    heartbeat가 살아 있는 다른 프로세스의 running 작업은 다시 큐에 넣지 않습니다.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        pdf_parser,
+        max_attempts: int = 3,
+        retry_delay_seconds: float = 10.0,
+        poll_seconds: float = 2.0,
+        lease_seconds: float = 120.0,
+    ):
+        self.session_factory = session_factory
+        self.pdf_parser = pdf_parser
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay_seconds = retry_delay_seconds
+        self.poll_seconds = poll_seconds
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    async def enqueue_pdf(self, law_id: int, filename: str, content: bytes) -> dict:
+        """PDF 인제스트 작업을 등록하고 작업 상태를 반환합니다."""
+        async with self.session_factory() as db:
+            job = IngestionJob(
+                law_id=law_id, kind="pdf_upload", status="queued", filename=filename, payload=content,
+                progress=0, steps="[]", attempts=0, max_attempts=self.max_attempts,
+            )
+            db.add(job)
+            await db.commit()
+            payload = job_to_dict(job)
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return payload
+
+    async def get(self, job_id: int) -> dict | None:
+        async with self.session_factory() as db:
+            job = await db.get(IngestionJob, job_id)
+            return job_to_dict(job) if job else None
+
+    async def recent(self, limit: int = 50) -> list[dict]:
+        async with self.session_factory() as db:
+            rows = await db.execute(select(IngestionJob).order_by(IngestionJob.id.desc()).limit(limit))
+            return [job_to_dict(job) for job in rows.scalars()]
+
+    # --- Worker ---
+
+    def start(self) -> None:
+        """이벤트 루프에서 워커 태스크를 시작합니다 (앱 lifespan 시작 시)."""
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run_forever(self) -> None:
+        await self.requeue_interrupted()
+        while True:
+            try:
+                ran = await self.run_once()
+            except Exception as e:
+                logger.error(f"Ingestion worker error: {e!r}")
+                ran = False
+            if ran:
+                continue
+            try:
+                # 다른 프로세스에서 실행 중에 중단된 작업도 heartbeat가 끊긴 뒤 이어받음
+                await self.requeue_interrupted()
+            except Exception as e:
+                logger.error(f"Ingestion requeue error: {e!r}")
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def requeue_interrupted(self) -> int:
+        """
+        heartbeat가 임대 시간(lease_seconds) 이상 갱신되지 않은 running 작업을 다시 큐에 넣습니다.
+        실행 중에 종료된 프로세스의 작업만 대상이며, 다른 프로세스가 지금 실행 중인 작업은 건드리지 않습니다.
+        """
+        expired = _utcnow() - timedelta(seconds=self.lease_seconds)
+        async with self.session_factory() as db:
+            result = await db.execute(
+                update(IngestionJob)
+                .where(
+                    IngestionJob.status == "running",
+                    IngestionJob.heartbeat_at.is_(None) | (IngestionJob.heartbeat_at <= expired),
+                )
+                .values(status="queued", next_attempt_at=None, heartbeat_at=None)
+            )
+            await db.commit()
+        if result.rowcount:
+            logger.warning(f"Requeued {result.rowcount} interrupted ingestion jobs")
+        return result.rowcount
+
+    async def _claim(self) -> int | None:
+        """실행 가능한 가장 오래된 작업을 running으로 바꾸고 ID를 반환합니다."""
+        now = _utcnow()
+        async with self.session_factory() as db:
+            job_id = (await db.execute(
+                select(IngestionJob.id)
+                .where(IngestionJob.status == "queued")
+                .where((IngestionJob.next_attempt_at.is_(None)) | (IngestionJob.next_attempt_at <= now))
+                .order_by(IngestionJob.id)
+                .limit(1)
+            )).scalar()
+            if job_id is None:
+                return None
+            claimed = await db.execute(
+                update(IngestionJob)
+                .where(IngestionJob.id == job_id, IngestionJob.status == "queued")
+                .values(
+                    status="running", started_at=now, heartbeat_at=now, next_attempt_at=None,
+                    attempts=IngestionJob.attempts + 1,
+                )
+            )
+            await db.commit()
+            return job_id if claimed.rowcount else None
+
+    async def run_once(self) -> bool:
+        """작업 하나를 꺼내 실행합니다. 실행할 작업이 없으면 False를 반환합니다."""
+        job_id = await self._claim()
+        if job_id is None:
+            return False
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        try:
+            await self._run_pdf_job(job_id)
+        except Exception as e:
+            await self._fail(job_id, e)
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+        return True
+
+    async def _heartbeat(self, job_id: int) -> None:
+        """작업이 끝날 때까지 임대 시간의 1/4 간격으로 heartbeat_at을 갱신합니다."""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 4)
+            try:
+                await self._update(job_id, heartbeat_at=_utcnow())
+            except Exception as e:
+                logger.warning(f"Ingestion job {job_id} heartbeat failed: {e!r}")
+
+    async def _update(self, job_id: int, **values) -> None:
+        async with self.session_factory() as db:
+            await db.execute(update(IngestionJob).where(IngestionJob.id == job_id).values(**values))
+            await db.commit()
+
+    async def _run_pdf_job(self, job_id: int) -> None:
+        async with self.session_factory() as db:
+            job = await db.get(IngestionJob, job_id)
+            law_id, content = job.law_id, job.payload
+            steps = {step["name"]: step for step in json.loads(job.steps or "[]")}
+            result = json.loads(job.result) if job.result else {}
+            law = await db.get(Law, law_id)
+        if law is None:
+            raise LookupError(f"Law {law_id} not found")
+
+        # 저장 단계가 마지막이고 한 트랜잭션이므로, 재시도는 항상 처음부터 (추출/분리 결과는 보관하지 않음)
+        split = articles_data = None
+        for name, progress in PDF_STEPS:
+            await self._update(job_id, current_step=name)
+            started = time.perf_counter()
+            try:
+                if name == "extract":
+                    # 쪽 텍스트를 프로세스 풀에서 추출하면서 바로 규칙 기반 조문 분리기에 넣음
+                    split = await self.pdf_parser._split_pdf(content)
+                elif name == "parse":
+                    # 분리기가 처리하지 못한 구간만 LLM으로 파싱
+                    articles_data = await self.pdf_parser._resolve_articles(*split)
+                elif name == "save":
+                    # 개정본과 임베딩 아웃박스 행을 함께 커밋 (벡터 스토어 반영은 아웃박스 워커가 처리)
+                    async with self.session_factory() as db:
+                        saved = await self.pdf_parser._save_articles(db, law_id, articles_data)
+                    result = {
+                        **{key: saved[key] for key in ("created", "updated", "unchanged", "removed")},
+                        "articles": saved["articles"],
+                        "revision_ids": [rev["revision_id"] for rev in saved["revisions"]],
+                        "closed_ids": [rev["revision_id"] for rev in saved["closed"]],
+                    }
+            except Exception:
+                steps[name] = {"name": name, "status": "failed", "seconds": round(time.perf_counter() - started, 3)}
+                await self._update(job_id, steps=json.dumps(list(steps.values())), result=json.dumps(result, ensure_ascii=False))
+                raise
+            steps[name] = {"name": name, "status": "succeeded", "seconds": round(time.perf_counter() - started, 3)}
+            await self._update(
+                job_id, progress=progress, steps=json.dumps(list(steps.values())),
+                result=json.dumps(result, ensure_ascii=False),
+            )
+
+        await self._update(
+            job_id, status="succeeded", progress=100, current_step=None, error=None, payload=None, finished_at=_utcnow()
+        )
+        logger.info(f"Ingestion job {job_id} finished: {len(result.get('articles', []))} articles")
+
+    async def _fail(self, job_id: int, error: Exception) -> None:
+        """일시적 오류는 남은 시도 횟수만큼 백오프 후 다시 큐에 넣고, 그 외에는 실패로 기록합니다."""
+        async with self.session_factory() as db:
+            job = await db.get(IngestionJob, job_id)
+            attempts, max_attempts = job.attempts or 0, job.max_attempts or self.max_attempts
+        if is_transient_error(error) and attempts < max_attempts:
+            delay = self.retry_delay_seconds * 2 ** (attempts - 1)
+            logger.warning(f"Ingestion job {job_id} attempt {attempts} failed ({error!r}), retrying in {delay:.0f}s")
+            await self._update(
+                job_id, status="queued", error=repr(error), next_attempt_at=_utcnow() + timedelta(seconds=delay)
+            )
+        else:
+            logger.error(f"Ingestion job {job_id} failed: {error!r}")
+            await self._update(job_id, status="failed", error=repr(error), finished_at=_utcnow())
@@ -0,0 +1,122 @@
+"""
+법령 본문 로컬 미러 동기화 모듈
+국가법령정보센터에서 법령의 전체 조문 트리를 받아 Law / LawArticle / LawArticleRevision 테이블에 반영합니다.
+조문 검색(/search/articles)은 미러링된 법령에 대해 원격 API를 호출하지 않고 로컬 테이블에서 응답합니다.
+
+조문 반영 규칙은 law_revisions.apply_article_revisions를 따르며, 원격에서 사라진 조문은 삭제된 것으로 처리합니다.
+"""
+import logging
+from datetime import date, datetime, timezone
+
+from sqlalchemy import select
+
+from app.core.config import get_settings
+from app.models import Law, LawMirror
+from app.plugins.law_db import fetch_law_tree
+from app.services.law_revisions import apply_article_revisions, closed_payload, revision_payload
+
+logger = logging.getLogger(__name__)
+
+
+def parse_effective_date(value: str) -> date | None:
+    """'20240101' 형식의 시행일자를 date로 변환합니다. 형식이 맞지 않으면 None"""
+    try:
+        return datetime.strptime(value.strip(), "%Y%m%d").date()
+    except (AttributeError, ValueError):
+        return None
+
+
+class LawMirrorService:
+    """원격 법령 API → 로컬 법령 테이블 동기화를 담당합니다."""
+
+    def __init__(self, session_factory):
+        """
+        Args:
+            session_factory: AsyncSession을 생성하는 팩토리 (예: AsyncSessionLocal)
+        """
+        self.session_factory = session_factory
+
+    async def target_law_names(self, names: list[str] | None = None) -> list[str]:
+        """동기화 대상 법령명 목록 (인자 → LAW_MIRROR_LAWS 설정 → laws 테이블 전체 순으로 결정)"""
+        if names:
+            return names
+        configured = get_settings().LAW_MIRROR_LAWS
+        if configured:
+            return configured
+        async with self.session_factory() as db:
+            return list((await db.scalars(select(Law.name).order_by(Law.id))).all())
+
+    async def sync(self, names: list[str] | None = None) -> list[dict]:
+        """
+        대상 법령들을 순서대로 동기화합니다. 한 법령의 실패가 나머지 법령의 동기화를 막지 않습니다.
+
+        Returns:
+            list[dict]: 법령별 동기화 결과 (sync_law 반환값, 실패 시 error 키 포함)
+        """
+        reports = []
+        for name in await self.target_law_names(names):
+            try:
+                reports.append(await self.sync_law(name))
+            except Exception as e:
+                logger.error(f"Law mirror sync failed for '{name}': {e!r}")
+                reports.append({"law_name": name, "error": str(e)})
+        return reports
+
+    async def sync_law(self, law_name: str) -> dict:
+        """
+        법령 하나의 전체 조문을 원격에서 받아 로컬 테이블에 반영합니다.
+
+        Args:
+            law_name (str): 동기화할 법령명 (예: 근로기준법)
+
+        Returns:
+            dict: law_name, law_id, created/updated/unchanged/removed 조문 수,
+                  revisions(벡터 스토어에 새로 임베딩할 개정본 목록, checker.add_revisions 입력 형식),
+                  closed(시행 종료된 개정본 목록, checker.close_revisions 입력 형식)
+
+        Raises:
+            LookupError: 원격 API에서 법령을 찾지 못한 경우
+            httpx.HTTPError, ET.ParseError: 원격 조회 실패
+        """
+        tree = await fetch_law_tree(law_name)
+        if tree is None:
+            raise LookupError(f"법령을 찾을 수 없습니다: {law_name}")
+
+        effective_date = parse_effective_date(tree["시행일자"])
+        items = [
+            {"article_number": item["조문번호"], "title": item["조문제목"], "content": item["조문내용"]}
+            for item in tree["articles"]
+        ]
+
+        async with self.session_factory() as db:
+            law = await db.scalar(select(Law).where(Law.name == law_name).order_by(Law.id))
+            if law is None:
+                law = Law(name=law_name)
+                db.add(law)
+                await db.flush()
+
+            # 원격 법령에서 사라진 조문(삭제 조문)은 비활성화
+            applied = await apply_article_revisions(
+                db, law, items, start_date=effective_date or date.today(), close_date=date.today(), remove_missing=True,
+            )
+
+            mirror = await db.scalar(select(LawMirror).where(LawMirror.law_id == law.id))
+            if mirror is None:
+                mirror = LawMirror(law_id=law.id)
+                db.add(mirror)
+            mirror.source_law_id = tree["법령ID"] or None
+            mirror.source_effective_date = effective_date
+            mirror.article_count = len({item["article_number"] for item in items if item["content"]})
+            mirror.synced_at = datetime.now(timezone.utc)
+
+            await db.commit()
+
+        counts = {key: applied[key] for key in ("created", "updated", "unchanged", "removed")}
+        logger.info(f"Law mirror synced '{law_name}': {counts}")
+        return {
+            "law_name": law_name,
+            "law_id": law.id,
+            **counts,
+            "revisions": [revision_payload(law, article, revision) for article, revision in applied["changed"]],
+            "closed": [closed_payload(revision) for revision in applied["closed"]],
+        }
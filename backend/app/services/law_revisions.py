@@ -0,0 +1,181 @@
+"""
+조문 개정본 반영 (개정 법령 재인제스트)
+법령 전체 조문 목록(원격 미러, PDF 업로드)을 기존 Law / LawArticle / LawArticleRevision에 개정 단위로 반영합니다.
+
+- 조문은 (law_id, article_number) 기준으로 찾고, 없으면 새로 만듭니다 (중복 행이 있으면 가장 최근 행만 남기고 비활성화).
+- 본문이 현행 개정본과 같으면 아무것도 바꾸지 않습니다 (재임베딩 대상 아님).
+- 본문이 바뀐 조문은 현행 개정본의 시행 종료일을 닫고 새 개정본을 추가합니다.
+- 삭제된 조문(deleted)과, remove_missing일 때 목록에서 사라진 조문은 is_active=False로 표시하고 현행 개정본을 닫습니다.
+따라서 다섯 조문만 바뀐 개정 법령을 다시 넣으면 새 개정본과 임베딩도 다섯 개만 생깁니다.
+새 조문과 개정본은 행마다 flush하지 않고 테이블별로 한 번의 대량 INSERT ... RETURNING(ORM bulk insert)으로 추가합니다.
+새 개정본과 시행 종료된 개정본은 같은 트랜잭션에서 임베딩 아웃박스(embedding_outbox)에 기록되어 워커가 벡터 스토어에 반영합니다.
+"""
+from datetime import date
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import EmbeddingOutbox, Law, LawArticle, LawArticleRevision
+from app.models.fulltext import index_revisions
+
+
+def revision_payload(law: Law, article: LawArticle, revision: LawArticleRevision) -> dict:
+    """checker.add_revisions 입력 형식"""
+    return {
+        "law_id": law.id,
+        "article_id": article.id,
+        "revision_id": revision.id,
+        "content": revision.content,
+        "law_name": law.name,
+        "article_number": article.article_number,
+        "effective_start_date": revision.effective_start_date,
+        "effective_end_date": revision.effective_end_date,
+    }
+
+
+def closed_payload(revision: LawArticleRevision) -> dict:
+    """checker.close_revisions 입력 형식"""
+    return {
+        "revision_id": revision.id,
+        "effective_start_date": revision.effective_start_date,
+        "effective_end_date": revision.effective_end_date,
+    }
+
+
+async def enqueue_embeddings(db: AsyncSession, revision_ids: list[int], closed_ids: list[int] = ()) -> None:
+    """
+    개정본의 벡터 스토어 반영을 임베딩 아웃박스에 기록합니다. 개정본을 저장하는 세션에서 호출하여 같은 트랜잭션으로 커밋합니다.
+
+    Args:
+        db (AsyncSession): 개정본을 저장 중인 데이터베이스 세션
+        revision_ids (list[int]): 새로 임베딩할 개정본 ID
+        closed_ids (list[int], optional): 시행 종료일만 벡터 메타데이터에 반영할 개정본 ID
+    """
+    rows = [{"revision_id": rid, "kind": "embed", "status": "pending"} for rid in revision_ids]
+    rows += [{"revision_id": rid, "kind": "close", "status": "pending"} for rid in closed_ids]
+    if rows:
+        await db.execute(insert(EmbeddingOutbox), rows)
+
+
+async def apply_article_revisions(
+    db: AsyncSession,
+    law: Law,
+    items: list[dict],
+    start_date: date,
+    close_date: date | None = None,
+    remove_missing: bool = False,
+) -> dict:
+    """
+    조문 목록을 법령에 개정 단위로 반영하고 벡터 스토어 반영을 아웃박스에 기록합니다. 커밋은 호출 측에서 합니다.
+
+    Args:
+        db (AsyncSession): 데이터베이스 세션
+        law (Law): 대상 법령 (flush되어 id가 있어야 함)
+        items (list[dict]): article_number, title, content 키를 가진 조문 목록.
+            effective_date(조문별 시행일)와 deleted(삭제 조문 여부) 키는 선택
+        start_date (date): effective_date가 없는 조문의 새 개정본 시행일
+        close_date (date | None, optional): 기존 개정본의 시행 종료일. None이면 새 개정본의 시행일로 닫음.
+        remove_missing (bool, optional): 목록에 없는 기존 조문을 삭제된 것으로 처리할지 여부. Defaults to False.
+
+    Returns:
+        dict: created/updated/unchanged/removed 조문 수, changed(새 개정본이 생긴 (조문, 개정본) 목록),
+              closed(시행 종료된 개정본 목록)
+    """
+    counts = {"created": 0, "updated": 0, "unchanged": 0, "removed": 0}
+    changed: list[tuple[LawArticle, LawArticleRevision]] = []
+    closed: list[LawArticleRevision] = []
+
+    articles: dict[str, LawArticle] = {}
+    duplicates: list[LawArticle] = []
+    for article in await db.scalars(select(LawArticle).where(LawArticle.law_id == law.id).order_by(LawArticle.id)):
+        if article.article_number in articles:
+            # 예전 인제스트가 같은 조를 중복 저장한 경우 가장 최근 행만 남김
+            duplicates.append(articles[article.article_number])
+        articles[article.article_number] = article
+    current = {
+        revision.article_id: revision
+        for revision in await db.scalars(
+            select(LawArticleRevision)
+            .join(LawArticle)
+            .where(LawArticle.law_id == law.id, LawArticleRevision.effective_end_date.is_(None))
+        )
+    }
+
+    def close(article: LawArticle, end: date) -> None:
+        active = current.pop(article.id, None)
+        if active is not None:
+            active.effective_end_date = max(end, active.effective_start_date)
+            closed.append(active)
+
+    for article in duplicates:
+        if article.is_active:
+            article.is_active = False
+            close(article, close_date or start_date)
+            counts["removed"] += 1
+
+    seen = set()
+    new_articles: list[dict] = []                  # 새로 만들 조문 행
+    pending: list[tuple[str, str, date]] = []      # 새 개정본 (조 번호, 본문, 시행일)
+    for item in items:
+        number, content = item["article_number"], item.get("content")
+        if number in seen or not (content or item.get("deleted")):
+            continue
+        seen.add(number)
+        article = articles.get(number)
+        revision_start = item.get("effective_date") or start_date
+
+        if item.get("deleted"):
+            if article is not None and article.is_active:
+                article.is_active = False
+                close(article, close_date or revision_start)
+                counts["removed"] += 1
+            continue
+
+        if article is None:
+            new_articles.append(
+                {"law_id": law.id, "article_number": number, "title": item.get("title") or None, "is_active": True}
+            )
+            counts["created"] += 1
+        else:
+            article.title = item.get("title") or article.title
+            article.is_active = True
+            active = current.get(article.id)
+            if active is not None and active.content == content:
+                counts["unchanged"] += 1
+                continue
+            close(article, close_date or revision_start)
+            counts["updated"] += 1
+        pending.append((number, content, revision_start))
+
+    # 조문·개정본을 행마다 flush하지 않고 각각 한 번의 대량 INSERT ... RETURNING으로 추가
+    # (RETURNING 행 순서를 보장하려면 SQLite에서 행 단위 INSERT로 바뀌므로, 순서 대신 조 번호·조문 ID로 짝지음)
+    if new_articles:
+        inserted = await db.scalars(insert(LawArticle).returning(LawArticle), new_articles)
+        for article in inserted.all():
+            articles[article.article_number] = article
+    if pending:
+        inserted = await db.scalars(
+            insert(LawArticleRevision).returning(LawArticleRevision),
+            [
+                {"article_id": articles[number].id, "content": content, "effective_start_date": revision_start}
+                for number, content, revision_start in pending
+            ],
+        )
+        revisions = {revision.article_id: revision for revision in inserted.all()}
+        # 대량 INSERT는 매퍼 이벤트를 거치지 않으므로 전문 검색 인덱스를 직접 갱신
+        indexed = [(revision.id, revision.content) for revision in revisions.values()]
+        await db.run_sync(lambda session: index_revisions(session.connection(), indexed))
+        changed = [(articles[number], revisions[articles[number].id]) for number, _, _ in pending]
+
+    if remove_missing:
+        for number, article in articles.items():
+            if number in seen or not article.is_active:
+                continue
+            article.is_active = False
+            close(article, close_date or start_date)
+            counts["removed"] += 1
+
+    await db.flush()
+    # 벡터 스토어 반영은 같은 트랜잭션에 아웃박스로 기록 (워커가 임베딩)
+    await enqueue_embeddings(db, [revision.id for _, revision in changed], [revision.id for revision in closed])
+    return {**counts, "changed": changed, "closed": closed}
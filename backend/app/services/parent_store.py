@@ -0,0 +1,65 @@
+"""
+부모 문서 저장소 (Parent Document Store)
+ingest_data는 청크 요약문만 벡터 스토어에 임베딩하고, 청크 원문은 parent_documents 테이블에 청크 ID(parent_id)로 보관합니다.
+원문을 벡터 메타데이터(original_text)에 함께 넣지 않으므로 벡터 레코드가 작아지고,
+검색기는 요약문으로 찾은 상위 k개 문서의 원문만 ID로 한 번에 조회하여 답변 모델에 법령 원문을 그대로 전달합니다.
+"""
+import logging
+
+from sqlalchemy import select
+
+from app.models import ParentDocument
+
+logger = logging.getLogger(__name__)
+
+# IN 절 하나에 넣는 ID 수 (SQLite 바인드 변수 한도보다 충분히 작게)
+_ID_BATCH = 500
+
+
+class ParentDocumentStore:
+    """청크 ID → 원문 키/값 저장소입니다. 요청 세션과 독립된 세션을 직접 열어 사용합니다."""
+
+    def __init__(self, session_factory):
+        """
+        Args:
+            session_factory: AsyncSession을 생성하는 팩토리 (예: AsyncSessionLocal)
+        """
+        self.session_factory = session_factory
+
+    async def put(self, documents: list[dict]) -> int:
+        """
+        원문을 저장합니다. 청크 ID는 원문 해시를 포함하므로 이미 있는 ID는 내용이 같아 건너뜁니다.
+
+        Args:
+            documents (list[dict]): id, content, source 키를 가진 원문 목록
+
+        Returns:
+            int: 새로 저장한 원문 수
+        """
+        unique = {doc["id"]: doc for doc in documents}
+        ids = list(unique)
+        added = 0
+        async with self.session_factory() as db:
+            for start in range(0, len(ids), _ID_BATCH):
+                batch = ids[start:start + _ID_BATCH]
+                existing = set(await db.scalars(select(ParentDocument.id).where(ParentDocument.id.in_(batch))))
+                rows = [
+                    ParentDocument(id=doc_id, content=unique[doc_id]["content"], source=unique[doc_id].get("source"))
+                    for doc_id in batch if doc_id not in existing
+                ]
+                db.add_all(rows)
+                added += len(rows)
+            await db.commit()
+        logger.info(f"Stored {added} parent documents ({len(ids) - added} already present)")
+        return added
+
+    async def get_many(self, ids: list[str]) -> dict[str, str]:
+        """청크 ID 목록의 원문을 한 번의 조회로 가져옵니다 (없는 ID는 결과에서 빠짐)."""
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return {}
+        async with self.session_factory() as db:
+            rows = (await db.execute(
+                select(ParentDocument.id, ParentDocument.content).where(ParentDocument.id.in_(ids))
+            )).all()
+        return {row.id: row.content for row in rows}
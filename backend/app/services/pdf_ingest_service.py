@@ -2,24 +2,43 @@
 PDF 법률 문서 파싱 서비스
 admin.py에서 100줄 이상의 PDF 파싱 비즈니스 로직을 분리합니다.
 """
-import os
-import tempfile
+import asyncio
 import logging
 from datetime import date
 
-from sqlalchemy.orm import Session
-from langchain_community.document_loaders import PyPDFLoader
+from sqlalchemy.ext.asyncio import AsyncSession
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from pydantic import BaseModel, Field
 from typing import List
 
+from app.core.config import get_settings
 from app.core.llm import get_mini_llm
-from app.models import Law, LawArticle, LawArticleRevision
+from app.models import Law
+from app.services.article_splitter import ArticleSplitter, article_sort_key, split_articles
+from app.services.law_revisions import apply_article_revisions, closed_payload, revision_payload
+from app.services.pdf_text import iter_pdf_pages
 
 logger = logging.getLogger(__name__)
 
 
+def _chunk_text(text: str, max_length: int) -> list[str]:
+    """텍스트를 줄 경계에서 max_length 이하 조각으로 나눕니다 (한 줄이 더 길면 그 줄은 잘라서 나눔)."""
+    chunks, current, size = [], [], 0
+    for line in text.splitlines():
+        if current and size + len(line) + 1 > max_length:
+            chunks.append("\n".join(current))
+            current, size = [], 0
+        while len(line) > max_length:
+            chunks.append(line[:max_length])
+            line = line[max_length:]
+        current.append(line)
+        size += len(line) + 1
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
 class ParsedArticle(BaseModel):
     article_number: str = Field(description="조문 번호. 예: 제36조")
     title: str = Field(description="조문 제목. 예: 임금 지급")
@@ -33,19 +52,26 @@ class ParsedLaw(BaseModel):
 class PDFLawParser:
     """PDF 파일에서 법 조문을 추출하고 DB에 삽입하는 서비스"""
 
-    def __init__(self):
+    def __init__(self, llm=None):
         """
         PDFLawParser의 생성자입니다.
         비용 및 속도 최적화를 위해 경량(Mini) LLM을 초기화하고,
         반환 형태를 ParsedLaw Pydantic 스키마에 맞춘 JSON 파서로 설정합니다.
+
+        Args:
+            llm (optional): 규칙으로 나누지 못한 구간을 조문으로 추출할 LLM. None이면 get_mini_llm().
         """
-        self.llm = get_mini_llm()
+        self.llm = llm or get_mini_llm()
         self.parser = JsonOutputParser(pydantic_object=ParsedLaw)
 
-    def _load_pdf(self, file_content: bytes) -> str:
+    async def _iter_pages(self, file_content: bytes):
+        """PDF 쪽 텍스트를 문서 순서대로 비동기로 내보냅니다 (메모리 버퍼에서 추출, 큰 문서는 프로세스 풀 병렬 추출)."""
+        async for page in iter_pdf_pages(file_content):
+            yield page
+
+    async def _load_pdf(self, file_content: bytes) -> str:
         """
-        메모리상의 PDF 바이트(bytes) 데이터를 임시 파일로 저장한 뒤,
-        PyPDFLoader를 이용해 내부의 모든 텍스트를 문자열로 추출하여 반환합니다.
+        메모리상의 PDF 바이트(bytes) 데이터에서 임시 파일 없이 모든 텍스트를 추출하여 반환합니다.
 
         Args:
             file_content (bytes): 업로드된 PDF 원본 파일의 바이트 데이터
@@ -53,26 +79,68 @@ class PDFLawParser:
         Returns:
             str: PDF 문서에서 추출된 전체 텍스트
         """
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            tmp.write(file_content)
-            tmp_path = tmp.name
+        return "\n".join([page async for page in self._iter_pages(file_content)])
 
-        try:
-            loader = PyPDFLoader(tmp_path)
-            documents = loader.load()
-            return "\n".join([doc.page_content for doc in documents])
-        finally:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+    async def _split_pdf(self, file_content: bytes) -> tuple[list[dict], list[str]]:
+        """
+        PDF 쪽이 추출되는 대로 조문 분리기에 넣어, 마지막 쪽 추출을 기다리지 않고 분리를 진행합니다.
+
+        Args:
+            file_content (bytes): 업로드된 PDF 원본 파일의 바이트 데이터
+
+        Returns:
+            tuple[list[dict], list[str]]: split_articles와 같은 (조문 목록, 분리하지 못한 구간 목록)
+        """
+        splitter = ArticleSplitter()
+        async for page in self._iter_pages(file_content):
+            splitter.feed(page)
+        return splitter.finish()
 
     async def _parse_articles(self, text: str) -> list[dict]:
         """
-        추출된 전체 법률 텍스트를 LLM에 전달하여,
-        각 조항(조문 번호, 제목, 내용) 단위로 분해(Parsing)한 리스트를 반환합니다.
+        추출된 전체 법률 텍스트를 각 조항(조문 번호, 제목, 내용) 단위로 분해(Parsing)한 리스트를 반환합니다.
 
         Args:
             text (str): PDF에서 추출된 전체 텍스트 원문
 
+        Returns:
+            list[dict]: 각 조항 정보(article_number, title, content)가 담긴 딕셔너리 리스트 (조 번호순)
+        """
+        return await self._resolve_articles(*split_articles(text))
+
+    async def _resolve_articles(self, articles: list[dict], unparsed: list[str]) -> list[dict]:
+        """
+        규칙 기반 분리기(split_articles / ArticleSplitter) 결과에,
+        분리기가 처리하지 못한 구간만 PDF_MAX_TEXT_LENGTH 크기로 나누어 LLM에 전달해 빠진 조문을 채웁니다.
+        삭제된 조("제35조 삭제")는 deleted 표시를 유지하여 저장 시 기존 조문을 비활성화하는 데 사용합니다.
+
+        Args:
+            articles (list[dict]): 규칙으로 분리한 조문 목록
+            unparsed (list[str]): 규칙으로 분리하지 못한 텍스트 구간 목록
+
+        Returns:
+            list[dict]: 각 조항 정보(article_number, title, content, 선택적으로 effective_date/deleted)가 담긴 딕셔너리 리스트 (조 번호순)
+        """
+        parsed = {article["article_number"]: article for article in articles}
+
+        if unparsed:
+            logger.info(f"Rule-based splitter left {len(unparsed)} segments, parsing them with LLM")
+            segments = [piece for segment in unparsed for piece in _chunk_text(segment, get_settings().PDF_MAX_TEXT_LENGTH)]
+            results = await asyncio.gather(*(self._parse_with_llm(segment) for segment in segments))
+            for result in results:
+                for article in result:
+                    # 규칙으로 분리한 조문을 우선하고, LLM은 빠진 조문만 채움
+                    parsed.setdefault(article["article_number"], article)
+
+        return sorted(parsed.values(), key=lambda a: article_sort_key(a["article_number"]))
+
+    async def _parse_with_llm(self, text: str) -> list[dict]:
+        """
+        규칙 기반 분리기가 처리하지 못한 텍스트 구간을 LLM에 전달하여 조문 단위로 분해합니다.
+
+        Args:
+            text (str): PDF_MAX_TEXT_LENGTH 이하의 텍스트 구간
+
         Returns:
             list[dict]: 각 조항 정보(article_number, title, content)가 담긴 딕셔너리 리스트
         """
@@ -82,77 +150,62 @@ class PDFLawParser:
         ])
 
         chain = prompt | self.llm | self.parser
-        # 안전한 텍스트 크기 제한 (LLM 컨텍스트 보호)
-        from app.core.config import get_settings
-        text_to_process = text[:get_settings().PDF_MAX_TEXT_LENGTH]
-        return await chain.ainvoke({"text": text_to_process})
+        try:
+            result = await chain.ainvoke({"text": text})
+        except Exception as e:
+            logger.error(f"LLM article parsing failed for a {len(text)}-char segment: {e}")
+            return []
+        return [article for article in result.get("articles", []) if article.get("article_number")]
 
-    def _save_articles(self, db: Session, law_id: int, articles_data: list[dict]) -> tuple[list[dict], list[dict]]:
+    async def _save_articles(self, db: AsyncSession, law_id: int, articles_data: list[dict]) -> dict:
         """
-        파싱 완료된 조문 데이터(딕셔너리)들을 RDBMS의 LawArticle 및 LawArticleRevision 테이블에 적재합니다.
+        파싱 완료된 조문 데이터(딕셔너리)들을 RDBMS의 LawArticle 및 LawArticleRevision 테이블에 개정 단위로 반영합니다.
+        이미 등록된 법령의 개정판을 다시 올리면 (law_id, article_number)로 기존 조문을 찾아 본문을 비교하고,
+        바뀐 조문만 기존 개정본의 시행 종료일을 닫고 새 개정본을 만듭니다 (바뀌지 않은 조문은 재임베딩 대상에서 제외).
+        새 개정본의 시행일은 조문별 시행일 → 법령 시행일 → 오늘 순으로 정합니다.
 
         Args:
-            db (Session): SQLAlchemy 데이터베이스 세션
+            db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션
             law_id (int): 해당 조문들이 속한 상위 법령(Law)의 기본키 ID
-            articles_data (list[dict]): LLM이 파싱한 조항 정보 리스트
+            articles_data (list[dict]): 분리(파싱)된 조항 정보 리스트
 
         Returns:
-            tuple[list[dict], list[dict]]: DB에 삽입된 조문(Created Articles) 데이터 리스트와 벡터 DB 인덱싱을 위한 리비전(Embedded Revisions) 데이터 리스트의 튜플
-        """
-        created_articles = []
-        embedded_revisions = []
-        law = db.query(Law).filter(Law.id == law_id).first()
-
-        for article_data in articles_data:
-            db_article = LawArticle(
-                law_id=law_id,
-                article_number=article_data["article_number"],
-                title=article_data["title"],
-                is_active=True
-            )
-            db.add(db_article)
-            db.flush()
-
-            db_revision = LawArticleRevision(
-                article_id=db_article.id,
-                content=article_data["content"],
-                effective_start_date=date.today(),
-                effective_end_date=None
-            )
-            db.add(db_revision)
-            db.flush()
-
-            created_articles.append({
-                "article_number": db_article.article_number,
-                "title": db_article.title
-            })
-
-            embedded_revisions.append({
-                "law_id": law_id,
-                "article_id": db_article.id,
-                "revision_id": db_revision.id,
-                "content": db_revision.content,
-                "law_name": law.name if law else "Unknown",
-                "article_number": db_article.article_number
-            })
-
-        db.commit()
-        return created_articles, embedded_revisions
-
-    async def process_pdf(self, db: Session, law_id: int, file_content: bytes) -> tuple[list[dict], list[dict]]:
+            dict: law_id, law_name, created/updated/unchanged/removed 조문 수,
+                  articles(새 개정본이 생긴 조문 목록), revisions(벡터 DB 인덱싱 대상 개정본, checker.add_revisions 입력 형식),
+                  closed(시행 종료된 개정본, checker.close_revisions 입력 형식)
+        """
+        law = await db.get(Law, law_id)
+        if law is None:
+            raise LookupError(f"Law {law_id} not found")
+
+        applied = await apply_article_revisions(db, law, articles_data, start_date=date.today())
+        await db.commit()
+
+        counts = {key: applied[key] for key in ("created", "updated", "unchanged", "removed")}
+        logger.info(f"Saved articles for '{law.name}': {counts}")
+        return {
+            "law_id": law.id,
+            "law_name": law.name,
+            **counts,
+            "articles": [
+                {"article_number": article.article_number, "title": article.title} for article, _ in applied["changed"]
+            ],
+            "revisions": [revision_payload(law, article, revision) for article, revision in applied["changed"]],
+            "closed": [closed_payload(revision) for revision in applied["closed"]],
+        }
+
+    async def process_pdf(self, db: AsyncSession, law_id: int, file_content: bytes) -> dict:
         """
         사용자가 업로드한 PDF 형식의 법률/시행령 문서를 처리하는 전체 파이프라인 메서드입니다.
-        PDF 로드(텍스트 추출) → LLM 조문 파싱 → 관계형 DB(RDBMS) 저장 단계를 순차적으로 실행합니다.
+        PDF 텍스트 추출과 조문 분리(규칙 기반, 쪽 단위 스트리밍) → 분리 실패 구간만 LLM 파싱 → 관계형 DB(RDBMS) 저장 단계를 실행합니다.
 
         Args:
-            db (Session): 데이터베이스 세션
+            db (AsyncSession): 데이터베이스 세션
             law_id (int): 대상 법령의 ID
             file_content (bytes): PDF 파일 원본 바이너리
 
         Returns:
-            tuple[list[dict], list[dict]]: RDBMS에 생성된 조문 데이터 및 벡터 스토어 삽입용 추출 데이터 튜플
+            dict: _save_articles의 반영 결과 (변경 조문 수, 임베딩할 개정본, 시행 종료된 개정본)
         """
-        full_text = self._load_pdf(file_content)
-        parsed_result = await self._parse_articles(full_text)
-        articles_data = parsed_result.get("articles", [])
-        return self._save_articles(db, law_id, articles_data)
+        articles_data = await self._resolve_articles(*await self._split_pdf(file_content))
+        return await self._save_articles(db, law_id, articles_data)
@@ -0,0 +1,80 @@
+"""
+PDF 텍스트 추출
+업로드된 PDF 바이트를 임시 파일 없이 메모리 버퍼(BytesIO)에서 pypdf로 읽어 쪽 단위로 추출합니다.
+텍스트 추출은 CPU 작업이므로 이벤트 루프에서 실행하지 않고,
+쪽 수가 많은 문서는 프로세스 풀에서 쪽 범위별로 나누어 병렬 추출합니다.
+추출된 쪽은 문서 순서대로 바로 내보내므로, 조문 분리 등 후속 처리가 마지막 쪽을 기다리지 않고 시작할 수 있습니다.
+(텍스트는 기존 PyPDFLoader와 같은 plain 모드 + 쪽별 strip 결과입니다.)
+"""
+import asyncio
+import io
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator
+
+from app.core.config import get_settings
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def page_count(content: bytes) -> int:
+    from pypdf import PdfReader
+
+    return len(PdfReader(io.BytesIO(content)).pages)
+
+
+def extract_page_range(content: bytes, start: int, stop: int) -> list[str]:
+    """[start, stop) 쪽의 텍스트를 추출합니다. 프로세스 풀 작업자에서 실행되므로 모듈 최상위 함수로 둡니다."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(content))
+    return [reader.pages[i].extract_text(extraction_mode="plain").strip() for i in range(start, min(stop, len(reader.pages)))]
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=workers)
+    return _pool
+
+
+def shutdown_pdf_pool() -> None:
+    """PDF 추출 프로세스 풀을 종료합니다 (앱 종료 시)."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+async def iter_pdf_pages(content: bytes) -> AsyncIterator[str]:
+    """
+    PDF의 쪽 텍스트를 문서 순서대로 비동기로 내보냅니다.
+    PDF_PARALLEL_MIN_PAGES쪽 이상이고 PDF_EXTRACT_WORKERS가 1 이상이면 PDF_PAGES_PER_TASK쪽씩 프로세스 풀에 한꺼번에 제출하고,
+    그보다 작은 문서는 같은 크기의 쪽 묶음을 스레드에서 차례로 추출합니다.
+
+    Args:
+        content (bytes): PDF 원본 바이트
+
+    Yields:
+        str: 쪽별 텍스트
+    """
+    settings = get_settings()
+    total = await asyncio.to_thread(page_count, content)
+    size = max(1, settings.PDF_PAGES_PER_TASK)
+    ranges = [(start, min(start + size, total)) for start in range(0, total, size)]
+
+    if settings.PDF_EXTRACT_WORKERS > 0 and total >= settings.PDF_PARALLEL_MIN_PAGES:
+        loop = asyncio.get_running_loop()
+        pool = _get_pool(settings.PDF_EXTRACT_WORKERS)
+        futures = [loop.run_in_executor(pool, extract_page_range, content, start, stop) for start, stop in ranges]
+        try:
+            for future in futures:
+                for page in await future:
+                    yield page
+        finally:
+            for future in futures:
+                future.cancel()
+        return
+
+    for start, stop in ranges:
+        for page in await asyncio.to_thread(extract_page_range, content, start, stop):
+            yield page
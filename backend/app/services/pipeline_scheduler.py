@@ -0,0 +1,171 @@
+"""
+파이프라인 단계 스케줄러
+팩트체크 파이프라인의 각 단계(Stage)를 의존성 그래프로 선언하고,
+서로 의존하지 않는 단계(비전 분석, 의도 분석, 원본 질의 검색 등)를 asyncio로 동시에 실행합니다.
+실행이 끝나면 단계별 소요 시간과 전체 지연 시간을 결정한 임계 경로(Critical Path)를 보고합니다.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+StageFunc = Callable[[dict], Awaitable[Any]]
+
+
+class Stage:
+    """의존성 그래프의 단일 노드(단계) 정의"""
+
+    def __init__(
+        self,
+        name: str,
+        func: StageFunc,
+        deps: tuple[str, ...] = (),
+        condition: Callable[[dict], bool] | None = None,
+    ):
+        """
+        Args:
+            name (str): 단계 이름 (결과 딕셔너리의 키로 사용)
+            func (StageFunc): 선행 단계 결과 딕셔너리를 받아 이 단계의 결과를 반환하는 코루틴 함수
+            deps (tuple[str, ...], optional): 이 단계 실행 전에 완료되어야 하는 단계 이름 목록
+            condition (Callable[[dict], bool] | None, optional): 선행 단계 결과를 보고 실행 여부를 결정하는 함수.
+                False를 반환하면 단계를 건너뛰고 결과를 None으로 기록합니다.
+        """
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.condition = condition
+
+
+class StageScheduler:
+    """
+    등록된 단계들을 의존성 순서에 따라 최대한 동시에 실행하는 asyncio 기반 스케줄러입니다.
+    한 단계가 실패하면 진행 중인 나머지 단계를 취소하고 예외를 그대로 전파합니다.
+    """
+
+    def __init__(self):
+        self._stages: dict[str, Stage] = {}
+
+    def add(
+        self,
+        name: str,
+        func: StageFunc,
+        deps: tuple[str, ...] = (),
+        condition: Callable[[dict], bool] | None = None,
+    ) -> "StageScheduler":
+        """단계를 그래프에 등록합니다. 체이닝을 위해 자기 자신을 반환합니다."""
+        if name in self._stages:
+            raise ValueError(f"Duplicate stage name: {name}")
+        self._stages[name] = Stage(name, func, deps, condition)
+        return self
+
+    def _validate(self) -> None:
+        """존재하지 않는 의존성이나 순환 의존성이 있는지 검사합니다."""
+        for stage in self._stages.values():
+            for dep in stage.deps:
+                if dep not in self._stages:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dep}'")
+
+        visiting, visited = set(), set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Cycle detected at stage '{name}'")
+            visiting.add(name)
+            for dep in self._stages[name].deps:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self._stages:
+            visit(name)
+
+    async def run(
+        self,
+        initial: dict | None = None,
+        on_stage_done: Callable[[str, Any, dict], None] | None = None,
+    ) -> tuple[dict, dict]:
+        """
+        모든 단계를 실행하고 결과와 실행 리포트를 반환합니다.
+
+        Args:
+            initial (dict | None, optional): 모든 단계가 참조할 수 있는 초기 값 (결과 딕셔너리에 미리 채워짐)
+            on_stage_done (Callable | None, optional): 단계가 (건너뛰지 않고) 완료될 때마다
+                단계 이름, 결과, 타이밍을 인자로 호출되는 동기 콜백 (스트리밍 이벤트 전송용).
+                단계 태스크 안에서 호출되므로 이벤트를 큐에 넣기만 하고 바로 반환해야 합니다 (예: Queue.put_nowait).
+
+        Returns:
+            tuple[dict, dict]: 단계 이름별 결과 딕셔너리와, 단계별 타이밍/임계 경로가 담긴 리포트 딕셔너리
+        """
+        self._validate()
+        results: dict[str, Any] = dict(initial or {})
+        timings: dict[str, dict] = {}
+        origin = time.perf_counter()
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def run_stage(stage: Stage) -> None:
+            if stage.deps:
+                await asyncio.gather(*(tasks[dep] for dep in stage.deps))
+
+            started = time.perf_counter()
+            skipped = stage.condition is not None and not stage.condition(results)
+            if skipped:
+                results[stage.name] = None
+            else:
+                results[stage.name] = await stage.func(results)
+            finished = time.perf_counter()
+
+            timings[stage.name] = {
+                "start_ms": round((started - origin) * 1000, 1),
+                "end_ms": round((finished - origin) * 1000, 1),
+                "duration_ms": round((finished - started) * 1000, 1),
+                "skipped": skipped,
+            }
+            if on_stage_done is not None and not skipped:
+                on_stage_done(stage.name, results[stage.name], timings[stage.name])
+
+        for stage in self._stages.values():
+            tasks[stage.name] = asyncio.ensure_future(run_stage(stage))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        report = {
+            "total_ms": round((time.perf_counter() - origin) * 1000, 1),
+            "stages": timings,
+            "critical_path": self.critical_path(timings),
+        }
+        logger.info(
+            f"Pipeline finished in {report['total_ms']}ms, critical path: {' -> '.join(report['critical_path'])}"
+        )
+        return results, report
+
+    def critical_path(self, timings: dict[str, dict]) -> list[str]:
+        """
+        실행 타이밍을 바탕으로 전체 지연 시간을 결정한 단계 체인을 역추적합니다.
+        가장 늦게 끝난 단계에서 시작하여, 각 단계의 시작을 막고 있던(가장 늦게 끝난) 선행 단계를 따라갑니다.
+
+        Args:
+            timings (dict[str, dict]): run()이 기록한 단계별 타이밍
+
+        Returns:
+            list[str]: 실행 순서대로 정렬된 임계 경로 단계 이름 목록 (건너뛴 단계는 제외)
+        """
+        if not timings:
+            return []
+
+        current = max(timings, key=lambda name: timings[name]["end_ms"])
+        path = [current]
+        while self._stages[current].deps:
+            current = max(self._stages[current].deps, key=lambda name: timings[name]["end_ms"])
+            path.append(current)
+        path.reverse()
+        return [name for name in path if not timings[name]["skipped"]]
@@ -0,0 +1,223 @@
+"""
+판례 영구 캐시 모듈
+선고된 판례는 바뀌지 않으므로 상세조회 결과(사건명, 사건번호, 판결요지)를 판례일련번호 기준으로 DB에 보관하고,
+검색어 → 검색 결과(판례일련번호 목록)는 TTL을 두고 캐시합니다.
+검색어 캐시가 적중하면 목록/상세조회 API를 모두 생략하고, 목록만 새로 받은 경우에도 이미 보관된 판례는 상세조회를 생략합니다.
+"""
+import asyncio
+import json
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from app.models import Precedent, PrecedentQueryCache
+from app.plugins.precedent_search import (
+    FALLBACK_RESULT,
+    build_precedent_query,
+    fetch_precedent_summary,
+    format_precedent,
+    search_precedent_list,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """SQLite에서 읽은 naive datetime을 UTC로 간주합니다."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _row_to_result(row: Precedent) -> dict:
+    return {"사건명": row.case_name, "사건번호": row.case_number, "판결요지": row.summary}
+
+
+class PrecedentCache:
+    """
+    DB 기반 판례 캐시입니다. 요청 세션과 독립된 세션을 직접 열어 사용하므로,
+    파이프라인의 다른 단계와 동시에 실행되어도 요청의 AsyncSession을 공유하지 않습니다.
+    캐시 DB 조회/저장이 실패해도 검색 자체는 API 호출로 계속 진행합니다.
+    """
+
+    def __init__(self, session_factory, ttl_seconds: int = 604800):
+        """
+        Args:
+            session_factory: AsyncSession을 생성하는 팩토리 (예: AsyncSessionLocal)
+            ttl_seconds (int, optional): 검색어 → 결과 목록 캐시의 유효 시간(초). Defaults to 604800 (7일).
+        """
+        self.session_factory = session_factory
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._counters = {
+            "query_hits": 0,
+            "query_misses": 0,
+            "detail_hits": 0,
+            "detail_misses": 0,
+            "detail_failures": 0,
+            "api_errors": 0,
+        }
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    async def search(self, keywords: list) -> list:
+        """
+        캐시를 거쳐 판례를 검색합니다. 반환 형식은 plugins.precedent_search.search_precedents와 동일합니다.
+
+        Args:
+            keywords (list): 의도 분석 단계에서 추출한 검색 키워드 목록
+
+        Returns:
+            list: 사건명/사건번호/판결요지 키를 가진 판례 목록 (API 오류 시 대체 안내 1건)
+        """
+        query = build_precedent_query(keywords)
+        if not query:
+            return []
+
+        cached = await self._load_query(query)
+        if cached is not None:
+            self._count("query_hits")
+            return cached
+        self._count("query_misses")
+
+        try:
+            items = await search_precedent_list(keywords)
+        except Exception as e:
+            self._count("api_errors")
+            logger.error(f"Error fetching precedent list for '{query}': {e!r}")
+            return [dict(FALLBACK_RESULT)]
+
+        known = await self._load_precedents([item["판례일련번호"] for item in items if item["판례일련번호"]])
+        missing = [item for item in items if item["판례일련번호"] not in known]
+        summaries = await asyncio.gather(*(fetch_precedent_summary(item) for item in missing))
+        fetched = dict(zip((id(item) for item in missing), summaries))
+        self._count("detail_hits", len(items) - len(missing))
+        self._count("detail_misses", len(missing))
+
+        results, fresh = [], []
+        for item in items:
+            serial = item["판례일련번호"]
+            if serial in known:
+                results.append(_row_to_result(known[serial]))
+                continue
+            summary = fetched[id(item)]
+            if summary is None:
+                self._count("detail_failures")
+            elif serial:
+                fresh.append((item, summary))
+            results.append(format_precedent(item, summary))
+
+        # 상세조회가 하나라도 실패하면 다음 요청에서 다시 시도하도록 검색어 캐시는 남기지 않음
+        complete = all(summary is not None for summary in summaries) and all(item["판례일련번호"] for item in items)
+        await self._save(query, items if complete else None, fresh)
+        return results
+
+    async def _load_query(self, query: str) -> list | None:
+        """유효한 검색어 캐시가 있고 모든 판례 상세가 보관되어 있으면 결과 목록을, 아니면 None을 반환합니다."""
+        try:
+            async with self.session_factory() as db:
+                entry = await db.scalar(select(PrecedentQueryCache).where(PrecedentQueryCache.query == query))
+                if entry is None or self._is_expired(entry.fetched_at):
+                    return None
+                serials = json.loads(entry.precedent_serial_nos)
+                rows = await self._select_precedents(db, serials)
+        except (SQLAlchemyError, ValueError) as e:
+            logger.warning(f"Precedent query cache lookup failed: {e!r}")
+            return None
+
+        if len(rows) < len(serials):
+            return None
+        return [_row_to_result(rows[serial]) for serial in serials]
+
+    async def _load_precedents(self, serials: list[str]) -> dict[str, Precedent]:
+        """이미 보관된 판례 상세를 판례일련번호 → 행 딕셔너리로 반환합니다."""
+        if not serials:
+            return {}
+        try:
+            async with self.session_factory() as db:
+                return await self._select_precedents(db, serials)
+        except SQLAlchemyError as e:
+            logger.warning(f"Precedent cache lookup failed: {e!r}")
+            return {}
+
+    @staticmethod
+    async def _select_precedents(db, serials: list[str]) -> dict[str, Precedent]:
+        rows = await db.scalars(select(Precedent).where(Precedent.precedent_serial_no.in_(serials)))
+        return {row.precedent_serial_no: row for row in rows}
+
+    async def _save(self, query: str, items: list[dict] | None, fresh: list[tuple[dict, str]]) -> None:
+        """
+        새로 조회한 판례 상세와 (모든 상세가 확보된 경우) 검색어 캐시를 저장합니다.
+        동시 요청이 같은 판례를 먼저 저장할 수 있으므로 이미 있는 판례는 건너뛰고,
+        그 사이에 제약 조건 위반이 나면 한 번 더 시도합니다.
+        """
+        if not fresh and items is None:
+            return
+        for attempt in range(2):
+            try:
+                async with self.session_factory() as db:
+                    existing = await self._select_precedents(db, [item["판례일련번호"] for item, _ in fresh])
+                    for item, summary in fresh:
+                        if item["판례일련번호"] in existing:
+                            continue
+                        db.add(Precedent(
+                            precedent_serial_no=item["판례일련번호"],
+                            case_name=item["사건명"],
+                            case_number=item["사건번호"],
+                            summary=summary,
+                        ))
+                    if items is not None:
+                        serials = json.dumps([item["판례일련번호"] for item in items], ensure_ascii=False)
+                        entry = await db.scalar(select(PrecedentQueryCache).where(PrecedentQueryCache.query == query))
+                        if entry is None:
+                            db.add(PrecedentQueryCache(query=query, precedent_serial_nos=serials))
+                        else:
+                            entry.precedent_serial_nos = serials
+                            entry.fetched_at = datetime.now(timezone.utc)
+                    await db.commit()
+                return
+            except IntegrityError as e:
+                if attempt:
+                    logger.warning(f"Precedent cache store skipped for '{query}': {e!r}")
+            except SQLAlchemyError as e:
+                logger.warning(f"Precedent cache store skipped for '{query}': {e!r}")
+                return
+
+    def _is_expired(self, fetched_at: datetime | None) -> bool:
+        if fetched_at is None:
+            return True
+        return datetime.now(timezone.utc) - _as_utc(fetched_at) > timedelta(seconds=self.ttl_seconds)
+
+    async def stats(self) -> dict:
+        """적중/미스 카운터(프로세스 기준)와 캐시 테이블 크기를 반환합니다."""
+        with self._lock:
+            counters = dict(self._counters)
+        async with self.session_factory() as db:
+            precedents = await db.scalar(select(func.count(Precedent.id)))
+            queries = await db.scalar(select(func.count(PrecedentQueryCache.id)))
+            cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.ttl_seconds)
+            expired = await db.scalar(
+                select(func.count(PrecedentQueryCache.id)).where(PrecedentQueryCache.fetched_at < cutoff)
+            )
+
+        query_lookups = counters["query_hits"] + counters["query_misses"]
+        detail_lookups = counters["detail_hits"] + counters["detail_misses"]
+        return {
+            **counters,
+            "query_hit_rate": round(counters["query_hits"] / query_lookups, 4) if query_lookups else 0.0,
+            "detail_hit_rate": round(counters["detail_hits"] / detail_lookups, 4) if detail_lookups else 0.0,
+            "stored_precedents": precedents,
+            "stored_queries": queries,
+            "expired_queries": expired,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+    async def flush_queries(self) -> int:
+        """검색어 캐시를 모두 비우고 삭제된 행 수를 반환합니다. 판례 상세는 바뀌지 않으므로 유지합니다."""
+        async with self.session_factory() as db:
+            result = await db.execute(delete(PrecedentQueryCache))
+            await db.commit()
+        return result.rowcount
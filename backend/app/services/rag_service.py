@@ -1,4 +1,3 @@
-from langchain_openai import OpenAIEmbeddings
 from langchain_chroma import Chroma
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.output_parsers import JsonOutputParser
@@ -6,16 +5,42 @@ from langchain_core.messages import HumanMessage, AIMessage
 from langchain_classic.chains import create_history_aware_retriever
 from langchain_classic.chains.combine_documents import create_stuff_documents_chain
 from pydantic import BaseModel, Field
+from datetime import date
+from typing import Awaitable, Callable
+import asyncio
 import json
 import logging
+import re
 
-from app.core.llm import get_main_llm
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.llm import get_embeddings, get_main_llm
 from app.core.config import get_settings
 from app.services.context_service import ContextCompressor
-from app.services.prompts import FACT_CHECK_SYSTEM_PROMPT, CONTEXTUALIZE_Q_SYSTEM_PROMPT
+from app.services.hybrid_retriever import (
+    BM25Index,
+    HybridRetriever,
+    content_hash,
+    effective_date_metadata,
+    retrieval_filter,
+    vector_id,
+)
+from app.services.intent_rules import UNKNOWN_DOMAIN
+from app.services.parent_store import ParentDocumentStore
+from app.services.section_stream import SectionStreamParser
+from app.services.prompts import FACT_CHECK_SYSTEM_PROMPT, CONTEXTUALIZE_Q_SYSTEM_PROMPT, CLAIM_VERDICT_SYSTEM_PROMPT
 
 logger = logging.getLogger(__name__)
 
+# law_domain에 여러 법이 함께 적힌 경우("근로기준법, 최저임금법")의 구분자
+_DOMAIN_SEPARATOR = re.compile(r"\s*(?:,|/|·|및)\s*")
+
+
+def _normalize_law_name(name: str) -> str:
+    return re.sub(r"\s+", "", name or "")
+
+
 class FactCheckResult(BaseModel):
     verdict: str = Field(description="판정 결과: '사실', '일부 사실', '사실 아님', '추가 판단 필요' 중 하나")
     section_1_summary: str = Field(description="1️⃣ 핵심 요약 (3~5줄 이내)")
@@ -25,45 +50,217 @@ class FactCheckResult(BaseModel):
     section_5_counseling_recommendation: str = Field(description="5️⃣ 법률 상담 권장 여부 (필요시 '정확한 판단은 노무사/변호사 상담이 필요합니다.' 명시)")
     section_6_suggested_followups: list[str] = Field(description="6️⃣ 추천 후속 질문 3가지 (사용자의 현재 상황에서 궁금해할 만한 이어지는 질문)")
 
+class ClaimVerdictResult(BaseModel):
+    """ExplanationCache로 조문 해설(섹션 2, 4)을 재사용할 때 LLM이 생성하는 주장별 항목"""
+    verdict: str = Field(description="판정 결과: '사실', '일부 사실', '사실 아님', '추가 판단 필요' 중 하나")
+    section_1_summary: str = Field(description="1️⃣ 핵심 요약 (3~5줄 이내)")
+    section_3_real_case_example: str = Field(description="3️⃣ 현실 적용 예시 및 관련 판례 (제공된 [관련 판례/재결례 정보]가 있다면 반드시 이를 요약해서 포함할 것. 사건명과 판결요지를 명시)")
+    section_5_counseling_recommendation: str = Field(description="5️⃣ 법률 상담 권장 여부 (필요시 '정확한 판단은 노무사/변호사 상담이 필요합니다.' 명시)")
+    section_6_suggested_followups: list[str] = Field(description="6️⃣ 추천 후속 질문 3가지 (사용자의 현재 상황에서 궁금해할 만한 이어지는 질문)")
+
 class LegalFactChecker:
     """
     RAG(Retrieval-Augmented Generation) 기반의 핵심 팩트체크 클래스.
     벡터 DB를 조회해 관련 법령을 찾고 LLM을 통해 FactCheckResult를 도출합니다.
     """
-    def __init__(self):
+    def __init__(self, session_factory=None, embeddings=None, llm=None, compressor=None):
         """
         LegalFactChecker의 생성자입니다.
-        벡터 스토어 경로, 임베딩 모델(OpenAI), 주 판단용(Main) LLM, JSON 출력 파서,
+        벡터 스토어 경로, 임베딩 모델(OpenAI, 본문 해시 디스크 캐시), 주 판단용(Main) LLM, JSON 출력 파서,
         그리고 검색된 문서 문맥을 압축/요약하기 위한 ContextCompressor를 초기화합니다.
+
+        Args:
+            session_factory (optional): 법 영역 → 법령 ID, 부모 문서(청크 원문) 조회에 쓸 AsyncSession 팩토리.
+                None이면 AsyncSessionLocal.
+            embeddings (optional): 임베딩 모델. None이면 get_embeddings().
+            llm (optional): 답변 생성 LLM. None이면 get_main_llm().
+            compressor (optional): 문맥 압축기. None이면 ContextCompressor().
         """
         settings = get_settings()
-        self.embeddings = OpenAIEmbeddings()
+        self.embeddings = embeddings or get_embeddings()
         self.vector_store_path = settings.VECTOR_STORE_PATH
         self.vector_store = None
-        self.llm = get_main_llm()
+        self.llm = llm or get_main_llm()
         self.parser = JsonOutputParser(pydantic_object=FactCheckResult)
-        self.compressor = ContextCompressor()
+        self.verdict_parser = JsonOutputParser(pydantic_object=ClaimVerdictResult)
+        self.compressor = compressor or ContextCompressor()
+        self.retrieval_mode = settings.RETRIEVAL_MODE
+        self.retrieval_top_k = settings.RETRIEVAL_TOP_K
+        self.retrieval_candidate_k = settings.RETRIEVAL_CANDIDATE_K
+        self.rrf_k = settings.RRF_K
+        self.rrf_weights = (settings.RRF_DENSE_WEIGHT, settings.RRF_BM25_WEIGHT)
+        self.bm25_index = BM25Index()
+        self.law_partitioning = settings.RETRIEVAL_LAW_PARTITIONING
+        self.session_factory = session_factory
+        self._laws: list[tuple[int, str, str]] | None = None  # (law_id, 정규화한 법령명, 정규화한 약칭) 캐시
 
     def initialize_vector_store(self):
         """
         설정된 경로(VECTOR_STORE_PATH)에 존재하는 로컬 Chroma 오픈소스 벡터 DB를 
         동기적으로 로드하여 팩트체크 검색(Retriever)에 사용할 준비를 마칩니다.
+        하이브리드 검색 모드에서는 저장된 문서 전체로 BM25 색인도 함께 구성합니다.
         """
         self.vector_store = Chroma(
             persist_directory=self.vector_store_path,
             embedding_function=self.embeddings
         )
+        self.sync_effective_dates()
+        if self.retrieval_mode == "hybrid":
+            self._rebuild_bm25_index()
+
+    def open_vector_store(self) -> Chroma:
+        """
+        시행일 동기화나 BM25 색인 구성 없이 Chroma 컬렉션 핸들만 엽니다 (이미 열려 있으면 그대로 사용).
+        컬렉션 전체를 읽지 않으므로, 검색을 하지 않는 점검·복구 스크립트처럼 벡터를 ID/필터로만 다루는 곳에서 사용합니다.
+        """
+        if self.vector_store is None:
+            self.vector_store = Chroma(
+                persist_directory=self.vector_store_path,
+                embedding_function=self.embeddings
+            )
+        return self.vector_store
+
+    def sync_effective_dates(self) -> int:
+        """
+        벡터 메타데이터의 시행 기간(effective_start/effective_end)을 DB의 개정본 시행일과 맞춥니다.
+        날짜 메타데이터가 없던 기존 벡터를 채우고, 이후 시행 종료된 개정본의 종료일을 반영합니다.
+        개정본과 연결되지 않은 문서(일반 인제스트 청크)는 항상 시행 중으로 표시합니다. 임베딩은 다시 계산하지 않습니다.
+
+        Returns:
+            int: 메타데이터를 갱신한 벡터 수
+        """
+        from app.core.database import SessionLocal
+        from app.models import LawArticleRevision
+
+        stored = self.vector_store.get(include=["metadatas"])
+        revision_ids = {m.get("revision_id") for m in stored["metadatas"] if m and m.get("revision_id") is not None}
+        dates = {}
+        if revision_ids:
+            try:
+                with SessionLocal() as db:
+                    rows = db.query(
+                        LawArticleRevision.id, LawArticleRevision.effective_start_date, LawArticleRevision.effective_end_date
+                    ).filter(LawArticleRevision.id.in_(revision_ids)).all()
+                dates = {row.id: effective_date_metadata(row.effective_start_date, row.effective_end_date) for row in rows}
+            except SQLAlchemyError as e:
+                logger.warning(f"Revision date lookup failed, only filling missing vector dates: {e!r}")
+
+        ids, metadatas = [], []
+        for vector_id, metadata in zip(stored["ids"], stored["metadatas"]):
+            metadata = metadata or {}
+            expected = dates.get(metadata.get("revision_id"), effective_date_metadata(None, None))
+            if "effective_start" in metadata and metadata.get("revision_id") not in dates:
+                continue
+            if any(metadata.get(key) != value for key, value in expected.items()):
+                ids.append(vector_id)
+                metadatas.append({**metadata, **expected})
+        if ids:
+            self.vector_store._collection.update(ids=ids, metadatas=metadatas)
+            logger.info(f"Updated effective dates on {len(ids)} vectors")
+        return len(ids)
+
+    def close_revisions(self, revisions: list[dict]) -> None:
+        """
+        시행이 종료된 개정본의 벡터 메타데이터에 종료일을 반영합니다 (법령 미러 동기화 직후 등).
+
+        Args:
+            revisions (list[dict]): revision_id, effective_start_date, effective_end_date 키를 가진 개정본 목록
+        """
+        if not revisions:
+            return
+        if not self.vector_store:
+            self.initialize_vector_store()
+        for rev in revisions:
+            updates = effective_date_metadata(rev.get("effective_start_date"), rev.get("effective_end_date"))
+            stored = self.vector_store.get(where={"revision_id": rev["revision_id"]}, include=["metadatas"])
+            if stored["ids"]:
+                self.vector_store._collection.update(
+                    ids=stored["ids"], metadatas=[{**(m or {}), **updates} for m in stored["metadatas"]]
+                )
+            self.bm25_index.update_metadata(rev["revision_id"], updates)
+
+    def _rebuild_bm25_index(self):
+        """벡터 스토어에 저장된 문서(본문 + 메타데이터)로 BM25 색인을 다시 만듭니다."""
+        from langchain_core.documents import Document
+
+        stored = self.vector_store.get(include=["documents", "metadatas"])
+        self.bm25_index.clear()
+        self.bm25_index.add([
+            Document(page_content=content, metadata=metadata or {})
+            for content, metadata in zip(stored["documents"], stored["metadatas"])
+        ])
+        logger.info(f"BM25 index built with {len(self.bm25_index)} documents")
+
+    async def resolve_law_ids(self, law_domain: str | None) -> list[int] | None:
+        """
+        의도 분석의 법 영역(law_domain)을 검색할 법령 파티션(law_id 목록)으로 바꿉니다.
+        법령명(또는 약칭)이 법 영역과 같거나 그 이름으로 시작하는 법령을 모두 포함하므로
+        "근로기준법"은 "근로기준법 시행령"·"근로기준법 시행규칙"까지 함께 검색합니다.
+
+        Returns:
+            list[int] | None: 법령 ID 목록. 파티셔닝이 꺼져 있거나 법 영역이 "알 수 없음"이거나
+                              일치하는 법령이 없으면 None (전체 검색)
+        """
+        if not self.law_partitioning or not law_domain or law_domain.strip() == UNKNOWN_DOMAIN:
+            return None
+        domains = [_normalize_law_name(d) for d in _DOMAIN_SEPARATOR.split(law_domain) if d.strip()]
+        if self._laws is None:
+            try:
+                self._laws = await self._load_laws()
+            except SQLAlchemyError as e:
+                logger.warning(f"Law lookup failed, searching all laws: {e!r}")
+                return None
+        law_ids = [
+            law_id for law_id, name, short_name in self._laws
+            if any(name.startswith(domain) or short_name == domain for domain in domains)
+        ]
+        return law_ids or None
+
+    async def _load_laws(self) -> list[tuple[int, str, str]]:
+        from app.core.database import AsyncSessionLocal
+        from app.models import Law
+
+        async with (self.session_factory or AsyncSessionLocal)() as db:
+            rows = (await db.execute(select(Law.id, Law.name, Law.short_name))).all()
+        return [(row.id, _normalize_law_name(row.name), _normalize_law_name(row.short_name)) for row in rows]
+
+    def _build_retriever(self, as_of: date | None = None, law_ids: list[int] | None = None):
+        """
+        검색 모드 설정에 따라 하이브리드(BM25 + 벡터 RRF) 또는 벡터 전용 Retriever를 생성합니다.
+        as_of가 주어지면 그 시점에 시행 중인 조문만, law_ids가 주어지면 그 법령의 조문만 검색하도록 메타데이터 필터를 적용합니다.
+        """
+        if self.retrieval_mode != "hybrid":
+            search_kwargs = {"k": self.retrieval_top_k}
+            where = retrieval_filter(as_of, law_ids)
+            if where is not None:
+                search_kwargs["filter"] = where
+            return self.vector_store.as_retriever(search_kwargs=search_kwargs)
+        dense_weight, bm25_weight = self.rrf_weights
+        return HybridRetriever(
+            vector_store=self.vector_store,
+            bm25_index=self.bm25_index,
+            top_k=self.retrieval_top_k,
+            candidate_k=self.retrieval_candidate_k,
+            rrf_k=self.rrf_k,
+            dense_weight=dense_weight,
+            bm25_weight=bm25_weight,
+            as_of=as_of,
+            law_ids=law_ids,
+        )
 
     async def add_revisions(self, revisions_data: list[dict]):
         """
         DB에 저장된 법령 개정안이나 조문(LawArticleRevision) 데이터를
         문서 변환을 거쳐 벡터 스토어에 삽입(Add) 및 임베딩 처리합니다.
+        벡터 ID는 revision_id로 정해지므로 같은 개정본을 다시 넣으면 중복 없이 덮어쓰며(upsert),
+        본문이 그대로인 개정본은 임베딩 캐시에서 가져와 임베딩 API를 다시 호출하지 않습니다.
 
         Args:
             revisions_data (list[dict]): 추가 또는 갱신할 법령/조문 메타데이터 및 텍스트 콘텐츠 리스트
+                (effective_start_date/effective_end_date가 있으면 시점 검색용 메타데이터로 함께 저장)
         """
         if not self.vector_store:
-            self.initialize_vector_store()
+            await asyncio.to_thread(self.initialize_vector_store)
             
         from langchain_core.documents import Document
         
@@ -73,40 +270,120 @@ class LegalFactChecker:
                 "law_id": rev.get("law_id"),
                 "article_id": rev.get("article_id"),
                 "revision_id": rev.get("revision_id"),
-                "source": f"{rev.get('law_name', '법')} {rev.get('article_number', '조항')}"
+                "source": f"{rev.get('law_name', '법')} {rev.get('article_number', '조항')}",
+                "content_hash": content_hash(rev["content"]),
+                **effective_date_metadata(rev.get("effective_start_date"), rev.get("effective_end_date")),
             }
             docs.append(Document(page_content=rev["content"], metadata=metadata))
             
+        if self._laws is not None and {doc.metadata["law_id"] for doc in docs} - {law[0] for law in self._laws}:
+            # 새로 등록된 법령의 개정본이면 다음 검색에서 법령 목록을 다시 읽음
+            self._laws = None
         if docs:
-            self.vector_store.add_documents(docs)
+            ids = [vector_id(doc) for doc in docs]
+            # 임베딩 API 호출과 Chroma 쓰기는 동기 I/O이므로 이벤트 루프 밖에서 실행 (진행 중인 요청이 멈추지 않게)
+            await asyncio.to_thread(self._write_documents, docs, ids)
+            self.bm25_index.add(docs)
 
-    async def check_fact_with_history(self, query: str, chat_history: list, plugin_context: str = ""):
-        """
-        이전 채팅 내역과 부가적인 플러그인 문맥을 참고하여 벡터 DB에서 관련된 법령/판례를 조회하고,
-        LLM을 통해 구조화된 형태(FactCheckResult)로 팩트체크 및 검증 결과를 최종 도출합니다.
-
-        Args:
-            query (str): 팩트체크 대상이 되는 사용자 질문 또는 보완된 검색 쿼리
-            chat_history (list): 사용자와의 이전 대화 내역 (Human/AI 역할 모델 컨버팅 포함)
-            plugin_context (str, optional): Agent나 Vision 판단 등 외부 플러그인에서 생성되어 검색 정확도를 높여주는 추가 문맥(텍스트). Defaults to "".
+    def _write_documents(self, docs: list, ids: list[str]) -> None:
+        self._delete_legacy_vectors(docs, ids)
+        self.vector_store.add_documents(docs, ids=ids)
 
-        Returns:
-            dict: AI가 판정한 팩트체크 포맷 결과(result), 참고 조문 출처들의 리스트(sources), 참고 법 조항 메타데이터(revision_ids) 요소
+    def delete_vectors(self, ids: list[str], orphan_revision_ids: list[int] = ()) -> None:
+        """
+        벡터를 ID로 지웁니다 (정합성 검사의 중복·고아 벡터 정리).
+        orphan_revision_ids는 DB에 더 이상 없는 개정본으로, BM25 색인에서도 뺍니다.
         """
         if not self.vector_store:
             self.initialize_vector_store()
-            
-        if not self.vector_store:
-            return {"result": "Error", "reasoning": "Vector store not initialized. Please ingest data first."}
+        if ids:
+            self.vector_store.delete(ids=ids)
+        self.bm25_index.remove_revisions(list(orphan_revision_ids))
 
+    def _delete_legacy_vectors(self, docs: list, ids: list[str]) -> None:
+        """
+        결정적 ID 도입 전에 자동 생성 ID로 저장된 같은 개정본의 벡터(중복 삽입분 포함)를 지웁니다.
+        upsert 전에 지워야 같은 조문이 top-k를 여러 칸 차지하지 않습니다.
+        """
+        revision_ids = [doc.metadata["revision_id"] for doc in docs if doc.metadata.get("revision_id") is not None]
+        if not revision_ids:
+            return
+        stored = self.vector_store.get(where={"revision_id": {"$in": revision_ids}}, include=[])
+        keep = set(ids)
+        stale = [stored_id for stored_id in stored["ids"] if stored_id not in keep]
+        if stale:
+            self.vector_store.delete(ids=stale)
+            logger.info(f"Removed {len(stale)} duplicate vectors for re-added revisions")
+
+    def _format_history(self, chat_history: list) -> list:
+        """대화 내역 딕셔너리 리스트를 LangChain 메시지 객체(Human/AI) 리스트로 변환합니다."""
         formatted_history = []
         for msg in chat_history:
             if msg["role"] == "user":
                 formatted_history.append(HumanMessage(content=msg["content"]))
             elif msg["role"] == "ai":
                 formatted_history.append(AIMessage(content=msg["content"]))
+        return formatted_history
+
+    async def retrieve_documents(
+        self, query: str, chat_history: list, as_of: date | None = None, law_domain: str | None = None
+    ) -> list:
+        """
+        이전 대화 맥락을 반영하여(History-aware) 벡터 DB에서 질문과 관련된 법령 문서를 검색합니다.
+        하이브리드 모드에서는 벡터 유사도와 BM25 순위를 RRF로 합쳐 상위 RETRIEVAL_TOP_K개를 반환합니다.
+        답변 생성과 분리되어 있어, 파이프라인에서 의도 분석 등 다른 단계와 동시에 실행할 수 있습니다.
+        law_domain이 주어지면 해당 법령 파티션만 검색하고, 법 영역을 알 수 없거나 파티션에서 찾은 문서가 없으면 전체를 검색합니다.
+        요약문으로 저장된 인제스트 청크는 검색 후 원문으로 바꾸어 반환합니다 (attach_parent_documents).
+
+        Args:
+            query (str): 검색 대상 질문 (원본 질의 또는 키워드로 보강된 질의)
+            chat_history (list): 사용자와의 이전 대화 내역
+            as_of (date | None, optional): 이 날짜에 시행 중인 조문만 검색. None이면 시점 필터 없음. Defaults to None.
+            law_domain (str | None, optional): 의도 분석의 법 영역 (예: 근로기준법). None이면 전체 검색. Defaults to None.
+
+        Returns:
+            list: 검색된 Document 객체 리스트
+        """
+        if not self.vector_store:
+            self.initialize_vector_store()
+
+        law_ids = await self.resolve_law_ids(law_domain)
+        docs = await self._retrieve(query, chat_history, as_of, law_ids)
+        if law_ids and not docs:
+            logger.info(f"No documents in law partition {law_domain!r}, falling back to global search")
+            docs = await self._retrieve(query, chat_history, as_of, None)
+        return await self.attach_parent_documents(docs)
+
+    async def attach_parent_documents(self, docs: list) -> list:
+        """
+        요약문으로 검색된 인제스트 청크(metadata["parent_id"])의 본문을 부모 문서 저장소의 원문으로 바꿉니다.
+        상위 k개 문서의 원문만 ID로 한 번에 조회하며, 요약문은 metadata["summary"]에 남깁니다.
+        원문을 메타데이터(original_text)에 싣던 기존 벡터는 그 값을 그대로 사용합니다.
+        """
+        parent_ids = [d.metadata["parent_id"] for d in docs if d.metadata.get("parent_id")]
+        originals = {}
+        if parent_ids:
+            from app.core.database import AsyncSessionLocal
 
-        retriever = self.vector_store.as_retriever(search_kwargs={"k": 3})
+            try:
+                originals = await ParentDocumentStore(self.session_factory or AsyncSessionLocal).get_many(parent_ids)
+            except SQLAlchemyError as e:
+                logger.warning(f"Parent document lookup failed, answering from summaries: {e!r}")
+
+        from langchain_core.documents import Document
+
+        attached = []
+        for doc in docs:
+            original = originals.get(doc.metadata.get("parent_id")) or doc.metadata.get("original_text")
+            if original is None:
+                attached.append(doc)
+                continue
+            metadata = {key: value for key, value in doc.metadata.items() if key != "original_text"}
+            attached.append(Document(page_content=original, metadata={**metadata, "summary": doc.page_content}))
+        return attached
+
+    async def _retrieve(self, query: str, chat_history: list, as_of: date | None, law_ids: list[int] | None) -> list:
+        retriever = self._build_retriever(as_of, law_ids)
 
         contextualize_q_prompt = ChatPromptTemplate.from_messages(
             [
@@ -115,24 +392,70 @@ class LegalFactChecker:
                 ("human", "{input}"),
             ]
         )
-        
+
         history_aware_retriever = create_history_aware_retriever(
             self.llm, retriever, contextualize_q_prompt
         )
+        return await history_aware_retriever.ainvoke({
+            "input": query,
+            "chat_history": self._format_history(chat_history),
+        })
 
-        qa_prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", FACT_CHECK_SYSTEM_PROMPT),
-                MessagesPlaceholder("chat_history"),
-                ("human", "{input}"),
-            ]
-        ).partial(format_instructions=self.parser.get_format_instructions())
+    async def answer_with_documents(
+        self,
+        query: str,
+        chat_history: list,
+        docs: list,
+        plugin_context: str = "",
+        on_section_delta: Callable[[str, str], Awaitable[None]] | None = None,
+        cached_explanation: dict | None = None,
+    ) -> dict:
+        """
+        이미 검색된 문서를 압축(Compress)한 뒤 플러그인 문맥과 합쳐 LLM으로 최종 팩트체크 결과를 생성합니다.
+        on_section_delta가 주어지면 LLM 응답을 토큰 단위로 스트리밍하면서,
+        새로 들어온 청크만 SectionStreamParser로 해석해 각 섹션(section_1_summary 등)에 새로 추가된 텍스트를 콜백으로 전달합니다.
+        cached_explanation(ExplanationCache 내용)이 주어지면 조문 해설 섹션(2~4)은 캐시를 그대로 사용하고,
+        더 작은 프롬프트로 판정/요약/상담 권장/후속 질문만 생성합니다.
+
+        Args:
+            query (str): 팩트체크 대상이 되는 사용자 질문 또는 보완된 검색 쿼리
+            chat_history (list): 사용자와의 이전 대화 내역
+            docs (list): retrieve_documents 등으로 검색된 Document 객체 리스트
+            plugin_context (str, optional): 비전/판례/계산기 플러그인이 생성한 추가 문맥. Defaults to "".
+            on_section_delta (Callable | None, optional): (섹션 키, 추가된 텍스트)를 받는 스트리밍 콜백. Defaults to None.
+            cached_explanation (dict | None, optional): plain_summary/caution_note 키를 가진 캐시된 조문 해설 (현실 적용 예시는 새로 생성). Defaults to None.
+
+        Returns:
+            dict: 팩트체크 결과(result), 출처 리스트(sources), 참고 조문 리비전 ID(revision_ids), 캐시 해설 사용 여부(explanation_cached)
+        """
+        formatted_history = self._format_history(chat_history)
+
+        if cached_explanation is None:
+            qa_prompt = ChatPromptTemplate.from_messages(
+                [
+                    ("system", FACT_CHECK_SYSTEM_PROMPT),
+                    MessagesPlaceholder("chat_history"),
+                    ("human", "{input}"),
+                ]
+            ).partial(format_instructions=self.parser.get_format_instructions())
+        else:
+            explanation_text = (
+                f"- 법 조문 기준 설명: {cached_explanation['plain_summary']}\n"
+                f"- 주의사항: {cached_explanation.get('caution_note') or ''}"
+            )
+            qa_prompt = ChatPromptTemplate.from_messages(
+                [
+                    ("system", CLAIM_VERDICT_SYSTEM_PROMPT),
+                    MessagesPlaceholder("chat_history"),
+                    ("human", "{input}"),
+                ]
+            ).partial(
+                format_instructions=self.verdict_parser.get_format_instructions(),
+                cached_explanation=explanation_text,
+            )
         
         question_answer_chain = create_stuff_documents_chain(self.llm, qa_prompt)
 
-        # Retrieve documents manually
-        docs = await history_aware_retriever.ainvoke({"input": query, "chat_history": formatted_history})
-        
         # Compress context
         compressed_context = await self.compressor.compress_documents(query, docs)
         
@@ -142,11 +465,21 @@ class LegalFactChecker:
         from langchain_core.documents import Document
         compressed_doc = Document(page_content=compressed_context)
 
-        answer_response = await question_answer_chain.ainvoke({
+        chain_input = {
             "input": query, 
             "chat_history": formatted_history,
             "context": [compressed_doc],
-        })
+        }
+        if on_section_delta is None:
+            answer_response = await question_answer_chain.ainvoke(chain_input)
+        else:
+            chunks = []
+            sections = SectionStreamParser()
+            async for chunk in question_answer_chain.astream(chain_input):
+                chunks.append(chunk)
+                for key, delta in sections.feed(chunk).items():
+                    await on_section_delta(key, delta)
+            answer_response = "".join(chunks)
         
         try:
             parsed_answer = json.loads(answer_response)
@@ -160,9 +493,50 @@ class LegalFactChecker:
                 "section_5_counseling_recommendation": "N/A",
                 "section_6_suggested_followups": []
             }
+
+        # 파싱에 실패한 답변(ERROR)에는 캐시 해설을 붙이지 않아, 오류 응답이 정상 해설처럼 보이지 않게 함
+        explanation_cached = cached_explanation is not None and parsed_answer.get("verdict") != "ERROR"
+        if explanation_cached:
+            parsed_answer = {
+                "verdict": parsed_answer.get("verdict", "ERROR"),
+                "section_1_summary": parsed_answer.get("section_1_summary", ""),
+                "section_2_law_explanation": cached_explanation["plain_summary"],
+                "section_3_real_case_example": parsed_answer.get("section_3_real_case_example", ""),
+                "section_4_caution": cached_explanation.get("caution_note") or "",
+                "section_5_counseling_recommendation": parsed_answer.get("section_5_counseling_recommendation", ""),
+                "section_6_suggested_followups": parsed_answer.get("section_6_suggested_followups", []),
+            }
+            if on_section_delta is not None:
+                for key in ("section_2_law_explanation", "section_4_caution"):
+                    if parsed_answer[key]:
+                        await on_section_delta(key, parsed_answer[key])
         
         return {
+            "explanation_cached": explanation_cached,
             "result": parsed_answer,
             "sources": [d.metadata.get("source", "Unknown") for d in docs],
             "revision_ids": [d.metadata.get("revision_id") for d in docs if "revision_id" in d.metadata]
         }
+
+    async def check_fact_with_history(self, query: str, chat_history: list, plugin_context: str = "", as_of: date | None = None):
+        """
+        이전 채팅 내역과 부가적인 플러그인 문맥을 참고하여 벡터 DB에서 관련된 법령/판례를 조회하고,
+        LLM을 통해 구조화된 형태(FactCheckResult)로 팩트체크 및 검증 결과를 최종 도출합니다.
+
+        Args:
+            query (str): 팩트체크 대상이 되는 사용자 질문 또는 보완된 검색 쿼리
+            chat_history (list): 사용자와의 이전 대화 내역 (Human/AI 역할 모델 컨버팅 포함)
+            plugin_context (str, optional): Agent나 Vision 판단 등 외부 플러그인에서 생성되어 검색 정확도를 높여주는 추가 문맥(텍스트). Defaults to "".
+            as_of (date | None, optional): 기준일. 이 날짜에 시행 중인 조문만 근거로 사용. Defaults to None (오늘).
+
+        Returns:
+            dict: AI가 판정한 팩트체크 포맷 결과(result), 참고 조문 출처들의 리스트(sources), 참고 법 조항 메타데이터(revision_ids) 요소
+        """
+        if not self.vector_store:
+            self.initialize_vector_store()
+            
+        if not self.vector_store:
+            return {"result": "Error", "reasoning": "Vector store not initialized. Please ingest data first."}
+
+        docs = await self.retrieve_documents(query, chat_history, as_of=as_of or date.today())
+        return await self.answer_with_documents(query, chat_history, docs, plugin_context)
@@ -0,0 +1,144 @@
+"""
+스트리밍 JSON 섹션 파서
+LLM이 토큰 단위로 생성 중인 팩트체크 JSON({"verdict": ..., "section_1_summary": ...})에서
+최상위 문자열 값이 늘어난 부분만 섹션별 증분(delta)으로 꺼냅니다.
+새로 들어온 글자만 한 번씩 훑는 상태 기계이므로, 청크마다 누적 문자열 전체를 다시 파싱하는 방식(O(n²))과 달리
+전체 응답 길이에 선형인 시간으로 동작합니다. 중첩된 값(배열/객체)과 숫자 등은 건너뜁니다.
+"""
+
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+# 상태
+_BEFORE = "before"          # 최상위 '{' 이전 (```json 코드 펜스 등)
+_KEY_OR_END = "key_or_end"  # 다음 키 또는 객체 끝
+_KEY = "key"                # 키 문자열 안
+_COLON = "colon"            # 키 뒤 ':' 대기
+_VALUE = "value"            # 값 시작 대기
+_STRING = "string"          # 최상위 문자열 값 안 (증분 방출)
+_NESTED = "nested"          # 배열/객체 값 건너뛰기
+_SCALAR = "scalar"          # 숫자/불리언/null 건너뛰기
+_DONE = "done"
+
+
+class SectionStreamParser:
+    """
+    feed()에 LLM 출력 청크를 차례로 넣으면 {섹션 키: 이번 청크에서 늘어난 텍스트}를 반환합니다.
+    문자열 이스케이프(\\n, \\", \\uXXXX 및 서로게이트 쌍)가 청크 경계에서 잘려도 올바르게 복원합니다.
+    """
+
+    def __init__(self):
+        self._state = _BEFORE
+        self._key = ""
+        self._escape: str | None = None      # 진행 중인 이스케이프 시퀀스 (백슬래시 뒤 글자들)
+        self._high_surrogate: str | None = None
+        self._depth = 0                      # _NESTED 상태의 괄호 깊이
+        self._nested_string = False
+        self.sections: dict[str, str] = {}   # 지금까지 완성된/진행 중인 최상위 문자열 섹션 전체
+
+    def feed(self, chunk: str) -> dict[str, str]:
+        """
+        Args:
+            chunk (str): 새로 생성된 LLM 출력
+
+        Returns:
+            dict[str, str]: 섹션 키별로 이번 청크에서 새로 추가된 텍스트 (추가된 것이 없으면 빈 딕셔너리)
+        """
+        deltas: dict[str, str] = {}
+        for ch in chunk:
+            state = self._state
+            if state == _STRING or state == _KEY:
+                text = self._read_string_char(ch)
+                if text is None:
+                    continue
+                if state == _KEY:
+                    self._key += text
+                elif text:
+                    deltas[self._key] = deltas.get(self._key, "") + text
+            elif state == _BEFORE:
+                if ch == "{":
+                    self._state = _KEY_OR_END
+            elif state == _KEY_OR_END:
+                if ch == '"':
+                    self._key = ""
+                    self._state = _KEY
+                elif ch == "}":
+                    self._state = _DONE
+            elif state == _COLON:
+                if ch == ":":
+                    self._state = _VALUE
+            elif state == _VALUE:
+                if ch == '"':
+                    self.sections.setdefault(self._key, "")
+                    self._state = _STRING
+                elif ch in "[{":
+                    self._depth, self._nested_string = 1, False
+                    self._state = _NESTED
+                elif not ch.isspace():
+                    self._state = _SCALAR
+            elif state == _NESTED:
+                self._skip_nested(ch)
+            elif state == _SCALAR:
+                if ch == ",":
+                    self._state = _KEY_OR_END
+                elif ch == "}":
+                    self._state = _DONE
+
+        for key, text in deltas.items():
+            self.sections[key] = self.sections.get(key, "") + text
+        return deltas
+
+    def _read_string_char(self, ch: str) -> str | None:
+        """
+        문자열 안의 글자 하나를 처리합니다. 추가할 텍스트를 반환하며, 문자열이 닫히면 상태를 바꾸고 None을 반환합니다.
+        """
+        if self._escape is not None:
+            self._escape += ch
+            if self._escape[0] != "u":
+                text = _ESCAPES.get(self._escape, self._escape)
+                self._escape = None
+                return self._join_surrogate(text)
+            if len(self._escape) < 5:
+                return ""
+            try:
+                text = chr(int(self._escape[1:], 16))
+            except ValueError:
+                text = ""
+            self._escape = None
+            return self._join_surrogate(text)
+        if ch == "\\":
+            self._escape = ""
+            return ""
+        if ch == '"':
+            self._state = _COLON if self._state == _KEY else _KEY_OR_END
+            self._high_surrogate = None
+            return None
+        return self._join_surrogate(ch)
+
+    def _join_surrogate(self, text: str) -> str:
+        """\\uD83D\\uDE00처럼 두 이스케이프로 나뉜 서로게이트 쌍을 한 글자로 합칩니다."""
+        if len(text) == 1 and 0xD800 <= ord(text) <= 0xDBFF:
+            self._high_surrogate = text
+            return ""
+        if self._high_surrogate is not None:
+            high, self._high_surrogate = self._high_surrogate, None
+            if len(text) == 1 and 0xDC00 <= ord(text) <= 0xDFFF:
+                return chr(0x10000 + ((ord(high) - 0xD800) << 10) + (ord(text) - 0xDC00))
+        return text
+
+    def _skip_nested(self, ch: str) -> None:
+        if self._nested_string:
+            if self._escape is not None:
+                self._escape = None
+            elif ch == "\\":
+                self._escape = ""
+            elif ch == '"':
+                self._nested_string = False
+            return
+        if ch == '"':
+            self._nested_string = True
+        elif ch in "[{":
+            self._depth += 1
+        elif ch in "]}":
+            self._depth -= 1
+            if self._depth == 0:
+                self._state = _KEY_OR_END
@@ -0,0 +1,181 @@
+"""
+벡터 스토어 / SQL 정합성 검사와 증분 복구
+모든 LawArticleRevision이 벡터 스토어(Chroma)에 정확히 하나의 벡터(revision-{id})를 갖는지,
+DB에 없는 개정본을 가리키는 고아 벡터가 남아 있지 않은지 페이지 단위로 비교합니다.
+컬렉션 전체를 메모리에 올리지 않도록 두 방향으로 나누어 훑습니다.
+
+1. SQL → 벡터: 개정본을 ID 순(키셋)으로 VECTOR_CHECK_PAGE_SIZE개씩 읽고, 같은 개정본의 벡터만 where 필터로 조회
+   - missing: 벡터가 없음 → 재임베딩
+   - stale_content: 본문 해시(content_hash)나 law_id/article_id가 다름 → 재임베딩
+   - stale_metadata: 시행 기간 메타데이터만 다름 → 메타데이터만 갱신
+   - duplicates: 결정적 ID가 아닌 같은 개정본의 벡터 (자동 ID 시절 중복 삽입분) → 삭제
+   - queued: 아직 임베딩 아웃박스에 대기 중인 개정본 → 건너뜀
+2. 벡터 → SQL: 벡터를 offset/limit으로 VECTOR_CHECK_PAGE_SIZE개씩 읽고 revision_id가 DB에 없는 벡터를 찾음
+   - orphans: 고아 벡터 → 페이지 단위로 삭제
+재임베딩과 메타데이터 갱신은 임베딩 아웃박스에 기록하여 워커가 묶어서 처리하므로, 인덱스 전체를 다시 만들 필요가 없습니다.
+"""
+import asyncio
+import logging
+
+from sqlalchemy import select
+
+from app.models import EmbeddingOutbox, LawArticle, LawArticleRevision
+from app.services.hybrid_retriever import content_hash, effective_date_metadata
+from app.services.law_revisions import enqueue_embeddings
+
+logger = logging.getLogger(__name__)
+
+# 보고서에 함께 싣는 분류별 예시 ID 수
+SAMPLE_SIZE = 20
+KINDS = ("missing", "stale_content", "stale_metadata", "duplicates", "orphans", "queued")
+
+
+class VectorConsistencyChecker:
+    """SQL 개정본과 벡터 스토어를 비교하고, repair=True이면 차이를 복구합니다."""
+
+    def __init__(self, session_factory, checker, page_size: int = 500):
+        self.session_factory = session_factory
+        self.checker = checker
+        self.page_size = page_size
+
+    async def run(self, repair: bool = False) -> dict:
+        """
+        정합성 검사를 실행합니다.
+
+        Args:
+            repair (bool, optional): True이면 재임베딩·메타데이터 갱신을 아웃박스에 기록하고 중복·고아 벡터를 삭제합니다.
+
+        Returns:
+            dict: revisions_checked, vectors_checked, 분류별 건수(KINDS), samples(분류별 예시 ID),
+                  repair 여부와 queued_for_embedding(아웃박스에 기록한 개정본 수), deleted_vectors
+        """
+        # 서버에서는 이미 초기화된 스토어를 쓰고, 스크립트에서는 전체 컬렉션을 읽는 초기화(시행일 동기화·BM25) 없이 핸들만 엶
+        self.checker.open_vector_store()
+        report = {
+            "repair": repair,
+            "revisions_checked": 0,
+            "vectors_checked": 0,
+            **{kind: 0 for kind in KINDS},
+            "queued_for_embedding": 0,
+            "deleted_vectors": 0,
+            "samples": {kind: [] for kind in KINDS},
+        }
+        await self._check_revisions(report, repair)
+        await self._check_orphans(report, repair)
+        logger.info(
+            "Vector consistency check: "
+            + ", ".join(f"{kind}={report[kind]}" for kind in KINDS)
+            + (" (repaired)" if repair else "")
+        )
+        return report
+
+    @staticmethod
+    def _record(report: dict, kind: str, ids: list) -> None:
+        report[kind] += len(ids)
+        samples = report["samples"][kind]
+        samples.extend(ids[: SAMPLE_SIZE - len(samples)])
+
+    async def _get_vectors(self, **kwargs) -> dict:
+        # Chroma 조회는 동기 I/O이므로 이벤트 루프 밖에서 실행
+        return await asyncio.to_thread(self.checker.vector_store.get, **kwargs)
+
+    async def _check_revisions(self, report: dict, repair: bool) -> None:
+        """SQL → 벡터 방향: 없는 벡터, 본문·메타데이터가 어긋난 벡터, 중복 벡터를 찾습니다."""
+        last_id = 0
+        while True:
+            async with self.session_factory() as db:
+                rows = (await db.execute(
+                    select(
+                        LawArticleRevision.id, LawArticleRevision.content, LawArticleRevision.article_id,
+                        LawArticleRevision.effective_start_date, LawArticleRevision.effective_end_date,
+                        LawArticle.law_id,
+                    )
+                    .join(LawArticle, LawArticleRevision.article_id == LawArticle.id)
+                    .where(LawArticleRevision.id > last_id)
+                    .order_by(LawArticleRevision.id)
+                    .limit(self.page_size)
+                )).all()
+                if not rows:
+                    return
+                ids = [row.id for row in rows]
+                queued = set(await db.scalars(
+                    select(EmbeddingOutbox.revision_id)
+                    .where(EmbeddingOutbox.revision_id.in_(ids), EmbeddingOutbox.status.in_(["pending", "processing"]))
+                ))
+            last_id = ids[-1]
+            report["revisions_checked"] += len(rows)
+
+            stored = await self._get_vectors(where={"revision_id": {"$in": ids}}, include=["metadatas", "documents"])
+            vectors: dict[int, list[tuple[str, dict, str]]] = {}
+            for vid, metadata, document in zip(stored["ids"], stored["metadatas"], stored["documents"]):
+                vectors.setdefault((metadata or {}).get("revision_id"), []).append((vid, metadata or {}, document or ""))
+
+            embed, close, duplicates = [], [], []
+            for row in rows:
+                canonical = f"revision-{row.id}"
+                entries = vectors.get(row.id, [])
+                duplicates += [vid for vid, _, _ in entries if vid != canonical]
+                if row.id in queued:
+                    self._record(report, "queued", [row.id])
+                    continue
+                current = next(((metadata, document) for vid, metadata, document in entries if vid == canonical), None)
+                if current is None:
+                    self._record(report, "missing", [row.id])
+                    embed.append(row.id)
+                    continue
+                metadata, document = current
+                stored_hash = metadata.get("content_hash") or content_hash(document)
+                if (
+                    stored_hash != content_hash(row.content)
+                    or metadata.get("law_id") != row.law_id
+                    or metadata.get("article_id") != row.article_id
+                ):
+                    self._record(report, "stale_content", [row.id])
+                    embed.append(row.id)
+                    continue
+                expected = effective_date_metadata(row.effective_start_date, row.effective_end_date)
+                if any(metadata.get(key) != value for key, value in expected.items()):
+                    self._record(report, "stale_metadata", [row.id])
+                    close.append(row.id)
+            self._record(report, "duplicates", duplicates)
+
+            if repair:
+                if embed or close:
+                    async with self.session_factory() as db:
+                        await enqueue_embeddings(db, embed, close)
+                        await db.commit()
+                    report["queued_for_embedding"] += len(embed) + len(close)
+                if duplicates:
+                    await asyncio.to_thread(self.checker.delete_vectors, duplicates)
+                    report["deleted_vectors"] += len(duplicates)
+
+    async def _check_orphans(self, report: dict, repair: bool) -> None:
+        """벡터 → SQL 방향: DB에 없는 개정본을 가리키는 벡터를 찾습니다. 개정본과 무관한 문서(일반 인제스트 청크)는 제외합니다."""
+        offset = 0
+        while True:
+            stored = await self._get_vectors(limit=self.page_size, offset=offset, include=["metadatas"])
+            if not stored["ids"]:
+                return
+            page = [
+                (vid, metadata["revision_id"])
+                for vid, metadata in zip(stored["ids"], stored["metadatas"])
+                if metadata and metadata.get("revision_id") is not None
+            ]
+            existing = set()
+            if page:
+                async with self.session_factory() as db:
+                    existing = set(await db.scalars(
+                        select(LawArticleRevision.id).where(LawArticleRevision.id.in_({rid for _, rid in page}))
+                    ))
+            report["vectors_checked"] += len(stored["ids"])
+            orphans = [(vid, rid) for vid, rid in page if rid not in existing]
+            self._record(report, "orphans", [vid for vid, _ in orphans])
+
+            offset += len(stored["ids"])
+            if repair and orphans:
+                await asyncio.to_thread(
+                    self.checker.delete_vectors, [vid for vid, _ in orphans], [rid for _, rid in orphans]
+                )
+                report["deleted_vectors"] += len(orphans)
+                # 지운 만큼 뒤의 벡터가 앞으로 당겨지므로 offset을 되돌림
+                offset -= len(orphans)
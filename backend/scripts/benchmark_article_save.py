@@ -0,0 +1,105 @@
+"""
+조문 저장 벤치마크 (행 단위 flush vs 대량 INSERT ... RETURNING)
+합성 조문 목록을 임시 DB에 저장하면서, 기존 방식(조문·개정본마다 flush하여 ID를 받음)과
+apply_article_revisions의 대량 INSERT 경로(PDFLawParser._save_articles가 사용)의 초당 저장 조문 수를 비교합니다.
+
+사용법:
+    python -m scripts.benchmark_article_save [--articles 500] [--repeat 3] [--database-url sqlite:///... --database-url postgresql://...]
+    (--database-url을 생략하면 임시 SQLite 파일을 사용합니다. 여러 번 지정하면 DB별로 실행합니다.
+     합성 법령과 조문이 삽입되므로 빈 DB를 사용하세요.)
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import date
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.database import to_async_url
+from app.models import Base, Law, LawArticle, LawArticleRevision
+from app.services.law_revisions import apply_article_revisions
+
+
+def build_articles(count: int) -> list[dict]:
+    return [
+        {
+            "article_number": f"제{i}조",
+            "title": f"조문{i}",
+            "content": f"제{i}조(조문{i}) 사용자는 근로자에게 {i}번째 의무를 이행하여야 한다. 위반 시 대통령령으로 정하는 바에 따른다.",
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+async def save_per_row(db, law: Law, items: list[dict]) -> None:
+    """기존 _save_articles 방식: 조문과 개정본마다 flush (조문당 왕복 2회)"""
+    for item in items:
+        article = LawArticle(law_id=law.id, article_number=item["article_number"], title=item["title"], is_active=True)
+        db.add(article)
+        await db.flush()
+        db.add(LawArticleRevision(article_id=article.id, content=item["content"], effective_start_date=date.today()))
+        await db.flush()
+    await db.commit()
+
+
+async def save_bulk(db, law: Law, items: list[dict]) -> None:
+    await apply_article_revisions(db, law, items, start_date=date.today())
+    await db.commit()
+
+
+async def run(url: str, articles: int, repeat: int) -> None:
+    engine = create_async_engine(to_async_url(url))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    items = build_articles(articles)
+
+    results = {}
+    for name, save in (("per-row flush", save_per_row), ("bulk insert", save_bulk)):
+        timings = []
+        for i in range(repeat):
+            async with session_factory() as db:
+                law = Law(name=f"벤치마크법-{name}-{i}-{time.time_ns()}")
+                db.add(law)
+                await db.commit()
+                started = time.perf_counter()
+                await save(db, law, items)
+                timings.append(time.perf_counter() - started)
+        results[name] = statistics.median(timings)
+
+    dialect = engine.dialect.name
+    for name, seconds in results.items():
+        print(f"{dialect:<12}{name:<16}{seconds * 1000:>10.1f} ms{articles / seconds:>12.0f} articles/sec")
+    print(f"{dialect:<12}{'speedup':<16}{results['per-row flush'] / results['bulk insert']:>12.1f}x")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark per-row flushes against bulk INSERT ... RETURNING for article saves.")
+    parser.add_argument("--articles", type=int, default=500, help="법령 하나의 합성 조문 수")
+    parser.add_argument("--repeat", type=int, default=3, help="방식별 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--database-url", action="append", default=[], help="벤치마크용 DB URL (여러 번 지정 가능, 기본: 임시 SQLite 파일)")
+    args = parser.parse_args()
+
+    tmpdir = None
+    urls = args.database_url
+    if not urls:
+        tmpdir = tempfile.TemporaryDirectory()
+        urls = [f"sqlite:///{os.path.join(tmpdir.name, 'bench.db')}"]
+
+    for url in urls:
+        asyncio.run(run(url, args.articles, args.repeat))
+
+    if tmpdir is not None:
+        tmpdir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+조문 본문 검색 벤치마크 (LIKE 전체 스캔 vs 전문 검색 인덱스)
+합성 조문 코퍼스(기본 5,000개)를 임시 DB에 만들고, 같은 검색어로 기존 LIKE '%검색어%' 스캔과
+전문 검색 인덱스(SQLite FTS5 바이그램 / Postgres pg_trgm)의 응답 시간과 결과 수를 비교합니다.
+
+사용법:
+    python -m scripts.benchmark_article_search [--articles 5000] [--repeat 20] [--database-url sqlite:///...]
+    (--database-url을 생략하면 임시 SQLite 파일을 사용합니다. 지정할 경우 합성 데이터가 삽입되므로 빈 DB를 사용하세요.)
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import date
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.models import Base, Law, LawArticle, LawArticleRevision
+from app.models.fulltext import build_search_statement
+
+SUBJECTS = ["사용자는", "근로자는", "고용노동부장관은", "노동위원회는", "임차인은", "임대인은", "사업주는", "채권자는"]
+PHRASES = [
+    "임금을 통화로 직접 근로자에게 그 전액을 지급하여야 한다",
+    "근로자를 해고하려면 적어도 30일 전에 예고를 하여야 한다",
+    "1년간 80퍼센트 이상 출근한 근로자에게 15일의 유급휴가를 주어야 한다",
+    "퇴직한 근로자에게 퇴직금을 지급하기 위하여 퇴직급여제도를 설정하여야 한다",
+    "정당한 이유 없이 근로자에게 해고, 휴직, 정직, 전직, 감봉, 그 밖의 징벌을 하지 못한다",
+    "주택의 인도와 주민등록을 마친 때에는 그 다음 날부터 제3자에 대하여 효력이 생긴다",
+    "계약갱신요구권을 행사하는 경우 차임과 보증금의 증액은 약정한 금액의 20분의 1을 초과하지 못한다",
+    "연장근로에 대하여는 통상임금의 100분의 50 이상을 가산하여 지급하여야 한다",
+    "대통령령으로 정하는 바에 따라 관계 서류를 3년간 보존하여야 한다",
+    "제1항에 따른 신고를 받은 경우에는 지체 없이 필요한 조치를 하여야 한다",
+]
+# 일부 조문에만 등장하는 드문 주제어 (실제 법령처럼 대부분의 검색어는 소수 조문에만 일치)
+TOPICS = [
+    "직장 내 괴롭힘", "산전후휴가", "육아휴직", "취업규칙", "부당노동행위", "단체협약", "최저임금위원회",
+    "경비원", "전세사기", "확정일자", "우선변제권", "소액임차인", "임차권등기명령", "계약갱신거절",
+    "파견근로자", "기간제근로자", "휴게시간", "야간근로", "탄력적 근로시간제", "선택적 근로시간제",
+]
+QUERIES = [
+    "임금", "통화로 직접", "해고 예고", "퇴직급여제도",
+    "육아휴직", "임차권등기명령", "탄력적 근로시간제", "존재하지않는문구",
+]
+
+
+def build_corpus(engine, articles: int, seed: int = 7) -> float:
+    """합성 법령/조문/개정본을 삽입하고 걸린 시간(초)을 반환합니다. (ORM 경로이므로 FTS 동기화 비용 포함)"""
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    with Session(engine) as db:
+        laws = [Law(name=f"벤치마크법{i}") for i in range(max(1, articles // 200))]
+        db.add_all(laws)
+        db.flush()
+        for i in range(articles):
+            law = laws[i % len(laws)]
+            sentences = [f"{rng.choice(SUBJECTS)} {rng.choice(PHRASES)}." for _ in range(rng.randint(2, 6))]
+            if rng.random() < 0.1:
+                sentences.append(f"{rng.choice(TOPICS)}에 관하여 필요한 사항은 대통령령으로 정한다.")
+            article = LawArticle(law_id=law.id, article_number=f"제{i // len(laws) + 1}조")
+            article.revisions.append(LawArticleRevision(
+                content=" ".join(sentences), effective_start_date=date(2024, 1, 1)
+            ))
+            db.add(article)
+        db.commit()
+    return time.perf_counter() - started
+
+
+def time_query(engine, run, repeat: int) -> tuple[float, int]:
+    """검색 함수를 repeat회 실행하여 중앙값(ms)과 결과 수를 반환합니다."""
+    timings, count = [], 0
+    with engine.connect() as conn:
+        run(conn)  # 워밍업 (페이지 캐시)
+        for _ in range(repeat):
+            started = time.perf_counter()
+            count = len(run(conn))
+            timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark LIKE scans against the article full-text index.")
+    parser.add_argument("--articles", type=int, default=5000, help="합성 조문 수")
+    parser.add_argument("--repeat", type=int, default=20, help="검색어별 반복 횟수")
+    parser.add_argument("--limit", type=int, default=50, help="검색 결과 최대 수 (/search/articles와 동일)")
+    parser.add_argument("--database-url", default="", help="벤치마크용 DB URL (기본: 임시 SQLite 파일)")
+    args = parser.parse_args()
+
+    tmpdir = None
+    url = args.database_url
+    if not url:
+        tmpdir = tempfile.TemporaryDirectory()
+        url = f"sqlite:///{os.path.join(tmpdir.name, 'bench.db')}"
+
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    elapsed = build_corpus(engine, args.articles)
+    dialect = engine.dialect.name
+    print(f"{dialect}: inserted {args.articles} articles in {elapsed:.2f}s ({args.articles / elapsed:.0f} articles/sec)")
+
+    def like(query):
+        stmt = (
+            select(LawArticleRevision.id)
+            .where(LawArticleRevision.content.ilike(f"%{query}%"), LawArticleRevision.effective_end_date.is_(None))
+            .limit(args.limit)
+        )
+        return lambda conn: conn.execute(stmt).all()
+
+    def fulltext(query):
+        stmt = build_search_statement(dialect, query, args.limit)
+        return (lambda conn: conn.execute(stmt).all()) if stmt is not None else None
+
+    print(f"{'query':<20}{'LIKE ms':>10}{'hits':>7}{'FTS ms':>10}{'hits':>7}{'speedup':>10}")
+    for query in QUERIES:
+        like_ms, like_hits = time_query(engine, like(query), args.repeat)
+        run = fulltext(query)
+        if run is None:
+            print(f"{query:<20}{like_ms:>10.2f}{like_hits:>7}{'n/a':>10}{'':>7}{'':>10}")
+            continue
+        fts_ms, fts_hits = time_query(engine, run, args.repeat)
+        print(f"{query:<20}{like_ms:>10.2f}{like_hits:>7}{fts_ms:>10.2f}{fts_hits:>7}{like_ms / fts_ms:>9.1f}x")
+
+    engine.dispose()
+    if tmpdir is not None:
+        tmpdir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+벡터 스토어 / SQL 정합성 검사 스크립트
+모든 조문 개정본(law_article_revisions)이 벡터 스토어에 정확히 하나의 벡터를 갖는지, 고아 벡터가 없는지 페이지 단위로 비교합니다.
+장애(임베딩 실패, 벡터 스토어 복원 등) 후 인덱스 전체를 다시 만들지 않고 어긋난 부분만 복구할 때 사용합니다.
+
+사용법:
+    python -m scripts.check_vector_store [--repair] [--page-size 500]
+    (--repair: 없거나 어긋난 개정본을 임베딩 아웃박스에 기록한 뒤 바로 비우고, 중복·고아 벡터를 삭제)
+"""
+import argparse
+import asyncio
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal, async_engine, engine
+from app.models import Base
+from app.services.vector_consistency import KINDS, VectorConsistencyChecker
+
+
+async def check(repair: bool, page_size: int) -> None:
+    from app.core.container import get_services
+
+    services = get_services()
+    checker = VectorConsistencyChecker(AsyncSessionLocal, services.checker, page_size=page_size)
+    try:
+        started = time.perf_counter()
+        report = await checker.run(repair=repair)
+        print(
+            f"checked {report['revisions_checked']} revisions / {report['vectors_checked']} vectors "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+        for kind in KINDS:
+            samples = report["samples"][kind]
+            print(f"  {kind:<16}{report[kind]:>8}  {samples[:5]}{' ...' if report[kind] > 5 else ''}")
+        if repair:
+            print(f"deleted {report['deleted_vectors']} vectors, queued {report['queued_for_embedding']} revisions")
+            # 서버 워커 없이 실행되므로 방금 기록한 아웃박스를 바로 비움
+            print(f"embedded {await services.embedding_outbox.drain()} outbox rows")
+            stats = await services.embedding_outbox.stats()
+            if stats["backlog"] or stats["dead"]:
+                print(f"outbox not empty: {stats}")
+    finally:
+        await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Diff SQL article revisions against the vector store and repair drift.")
+    parser.add_argument("--repair", action="store_true", help="없거나 어긋난 벡터를 재임베딩하고 중복·고아 벡터를 삭제")
+    parser.add_argument("--page-size", type=int, default=get_settings().VECTOR_CHECK_PAGE_SIZE, help="한 번에 비교하는 개정본·벡터 수")
+    args = parser.parse_args()
+
+    # Make sure tables exist
+    Base.metadata.create_all(bind=engine)
+    asyncio.run(check(args.repair, args.page_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+ingest_data 청크 분할 비교 (글자 수 기준 분할 vs 조 단위 분할)
+backend/data의 법령 PDF를 기존 RecursiveCharacterTextSplitter(1000자, 200자 겹침)와 조 단위 분할(article_chunks)로
+각각 나누어 청크 수, 요약 LLM 호출 수, 요약에 보내는 글자 수, 검색 적중률(hit@k)을 비교합니다.
+요약·임베딩 API 없이 비교할 수 있도록 검색은 청크 원문에 대한 BM25(하이브리드 검색의 어휘 검색기)로 측정하며,
+--dense를 주면 임베딩 모델(EMBEDDING_MODEL)로 청크 원문 벡터 검색 적중률도 함께 측정합니다.
+적중: 상위 k개 청크 중 하나가 정답 법령의 정답 조 제목줄("제26조(해고의 예고)")을 포함
+
+사용법:
+    python -m scripts.compare_ingest_chunking [--top-k 3] [--max-chars 1000] [--dense]
+"""
+import argparse
+import glob
+import os
+import tempfile
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from langchain_community.document_loaders import PyPDFLoader
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from app.core.config import get_settings
+from app.services.hybrid_retriever import BM25Index
+from app.services.ingest_service import article_chunks, law_name_from_source
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+# (질문, 법령명, 정답 조)
+QUERIES = [
+    ("사용자가 근로자를 해고하려면 며칠 전에 예고해야 하나요?", "근로기준법", "제26조"),
+    ("해고 사유와 해고 시기는 서면으로 통지해야 하나요?", "근로기준법", "제27조"),
+    ("부당해고를 당하면 노동위원회에 구제신청을 할 수 있나요?", "근로기준법", "제28조"),
+    ("퇴직한 근로자에게 임금과 퇴직금을 언제까지 지급해야 하나요?", "근로기준법", "제36조"),
+    ("임금은 통화로 직접 근로자에게 전액 지급해야 하나요?", "근로기준법", "제43조"),
+    ("사용자의 귀책사유로 휴업하면 휴업수당은 평균임금의 몇 퍼센트인가요?", "근로기준법", "제46조"),
+    ("임금명세서를 근로자에게 교부해야 하나요?", "근로기준법", "제48조"),
+    ("임금채권의 소멸시효는 몇 년인가요?", "근로기준법", "제49조"),
+    ("1주간 근로시간은 휴게시간을 제외하고 40시간을 초과할 수 없나요?", "근로기준법", "제50조"),
+    ("근로시간이 8시간인 경우 휴게시간은 얼마나 주어야 하나요?", "근로기준법", "제54조"),
+    ("연장근로와 야간근로에 대한 가산임금은 통상임금의 몇 퍼센트인가요?", "근로기준법", "제56조"),
+    ("1년간 80퍼센트 이상 출근하면 연차 유급휴가는 며칠인가요?", "근로기준법", "제60조"),
+    ("출산전후휴가는 며칠 주어야 하나요?", "근로기준법", "제74조"),
+    ("직장 내 괴롭힘이란 무엇인가요?", "근로기준법", "제76조의2"),
+    ("직장 내 괴롭힘 신고를 받으면 사용자는 어떤 조치를 해야 하나요?", "근로기준법", "제76조의3"),
+    ("근로계약을 체결할 때 임금과 근로시간을 서면으로 명시해야 하나요?", "근로기준법", "제17조"),
+    ("주택의 인도와 주민등록을 마치면 대항력은 언제부터 생기나요?", "주택임대차보호법", "제3조"),
+    ("확정일자를 갖춘 임차인은 경매 때 보증금을 우선변제 받을 수 있나요?", "주택임대차보호법", "제3조의2"),
+    ("임대차가 끝난 후 보증금을 돌려받지 못하면 임차권등기명령을 신청할 수 있나요?", "주택임대차보호법", "제3조의3"),
+    ("임대차 기간을 2년 미만으로 정하면 어떻게 되나요?", "주택임대차보호법", "제4조"),
+    ("묵시적 갱신이 되면 임차인은 언제든지 계약 해지를 통지할 수 있나요?", "주택임대차보호법", "제6조의2"),
+    ("계약갱신요구권은 몇 번 행사할 수 있나요?", "주택임대차보호법", "제6조의3"),
+    ("차임이나 보증금 증액은 약정한 금액의 20분의 1을 초과할 수 없나요?", "주택임대차보호법", "제7조"),
+    ("보증금을 월차임으로 전환할 때 산정률 제한이 있나요?", "주택임대차보호법", "제7조의2"),
+    ("소액임차인의 보증금 중 일정액은 다른 담보권자보다 우선 변제받나요?", "주택임대차보호법", "제8조"),
+    ("임차인이 상속인 없이 사망하면 임차권은 누가 승계하나요?", "주택임대차보호법", "제9조"),
+]
+
+
+def load_documents(paths: list[str]) -> list:
+    documents = []
+    for path in paths:
+        documents.extend(PyPDFLoader(path).load())
+    return documents
+
+
+def headings(chunks: list) -> dict[tuple[str, str], str]:
+    """(법령명, 조 번호) → 조 제목줄. 조 단위 청크의 메타데이터에서 만듭니다."""
+    return {
+        (doc.metadata["law_name"], doc.metadata["article_number"]):
+            doc.metadata["article_number"] + (f"({doc.metadata['article_title']})" if doc.metadata["article_title"] else "")
+        for doc in chunks if "article_number" in doc.metadata
+    }
+
+
+def is_hit(doc, law_name: str, heading: str) -> bool:
+    return law_name_from_source(doc.metadata.get("source", "")) == law_name and heading in doc.page_content
+
+
+def bm25_hits(chunks: list, targets: list, top_k: int) -> int:
+    index = BM25Index()
+    index.add(chunks)
+    return sum(
+        any(is_hit(doc, law_name, heading) for doc, _ in index.search(query, top_k))
+        for query, law_name, heading in targets
+    )
+
+
+def dense_hits(chunks: list, targets: list, top_k: int) -> int:
+    from langchain_chroma import Chroma
+
+    from app.core.llm import get_embeddings
+
+    with tempfile.TemporaryDirectory() as path:
+        store = Chroma.from_documents(chunks, embedding=get_embeddings(), persist_directory=path)
+        return sum(
+            any(is_hit(doc, law_name, heading) for doc in store.similarity_search(query, k=top_k))
+            for query, law_name, heading in targets
+        )
+
+
+def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Compare fixed-size and article-aware chunking for ingest_data.")
+    parser.add_argument("--top-k", type=int, default=settings.RETRIEVAL_TOP_K, help="적중 판정에 쓰는 상위 청크 수")
+    parser.add_argument("--max-chars", type=int, default=settings.INGEST_ARTICLE_MAX_CHARS, help="조 단위 청크 최대 길이")
+    parser.add_argument("--min-chars", type=int, default=settings.INGEST_SUMMARY_MIN_CHARS, help="요약하지 않는 짧은 청크 기준")
+    parser.add_argument("--dense", action="store_true", help="임베딩 API로 벡터 검색 적중률도 측정")
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(DATA_DIR, "*.pdf")))
+    documents = load_documents(paths)
+    print(f"{len(paths)} statutes, {len(documents)} pages, {sum(len(d.page_content) for d in documents)} chars")
+
+    fixed = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200).split_documents(documents)
+    articles = article_chunks(documents, args.max_chars)
+    lookup = headings(articles)
+    targets = [(query, law_name, lookup[(law_name, number)]) for query, law_name, number in QUERIES]
+
+    rows = [
+        # 기존 ingest_data는 모든 청크를 요약
+        ("fixed 1000/200", fixed, fixed),
+        ("article", articles, [doc for doc in articles if len(doc.page_content) >= args.min_chars]),
+    ]
+    print(f"{'chunking':<16}{'chunks':>8}{'summary calls':>15}{'chars summarized':>18}{f'bm25 hit@{args.top_k}':>14}"
+          + (f"{f'dense hit@{args.top_k}':>15}" if args.dense else ""))
+    for name, chunks, summarized in rows:
+        hits = bm25_hits(chunks, targets, args.top_k)
+        line = (
+            f"{name:<16}{len(chunks):>8}{len(summarized):>15}{sum(len(d.page_content) for d in summarized):>18}"
+            f"{hits / len(targets):>14.1%}"
+        )
+        if args.dense:
+            line += f"{dense_hits(chunks, targets, args.top_k) / len(targets):>15.1%}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
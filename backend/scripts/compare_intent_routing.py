@@ -0,0 +1,113 @@
+"""
+의도 분석/도구 결정 방식 비교 리포트 (two_call vs fused)
+동일한 질문 목록에 대해 InputAnalyzer → RoutingAgent 순차 호출(two_call)과
+RoutingAgent.analyze_and_decide 단일 호출(fused)을 모두 실행하여 지연 시간과 판단 일치율을 비교합니다.
+규칙 기반 Fast Path는 두 방식 모두에서 동일하게 동작하므로 비교 대상에서 제외합니다.
+
+사용법:
+    python -m scripts.compare_intent_routing queries.txt
+    (한 줄에 질문 하나, 또는 INTENT_LOG_PATH 형식의 JSONL)
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.services.hook_service import InputAnalyzer
+from app.services.agent_service import RoutingAgent
+
+DECISION_FIELDS = [
+    "requires_law_db_search",
+    "requires_precedent_search",
+    "requires_calculator",
+    "requires_clarification",
+]
+
+
+def load_queries(path: str) -> list[str]:
+    """텍스트(한 줄 한 질문) 또는 JSONL(query 키) 파일에서 질문 목록을 읽어옵니다."""
+    queries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("{"):
+                queries.append(json.loads(line)["query"])
+            else:
+                queries.append(line)
+    return queries
+
+
+async def run_two_call(analyzer: InputAnalyzer, agent: RoutingAgent, query: str) -> tuple[dict, dict, float]:
+    started = time.perf_counter()
+    intent = await analyzer.analyze_query(query)
+    action = await agent.decide_action(intent, [])
+    return intent, action, time.perf_counter() - started
+
+
+async def run_fused(agent: RoutingAgent, query: str) -> tuple[dict, dict, float]:
+    started = time.perf_counter()
+    intent, action = await agent.analyze_and_decide(query, [])
+    return intent, action, time.perf_counter() - started
+
+
+async def compare(queries: list[str]) -> None:
+    analyzer = InputAnalyzer()
+    analyzer.rules = None
+    agent = RoutingAgent()
+
+    two_call_latencies, fused_latencies = [], []
+    agreement = {field: 0 for field in DECISION_FIELDS + ["is_legal_question", "law_domain"]}
+    compared = 0
+
+    for query in queries:
+        try:
+            base_intent, base_action, base_latency = await run_two_call(analyzer, agent, query)
+            fused_intent, fused_action, fused_latency = await run_fused(agent, query)
+        except Exception as e:
+            print(f"[skip] {query!r}: {e}")
+            continue
+
+        compared += 1
+        two_call_latencies.append(base_latency)
+        fused_latencies.append(fused_latency)
+        for field in DECISION_FIELDS:
+            agreement[field] += base_action.get(field) == fused_action.get(field)
+        agreement["is_legal_question"] += base_intent.get("is_legal_question") == fused_intent.get("is_legal_question")
+        agreement["law_domain"] += base_intent.get("law_domain") == fused_intent.get("law_domain")
+
+        if base_action.get("requires_clarification") != fused_action.get("requires_clarification"):
+            print(f"[clarification mismatch] {query!r}: two_call={base_action.get('requires_clarification')} fused={fused_action.get('requires_clarification')}")
+
+    if not compared:
+        print("No queries compared.")
+        return
+
+    def p(values: list[float], q: float) -> float:
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    print(f"\nCompared {compared} queries")
+    print(f"{'mode':>9} {'p50(s)':>7} {'p90(s)':>7} {'mean(s)':>7}")
+    for name, values in (("two_call", two_call_latencies), ("fused", fused_latencies)):
+        print(f"{name:>9} {p(values, 0.5):>7.2f} {p(values, 0.9):>7.2f} {statistics.mean(values):>7.2f}")
+    print("\nDecision agreement:")
+    for field, count in agreement.items():
+        print(f"  {field:<26} {count / compared:.2%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare two-call and fused intent/routing modes.")
+    parser.add_argument("queries_path", help="질문 목록 파일 (txt 또는 JSONL)")
+    args = parser.parse_args()
+    asyncio.run(compare(load_queries(args.queries_path)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+규칙 기반 의도 분류기 평가 리포트
+InputAnalyzer가 INTENT_LOG_PATH에 기록한 LLM 의도 분석 결과(JSONL)를 정답으로 삼아,
+RuleBasedIntentClassifier가 확신한 입력에 대해 정밀도/재현율과 법 영역·키워드 일치도를 계산합니다.
+
+치우치지 않은 기준 데이터를 모으려면 INTENT_RULES_ENABLED=false 상태로 일정 기간 로그를 수집하세요
+(규칙이 켜져 있으면 규칙이 확신한 질문은 LLM을 거치지 않아 로그에 남지 않습니다).
+
+사용법:
+    python -m scripts.evaluate_intent_rules intent_log.jsonl [--threshold 0.75]
+"""
+import argparse
+import json
+
+from app.core.config import get_settings
+from app.services.intent_rules import RuleBasedIntentClassifier, UNKNOWN_DOMAIN
+
+
+def load_records(path: str) -> list[dict]:
+    """JSONL 로그에서 query/intent_analysis 쌍을 읽어옵니다."""
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if record.get("query") and isinstance(record.get("intent_analysis"), dict):
+                records.append(record)
+    return records
+
+
+def _ratio(numerator: int, denominator: int) -> float:
+    return round(numerator / denominator, 4) if denominator else 0.0
+
+
+def evaluate(records: list[dict], threshold: float, classifier: RuleBasedIntentClassifier) -> dict:
+    """
+    주어진 확신도 임계값에서 규칙 분류기의 적용률(coverage)과 품질 지표를 계산합니다.
+
+    Returns:
+        dict: coverage, 법률 질문 여부(is_legal_question) 정밀도/재현율, 법 영역/상담 여부 일치율, 키워드 재현율
+    """
+    tp = fp = fn = tn = 0
+    covered = domain_total = domain_match = counseling_match = 0
+    keyword_recalls = []
+    disagreements = []
+
+    for record in records:
+        gold = record["intent_analysis"]
+        predicted, confidence = classifier.classify(record["query"])
+        if confidence < threshold:
+            continue
+        covered += 1
+
+        gold_legal = bool(gold.get("is_legal_question"))
+        pred_legal = predicted["is_legal_question"]
+        if pred_legal and gold_legal:
+            tp += 1
+        elif pred_legal and not gold_legal:
+            fp += 1
+        elif not pred_legal and gold_legal:
+            fn += 1
+        else:
+            tn += 1
+        if pred_legal != gold_legal:
+            disagreements.append({"query": record["query"], "gold": gold, "rules": predicted})
+
+        if gold_legal and pred_legal and gold.get("law_domain") not in (None, "", UNKNOWN_DOMAIN):
+            domain_total += 1
+            if gold["law_domain"] in predicted["law_domain"] or predicted["law_domain"] in gold["law_domain"]:
+                domain_match += 1
+
+        if bool(gold.get("is_counseling_request")) == predicted["is_counseling_request"]:
+            counseling_match += 1
+
+        gold_keywords = [k.replace(" ", "") for k in gold.get("keywords") or []]
+        if gold_keywords:
+            predicted_text = " ".join(predicted["keywords"]).replace(" ", "")
+            hits = sum(1 for k in gold_keywords if k in predicted_text)
+            keyword_recalls.append(hits / len(gold_keywords))
+
+    return {
+        "threshold": threshold,
+        "records": len(records),
+        "coverage": _ratio(covered, len(records)),
+        "legal_precision": _ratio(tp, tp + fp),
+        "legal_recall": _ratio(tp, tp + fn),
+        "non_legal_precision": _ratio(tn, tn + fn),
+        "non_legal_recall": _ratio(tn, tn + fp),
+        "law_domain_agreement": _ratio(domain_match, domain_total),
+        "counseling_agreement": _ratio(counseling_match, covered),
+        "keyword_recall": round(sum(keyword_recalls) / len(keyword_recalls), 4) if keyword_recalls else 0.0,
+        "disagreements": disagreements,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Evaluate the rule-based intent classifier against logged LLM intents.")
+    parser.add_argument("log_path", help="INTENT_LOG_PATH로 기록된 JSONL 파일")
+    parser.add_argument("--threshold", type=float, default=None, help="단일 임계값만 평가 (기본: 여러 임계값 비교)")
+    parser.add_argument("--show-disagreements", type=int, default=10, help="출력할 불일치 사례 수")
+    args = parser.parse_args()
+
+    records = load_records(args.log_path)
+    classifier = RuleBasedIntentClassifier()
+    thresholds = [args.threshold] if args.threshold is not None else [0.6, 0.65, 0.7, 0.75, 0.8, 0.85, 0.9]
+
+    print(f"Loaded {len(records)} logged intent analyses from {args.log_path}\n")
+    header = f"{'threshold':>9} {'coverage':>8} {'legal_P':>7} {'legal_R':>7} {'nonleg_P':>8} {'nonleg_R':>8} {'domain':>6} {'counsel':>7} {'kw_R':>6}"
+    print(header)
+    print("-" * len(header))
+    reports = [evaluate(records, t, classifier) for t in thresholds]
+    for r in reports:
+        print(
+            f"{r['threshold']:>9.2f} {r['coverage']:>8.2%} {r['legal_precision']:>7.2%} {r['legal_recall']:>7.2%} "
+            f"{r['non_legal_precision']:>8.2%} {r['non_legal_recall']:>8.2%} {r['law_domain_agreement']:>6.2%} "
+            f"{r['counseling_agreement']:>7.2%} {r['keyword_recall']:>6.2%}"
+        )
+
+    reference = args.threshold if args.threshold is not None else get_settings().INTENT_RULES_MIN_CONFIDENCE
+    disagreements = evaluate(records, reference, classifier)["disagreements"]
+    if disagreements and args.show_disagreements:
+        print(f"\nis_legal_question disagreements (threshold={reference}):")
+        for d in disagreements[: args.show_disagreements]:
+            print(f"- {d['query']!r}: llm={d['gold'].get('is_legal_question')} rules={d['rules']['is_legal_question']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
 import os
 import asyncio
 import logging
-from app.core.database import SessionLocal, engine
+from sqlalchemy import select
+
+from app.core.database import AsyncSessionLocal, async_engine, engine
 from app.models import Base, Law
 from app.core.container import get_services
 
@@ -14,7 +16,7 @@ async def run_ingestion():
     
     services = get_services()
     pdf_parser = services.pdf_parser
-    checker = services.checker
+    outbox = services.embedding_outbox
 
     data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
     if not os.path.exists(data_dir):
@@ -26,22 +28,21 @@ async def run_ingestion():
         logger.info("No PDF files found.")
         return
 
-    db = SessionLocal()
+    db = AsyncSessionLocal()
     try:
         for file_name in pdf_files:
             law_name = file_name.split("(")[0].strip()
             
-            # Check if law already exists
-            existing_law = db.query(Law).filter(Law.name == law_name).first()
-            if existing_law:
-                logger.info(f"Law {law_name} already exists. Skipping ingestion for {file_name}.")
-                continue
-                
-            logger.info(f"Creating Law entry for: {law_name}")
-            new_law = Law(name=law_name, jurisdiction="KR")
-            db.add(new_law)
-            db.commit()
-            db.refresh(new_law)
+            # 이미 등록된 법령이면 개정판으로 보고 바뀐 조문만 반영
+            law = await db.scalar(select(Law).where(Law.name == law_name))
+            if law:
+                logger.info(f"Law {law_name} already exists. Applying {file_name} as a revision.")
+            else:
+                logger.info(f"Creating Law entry for: {law_name}")
+                law = Law(name=law_name, jurisdiction="KR")
+                db.add(law)
+                await db.commit()
+                await db.refresh(law)
             
             file_path = os.path.join(data_dir, file_name)
             logger.info(f"Reading file: {file_path}")
@@ -49,20 +50,29 @@ async def run_ingestion():
                 file_content = f.read()
             
             logger.info(f"Parsing PDF and updating DB for: {law_name} ... (This may take a while using LLM)")
-            created_articles, embedded_revisions = await pdf_parser.process_pdf(db, new_law.id, file_content)
+            report = await pdf_parser.process_pdf(db, law.id, file_content)
             
-            logger.info(f"Added {len(created_articles)} articles.")
+            logger.info(
+                f"Articles created={report['created']} updated={report['updated']} "
+                f"unchanged={report['unchanged']} removed={report['removed']}"
+            )
             
-            if embedded_revisions:
-                logger.info(f"Adding embeddings to Vector Store...")
-                checker.add_revisions(embedded_revisions)
-                logger.info("Embeddings added successfully.")
+            # 저장과 함께 임베딩 아웃박스에 기록된 개정본을 바로 벡터 스토어에 반영 (서버 워커 없이 실행되므로)
+            if report["revisions"] or report["closed"]:
+                logger.info(f"Adding {len(report['revisions'])} embeddings to Vector Store...")
+                await outbox.drain()
+                stats = await outbox.stats()
+                if stats["backlog"] or stats["dead"]:
+                    logger.warning(f"Embedding outbox not empty: {stats}")
+                else:
+                    logger.info("Embeddings added successfully.")
                 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Failed during ingestion: {e}")
     finally:
-        db.close()
+        await db.close()
+        await async_engine.dispose()
 
 if __name__ == "__main__":
     asyncio.run(run_ingestion())
@@ -0,0 +1,114 @@
+"""
+부모 문서 저장소 이전 스크립트
+원문을 벡터 메타데이터(original_text)에 싣고 있던 기존 인제스트 벡터의 원문을 parent_documents 테이블로 옮기고,
+벡터에는 청크 ID(parent_id)만 남깁니다. 저장된 임베딩을 그대로 다시 쓰므로 임베딩 API를 호출하지 않습니다.
+벡터 ID도 parent_id 기준의 결정적 ID로 바꾸어, 이후 같은 문서를 다시 수집하면 중복 없이 덮어쓰게 합니다.
+
+사용법:
+    python -m scripts.migrate_parent_documents [--batch-size 500] [--dry-run]
+"""
+import argparse
+import asyncio
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from langchain_chroma import Chroma
+from langchain_core.documents import Document
+
+from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal, async_engine, engine
+from app.models import Base
+from app.services.hybrid_retriever import vector_id
+from app.services.ingest_service import chunk_key
+from app.services.parent_store import ParentDocumentStore
+
+
+def legacy_ids(store: Chroma, batch_size: int) -> list[str]:
+    """original_text 메타데이터가 남아 있는 벡터 ID를 페이지 단위로 찾습니다."""
+    ids, offset = [], 0
+    while True:
+        page = store.get(limit=batch_size, offset=offset, include=["metadatas"])
+        if not page["ids"]:
+            return ids
+        ids += [vid for vid, metadata in zip(page["ids"], page["metadatas"]) if metadata and "original_text" in metadata]
+        offset += len(page["ids"])
+
+
+async def migrate(store: Chroma, parents: ParentDocumentStore, batch_size: int, dry_run: bool) -> dict:
+    """
+    기존 벡터의 original_text를 부모 문서 저장소로 옮기고 벡터를 parent_id 기준 ID로 다시 저장합니다.
+
+    Returns:
+        dict: legacy(대상 벡터 수), moved_bytes, stored(새로 저장한 원문 수), rekeyed, vectors(남은 벡터 수)
+    """
+    ids = legacy_ids(store, batch_size)
+    moved_bytes = stored = rekeyed = 0
+    written: set[str] = set()
+    for start in range(0, len(ids), batch_size):
+        batch = store.get(ids=ids[start:start + batch_size], include=["embeddings", "documents", "metadatas"])
+        # 새 ID → (임베딩, 본문, 메타데이터). 같은 청크가 중복 수집되어 여러 기존 벡터가 같은 새 ID로 모이면
+        # 첫 벡터만 남기고 나머지 기존 ID는 삭제 (한 번의 upsert에 같은 ID가 두 번 들어가면 DuplicateIDError)
+        merged: dict[str, tuple] = {}
+        originals = []
+        for embedding, metadata, document in zip(batch["embeddings"], batch["metadatas"], batch["documents"]):
+            if "original_text" not in metadata:
+                # 앞 배치에서 이미 새 ID로 덮어쓴 벡터
+                continue
+            original = metadata["original_text"]
+            # 인제스트 때와 같은 청크 키 (출처 + 쪽 + 원문 해시)
+            key = chunk_key(Document(page_content=original, metadata=metadata))
+            moved_bytes += len(original.encode("utf-8"))
+            originals.append({"id": key, "content": original, "source": metadata.get("source")})
+            metadata = {k: v for k, v in metadata.items() if k != "original_text"}
+            metadata["parent_id"] = key
+            new_id = vector_id(Document(page_content=document, metadata=metadata))
+            merged.setdefault(new_id, (embedding, document, metadata))
+        if dry_run:
+            continue
+        # 원문을 먼저 저장한 뒤 벡터를 바꿔야 벡터가 원문 없는 parent_id를 가리키지 않음
+        stored += await parents.put(originals)
+        store._collection.upsert(
+            ids=list(merged),
+            embeddings=[embedding for embedding, _, _ in merged.values()],
+            documents=[document for _, document, _ in merged.values()],
+            metadatas=[metadata for _, _, metadata in merged.values()],
+        )
+        written.update(merged)
+        stale = [old for old in batch["ids"] if old not in written]
+        if stale:
+            store.delete(ids=stale)
+        rekeyed += len(batch["ids"])
+    return {
+        "legacy": len(ids), "moved_bytes": moved_bytes, "stored": stored, "rekeyed": rekeyed, "vectors": len(written),
+    }
+
+
+async def run(batch_size: int, dry_run: bool) -> None:
+    store = Chroma(persist_directory=get_settings().VECTOR_STORE_PATH)
+    try:
+        stats = await migrate(store, ParentDocumentStore(AsyncSessionLocal), batch_size, dry_run)
+    finally:
+        await async_engine.dispose()
+
+    print(f"{stats['legacy']} vectors carry original_text in metadata")
+    action = "would move" if dry_run else "moved"
+    print(f"{action} {stats['moved_bytes'] / 1024:.1f} KiB of original text out of vector metadata")
+    if not dry_run:
+        print(f"stored {stats['stored']} parent documents, re-keyed {stats['rekeyed']} vectors into {stats['vectors']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Move original_text from vector metadata into the parent document store.")
+    parser.add_argument("--batch-size", type=int, default=get_settings().VECTOR_CHECK_PAGE_SIZE, help="한 번에 옮기는 벡터 수")
+    parser.add_argument("--dry-run", action="store_true", help="옮길 벡터 수와 크기만 출력")
+    args = parser.parse_args()
+
+    # Make sure tables exist
+    Base.metadata.create_all(bind=engine)
+    asyncio.run(run(args.batch_size, args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+법령 본문 로컬 미러 동기화 스크립트
+국가법령정보센터에서 법령의 전체 조문을 받아 laws / law_articles / law_article_revisions 테이블을 갱신합니다.
+동기화된 법령은 /search/articles가 원격 API 대신 로컬 테이블에서 응답합니다. (cron 등으로 주기 실행)
+
+사용법:
+    python -m scripts.sync_law_mirror [법령명 ...] [--embed]
+    (법령명을 생략하면 LAW_MIRROR_LAWS 설정, 그마저 없으면 laws 테이블의 모든 법령)
+    새 개정본은 임베딩 아웃박스에 기록되어 서버의 아웃박스 워커가 벡터 스토어에 반영합니다.
+    --embed를 지정하면 이 스크립트에서 바로 아웃박스를 비웁니다.
+"""
+import argparse
+import asyncio
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.core.database import AsyncSessionLocal, async_engine, engine
+from app.models import Base
+from app.plugins.http_client import close_law_api_client
+from app.services.law_mirror_service import LawMirrorService
+
+
+async def sync(names: list[str], embed: bool) -> None:
+    service = LawMirrorService(AsyncSessionLocal)
+    outbox = None
+    if embed:
+        from app.core.container import get_services
+        outbox = get_services().embedding_outbox
+
+    try:
+        for name in await service.target_law_names(names):
+            started = time.perf_counter()
+            [report] = await service.sync([name])
+            elapsed = time.perf_counter() - started
+            if "error" in report:
+                print(f"{name}: FAILED ({report['error']})")
+                continue
+            print(
+                f"{name}: created {report['created']}, updated {report['updated']}, "
+                f"unchanged {report['unchanged']}, removed {report['removed']} ({elapsed:.2f}s)"
+            )
+            if outbox is not None and (report["revisions"] or report["closed"]):
+                await outbox.drain()
+                print(f"  embedded {len(report['revisions'])} revisions")
+    finally:
+        await close_law_api_client()
+        await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mirror full law article trees from law.go.kr into local tables.")
+    parser.add_argument("names", nargs="*", help="동기화할 법령명")
+    parser.add_argument("--embed", action="store_true", help="임베딩 아웃박스를 바로 비워 새 개정본을 벡터 스토어에 임베딩")
+    args = parser.parse_args()
+
+    # Make sure tables exist
+    Base.metadata.create_all(bind=engine)
+    asyncio.run(sync(args.names, args.embed))
+
+
+if __name__ == "__main__":
+    main()
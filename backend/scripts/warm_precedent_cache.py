@@ -0,0 +1,100 @@
+"""
+판례 캐시 예열(Warm-up) 스크립트
+ClaimCheck 이력에서 자주 검증된 주장들의 검색 키워드 조합을 뽑아, 판례 캐시(검색어 캐시 + 판례 상세)를 미리 채웁니다.
+키워드는 파이프라인과 동일한 규칙 기반 분류기로 추출하며, --llm 옵션을 주면 규칙이 확신하지 못한 주장은
+InputAnalyzer(LLM)로 분석하여 실제 요청 시의 판례 검색어와 최대한 일치시킵니다.
+
+사용법:
+    python -m scripts.warm_precedent_cache [--claims 200] [--sets 30] [--llm]
+"""
+import argparse
+import asyncio
+from collections import Counter
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from sqlalchemy import desc, func, select
+
+from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal, async_engine, engine
+from app.models import Base, ClaimCheck
+from app.services.intent_rules import RuleBasedIntentClassifier
+from app.services.precedent_cache import PrecedentCache
+
+
+async def load_frequent_claims(limit: int) -> list[tuple[str, int]]:
+    """ClaimCheck 이력에서 가장 많이 검증된 주장 텍스트와 횟수를 반환합니다."""
+    async with AsyncSessionLocal() as db:
+        rows = await db.execute(
+            select(ClaimCheck.claim_text, func.count(ClaimCheck.id))
+            .group_by(ClaimCheck.claim_text)
+            .order_by(desc(func.count(ClaimCheck.id)))
+            .limit(limit)
+        )
+        return [(text, count) for text, count in rows.all()]
+
+
+async def extract_keyword_sets(claims: list[tuple[str, int]], use_llm: bool) -> Counter:
+    """주장별 검색 키워드 조합을 추출하고, 검증 횟수를 가중치로 조합별 빈도를 집계합니다."""
+    classifier = RuleBasedIntentClassifier()
+    min_confidence = get_settings().INTENT_RULES_MIN_CONFIDENCE
+    analyzer = None
+    if use_llm:
+        from app.services.hook_service import InputAnalyzer
+        analyzer = InputAnalyzer()
+
+    keyword_sets: Counter = Counter()
+    for text, count in claims:
+        intent, confidence = classifier.classify(text)
+        if confidence < min_confidence and analyzer is not None:
+            intent = await analyzer.analyze_query(text)
+        if intent.get("is_legal_question") and intent.get("keywords"):
+            keyword_sets[tuple(intent["keywords"])] += count
+    return keyword_sets
+
+
+async def warm(claim_limit: int, set_limit: int, use_llm: bool, concurrency: int) -> None:
+    settings = get_settings()
+    cache = PrecedentCache(AsyncSessionLocal, ttl_seconds=settings.PRECEDENT_QUERY_CACHE_TTL_SECONDS)
+
+    claims = await load_frequent_claims(claim_limit)
+    keyword_sets = await extract_keyword_sets(claims, use_llm)
+    targets = keyword_sets.most_common(set_limit)
+    print(f"{len(claims)} distinct claims -> {len(keyword_sets)} keyword sets, warming top {len(targets)}")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def warm_one(keywords: tuple, weight: int) -> None:
+        async with semaphore:
+            results = await cache.search(list(keywords))
+        print(f"  [{weight:>4}] {' '.join(keywords)} -> {len(results)} precedents")
+
+    await asyncio.gather(*(warm_one(keywords, weight) for keywords, weight in targets))
+
+    stats = await cache.stats()
+    print(
+        f"query hits/misses: {stats['query_hits']}/{stats['query_misses']}, "
+        f"detail hits/misses: {stats['detail_hits']}/{stats['detail_misses']}, "
+        f"detail failures: {stats['detail_failures']}, api errors: {stats['api_errors']}"
+    )
+    print(f"stored precedents: {stats['stored_precedents']}, stored queries: {stats['stored_queries']}")
+    await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Prefetch precedents for frequent ClaimCheck keyword sets.")
+    parser.add_argument("--claims", type=int, default=200, help="집계할 상위 주장 수")
+    parser.add_argument("--sets", type=int, default=30, help="예열할 상위 키워드 조합 수")
+    parser.add_argument("--llm", action="store_true", help="규칙이 확신하지 못한 주장은 LLM으로 키워드 추출")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시에 예열할 키워드 조합 수")
+    args = parser.parse_args()
+
+    # Make sure tables exist
+    Base.metadata.create_all(bind=engine)
+    asyncio.run(warm(args.claims, args.sets, args.llm, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
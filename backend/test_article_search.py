@@ -0,0 +1,99 @@
+"""
+조문 본문 전문 검색(FTS5 바이그램 인덱스) 테스트
+인메모리 SQLite에서 개정본 추가/수정/삭제 시 인덱스 동기화, 한국어 부분 일치, 관련도 정렬, 하이라이트를 확인합니다.
+"""
+import asyncio
+from datetime import date
+
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.models import Base, Law, LawArticle, LawArticleRevision
+from app.models.fulltext import FTS_TABLE, to_fts_query, to_ngrams
+from app.services.article_search_service import ArticleSearchService, highlight
+from testkit import temp_database
+
+
+def test_ngram_tokenizer():
+    assert to_ngrams("임금은 통화로") == "임금 금은 통화 화로"
+    assert to_fts_query("통화로 직접") == '"통화 화로" AND "직접"'
+    # 한 글자 단어는 바이그램 색인으로 찾을 수 없으므로 LIKE 검색으로 대체
+    assert to_fts_query("법") is None
+
+
+def test_highlight_escapes_and_marks_terms():
+    marked = highlight("사용자는 <임금>을 통화로 지급하여야 한다.", ["임금", "통화로"])
+    assert marked == "사용자는 &lt;<mark>임금</mark>&gt;을 <mark>통화로</mark> 지급하여야 한다."
+
+
+def test_fulltext_index_sync_and_ranking():
+    # 로컬에서 찾지 못한 검색어는 원격 API로 넘어가므로, 즉시 실패하는 주소로 바꿔 둠
+    get_settings().DATA_GO_KR_LAW_URL = "http://127.0.0.1:9"
+
+    async def scenario():
+        engine, session_factory = await temp_database()
+        search = ArticleSearchService(limit=10)
+
+        async with session_factory() as db:
+            law = Law(name="근로기준법")
+            db.add(law)
+            await db.flush()
+            contents = {
+                "제43조": "임금은 통화로 직접 근로자에게 그 전액을 지급하여야 한다. 임금 지급 방법은 통화로 한다.",
+                "제36조": "사용자는 근로자가 퇴직한 경우 14일 이내에 임금을 지급하여야 한다.",
+                "제26조": "사용자는 근로자를 해고하려면 적어도 30일 전에 예고를 하여야 한다.",
+                "제50조": "1주 간의 근로시간은 휴게시간을 제외하고 40시간을 초과할 수 없다.",
+                "제54조": "사용자는 근로시간이 4시간인 경우에는 30분 이상의 휴게시간을 주어야 한다.",
+            }
+            revisions = {}
+            for number, content in contents.items():
+                article = LawArticle(law_id=law.id, article_number=number)
+                revision = LawArticleRevision(content=content, effective_start_date=date(2024, 1, 1))
+                article.revisions.append(revision)
+                db.add(article)
+                revisions[number] = revision
+            await db.commit()
+
+            # 1) 조사가 붙은 어절("통화로")도 부분 일치, 관련도(bm25) 순 정렬
+            results = (await search.search(db, "통화로"))["results"]
+            assert [r["article_number"] for r in results] == ["제43조"]
+            assert "<mark>통화로</mark>" in results[0]["highlight"]
+
+            results = (await search.search(db, "임금"))["results"]
+            assert [r["article_number"] for r in results] == ["제43조", "제36조"]
+            assert results[0]["score"] > results[1]["score"]
+
+            # 2) 여러 단어는 AND 검색 (LIKE '%해고 예고%'로는 찾을 수 없는 조문)
+            results = (await search.search(db, "해고 예고"))["results"]
+            assert [r["article_number"] for r in results] == ["제26조"]
+
+            # 3) 수정/삭제 시 인덱스 동기화
+            revisions["제26조"].content = "사용자는 근로자에게 해고 사유를 서면으로 통지하여야 한다."
+            await db.commit()
+            assert (await search.search(db, "해고 예고"))["results"] == []
+            assert [r["article_number"] for r in (await search.search(db, "서면으로"))["results"]] == ["제26조"]
+
+            await db.delete(revisions["제36조"])
+            await db.commit()
+            assert [r["article_number"] for r in (await search.search(db, "임금"))["results"]] == ["제43조"]
+
+            # 4) 시행 종료된 개정본은 검색되지 않음
+            revisions["제43조"].effective_end_date = date(2025, 1, 1)
+            await db.commit()
+            assert (await search.search(db, "통화로"))["results"] == []
+
+        # 5) 인덱스가 비어 있는 기존 DB는 create_all 시 다시 채움
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DELETE FROM {FTS_TABLE}"))
+            await conn.run_sync(Base.metadata.create_all)
+            assert (await conn.execute(text(f"SELECT count(*) FROM {FTS_TABLE}"))).scalar() == 4
+        await engine.dispose()
+
+    asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"{name}: ok")
@@ -0,0 +1,187 @@
+"""
+규칙 기반 조문 분리기 테스트
+국가법령정보센터 PDF 텍스트 형식(쪽 머리글, 장 제목, 삭제 조, 가지 조, 시행 예정 개정문, 부칙)을 흉내 낸 텍스트와
+backend/data의 실제 법령 PDF로 조문 분리 결과를 확인하고, 분리하지 못한 구간만 LLM으로 넘기는지 확인합니다.
+"""
+import asyncio
+import glob
+import os
+import time
+from datetime import date
+
+from langchain_community.document_loaders import PyPDFLoader
+from langchain_core.documents import Document
+
+from app.core.config import get_settings
+from app.services.article_splitter import article_sort_key, split_articles, split_paragraphs
+from app.services.ingest_service import article_chunks
+from app.services.pdf_text import shutdown_pdf_pool
+from testkit import fake_parser
+
+SAMPLE = """법제처                                                            1                                                       국가법령정보센터
+근로기준법
+
+근로기준법
+[시행 2025. 2. 23.] [법률 제20520호, 2024. 10. 22., 일부개정]
+고용노동부 (근로기준정책과 - 해고, 취업규칙, 기타) 044-202-7534
+       제1장 총칙
+
+제1조(목적) 이 법은 헌법에 따라 근로조건의 기준을 정함으로써 근로자의 기본적 생활을 보장, 향상시키며 균형 있는
+국민경제의 발전을 꾀하는 것을 목적으로 한다.
+
+제2조(정의) ① 이 법에서 사용하는 용어의 뜻은 다음과 같다.
+1. "근로자"란 직업의 종류와 관계없이 임금을 목적으로 사업이나 사업장에 근로를 제공하는 사람을 말한다.
+② 제1항제6호에 따라 산출된 금액이 그 근로자의 통상임금보다 적으면 그 통상임금액을 평균임금으로 한다.
+법제처                                                            2                                                       국가법령정보센터
+근로기준법
+제3조 삭제 <2019. 1. 15.>
+       제2장 근로계약
+제4조(금품 청산) 사용자는 근로자가 퇴직한 경우에는 14일 이내에 임금을 지급하여야 한다.
+제4조의2(지연이자) ① 사용자는 「근로자퇴직급여 보장법」
+제2조(정의)에 따른 급여를 지급하지 아니한 경우 지연이자를 지급하여야 한다.
+제4조의2(지연이자) ① 사용자는 다음 각 호의 임금을 지급하지 아니한 경우 지연이자를 지급하여야 한다.
+1. 제4조에 따라 지급하여야 하는 임금
+[시행일: 2025. 10. 23.] 제4조의2
+
+제5조(근로조건의 준수) 근로자와 사용자는 각자가 단체협약을 지키고 성실하게 이행할 의무가 있다.
+부칙 <제20520호,2024. 10. 22.>
+제1조(시행일) 이 법은 공포 후 1년이 경과한 날부터 시행한다.
+제7조(적용례) 제4조의2의 개정규정은 이 법 시행 이후 발생한 경우부터 적용한다.
+"""
+
+
+def test_split_statute_structure():
+    articles, unparsed = split_articles(SAMPLE, as_of=date(2026, 1, 1))
+    assert unparsed == []
+    assert [a["article_number"] for a in articles] == ["제1조", "제2조", "제3조", "제4조", "제4조의2", "제5조"]
+
+    by_number = {a["article_number"]: a for a in articles}
+    # 줄바꿈된 본문, 항/호 줄은 같은 조에 이어지고, 쪽 머리글·장 제목은 빠짐
+    assert by_number["제1조"]["title"] == "목적"
+    assert by_number["제1조"]["content"].endswith("꾀하는 것을 목적으로 한다.")
+    assert "법제처" not in by_number["제2조"]["content"]
+    assert by_number["제2조"]["content"].count("\n") == 2
+    assert by_number["제3조"]["deleted"] and not by_number["제1조"]["deleted"]
+    assert "제2장" not in by_number["제3조"]["content"]
+    # 행 첫머리의 조문 인용("제2조(정의)에 따른")은 제목줄로 보지 않고, 시행 중인 개정문을 선택
+    assert by_number["제4조의2"]["effective_date"] == date(2025, 10, 23)
+    assert "다음 각 호의 임금" in by_number["제4조의2"]["content"]
+
+    before = {a["article_number"]: a for a in split_articles(SAMPLE, as_of=date(2025, 3, 1))[0]}
+    assert "제2조(정의)에 따른 급여" in before["제4조의2"]["content"]
+
+    with_supplementary = split_articles(SAMPLE, include_supplementary=True)[0]
+    assert [a["article_number"] for a in with_supplementary][-2:] == ["부칙(제20520호) 제1조", "부칙(제20520호) 제7조"]
+    assert by_number["제5조"]["content"].endswith("의무가 있다.")
+
+
+def test_unparsed_segments_and_sort_key():
+    # 제2조 제목줄이 깨져 제1조 다음에 제3조가 오면, 제1조 구간은 LLM으로 넘김
+    broken = "제1조(목적) 이 법은 목적을 정한다.\n제 2 조 (정의)가 깨진 줄\n제3조(적용) 이 법은 모두에게 적용한다."
+    articles, unparsed = split_articles(broken)
+    assert [a["article_number"] for a in articles] == ["제3조"]
+    assert unparsed == ["제1조(목적) 이 법은 목적을 정한다.\n제 2 조 (정의)가 깨진 줄"]
+
+    assert split_articles("조문 제목줄이 없는 안내문\n두 번째 줄") == ([], ["조문 제목줄이 없는 안내문\n두 번째 줄"])
+    assert sorted(["제10조", "부칙 제1조", "제2조의3", "제2조"], key=article_sort_key) == ["제2조", "제2조의3", "제10조", "부칙 제1조"]
+
+
+def test_parser_calls_llm_only_for_unparsed_segments():
+    parser = fake_parser()
+    calls = []
+
+    async def fake_llm(text):
+        calls.append(text)
+        return [
+            {"article_number": "제1조", "title": "목적", "content": "제1조(목적) 이 법은 목적을 정한다."},
+            {"article_number": "제2조", "title": "정의", "content": "제2조(정의) 용어의 뜻은 다음과 같다."},
+            {"article_number": "제3조", "title": "중복", "content": "LLM이 다시 뽑은 제3조"},
+        ]
+
+    parser._parse_with_llm = fake_llm
+    text = "제1조(목적) 이 법은 목적을 정한다.\n제 2 조 (정의)가 깨진 줄\n제3조(적용) 이 법은 모두에게 적용한다.\n제4조 삭제 <2020. 1. 1.>"
+    articles = asyncio.run(parser._parse_articles(text))
+    assert len(calls) == 1
+    assert [a["article_number"] for a in articles] == ["제1조", "제2조", "제3조", "제4조"]
+    assert articles[2]["content"] == "제3조(적용) 이 법은 모두에게 적용한다."
+    # 삭제된 조는 저장 시 기존 조문을 비활성화하도록 표시를 유지
+    assert articles[3]["deleted"] and not articles[2]["deleted"]
+
+    calls.clear()
+    asyncio.run(parser._parse_articles(SAMPLE))
+    assert calls == []
+
+
+def test_real_statutes_split_without_truncation():
+    data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+    parser = fake_parser()
+    settings = get_settings()
+    for path in glob.glob(os.path.join(data_dir, "*.pdf")):
+        with open(path, "rb") as f:
+            content = f.read()
+        # 메모리 버퍼 추출 결과는 기존 PyPDFLoader(임시 파일)와 같고, 프로세스 풀 병렬 추출도 쪽 순서를 유지
+        expected = "\n".join(doc.page_content for doc in PyPDFLoader(path).load())
+        text = asyncio.run(parser._load_pdf(content))
+        assert text == expected
+        original = (settings.PDF_PARALLEL_MIN_PAGES, settings.PDF_EXTRACT_WORKERS)
+        settings.PDF_PARALLEL_MIN_PAGES, settings.PDF_EXTRACT_WORKERS = 1, 2
+        try:
+            assert asyncio.run(parser._load_pdf(content)) == expected
+            # 쪽 단위로 스트리밍한 분리 결과도 전문 분리와 같음
+            assert asyncio.run(parser._split_pdf(content)) == split_articles(text)
+        finally:
+            settings.PDF_PARALLEL_MIN_PAGES, settings.PDF_EXTRACT_WORKERS = original
+            shutdown_pdf_pool()
+
+        started = time.perf_counter()
+        articles, unparsed = split_articles(text)
+        assert time.perf_counter() - started < 1.0
+        assert unparsed == []
+        numbers = [a["article_number"] for a in articles]
+        assert numbers[0] == "제1조" and len(numbers) == len(set(numbers))
+        # 마지막 조(벌칙/과태료 등)까지 잘리지 않고 분리됨
+        main_numbers = [article_sort_key(n)[1] for n in numbers]
+        assert main_numbers == sorted(main_numbers)
+        assert set(range(1, main_numbers[-1] + 1)) <= set(main_numbers)
+
+
+def test_long_articles_split_on_paragraph_boundaries():
+    content = "제74조(임산부의 보호) ① 첫째 항 본문이\n이어지는 줄\n② 둘째 항\n1. 첫째 호\n③ 셋째 항"
+    assert split_paragraphs(content, 1000) == [content]
+    groups = split_paragraphs(content, 30)
+    assert groups == ["제74조(임산부의 보호) ① 첫째 항 본문이\n이어지는 줄", "② 둘째 항\n1. 첫째 호\n③ 셋째 항"]
+    assert "\n".join(groups) == content
+    # 항 하나가 한도보다 길어도 항 중간은 자르지 않음
+    assert split_paragraphs(content, 5) == ["제74조(임산부의 보호) ① 첫째 항 본문이\n이어지는 줄", "② 둘째 항\n1. 첫째 호", "③ 셋째 항"]
+
+
+def test_ingest_chunks_follow_articles():
+    pages = [
+        Document(page_content=page, metadata={"source": "data/근로기준법(법률)(제20520호)(20250223).pdf", "page": i})
+        for i, page in enumerate(SAMPLE.split("법제처                                                            2"))
+    ]
+    pages.append(Document(page_content="조문 제목줄이 없는 안내문입니다.", metadata={"source": "안내서.txt"}))
+    chunks = article_chunks(pages, max_chars=60)
+
+    statute = [c for c in chunks if "article_number" in c.metadata]
+    # 삭제된 제3조는 빼고 부칙 조문까지 조마다 청크, 겹치는 본문 없음
+    assert [c.metadata["article_number"] for c in statute if c.metadata["chunk_index"] == 0] == [
+        "제1조", "제2조", "제4조", "제4조의2", "제5조", "부칙(제20520호) 제1조", "부칙(제20520호) 제7조",
+    ]
+    first = statute[0]
+    assert first.metadata["law_name"] == "근로기준법" and first.metadata["article_title"] == "목적"
+    assert first.page_content.startswith("제1조(목적) 이 법은") and first.metadata["page"] == 0
+    # 긴 제2조는 항 경계에서 나뉘고, 이어지는 청크에는 조 제목줄이 붙음
+    article_2 = [c for c in statute if c.metadata["article_number"] == "제2조"]
+    assert [c.metadata["chunk_count"] for c in article_2] == [2, 2]
+    assert article_2[1].page_content.startswith("제2조(정의)\n② 제1항제6호")
+    assert next(c for c in statute if c.metadata["article_number"] == "제4조").metadata["page"] == 1
+    # 조문 구조가 없는 문서는 기존 분할
+    assert chunks[-1].page_content == "조문 제목줄이 없는 안내문입니다." and "law_name" not in chunks[-1].metadata
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"{name}: ok")
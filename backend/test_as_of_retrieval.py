@@ -0,0 +1,88 @@
+"""
+기준일(as_of) 시점 검색 테스트
+임시 디렉터리의 Chroma와 결정적 가짜 임베딩(DeterministicFakeEmbedding)으로, OpenAI API 없이
+시행 기간 메타데이터 저장, 벡터/BM25 시점 필터, 개정본 시행 종료 반영을 확인합니다.
+"""
+import asyncio
+import tempfile
+from datetime import date
+
+from langchain_core.documents import Document
+
+from app.services.hybrid_retriever import OPEN_END, is_effective
+from app.services.rag_service import LegalFactChecker
+from testkit import fake_checker
+
+OLD_TEXT = "제36조(금품 청산) 사용자는 근로자가 퇴직한 경우 14일 이내에 임금을 지급하여야 한다."
+NEW_TEXT = "제36조(금품 청산) 사용자는 근로자가 퇴직한 경우 7일 이내에 임금을 지급하여야 한다."
+
+
+def _revision(revision_id: int, content: str, start: date, end: date | None) -> dict:
+    return {
+        "law_id": 1, "article_id": 36, "revision_id": revision_id, "content": content,
+        "law_name": "근로기준법", "article_number": "제36조",
+        "effective_start_date": start, "effective_end_date": end,
+    }
+
+
+def _checker(path: str, mode: str) -> LegalFactChecker:
+    checker = fake_checker()
+    checker.vector_store_path = path
+    checker.retrieval_mode = mode
+    checker.initialize_vector_store()
+    return checker
+
+
+def test_as_of_filters_superseded_revisions():
+    for mode in ("hybrid", "dense"):
+        with tempfile.TemporaryDirectory() as path:
+            checker = _checker(path, mode)
+
+            async def scenario():
+                await checker.add_revisions([
+                    _revision(1, OLD_TEXT, date(2020, 1, 1), date(2025, 1, 1)),
+                    _revision(2, NEW_TEXT, date(2025, 1, 1), None),
+                ])
+                past = await checker.retrieve_documents("퇴직 금품 청산 기한", [], as_of=date(2024, 6, 1))
+                now = await checker.retrieve_documents("퇴직 금품 청산 기한", [], as_of=date(2025, 6, 1))
+                boundary = await checker.retrieve_documents("퇴직 금품 청산 기한", [], as_of=date(2025, 1, 1))
+                unfiltered = await checker.retrieve_documents("퇴직 금품 청산 기한", [])
+                return past, now, boundary, unfiltered
+
+            past, now, boundary, unfiltered = asyncio.run(scenario())
+            assert [d.metadata["revision_id"] for d in past] == [1], mode
+            assert [d.metadata["revision_id"] for d in now] == [2], mode
+            # 종료일은 포함하지 않으므로 개정 시행일에는 새 개정본만 검색됨
+            assert [d.metadata["revision_id"] for d in boundary] == [2], mode
+            assert sorted(d.metadata["revision_id"] for d in unfiltered) == [1, 2], mode
+            assert now[0].metadata["effective_start"] == 20250101
+            assert now[0].metadata["effective_end"] == OPEN_END
+
+
+def test_close_revisions_and_legacy_vectors():
+    with tempfile.TemporaryDirectory() as path:
+        checker = _checker(path, "hybrid")
+        asyncio.run(checker.add_revisions([_revision(2, NEW_TEXT, date(2025, 1, 1), None)]))
+        # 날짜 메타데이터 없이 저장된 기존 벡터 (일반 인제스트 청크)
+        checker.vector_store.add_documents([Document(page_content="퇴직금 지급 안내", metadata={"source": "안내서"})])
+
+        # 개정본 시행 종료 → 벡터와 BM25 색인 모두 반영
+        checker.close_revisions([{
+            "revision_id": 2, "effective_start_date": date(2025, 1, 1), "effective_end_date": date(2026, 1, 1),
+        }])
+        stored = checker.vector_store.get(where={"revision_id": 2})
+        assert stored["metadatas"][0]["effective_end"] == 20260101
+        assert checker.bm25_index.search("금품 청산", 5, as_of=date(2026, 3, 1)) == []
+
+        # 재시작 시 날짜가 없는 벡터는 항상 시행 중으로 채워짐
+        reloaded = _checker(path, "hybrid")
+        legacy = reloaded.vector_store.get(where={"source": "안내서"})["metadatas"][0]
+        assert (legacy["effective_start"], legacy["effective_end"]) == (0, OPEN_END)
+        assert is_effective(legacy, date(1990, 1, 1))
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"{name}: ok")
@@ -0,0 +1,174 @@
+"""
+팩트체크 파이프라인 구성 테스트
+LLM/검색 서비스를 가짜 객체로 바꾸고 임시 SQLite 파일의 세션/메시지 테이블로 CheckService._run을 실행하여,
+단계 의존성 그래프가 의도한 순서와 건너뛰기 조건으로 실행되는지 확인합니다.
+"""
+import asyncio
+import tempfile
+
+from langchain_core.documents import Document
+
+from app.services.check_service import CheckService
+from testkit import temp_database
+
+QUERY = "회사에서 해고 예고 없이 잘렸어요"
+ANSWER = {
+    "verdict": "FALSE",
+    "section_1_summary": "요약",
+    "section_2_law_explanation": "조문 해설",
+    "section_3_real_case_example": "예시",
+    "section_4_caution": "주의",
+}
+CACHED = {
+    "result": dict(ANSWER, is_clarification=False),
+    "sources": ["근로기준법"],
+    "revision_ids": [1],
+    "intent_analysis": {"intent": "해고 관련 문의"},
+    "agent_decision": {"requires_clarification": False},
+}
+
+
+class FakeAnswerCache:
+    def __init__(self, response=None, delay: float = 0.0):
+        self.response = response
+        self.delay = delay
+        self.stored = []
+
+    async def lookup(self, query: str) -> dict:
+        await asyncio.sleep(self.delay)
+        return {"embedding": [0.0], "response": self.response}
+
+    def store(self, query, embedding, response, revision_ids) -> None:
+        self.stored.append(response)
+
+
+class FakeAnalyzer:
+    def __init__(self):
+        self.calls = 0
+        self.delay = 0.0
+
+    def classify_with_rules(self, query: str):
+        return None
+
+    async def analyze_query(self, query: str) -> dict:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"intent": "해고 관련 문의", "law_domain": "근로기준법", "keywords": ["해고"], "is_legal_question": True}
+
+
+class FakeAgent:
+    async def decide_action(self, intent: dict, history: list) -> dict:
+        return {"requires_clarification": False, "requires_precedent_search": False, "requires_calculator": False}
+
+
+class FakeChecker:
+    retrieval_top_k = 4
+
+    def __init__(self):
+        self.queries = []
+
+    async def resolve_law_ids(self, law_domain):
+        return [1] if law_domain == "근로기준법" else None
+
+    async def retrieve_documents(self, query, history, as_of=None, law_domain=None) -> list:
+        self.queries.append(query)
+        # 문서 1은 다른 법령(law_id=2) 소속이며, 법 영역이 주어지면 그 법령의 문서만 반환
+        docs = [
+            Document(page_content=f"{query} 문서 {i}", metadata={"source": "근로기준법", "law_id": 2 if i == 1 else 1})
+            for i in range(3)
+        ]
+        return [d for d in docs if d.metadata["law_id"] == 1] if law_domain else docs
+
+    async def answer_with_documents(self, query, history, docs, plugin_context="", on_section_delta=None, cached_explanation=None) -> dict:
+        self.answered_docs = docs
+        return {
+            "result": dict(ANSWER), "sources": ["근로기준법"], "revision_ids": [],
+            "explanation_cached": cached_explanation is not None,
+        }
+
+
+class FakeValidator:
+    async def validate_and_correct(self, result: dict) -> dict:
+        return dict(result)
+
+
+async def _service(workdir: str, answer_cache=None):
+    engine, session_factory = await temp_database(workdir, "check.db")
+    service = CheckService(FakeChecker(), FakeAnalyzer(), FakeAgent(), FakeValidator(), vision=None, answer_cache=answer_cache)
+    service.law_partitioning = False
+    return engine, session_factory, service
+
+
+def test_semantic_cache_runs_without_waiting_for_history():
+    async def scenario():
+        with tempfile.TemporaryDirectory() as workdir:
+            cache = FakeAnswerCache(CACHED, delay=0.05)
+            engine, session_factory, service = await _service(workdir, cache)
+            async with session_factory() as db:
+                response = await service._run(db, 1, QUERY)
+                hit_calls = service.analyzer.calls
+                # 기존 세션에서 이어지는 질문은 대화 맥락이 있으므로 캐시를 조회하지 않음
+                follow_up = await service._run(db, 1, QUERY, session_id=response["session_id"])
+            await engine.dispose()
+            return response, follow_up, hit_calls
+
+    response, follow_up, hit_calls = asyncio.run(scenario())
+    stages = response["pipeline"]["stages"]
+    assert response["cache_hit"] and response["result"]["verdict"] == "FALSE"
+    # 캐시 조회는 세션/이력 조회를 기다리지 않음
+    assert stages["semantic_cache"]["start_ms"] < stages["history"]["end_ms"]
+    # 적중 시 의도 분석(LLM)·검색·라우팅 이후 단계는 건너뜀
+    assert hit_calls == 0
+    for name in ("fused_decision", "intent", "raw_retrieval", "routing", "retrieval", "answer"):
+        assert stages[name]["skipped"], name
+    assert follow_up["pipeline"]["stages"]["semantic_cache"]["skipped"] and not follow_up["cache_hit"]
+    assert not follow_up["pipeline"]["stages"]["intent"]["skipped"]
+
+
+def test_cache_miss_runs_full_pipeline_and_stores_answer():
+    async def scenario():
+        with tempfile.TemporaryDirectory() as workdir:
+            cache = FakeAnswerCache()
+            engine, session_factory, service = await _service(workdir, cache)
+            async with session_factory() as db:
+                response = await service._run(db, 1, QUERY)
+            await engine.dispose()
+            return response, cache, service.checker
+
+    response, cache, checker = asyncio.run(scenario())
+    assert not response["cache_hit"] and response["result"]["verdict"] == "FALSE"
+    # 원본 질의와 키워드 보강 질의 결과를 합쳐도 RETRIEVAL_TOP_K개까지만, 보강 질의 결과를 먼저 전달
+    assert checker.queries == [QUERY, f"{QUERY} 해고"]
+    assert [d.page_content for d in checker.answered_docs] == [
+        f"{QUERY} 해고 문서 0", f"{QUERY} 해고 문서 1", f"{QUERY} 해고 문서 2", f"{QUERY} 문서 0",
+    ]
+    assert not response["pipeline"]["stages"]["answer"]["skipped"]
+    assert len(cache.stored) == 1
+
+
+def test_raw_retrieval_overlaps_intent_and_partition_applies_later():
+    async def scenario():
+        with tempfile.TemporaryDirectory() as workdir:
+            engine, session_factory, service = await _service(workdir)
+            service.law_partitioning = True
+            service.analyzer.delay = 0.05
+            async with session_factory() as db:
+                response = await service._run(db, 1, QUERY)
+            await engine.dispose()
+            return response, service.checker
+
+    response, checker = asyncio.run(scenario())
+    stages = response["pipeline"]["stages"]
+    # 파티셔닝이 켜져 있어도 원본 질의 검색은 의도 분석과 겹쳐서 실행
+    assert stages["raw_retrieval"]["start_ms"] < stages["intent"]["end_ms"]
+    # 답변에는 법 영역(근로기준법, law_id=1)에 해당하는 문서만 전달
+    assert [d.page_content for d in checker.answered_docs] == [
+        f"{QUERY} 해고 문서 0", f"{QUERY} 해고 문서 2", f"{QUERY} 문서 0", f"{QUERY} 문서 2",
+    ]
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"{name}: ok")
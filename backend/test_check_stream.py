@@ -0,0 +1,137 @@
+"""
+팩트체크 SSE 스트리밍 테스트
+1. SectionStreamParser가 청크로 잘린 JSON(이스케이프·서로게이트 쌍이 청크 경계에서 잘린 경우 포함)에서
+   최상위 문자열 섹션의 증분만 꺼내고, 배열 등 중첩 값은 건너뛰는지 확인합니다.
+2. 가짜 LLM/검색 서비스와 임시 SQLite 파일로 /check/stream 엔드포인트를 호출하여
+   stage → token → result 순서로 이벤트가 오고, 마지막 result가 Output Hook 교정 결과(교정된 섹션 목록 포함)인지 확인합니다.
+"""
+import asyncio
+import json
+import tempfile
+
+import httpx
+from fastapi import FastAPI
+
+from app.api.endpoints import _get_check_service, router
+from app.core.auth import get_current_user_id
+from app.core.database import get_db
+from app.models import User
+from app.services.check_service import CheckService
+from app.services.section_stream import SectionStreamParser
+from test_check_pipeline import ANSWER, FakeAgent, FakeAnalyzer, FakeChecker
+from testkit import temp_database
+
+STREAMED = json.dumps(
+    {
+        "verdict": "FALSE",
+        "section_1_summary": "해고 예고 없이 \"즉시\" 해고는\n위법입니다 😀",
+        "section_6_suggested_followups": ["해고예고수당은?", "부당해고 구제는?"],
+        "section_2_law_explanation": "근로기준법 제26조",
+    },
+    ensure_ascii=True,
+)
+
+
+def _split(text: str, size: int) -> list[str]:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_section_stream_parser_emits_deltas_across_chunk_boundaries():
+    expected = json.loads(STREAMED)
+    for size in (1, 3, 7, len(STREAMED)):
+        parser = SectionStreamParser()
+        collected: dict[str, str] = {}
+        for chunk in _split("```json\n" + STREAMED + "\n```", size):
+            for key, delta in parser.feed(chunk).items():
+                collected[key] = collected.get(key, "") + delta
+        assert collected == {
+            "verdict": expected["verdict"],
+            "section_1_summary": expected["section_1_summary"],
+            "section_2_law_explanation": expected["section_2_law_explanation"],
+        }, size
+        assert parser.sections == collected
+
+
+def test_section_stream_parser_reports_partial_strings():
+    parser = SectionStreamParser()
+    assert parser.feed('{"verdict": "FA') == {"verdict": "FA"}
+    assert parser.feed('LSE", "section_1_summary": "') == {"verdict": "LSE"}
+    assert parser.feed("요약\\") == {"section_1_summary": "요약"}
+    assert parser.feed('n끝"}') == {"section_1_summary": "\n끝"}
+
+
+class StreamingChecker(FakeChecker):
+    async def answer_with_documents(self, query, history, docs, plugin_context="", on_section_delta=None, cached_explanation=None) -> dict:
+        for chunk in _split(json.dumps(ANSWER, ensure_ascii=False), 5):
+            for key, delta in self.sections.feed(chunk).items():
+                await on_section_delta(key, delta)
+        return await super().answer_with_documents(query, history, docs, plugin_context, None, cached_explanation)
+
+
+class CorrectingValidator:
+    async def validate_and_correct(self, result: dict) -> dict:
+        return dict(result, section_4_caution="교정된 주의사항")
+
+
+async def _post_stream(workdir: str) -> list[tuple[str, dict]]:
+    engine, session_factory = await temp_database(workdir, "stream.db")
+    async with session_factory() as db:
+        user = User(email="tester@example.com", name="tester", provider="google", provider_id="1")
+        db.add(user)
+        await db.commit()
+
+    checker = StreamingChecker()
+    checker.sections = SectionStreamParser()
+    service = CheckService(checker, FakeAnalyzer(), FakeAgent(), CorrectingValidator(), vision=None)
+    service.law_partitioning = False
+
+    async def override_db():
+        async with session_factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_current_user_id] = lambda: user.id
+    app.dependency_overrides[_get_check_service] = lambda: service
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/check/stream", json={"query": "회사에서 해고 예고 없이 잘렸어요"})
+    await engine.dispose()
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = []
+    for frame in response.text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in frame.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_stream_endpoint_ends_with_authoritative_result():
+    with tempfile.TemporaryDirectory() as workdir:
+        events = asyncio.run(_post_stream(workdir))
+
+    names = [name for name, _ in events]
+    assert names[-1] == "result" and "error" not in names
+    assert names.index("token") > names.index("stage")
+    assert {data["stage"] for name, data in events if name == "stage"} >= {"session", "intent", "routing", "retrieval", "answer"}
+
+    streamed: dict[str, str] = {}
+    for name, data in events:
+        if name == "token":
+            streamed[data["section"]] = streamed.get(data["section"], "") + data["delta"]
+    # 토큰 미리보기는 교정 전 LLM 출력
+    assert streamed["section_4_caution"] == ANSWER["section_4_caution"]
+
+    result = events[-1][1]
+    assert result["result"]["section_4_caution"] == "교정된 주의사항"
+    assert result["corrected_sections"] == ["section_4_caution"]
+    assert result["session_id"] and result["cache_hit"] is False
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"{name}: ok")
@@ -0,0 +1,113 @@
+"""
+임베딩 캐시와 벡터 upsert 테스트
+호출 횟수를 세는 가짜 임베딩을 CacheBackedEmbeddings로 감싸, 같은 개정본을 다시 색인할 때
+임베딩 API 호출이 없고 벡터가 중복 저장되지 않는지, 임베딩 중에도 이벤트 루프가 멈추지 않는지 확인합니다.
+"""
+import asyncio
+import tempfile
+import time
+from datetime import date
+
+from langchain_classic.embeddings import CacheBackedEmbeddings
+from langchain_classic.storage import LocalFileStore
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from testkit import fake_checker
+
+
+class CountingEmbedding(DeterministicFakeEmbedding):
+    """임베딩한 문서 수를 세는 가짜 임베딩 (실제 API 호출 비용 대역)"""
+
+    embedded: int = 0
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded += len(texts)
+        return super().embed_documents(texts)
+
+
+def _revision(revision_id: int, number: str, content: str) -> dict:
+    return {
+        "law_id": 1, "article_id": revision_id, "revision_id": revision_id, "content": content,
+        "law_name": "근로기준법", "article_number": number,
+        "effective_start_date": date(2024, 1, 1), "effective_end_date": None,
+    }
+
+
+REVISIONS = [
+    _revision(1, "제26조", "사용자는 근로자를 해고하려면 적어도 30일 전에 예고를 하여야 한다."),
+    _revision(2, "제36조", "사용자는 근로자가 퇴직한 경우 14일 이내에 임금을 지급하여야 한다."),
+    _revision(3, "제43조", "임금은 통화로 직접 근로자에게 그 전액을 지급하여야 한다."),
+]
+
+
+def test_reindex_is_cached_and_idempotent():
+    with tempfile.TemporaryDirectory() as path:
+        underlying = CountingEmbedding(size=32)
+        checker = fake_checker(f"{path}/chroma", embeddings=CacheBackedEmbeddings.from_bytes_store(
+            underlying, LocalFileStore(f"{path}/cache"), namespace="fake-32", key_encoder="sha256"
+        ))
+
+        asyncio.run(checker.add_revisions(REVISIONS))
+        assert underlying.embedded == 3
+
+        # 결정적 ID 도입 전 자동 ID로 중복 저장된 벡터
+        checker.vector_store.add_documents([Document(page_content=REVISIONS[0]["content"], metadata={"revision_id": 1})])
+        assert checker.vector_store._collection.count() == 4
+
+        # 전체 재색인: 바뀐 조문 하나만 임베딩하고 벡터 수는 그대로
+        changed = [*REVISIONS[:2], {**REVISIONS[2], "content": "임금은 매월 1회 이상 일정한 날짜를 정하여 지급하여야 한다."}]
+        asyncio.run(checker.add_revisions(changed))
+        assert underlying.embedded == 4
+        assert checker.vector_store._collection.count() == 3
+        assert sorted(checker.vector_store.get()["ids"]) == ["revision-1", "revision-2", "revision-3"]
+        assert "매월" in checker.vector_store.get(ids=["revision-3"])["documents"][0]
+        assert len(checker.bm25_index) == 3
+
+        # 재시작 후에도 디스크 캐시가 유지되어 임베딩 호출 없음
+        restarted = CountingEmbedding(size=32)
+        checker.embeddings = CacheBackedEmbeddings.from_bytes_store(
+            restarted, LocalFileStore(f"{path}/cache"), namespace="fake-32", key_encoder="sha256"
+        )
+        checker.initialize_vector_store()
+        asyncio.run(checker.add_revisions(changed))
+        assert restarted.embedded == 0
+        assert checker.vector_store._collection.count() == 3
+
+
+class SlowEmbedding(DeterministicFakeEmbedding):
+    """응답이 느린 임베딩 API 대역 (동기 HTTP 호출처럼 스레드를 막음)"""
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        time.sleep(0.3)
+        return super().embed_documents(texts)
+
+
+def test_indexing_does_not_block_event_loop():
+    async def scenario(checker):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await checker.add_revisions(REVISIONS)
+        task.cancel()
+        return ticks
+
+    with tempfile.TemporaryDirectory() as path:
+        checker = fake_checker(f"{path}/chroma", embeddings=SlowEmbedding(size=32))
+        ticks = asyncio.run(scenario(checker))
+        # 임베딩(0.3초)이 스레드에서 도는 동안 다른 코루틴(/check 요청 등)이 계속 실행됨
+        assert ticks >= 10
+        assert checker.vector_store._collection.count() == 3
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"{name}: ok")
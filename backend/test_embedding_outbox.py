@@ -0,0 +1,212 @@
+"""
+임베딩 아웃박스 테스트
+임시 SQLite 파일과 호출을 기록하는 벡터 스토어 대역으로, 아웃박스 행이 임베딩 호출 한 번으로 묶여 처리되는지,
+같은 개정본의 행이 합쳐지는지, 일시적 오류 재시도와 dead-letter, 임대 시간이 지난 처리 중 행만 재등록되는지,
+반영한 개정본의 답변 캐시 무효화, 관리자 화면용 backlog/lag 통계를 확인합니다.
+"""
+import asyncio
+import tempfile
+from datetime import date, timedelta
+
+from sqlalchemy import select, update
+
+from app.models import EmbeddingOutbox, Law, LawArticle, LawArticleRevision
+from app.services.embedding_outbox import EmbeddingOutboxWorker, _utcnow
+from app.services.law_revisions import enqueue_embeddings
+from testkit import temp_database
+
+
+class FakeChecker:
+    """add_revisions/close_revisions 호출을 기록하고, 지정한 개정본이나 횟수만큼 오류를 일으키는 벡터 스토어 대역"""
+
+    def __init__(self, failures: int = 0, error: Exception | None = None, poison: int | None = None):
+        self.failures = failures
+        self.error = error or ConnectionError("embeddings API unreachable")
+        self.poison = poison
+        self.added = []
+        self.closed = []
+
+    async def add_revisions(self, revisions):
+        if self.failures:
+            self.failures -= 1
+            raise self.error
+        if any(rev["revision_id"] == self.poison for rev in revisions):
+            raise ValueError("invalid input")
+        self.added.append(revisions)
+
+    def close_revisions(self, revisions):
+        self.closed.append(revisions)
+
+
+async def _setup(revisions: int):
+    engine, session_factory = await temp_database(tempfile.mkdtemp(), "outbox.db")
+    async with session_factory() as db:
+        law = Law(name="근로기준법")
+        db.add(law)
+        await db.flush()
+        for i in range(1, revisions + 1):
+            article = LawArticle(law_id=law.id, article_number=f"제{i}조")
+            article.revisions.append(LawArticleRevision(content=f"제{i}조 본문", effective_start_date=date(2025, 1, 1)))
+            db.add(article)
+        await db.flush()
+        ids = list(await db.scalars(select(LawArticleRevision.id).order_by(LawArticleRevision.id)))
+        await enqueue_embeddings(db, ids)
+        await db.commit()
+    return engine, session_factory, ids
+
+
+async def _statuses(session_factory) -> list[str]:
+    async with session_factory() as db:
+        return list(await db.scalars(select(EmbeddingOutbox.status).order_by(EmbeddingOutbox.id)))
+
+
+def test_batches_are_coalesced_into_one_call():
+    async def scenario():
+        engine, session_factory, ids = await _setup(5)
+        async with session_factory() as db:
+            # 같은 개정본에 대한 중복 행과 시행 종료 행
+            await enqueue_embeddings(db, [ids[0]], [ids[0], ids[1]])
+            await db.commit()
+        checker = FakeChecker()
+        worker = EmbeddingOutboxWorker(session_factory, checker, batch_size=3)
+        assert (await worker.stats())["backlog"] == 8
+
+        assert await worker.drain() == 8
+        assert await _statuses(session_factory) == []
+        async with session_factory() as db:
+            await enqueue_embeddings(db, [], [ids[1]])
+            await db.commit()
+        assert await worker.drain() == 1
+        stats = await worker.stats()
+        await engine.dispose()
+        return checker, ids, stats
+
+    checker, ids, stats = asyncio.run(scenario())
+    # 8행 → 개정본 3개씩 두 번의 임베딩 호출, 같은 개정본의 행은 한 번만 처리
+    assert [[rev["revision_id"] for rev in call] for call in checker.added] == [ids[:3], ids[3:]]
+    assert checker.added[0][0]["law_name"] == "근로기준법"
+    # 임베딩되는 개정본의 close 행은 생략하고, close 행만 있는 개정본은 메타데이터만 갱신
+    assert [[rev["revision_id"] for rev in call] for call in checker.closed] == [[ids[1]]]
+    assert stats == {
+        "backlog": 0, "processing": 0, "retrying": 0, "dead": 0, "oldest_pending_at": None, "lag_seconds": 0.0,
+    }
+
+
+def test_transient_failure_is_retried_then_dead_lettered():
+    async def scenario():
+        engine, session_factory, ids = await _setup(2)
+        checker = FakeChecker(failures=1)
+        worker = EmbeddingOutboxWorker(session_factory, checker, max_attempts=2, retry_delay_seconds=60)
+        assert await worker.run_once() == 2
+        stats = await worker.stats()
+        assert (stats["backlog"], stats["retrying"], stats["dead"]) == (2, 2, 0)
+        assert stats["lag_seconds"] >= 0
+        # 재시도 대기 시각 전에는 처리하지 않음
+        assert await worker.run_once() == 0
+
+        async with session_factory() as db:
+            await db.execute(update(EmbeddingOutbox).values(next_attempt_at=None))
+            await db.commit()
+        assert await worker.run_once() == 2
+        assert checker.added and await _statuses(session_factory) == []
+
+        # 시도 횟수를 다 쓰면 dead로 남고 관리자가 다시 대기열에 넣을 수 있음
+        async with session_factory() as db:
+            await enqueue_embeddings(db, ids)
+            await db.commit()
+        checker.failures = 5
+        worker.retry_delay_seconds = 0
+        await worker.drain()
+        assert await _statuses(session_factory) == ["dead", "dead"]
+        dead = await worker.dead_letters()
+        assert dead[0]["attempts"] == 2 and "ConnectionError" in dead[0]["last_error"]
+
+        checker.failures = 0
+        assert await worker.retry_dead() == 2
+        await worker.drain()
+        assert await _statuses(session_factory) == []
+        await engine.dispose()
+
+    asyncio.run(scenario())
+
+
+def test_permanent_failure_isolates_bad_revision():
+    async def scenario():
+        engine, session_factory, ids = await _setup(4)
+        checker = FakeChecker(poison=ids[2])
+        worker = EmbeddingOutboxWorker(session_factory, checker)
+        await worker.drain()
+        async with session_factory() as db:
+            rows = (await db.scalars(select(EmbeddingOutbox))).all()
+        await engine.dispose()
+        return checker, ids, rows
+
+    checker, ids, rows = asyncio.run(scenario())
+    # 배치 실패 후 개정본별로 다시 시도하여 원인 개정본만 dead
+    assert sorted(rev["revision_id"] for call in checker.added for rev in call) == [ids[0], ids[1], ids[3]]
+    assert [(row.revision_id, row.status) for row in rows] == [(ids[2], "dead")]
+
+
+def test_interrupted_rows_are_requeued():
+    async def scenario():
+        engine, session_factory, ids = await _setup(2)
+        checker = FakeChecker()
+        worker = EmbeddingOutboxWorker(session_factory, checker, lease_seconds=60)
+        assert len(await worker._claim()) == 2
+        assert await _statuses(session_factory) == ["processing", "processing"]
+
+        # 다른 워커가 처리 중인(임대 시간이 남은) 행은 가로채지 않음
+        other = EmbeddingOutboxWorker(session_factory, checker, lease_seconds=60)
+        assert await other.requeue_interrupted() == 0
+        assert await other.run_once() == 0
+
+        # 임대 시간이 지나도록 남은 행은 중단된 배치로 보고 다시 대기열에 넣어 처리
+        async with session_factory() as db:
+            await db.execute(update(EmbeddingOutbox).values(claimed_at=_utcnow() - timedelta(seconds=120)))
+            await db.commit()
+        other.start()
+        for _ in range(100):
+            if not await _statuses(session_factory):
+                break
+            await asyncio.sleep(0.02)
+        await other.stop()
+        assert await _statuses(session_factory) == []
+        assert [rev["revision_id"] for rev in checker.added[0]] == ids
+        await engine.dispose()
+
+    asyncio.run(scenario())
+
+
+class FakeAnswerCache:
+    def __init__(self):
+        self.invalidated = []
+
+    def invalidate_revisions(self, revision_ids):
+        self.invalidated.append(sorted(revision_ids))
+        return 0
+
+
+def test_published_revisions_invalidate_answer_cache():
+    async def scenario():
+        engine, session_factory, ids = await _setup(3)
+        cache = FakeAnswerCache()
+        checker = FakeChecker()
+        worker = EmbeddingOutboxWorker(session_factory, checker, answer_cache=cache)
+        await worker.drain()
+        # 시행 기간만 닫힌 개정본도 무효화
+        async with session_factory() as db:
+            await enqueue_embeddings(db, [], closed_ids=[ids[0]])
+            await db.commit()
+        await worker.drain()
+        await engine.dispose()
+        return ids, cache, checker
+
+    ids, cache, checker = asyncio.run(scenario())
+    assert cache.invalidated == [ids, [ids[0]]]
+    assert [rev["revision_id"] for rev in checker.closed[0]] == [ids[0]]
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"{name}: ok")
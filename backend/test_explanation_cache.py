@@ -0,0 +1,126 @@
+"""
+조문 해설 캐시(ExplanationCache) 재사용 테스트
+인메모리 SQLite의 캐시 테이블과 가짜 채팅 LLM으로, save_results가 기록한 대표 리비전의 최신 캐시만 다시 읽는지,
+캐시에서는 조문 설명/주의사항만 가져오고 현실 적용 예시는 LLM이 새로 쓰는지,
+LLM 응답 파싱에 실패하면(ERROR) 캐시 해설을 붙이지도 캐시에 기록하지도 않는지 확인합니다.
+"""
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+from langchain_core.documents import Document
+from sqlalchemy import select
+
+from app.models import ExplanationCache
+from app.services.check_service import CheckService
+from testkit import fake_checker, temp_database
+
+QUERY = "회사에서 해고 예고 없이 잘렸어요"
+VERDICT = {
+    "verdict": "FALSE",
+    "section_1_summary": "예고 없는 해고는 원칙적으로 위법합니다.",
+    "section_3_real_case_example": "30일 전 예고 없이 해고되었다면 30일분 통상임금을 청구할 수 있습니다.",
+    "section_5_counseling_recommendation": "정확한 판단은 노무사/변호사 상담이 필요합니다.",
+    "section_6_suggested_followups": ["해고예고수당은 얼마인가요?"],
+}
+CACHED = {"plain_summary": "제26조: 해고하려면 30일 전에 예고해야 합니다.", "caution_note": "3개월 미만 근무자는 예외입니다."}
+
+
+def _docs(*revision_ids) -> list:
+    return [
+        Document(
+            page_content=f"조문 {rid}",
+            metadata={"source": "근로기준법", **({"revision_id": rid} if rid is not None else {})},
+        )
+        for rid in revision_ids
+    ]
+
+
+def test_cached_explanation_is_keyed_on_the_primary_revision():
+    async def scenario():
+        engine, session_factory = await temp_database()
+        stale = datetime.now(timezone.utc) - timedelta(days=3650)
+        async with session_factory() as db:
+            db.add(ExplanationCache(article_revision_id=3, plain_summary="오래된 설명", updated_at=stale))
+            await db.commit()
+
+        checker = fake_checker(responses=[json.dumps(dict(VERDICT, **{
+            "section_2_law_explanation": "제26조 설명", "section_4_caution": "예외 주의",
+        }), ensure_ascii=False)])
+        # 첫 번째 검색 문서가 리비전이 아닌 일반 청크여도 대표 리비전은 첫 리비전 문서(2)
+        fresh = await checker.answer_with_documents(QUERY, [], _docs(None, 2, 1))
+        service = CheckService(checker=checker, analyzer=None, agent=None, validator=None, vision=None)
+        async with session_factory() as db:
+            before = await service.load_cached_explanation(db, [None, 2, 1])
+            await service.save_results(db, 1, QUERY, fresh["result"], fresh)
+            results = {
+                "written": before is None,
+                "same_primary": await service.load_cached_explanation(db, [None, 2, 1]),
+                "other_primary": await service.load_cached_explanation(db, [1, 2]),
+                "stale": await service.load_cached_explanation(db, [3, 2]),
+                "no_revision": await service.load_cached_explanation(db, [None]),
+            }
+        await engine.dispose()
+        return results
+
+    results = asyncio.run(scenario())
+    # save_results가 기록한 대표 리비전으로 그대로 다시 읽힘 (해설 문단이 중복되어 합쳐지지 않음)
+    assert results["written"]
+    assert results["same_primary"] == {"plain_summary": "제26조 설명", "caution_note": "예외 주의"}
+    assert results["other_primary"] is None
+    assert results["stale"] is None
+    assert results["no_revision"] is None
+
+
+def test_cached_answer_regenerates_real_case_example():
+    async def scenario():
+        checker = fake_checker(responses=[json.dumps(VERDICT, ensure_ascii=False)])
+        streamed = {}
+
+        async def on_section_delta(section: str, delta: str) -> None:
+            streamed[section] = streamed.get(section, "") + delta
+
+        answer = await checker.answer_with_documents(
+            QUERY, [], _docs(1), on_section_delta=on_section_delta, cached_explanation=CACHED,
+        )
+        return answer, streamed
+
+    answer, streamed = asyncio.run(scenario())
+    result = answer["result"]
+    assert answer["explanation_cached"] is True
+    assert result["section_2_law_explanation"] == CACHED["plain_summary"]
+    assert result["section_4_caution"] == CACHED["caution_note"]
+    # 현실 적용 예시는 캐시가 아니라 이번 주장에 대해 LLM이 작성
+    assert result["section_3_real_case_example"] == VERDICT["section_3_real_case_example"]
+    assert streamed["section_3_real_case_example"] == VERDICT["section_3_real_case_example"]
+    assert streamed["section_2_law_explanation"] == CACHED["plain_summary"]
+
+
+def test_error_answer_is_not_merged_or_cached():
+    async def scenario():
+        engine, session_factory = await temp_database()
+        checker = fake_checker(responses=["JSON이 아닌 응답"])
+        cached = await checker.answer_with_documents(QUERY, [], _docs(1), cached_explanation=CACHED)
+        fresh = await checker.answer_with_documents(QUERY, [], _docs(1))
+
+        service = CheckService(checker=checker, analyzer=None, agent=None, validator=None, vision=None)
+        async with session_factory() as db:
+            await service.save_results(db, 1, QUERY, fresh["result"], fresh)
+            rows = (await db.scalars(select(ExplanationCache))).all()
+        await engine.dispose()
+        return cached, rows
+
+    cached, rows = asyncio.run(scenario())
+    assert cached["result"]["verdict"] == "ERROR"
+    assert cached["explanation_cached"] is False
+    assert cached["result"]["section_2_law_explanation"] != CACHED["plain_summary"]
+    assert cached["result"]["section_4_caution"] != CACHED["caution_note"]
+    # 오류 문구가 조문 해설로 캐시되지 않음
+    assert rows == []
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"{name}: ok")
@@ -0,0 +1,84 @@
+"""
+하이브리드 검색(BM25 + 벡터, RRF) 테스트
+벡터 스토어 대신 고정 순위를 돌려주는 간단한 스토어를 사용해, 임베딩 API 없이 BM25 색인과 융합 순위를 확인합니다.
+"""
+import asyncio
+
+from langchain_core.documents import Document
+
+from app.services.hybrid_retriever import BM25Index, HybridRetriever, reciprocal_rank_fusion
+
+
+def _doc(revision_id: int, source: str, content: str) -> Document:
+    return Document(page_content=content, metadata={"revision_id": revision_id, "source": source})
+
+
+DOCS = [
+    _doc(1, "근로기준법 제26조", "사용자는 근로자를 해고하려면 적어도 30일 전에 예고를 하여야 하고, 30일 전에 예고를 하지 아니하였을 때에는 30일분 이상의 통상임금을 지급하여야 한다."),
+    _doc(2, "근로기준법 제23조", "사용자는 근로자에게 정당한 이유 없이 해고, 휴직, 정직, 전직, 감봉, 그 밖의 징벌을 하지 못한다."),
+    _doc(3, "근로기준법 제43조", "임금은 통화로 직접 근로자에게 그 전액을 지급하여야 한다."),
+    _doc(4, "근로기준법 제36조", "사용자는 근로자가 사망 또는 퇴직한 경우에는 그 지급 사유가 발생한 때부터 14일 이내에 임금, 보상금, 그 밖의 모든 금품을 지급하여야 한다."),
+    _doc(5, "주택임대차보호법 제3조", "임대차는 그 등기가 없는 경우에도 임차인이 주택의 인도와 주민등록을 마친 때에는 그 다음 날부터 제3자에 대하여 효력이 생긴다."),
+]
+
+
+class FixedVectorStore:
+    """질의와 무관하게 정해진 순서(임베딩이 조문번호를 놓친 상황)로 문서를 반환하는 벡터 스토어 대역"""
+
+    def __init__(self, ranking: list[Document]):
+        self.ranking = ranking
+
+    def similarity_search(self, query: str, k: int) -> list[Document]:
+        return self.ranking[:k]
+
+    async def asimilarity_search(self, query: str, k: int) -> list[Document]:
+        return self.ranking[:k]
+
+
+def test_bm25_matches_article_numbers_and_compound_terms():
+    index = BM25Index()
+    index.add(DOCS)
+
+    assert index.search("제26조", 1)[0][0].metadata["revision_id"] == 1
+    # 붙여 쓴 "해고예고"도 바이그램 일치로 제26조가 최상위
+    assert index.search("해고예고수당", 1)[0][0].metadata["revision_id"] == 1
+    assert index.search("임금 통화로", 1)[0][0].metadata["revision_id"] == 3
+    assert index.search("우주항공", 3) == []
+
+    # 같은 revision_id를 다시 추가하면 대체
+    index.add([_doc(3, "근로기준법 제43조", "임금은 매월 1회 이상 일정한 날짜를 정하여 지급하여야 한다.")])
+    assert len(index) == len(DOCS)
+    assert all(doc.metadata["revision_id"] != 3 for doc, _ in index.search("통화로", 5))
+
+
+def test_reciprocal_rank_fusion_weights():
+    a, b, c = DOCS[:3]
+    fused = reciprocal_rank_fusion([[a, b, c], [c, a]], [1.0, 1.0], k=60)
+    assert [d.metadata["revision_id"] for d in fused] == [1, 3, 2]
+    assert fused[0].metadata["rrf_score"] == round(1 / 61 + 1 / 62, 6)
+
+    # 어휘 검색 가중치를 높이면 BM25 1위가 앞으로
+    fused = reciprocal_rank_fusion([[a, b, c], [c, a]], [1.0, 3.0], k=60)
+    assert fused[0].metadata["revision_id"] == 3
+
+
+def test_hybrid_retriever_recovers_exact_article():
+    index = BM25Index()
+    index.add(DOCS)
+    # 벡터 검색은 제26조를 후보 최하위(4위)로 밀어내어, 벡터 상위 3개만 쓰면 제26조가 빠지는 상황
+    dense = FixedVectorStore([DOCS[4], DOCS[3], DOCS[1], DOCS[0], DOCS[2]])
+    retriever = HybridRetriever(vector_store=dense, bm25_index=index, top_k=3, candidate_k=4, rrf_k=10)
+
+    docs = asyncio.run(retriever.ainvoke("근로기준법 제26조 해고예고수당"))
+    assert len(docs) == 3
+    assert docs[0].metadata["revision_id"] == 1
+
+    dense_only = HybridRetriever(vector_store=dense, bm25_index=index, top_k=3, candidate_k=4, rrf_k=10, bm25_weight=0.0)
+    assert all(doc.metadata["revision_id"] != 1 for doc in dense_only.invoke("근로기준법 제26조 해고예고수당"))
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"{name}: ok")
@@ -0,0 +1,111 @@
+"""
+청크 요약 동시 처리 테스트
+LLM 대신 지연과 오류를 흉내 내는 가짜 체인으로 동시 실행 수 제한, 429 재시도, 입력 순서 유지,
+체크포인트를 이용한 중단 후 재개를 확인합니다.
+"""
+import asyncio
+import os
+import tempfile
+
+from langchain_core.documents import Document
+
+from app.services.ingest_service import SummaryCheckpoint, chunk_key, summarize_chunks
+
+
+class RateLimited(Exception):
+    status_code = 429
+
+
+class FakeSummaryChain:
+    """청크 번호를 요약으로 돌려주는 가짜 체인. 동시 실행 수를 기록하고, 지정한 청크에서 429 또는 중단을 일으킴"""
+
+    def __init__(self, rate_limited: set[int] = frozenset(), crash_at: int | None = None):
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.rate_limited = set(rate_limited)
+        self.crash_at = crash_at
+
+    async def ainvoke(self, inputs: dict) -> str:
+        number = int(inputs["text"].split()[1])
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            # 뒤쪽 청크가 먼저 끝나도록 지연을 줌
+            await asyncio.sleep(0.001 * (20 - number % 20))
+            if number == self.crash_at:
+                raise KeyboardInterrupt
+            if number in self.rate_limited:
+                self.rate_limited.discard(number)
+                raise RateLimited("rate limit")
+            return f"요약 {number}"
+        finally:
+            self.active -= 1
+
+
+def _splits(count: int) -> list[Document]:
+    return [Document(page_content=f"청크 {i} 본문", metadata={"source": "법.pdf", "page": i // 5}) for i in range(count)]
+
+
+def test_concurrency_retry_and_order():
+    chain = FakeSummaryChain(rate_limited={3, 7})
+    docs, stats = asyncio.run(summarize_chunks(chain, _splits(40), SummaryCheckpoint(""), concurrency=4, base_delay=0.001))
+
+    assert chain.max_active == 4
+    assert [d.page_content for d in docs] == [f"요약 {i}" for i in range(40)]
+    # 원문은 메타데이터에 싣지 않고 부모 문서 저장소 키만 남김
+    assert docs[5].metadata == {"source": "법.pdf", "page": 1, "parent_id": chunk_key(_splits(40)[5])}
+    assert (stats["summarized"], stats["retries"], stats["fallbacks"]) == (40, 2, 0)
+    assert stats["chunks_per_second"] > 0
+
+
+def test_non_transient_error_falls_back_to_original():
+    class Broken(FakeSummaryChain):
+        async def ainvoke(self, inputs):
+            raise ValueError("bad request")
+
+    docs, stats = asyncio.run(summarize_chunks(Broken(), _splits(3), SummaryCheckpoint(""), base_delay=0.001))
+    assert [d.page_content for d in docs] == ["청크 0 본문", "청크 1 본문", "청크 2 본문"]
+    assert (stats["fallbacks"], stats["retries"]) == (3, 0)
+
+
+def test_short_chunks_skip_summary():
+    chain = FakeSummaryChain()
+    splits = _splits(3) + [Document(page_content="청크 3 " + "긴 조문 본문 " * 10, metadata={"source": "법.pdf"})]
+    docs, stats = asyncio.run(summarize_chunks(chain, splits, SummaryCheckpoint(""), min_chars=20))
+    # 짧은 조문은 요약과 길이가 비슷하므로 LLM을 호출하지 않고 원문 그대로
+    assert [d.page_content for d in docs] == ["청크 0 본문", "청크 1 본문", "청크 2 본문", "요약 3"]
+    assert (chain.calls, stats["calls"], stats["short"], stats["summarized"]) == (1, 1, 3, 1)
+
+
+def test_checkpoint_resumes_after_crash():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "checkpoint.jsonl")
+        splits = _splits(30)
+
+        checkpoint = SummaryCheckpoint(path)
+        try:
+            asyncio.run(summarize_chunks(FakeSummaryChain(crash_at=25), splits, checkpoint, concurrency=1))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            checkpoint.close()
+
+        checkpoint = SummaryCheckpoint(path)
+        assert len(checkpoint.summaries) == 25
+        chain = FakeSummaryChain()
+        docs, stats = asyncio.run(summarize_chunks(chain, splits, checkpoint, concurrency=4))
+        checkpoint.clear()
+
+        assert chain.calls == 5
+        assert (stats["resumed"], stats["summarized"]) == (25, 5)
+        assert [d.page_content for d in docs] == [f"요약 {i}" for i in range(30)]
+        assert not os.path.exists(path)
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"{name}: ok")
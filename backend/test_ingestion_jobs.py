@@ -0,0 +1,181 @@
+"""
+법령 PDF 인제스트 작업 큐 테스트
+임시 SQLite 파일과 가짜 PDF 추출로 작업 등록 → 단계별 실행(진행률, 소요 시간, 임베딩 아웃박스 기록) → 일시적 오류 재시도
+(저장이 롤백되어 조문이 중복 저장되지 않음) → 영구 실패 → heartbeat가 끊긴 작업만 재등록되는지 확인합니다.
+"""
+import asyncio
+import tempfile
+from datetime import timedelta
+
+from sqlalchemy import select
+from app.models import EmbeddingOutbox, IngestionJob, Law, LawArticle
+from app.services.job_queue import IngestionJobQueue, _utcnow
+from testkit import fake_parser, temp_database
+
+LAW_TEXT = """근로기준법
+제1조(목적) 이 법은 근로조건의 기준을 정함을 목적으로 한다.
+제2조(정의) 이 법에서 사용하는 용어의 뜻은 다음과 같다.
+제3조(근로조건의 기준) 이 법에서 정하는 근로조건은 최저기준이다.
+"""
+
+
+class FlakySave:
+    """PDFLawParser._save_articles를 감싸, 지정한 횟수만큼 저장 트랜잭션 도중에 오류를 일으키는 대역"""
+
+    def __init__(self, parser, failures: int = 0, error: Exception | None = None):
+        self.save = parser._save_articles
+        self.failures = failures
+        self.error = error or ConnectionError("database connection lost")
+
+    async def __call__(self, db, law_id, articles_data):
+        if self.failures:
+            self.failures -= 1
+            db.add(LawArticle(law_id=law_id, article_number="제99조"))
+            await db.flush()
+            raise self.error
+        return await self.save(db, law_id, articles_data)
+
+
+async def _setup(failures: int = 0, error: Exception | None = None, **options):
+    # 워커와 상태 조회가 동시에 세션을 쓰므로 커넥션을 공유하는 인메모리 DB 대신 임시 파일 DB 사용
+    engine, session_factory = await temp_database(tempfile.mkdtemp(), "jobs.db")
+    async with session_factory() as db:
+        law = Law(name="근로기준법")
+        db.add(law)
+        await db.commit()
+    parser = fake_parser()
+
+    async def fake_pages(content):
+        yield content.decode("utf-8")
+
+    parser._iter_pages = fake_pages
+    parser._save_articles = FlakySave(parser, failures, error)
+    queue = IngestionJobQueue(session_factory, parser, retry_delay_seconds=0, **options)
+    return engine, session_factory, queue, law.id
+
+
+async def _article_count(session_factory) -> int:
+    async with session_factory() as db:
+        return len((await db.scalars(select(LawArticle.id))).all())
+
+
+def test_job_runs_all_steps():
+    async def scenario():
+        engine, session_factory, queue, law_id = await _setup()
+        queued = await queue.enqueue_pdf(law_id, "law.pdf", LAW_TEXT.encode("utf-8"))
+        assert (queued["status"], queued["progress"]) == ("queued", 0)
+
+        assert await queue.run_once() is True
+        assert await queue.run_once() is False
+        job = await queue.get(queued["id"])
+        assert (job["status"], job["progress"], job["attempts"]) == ("succeeded", 100, 1)
+        assert [(s["name"], s["status"]) for s in job["steps"]] == [
+            ("extract", "succeeded"), ("parse", "succeeded"), ("save", "succeeded"),
+        ]
+        assert all(s["seconds"] >= 0 for s in job["steps"])
+        assert [a["article_number"] for a in job["articles"]] == ["제1조", "제2조", "제3조"]
+        assert job["embedded_revisions"] == 3
+        async with session_factory() as db:
+            assert (await db.get(IngestionJob, queued["id"])).payload is None
+            # 새 개정본은 저장과 같은 트랜잭션에서 임베딩 아웃박스에 기록됨
+            outbox = (await db.scalars(select(EmbeddingOutbox))).all()
+            assert [(row.kind, row.status) for row in outbox] == [("embed", "pending")] * 3
+        await engine.dispose()
+
+    asyncio.run(scenario())
+
+
+def test_transient_failure_retries_without_duplicates():
+    async def scenario():
+        engine, session_factory, queue, law_id = await _setup(failures=1)
+        job_id = (await queue.enqueue_pdf(law_id, "law.pdf", LAW_TEXT.encode("utf-8")))["id"]
+
+        await queue.run_once()
+        job = await queue.get(job_id)
+        assert (job["status"], job["progress"], job["attempts"]) == ("queued", 60, 1)
+        assert "ConnectionError" in job["error"]
+        assert job["steps"][-1] == {"name": "save", "status": "failed", "seconds": job["steps"][-1]["seconds"]}
+        # 실패한 저장 트랜잭션은 롤백됨
+        assert await _article_count(session_factory) == 0
+
+        await queue.run_once()
+        job = await queue.get(job_id)
+        assert (job["status"], job["attempts"], job["error"]) == ("succeeded", 2, None)
+        assert await _article_count(session_factory) == 3
+        async with session_factory() as db:
+            assert len((await db.scalars(select(EmbeddingOutbox))).all()) == 3
+        await engine.dispose()
+
+    asyncio.run(scenario())
+
+
+def test_permanent_failure_and_attempt_limit():
+    async def scenario():
+        engine, session_factory, queue, law_id = await _setup(failures=1, error=ValueError("bad payload"))
+        job_id = (await queue.enqueue_pdf(law_id, "law.pdf", LAW_TEXT.encode("utf-8")))["id"]
+        await queue.run_once()
+        assert (await queue.get(job_id))["status"] == "failed"
+
+        queue.pdf_parser._save_articles.failures = 5
+        queue.pdf_parser._save_articles.error = ConnectionError("database connection lost")
+        job_id = (await queue.enqueue_pdf(law_id, "law.pdf", LAW_TEXT.encode("utf-8")))["id"]
+        while await queue.run_once():
+            pass
+        job = await queue.get(job_id)
+        assert (job["status"], job["attempts"]) == ("failed", 3)
+        assert await _article_count(session_factory) == 0
+        await engine.dispose()
+
+    asyncio.run(scenario())
+
+
+def test_interrupted_jobs_are_requeued():
+    async def scenario():
+        engine, session_factory, queue, law_id = await _setup(lease_seconds=60)
+        job_id = (await queue.enqueue_pdf(law_id, "law.pdf", LAW_TEXT.encode("utf-8")))["id"]
+        assert await queue._claim() == job_id
+        assert (await queue.get(job_id))["status"] == "running"
+
+        # heartbeat가 살아 있는(다른 프로세스가 실행 중인) 작업은 다시 큐에 넣지 않음
+        assert await queue.requeue_interrupted() == 0
+        assert (await queue.get(job_id))["status"] == "running"
+
+        # heartbeat가 임대 시간 이상 끊긴 작업은 다시 큐에 넣고 워커가 처리
+        await queue._update(job_id, heartbeat_at=_utcnow() - timedelta(seconds=120))
+        queue.start()
+        for _ in range(100):
+            if (await queue.get(job_id))["status"] == "succeeded":
+                break
+            await asyncio.sleep(0.02)
+        await queue.stop()
+        assert (await queue.get(job_id))["status"] == "succeeded"
+        await engine.dispose()
+
+    asyncio.run(scenario())
+
+
+def test_running_job_keeps_heartbeat():
+    async def scenario():
+        engine, session_factory, queue, law_id = await _setup(lease_seconds=0.2)
+        job_id = (await queue.enqueue_pdf(law_id, "law.pdf", LAW_TEXT.encode("utf-8")))["id"]
+        resolve = queue.pdf_parser._resolve_articles
+
+        async def slow_resolve(*args):
+            # 임대 시간보다 오래 걸리는 LLM 파싱 단계
+            await asyncio.sleep(0.5)
+            assert await queue.requeue_interrupted() == 0
+            return await resolve(*args)
+
+        queue.pdf_parser._resolve_articles = slow_resolve
+        assert await queue.run_once()
+        status = (await queue.get(job_id))["status"]
+        await engine.dispose()
+        return status
+
+    assert asyncio.run(scenario()) == "succeeded"
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"{name}: ok")
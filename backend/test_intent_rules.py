@@ -0,0 +1,61 @@
+"""
+규칙 기반 의도 분류기 테스트
+인사말은 메시지 전체가 인사말일 때만, 영문 인사말은 단어 단위로만 인식하는지,
+근로자/사용자 같은 일반 당사자 용어만으로는 LLM 생략 임계값(0.75)에 도달하지 않는지,
+용어가 분명한 법률 질문은 규칙으로 분류되는지 확인합니다.
+"""
+from app.services.intent_rules import RuleBasedIntentClassifier
+
+THRESHOLD = 0.75
+classifier = RuleBasedIntentClassifier()
+
+
+def test_whole_message_greetings():
+    for query in ("안녕하세요!", "ㅎㅇ", "감사합니다 ㅎㅎ", "hi", "Hello!", "안녕 반가워요"):
+        result, confidence = classifier.classify(query)
+        assert not result["is_legal_question"] and confidence >= THRESHOLD, query
+
+
+def test_greeting_words_inside_questions_are_not_greetings():
+    for query in ("하이닉스 다니는데 성과급 안줘", "is this legal?", "감사합니다 그런데 상여금은요?", "high school 알바 계약"):
+        _, confidence = classifier.classify(query)
+        # 용어 사전에 없는 질문은 LLM 분석으로 넘어가야 함
+        assert confidence < THRESHOLD, query
+
+
+def test_off_topic_with_own_situation_goes_to_llm():
+    _, chat = classifier.classify("오늘 날씨 어때?")
+    _, situation = classifier.classify("게임회사 다니는데 제가 성과급을 못받았어요")
+    assert chat >= THRESHOLD
+    assert situation < THRESHOLD
+
+
+def test_generic_party_terms_do_not_add_confidence():
+    result, confidence = classifier.classify("사용자 근로자 차이가 뭐야")
+    assert result["law_domain"] == "근로기준법"
+    assert confidence < THRESHOLD
+
+
+def test_specific_legal_terms_are_classified_by_rules():
+    result, confidence = classifier.classify("회사에서 부당해고 당했는데 해고예고수당 받을 수 있나요?")
+    assert confidence >= THRESHOLD
+    assert result["law_domain"] == "근로기준법"
+    assert result["is_legal_question"] and result["is_counseling_request"]
+    assert "부당해고" in result["keywords"] and "해고예고수당" in result["keywords"]
+
+    result, confidence = classifier.classify("주택임대차보호법 제3조의2 확정일자 있으면 보증금 우선변제 되나요")
+    assert confidence >= THRESHOLD
+    assert result["law_domain"] == "주택임대차보호법"
+    assert "제3조의2" in result["keywords"]
+
+
+def test_competing_domains_go_to_llm():
+    _, confidence = classifier.classify("퇴직금이랑 보증금 문제")
+    assert confidence < THRESHOLD
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"{name}: ok")
@@ -0,0 +1,270 @@
+"""
+법령/판례 플러그인 로컬 스텁 서버 테스트
+law.go.kr / data.go.kr 응답을 흉내 내는 HTTP 서버를 로컬 스레드로 띄워, 네트워크 없이
+상세조회 병렬 처리, 타임아웃, 부분 실패 시 Fallback 동작과 판례 캐시 적중 시 API 호출 생략,
+법령 로컬 미러 동기화와 미러 기반 조문 검색을 확인합니다.
+"""
+import asyncio
+import threading
+import time
+import urllib.parse
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.core.config import get_settings
+from app.plugins.http_client import get_law_api_client
+from app.plugins.law_db import search_law_articles
+from app.plugins.precedent_search import search_precedents
+from app.services.article_search_service import ArticleSearchService
+from app.services.law_mirror_service import LawMirrorService
+from app.services.precedent_cache import PrecedentCache
+from testkit import temp_database
+
+DETAIL_DELAY = 0.5
+
+PREC_LIST = """<?xml version="1.0" encoding="UTF-8"?>
+<PrecSearch>
+  <prec><판례일련번호>1</판례일련번호><사건명>부당해고구제재심판정취소</사건명><사건번호>2019두1</사건번호><선고법원>대법원</선고법원><선고일자>2020.01.01</선고일자><판례상세링크>/DRF/lawService.do?target=prec&amp;ID=1&amp;type=HTML</판례상세링크></prec>
+  <prec><판례일련번호>2</판례일련번호><사건명>임금</사건명><사건번호>2019다2</사건번호><선고법원>대법원</선고법원><선고일자>2020.02.02</선고일자><판례상세링크>/DRF/lawService.do?target=prec&amp;ID=2&amp;type=HTML</판례상세링크></prec>
+  <prec><판례일련번호>3</판례일련번호><사건명>퇴직금</사건명><사건번호>2019다3</사건번호><선고법원>대법원</선고법원><선고일자>2020.03.03</선고일자></prec>
+</PrecSearch>"""
+
+PREC_DETAIL = """<?xml version="1.0" encoding="UTF-8"?>
+<PrecService><판결요지>판결요지 {id}</판결요지></PrecService>"""
+
+LAW_LIST = """<?xml version="1.0" encoding="UTF-8"?>
+<LawSearch>
+  <law><법령ID>001872</법령ID><법령명한글>근로기준법</법령명한글><시행일자>20240101</시행일자><법령상세링크>/DRF/lawService.do?target=law&amp;MST=1&amp;type=HTML</법령상세링크></law>
+  <law><법령명한글>근로기준법 시행령</법령명한글><법령상세링크>/DRF/lawService.do?target=law&amp;MST=2&amp;type=HTML</법령상세링크></law>
+</LawSearch>"""
+
+LAW_DETAIL = """<?xml version="1.0" encoding="UTF-8"?>
+<법령>
+  <조문단위><조문번호>36</조문번호><조문제목>금품 청산</조문제목><조문내용>제36조(금품 청산) 사용자는 근로자가 사망 또는 퇴직한 경우 14일 이내에 지급하여야 한다.</조문내용></조문단위>
+  <조문단위><조문번호>43</조문번호><조문제목>임금 지급</조문제목><조문내용>제43조(임금 지급) 임금은 통화로 직접 근로자에게 그 전액을 지급하여야 한다.</조문내용></조문단위>
+</법령>"""
+
+# 개정 후 본문: 제36조 개정, 제43조 삭제, 제43조의2 신설, 장 제목(전문)은 조문이 아님
+LAW_DETAIL_AMENDED = """<?xml version="1.0" encoding="UTF-8"?>
+<법령>
+  <조문단위><조문번호>3</조문번호><조문여부>전문</조문여부><조문내용>제3장 임금</조문내용></조문단위>
+  <조문단위><조문번호>36</조문번호><조문여부>조문</조문여부><조문제목>금품 청산</조문제목><조문내용>제36조(금품 청산) 사용자는 근로자가 퇴직한 경우 14일 이내에 지급하여야 한다.</조문내용>
+    <항><항내용>① 특별한 사정이 있을 경우 당사자 사이의 합의로 기일을 연장할 수 있다.</항내용><호><호내용>1. 천재지변</호내용></호></항>
+  </조문단위>
+  <조문단위><조문번호>43</조문번호><조문가지번호>2</조문가지번호><조문여부>조문</조문여부><조문제목>체불사업주 명단 공개</조문제목><조문내용>제43조의2(체불사업주 명단 공개) 고용노동부장관은 명단을 공개할 수 있다.</조문내용></조문단위>
+</법령>"""
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """경로/쿼리에 따라 고정 XML을 반환하는 스텁 핸들러. behavior 딕셔너리로 ID별 지연/오류를 조정합니다."""
+
+    behavior: dict = {}
+    requests: Counter = Counter()
+    law_detail: str = LAW_DETAIL
+
+    def do_GET(self):
+        parsed = urllib.parse.urlparse(self.path)
+        params = dict(urllib.parse.parse_qsl(parsed.query))
+        self.requests[parsed.path] += 1
+
+        if parsed.path.endswith("/lawSearch.do"):
+            body = PREC_LIST
+        elif parsed.path.endswith("/lawSearchList.do"):
+            body = LAW_LIST
+        elif parsed.path.endswith("/lawService.do"):
+            item_id = params.get("ID") or params.get("MST")
+            action = self.behavior.get(item_id, "ok")
+            if action == "error":
+                self.send_response(500)
+                self.end_headers()
+                return
+            time.sleep(self.behavior.get("slow", 0) if action == "slow" else DETAIL_DELAY)
+            assert params.get("type") == "XML"
+            body = self.law_detail if "MST" in params else PREC_DETAIL.format(id=item_id)
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        payload = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        try:
+            self.wfile.write(payload)
+        except (BrokenPipeError, ConnectionResetError):
+            # 타임아웃 테스트에서 클라이언트가 먼저 연결을 끊은 경우
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_stub_server() -> ThreadingHTTPServer:
+    """스텁 서버를 임의 포트로 띄우고, 플러그인의 대상 URL을 스텁 서버로 바꿉니다."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    settings = get_settings()
+    settings.LAW_GO_KR_BASE_URL = base
+    settings.DATA_GO_KR_LAW_URL = base
+    return server
+
+
+def test_precedent_details_fetched_in_parallel():
+    server = _start_stub_server()
+    StubHandler.behavior = {}
+    try:
+        started = time.perf_counter()
+        results = asyncio.run(search_precedents(["해고", "임금"]))
+        elapsed = time.perf_counter() - started
+
+        assert [r["판결요지"] for r in results] == ["판결요지 1", "판결요지 2", "판결요지 3"]
+        assert results[0]["사건번호"] == "대법원 2020.01.01 선고 2019두1"
+        # 상세조회 3건이 순차라면 3 * DETAIL_DELAY 이상 걸림 (클라이언트 생성 비용 여유 포함)
+        assert elapsed < 2.5 * DETAIL_DELAY, elapsed
+    finally:
+        server.shutdown()
+
+
+def test_precedent_detail_failure_and_timeout_fall_back_per_item():
+    server = _start_stub_server()
+    StubHandler.behavior = {"2": "error", "3": "slow", "slow": 3.0}
+    client = get_law_api_client()
+    original_timeout = client.timeout
+    client.timeout = 0.5
+    try:
+        started = time.perf_counter()
+        results = asyncio.run(search_precedents(["해고"]))
+        elapsed = time.perf_counter() - started
+
+        assert len(results) == 3
+        assert results[0]["판결요지"] == "판결요지 1"
+        assert results[1]["판결요지"] == "내용 없음"
+        assert results[2]["판결요지"] == "내용 없음"
+        assert elapsed < 2.0, elapsed
+    finally:
+        client.timeout = original_timeout
+        asyncio.run(client.aclose())
+        server.shutdown()
+
+
+def test_law_articles_keyword_filter_and_parallel_details():
+    server = _start_stub_server()
+    StubHandler.behavior = {}
+    try:
+        started = time.perf_counter()
+        results = asyncio.run(search_law_articles("근로기준법", keyword="임금", limit=5))
+        elapsed = time.perf_counter() - started
+
+        assert [(r["법령명"], r["조문번호"]) for r in results] == [("근로기준법", "43"), ("근로기준법 시행령", "43")]
+        assert elapsed < 1.8 * DETAIL_DELAY, elapsed
+    finally:
+        server.shutdown()
+
+
+def test_precedent_cache_skips_api_on_hit():
+    server = _start_stub_server()
+    StubHandler.behavior = {"3": "error"}
+    StubHandler.requests.clear()
+
+    async def scenario():
+        engine, session_factory = await temp_database()
+        cache = PrecedentCache(session_factory, ttl_seconds=60)
+
+        # 1) 첫 검색: 목록 1회 + 상세 3회, 3번 상세가 실패하여 검색어 캐시는 남기지 않음
+        first = await cache.search(["해고"])
+        assert first[2]["판결요지"] == "내용 없음"
+        assert StubHandler.requests["/DRF/lawService.do"] == 3
+
+        # 2) 재검색: 목록은 다시 받지만 보관된 1, 2번은 상세조회를 생략
+        StubHandler.behavior = {}
+        second = await cache.search(["해고"])
+        assert [r["판결요지"] for r in second] == ["판결요지 1", "판결요지 2", "판결요지 3"]
+        assert StubHandler.requests["/DRF/lawSearch.do"] == 2
+        assert StubHandler.requests["/DRF/lawService.do"] == 4
+
+        # 3) 검색어 캐시 적중: API 호출 없음
+        third = await cache.search(["해고"])
+        assert third == second
+        assert sum(StubHandler.requests.values()) == 6
+
+        stats = await cache.stats()
+        assert (stats["query_hits"], stats["query_misses"]) == (1, 2)
+        assert (stats["detail_hits"], stats["detail_misses"], stats["detail_failures"]) == (2, 4, 1)
+        assert (stats["stored_precedents"], stats["stored_queries"]) == (3, 1)
+
+        # 4) TTL 만료 시 검색어 캐시는 미스 처리
+        cache.ttl_seconds = 0
+        await cache.search(["해고"])
+        assert StubHandler.requests["/DRF/lawSearch.do"] == 3
+        await engine.dispose()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        server.shutdown()
+
+
+def test_law_mirror_sync_and_local_search():
+    server = _start_stub_server()
+    StubHandler.behavior = {}
+    StubHandler.law_detail = LAW_DETAIL
+
+    async def scenario():
+        engine, session_factory = await temp_database()
+        mirror = LawMirrorService(session_factory)
+        search = ArticleSearchService(limit=50)
+
+        # 1) 첫 동기화: 조문 2개 생성, 시행일자가 개정본 시작일로 들어감
+        first = await mirror.sync_law("근로기준법")
+        assert (first["created"], first["updated"], first["unchanged"]) == (2, 0, 0)
+        assert [r["article_number"] for r in first["revisions"]] == ["제36조", "제43조"]
+
+        # 2) 본문이 같으면 아무것도 바뀌지 않음
+        second = await mirror.sync_law("근로기준법")
+        assert (second["created"], second["updated"], second["unchanged"], second["revisions"]) == (0, 0, 2, [])
+
+        # 3) 미러링된 법령은 원격 API 호출 없이 로컬에서 응답
+        StubHandler.requests.clear()
+        async with session_factory() as db:
+            listed = await search.search(db, "근로기준법")
+            single = await search.search(db, "근로기준법 제43조")
+            keyword = await search.search(db, "통화로 직접")
+        assert listed["source"] == "mirror" and [r["article_number"] for r in listed["results"]] == ["제36조", "제43조"]
+        assert [r["article_number"] for r in single["results"]] == ["제43조"]
+        assert keyword["source"] == "local" and keyword["results"][0]["article_number"] == "제43조"
+        assert sum(StubHandler.requests.values()) == 0
+
+        # 4) 개정: 바뀐 조문만 새 개정본, 삭제 조문은 비활성화, 신설 조문 추가
+        StubHandler.law_detail = LAW_DETAIL_AMENDED
+        third = await mirror.sync_law("근로기준법")
+        assert (third["created"], third["updated"], third["unchanged"], third["removed"]) == (1, 1, 0, 1)
+        amended = {r["article_number"]: r["content"] for r in third["revisions"]}
+        assert amended["제36조"].endswith("1. 천재지변") and "제43조의2" in amended
+
+        async with session_factory() as db:
+            listed = await search.search(db, "근로기준법")
+        assert [r["article_number"] for r in listed["results"]] == ["제36조", "제43조의2"]
+        await engine.dispose()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        StubHandler.law_detail = LAW_DETAIL
+        server.shutdown()
+
+
+def test_unreachable_server_returns_fallback():
+    settings = get_settings()
+    settings.LAW_GO_KR_BASE_URL = "http://127.0.0.1:9"
+    results = asyncio.run(search_precedents(["해고"]))
+    assert results[0]["사건번호"] == "-"
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"{name}: ok")
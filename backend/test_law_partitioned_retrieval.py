@@ -0,0 +1,120 @@
+"""
+법령 파티션 검색 테스트
+임시 SQLite 파일의 법령 목록, 임시 디렉터리의 Chroma, 결정적 가짜 임베딩으로, 의도 분석의 법 영역(law_domain)이
+해당 법령(시행령 포함)의 law_id로 바뀌는지, 벡터/BM25 검색이 그 법령만 대상으로 하는지,
+법 영역을 알 수 없거나 파티션에 문서가 없으면 전체 검색으로 돌아가는지 확인합니다.
+"""
+import asyncio
+import os
+import tempfile
+from datetime import date
+
+from app.models import Law
+from testkit import fake_checker, temp_database
+
+QUERY = "보증금 반환 해고 예고"
+TEXTS = {
+    "근로기준법": "제26조(해고의 예고) 사용자는 근로자를 해고하려면 적어도 30일 전에 예고를 하여야 한다.",
+    "근로기준법 시행령": "제6조(해고 예고의 예외) 보증금 없이 일용근로자로 3개월을 계속 근무하지 아니한 경우",
+    "주택임대차보호법": "제3조의2(보증금의 회수) 임차인은 보증금 반환을 받을 때까지 주택을 양수인에게 인도하지 아니할 수 있다.",
+    "민법": "제618조(임대차의 의의) 임대차는 당사자 일방이 상대방에게 목적물을 사용, 수익하게 할 것을 약정하는 계약이다.",
+}
+
+
+async def _setup(workdir: str, mode: str):
+    engine, session_factory = await temp_database(workdir)
+    async with session_factory() as db:
+        laws = [
+            Law(name="근로기준법", short_name="근기법"),
+            Law(name="근로기준법 시행령"),
+            Law(name="주택임대차보호법", short_name="주임법"),
+            Law(name="민법"),
+        ]
+        db.add_all(laws)
+        await db.commit()
+
+    checker = fake_checker(session_factory=session_factory)
+    checker.vector_store_path = os.path.join(workdir, "chroma")
+    checker.retrieval_mode = mode
+    checker.retrieval_top_k = 4
+    checker.initialize_vector_store()
+    # 민법은 아직 임베딩되지 않은 상태 (파티션이 비어 있음)
+    await checker.add_revisions([
+        {
+            "law_id": law.id, "article_id": i, "revision_id": i, "content": TEXTS[law.name],
+            "law_name": law.name, "article_number": f"제{i}조", "effective_start_date": date(2025, 1, 1),
+        }
+        for i, law in enumerate(laws[:3], start=1)
+    ])
+    return engine, session_factory, checker, {law.name: law.id for law in laws}
+
+
+def _law_ids(docs) -> set[int]:
+    return {d.metadata["law_id"] for d in docs}
+
+
+def test_domain_resolves_to_law_partitions():
+    async def scenario():
+        with tempfile.TemporaryDirectory() as workdir:
+            engine, session_factory, checker, ids = await _setup(workdir, "hybrid")
+            resolved = {
+                domain: await checker.resolve_law_ids(domain)
+                for domain in ("근로기준법", "근기법", "주택임대차보호법, 근로기준법", "알 수 없음", "상법", None)
+            }
+            checker.law_partitioning = False
+            disabled = await checker.resolve_law_ids("근로기준법")
+            checker.law_partitioning = True
+
+            # 새 법령이 등록되어 임베딩되면 캐시한 법령 목록을 다시 읽음
+            async with session_factory() as db:
+                db.add(Law(name="상법"))
+                await db.commit()
+            assert await checker.resolve_law_ids("상법") is None
+            await checker.add_revisions([{
+                "law_id": ids["민법"] + 1, "article_id": 9, "revision_id": 9, "content": "제1조(목적) 상행위",
+                "law_name": "상법", "article_number": "제1조",
+            }])
+            added = await checker.resolve_law_ids("상법")
+            await engine.dispose()
+            return ids, resolved, disabled, added
+
+    ids, resolved, disabled, added = asyncio.run(scenario())
+    labor = sorted([ids["근로기준법"], ids["근로기준법 시행령"]])
+    # 법 영역 이름으로 시작하는 시행령까지 같은 파티션, 약칭도 인식
+    assert sorted(resolved["근로기준법"]) == labor
+    assert sorted(resolved["근기법"]) == [ids["근로기준법"]]
+    assert sorted(resolved["주택임대차보호법, 근로기준법"]) == sorted(labor + [ids["주택임대차보호법"]])
+    # 알 수 없음·일치하는 법령 없음·파티셔닝 꺼짐은 전체 검색
+    assert resolved["알 수 없음"] is None and resolved["상법"] is None and resolved[None] is None
+    assert disabled is None
+    assert added == [ids["민법"] + 1]
+
+
+def test_retrieval_searches_only_matching_laws():
+    for mode in ("hybrid", "dense"):
+        async def scenario():
+            with tempfile.TemporaryDirectory() as workdir:
+                engine, _, checker, ids = await _setup(workdir, mode)
+                labor = await checker.retrieve_documents(QUERY, [], law_domain="근로기준법")
+                housing = await checker.retrieve_documents(QUERY, [], as_of=date(2025, 6, 1), law_domain="주택임대차보호법")
+                unknown = await checker.retrieve_documents(QUERY, [], law_domain="알 수 없음")
+                # 민법 파티션에는 아직 문서가 없으므로 전체 검색으로 대체
+                empty = await checker.retrieve_documents(QUERY, [], law_domain="민법")
+                bm25 = checker.bm25_index.search(QUERY, 10, law_ids=[ids["주택임대차보호법"]])
+                await engine.dispose()
+                return ids, labor, housing, unknown, empty, bm25
+
+        ids, labor, housing, unknown, empty, bm25 = asyncio.run(scenario())
+        assert _law_ids(labor) == {ids["근로기준법"], ids["근로기준법 시행령"]}, mode
+        assert _law_ids(housing) == {ids["주택임대차보호법"]}, mode
+        everything = {ids["근로기준법"], ids["근로기준법 시행령"], ids["주택임대차보호법"]}
+        assert _law_ids(unknown) == everything, mode
+        assert _law_ids(empty) == everything, mode
+        assert [doc.metadata["law_id"] for doc, _ in bm25] == [ids["주택임대차보호법"]]
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"{name}: ok")
@@ -0,0 +1,109 @@
+"""
+부모 문서 저장소 테스트
+임시 SQLite 파일의 parent_documents, 임시 디렉터리의 Chroma, 결정적 가짜 임베딩으로
+요약문만 벡터에 저장된 인제스트 청크가 검색 후 원문으로 바뀌는지, 벡터 메타데이터에 원문이 남지 않는지,
+original_text를 메타데이터에 싣던 기존 벡터도 그대로 동작하는지,
+이전 스크립트가 같은 청크로 중복 수집된 기존 벡터를 하나의 새 ID로 합치는지 확인합니다.
+"""
+import asyncio
+import os
+import tempfile
+
+from langchain_core.documents import Document
+
+from app.services.hybrid_retriever import vector_id
+from app.services.ingest_service import SummaryCheckpoint, chunk_key, summarize_chunks
+from app.services.parent_store import ParentDocumentStore
+from scripts.migrate_parent_documents import migrate
+from testkit import fake_checker, temp_database
+
+ORIGINALS = [
+    "제26조(해고의 예고) 사용자는 근로자를 해고(경영상 이유에 의한 해고를 포함한다)하려면 적어도 30일 전에 예고를 하여야 하고, "
+    "30일 전에 예고를 하지 아니하였을 때에는 30일분 이상의 통상임금을 지급하여야 한다.",
+    "제36조(금품 청산) 사용자는 근로자가 사망 또는 퇴직한 경우에는 그 지급 사유가 발생한 때부터 14일 이내에 "
+    "임금, 보상금, 그 밖의 모든 금품을 지급하여야 한다.",
+]
+
+
+class FakeSummaryChain:
+    async def ainvoke(self, inputs: dict) -> str:
+        return "[소제목] " + inputs["text"].split(")")[0] + ")\n\n[요약]\n해고 예고 금품 청산 요약"
+
+
+def test_search_summaries_then_fetch_originals():
+    async def scenario():
+        workdir = tempfile.mkdtemp()
+        engine, session_factory = await temp_database(workdir)
+
+        splits = [Document(page_content=text, metadata={"source": "근로기준법.pdf", "page": i}) for i, text in enumerate(ORIGINALS)]
+        summaries, _ = await summarize_chunks(FakeSummaryChain(), splits, SummaryCheckpoint(""))
+        store = ParentDocumentStore(session_factory)
+        added = await store.put([{"id": chunk_key(s), "content": s.page_content, "source": "근로기준법.pdf"} for s in splits])
+        # 같은 청크를 다시 넣어도 중복 저장하지 않음
+        again = await store.put([{"id": chunk_key(splits[0]), "content": ORIGINALS[0]}])
+
+        checker = fake_checker(session_factory=session_factory)
+        checker.vector_store_path = os.path.join(workdir, "chroma")
+        checker.retrieval_top_k = 5
+        checker.initialize_vector_store()
+        checker.vector_store.add_documents(summaries, ids=[vector_id(d) for d in summaries])
+        checker.bm25_index.add(summaries)
+        checker.vector_store.add_documents([
+            # 원문을 메타데이터에 싣던 기존 벡터와, 원문이 저장소에 없는 벡터
+            Document(page_content="퇴직금 안내 요약", metadata={"source": "안내서", "original_text": "퇴직금 안내 원문"}),
+            Document(page_content="해고 예고 요약만 있는 문서", metadata={"source": "메모", "parent_id": "missing"}),
+        ])
+        stored = checker.vector_store.get(include=["metadatas"])["metadatas"]
+        docs = await checker.retrieve_documents("해고 예고 금품 청산", [])
+        await engine.dispose()
+        return summaries, added, again, stored, docs
+
+    summaries, added, again, stored, docs = asyncio.run(scenario())
+    assert (added, again) == (2, 0)
+    assert sum("original_text" in m for m in stored) == 1
+    # 같은 원문 청크는 요약이 달라져도 같은 벡터 ID
+    resummarized = Document(page_content="다른 요약", metadata=summaries[0].metadata)
+    assert vector_id(resummarized) == vector_id(summaries[0])
+
+    by_source = {}
+    for doc in docs:
+        by_source.setdefault(doc.metadata["source"], []).append(doc)
+    assert sorted(d.page_content for d in by_source["근로기준법.pdf"]) == sorted(ORIGINALS)
+    assert all(d.metadata["summary"].startswith("[소제목]") for d in by_source["근로기준법.pdf"])
+    legacy = by_source["안내서"][0]
+    assert legacy.page_content == "퇴직금 안내 원문" and "original_text" not in legacy.metadata
+    assert by_source["메모"][0].page_content == "해고 예고 요약만 있는 문서"
+
+
+def test_migration_merges_duplicate_legacy_vectors():
+    for batch_size in (10, 1):
+        async def scenario():
+            with tempfile.TemporaryDirectory() as workdir:
+                engine, session_factory = await temp_database(workdir)
+                parents = ParentDocumentStore(session_factory)
+                checker = fake_checker(os.path.join(workdir, "chroma"))
+                # 같은 PDF를 두 번 수집해 같은 청크가 서로 다른 기존 ID로 두 번 저장된 상태
+                legacy = [
+                    Document(page_content="해고 예고 요약", metadata={"source": "근로기준법.pdf", "page": 0, "original_text": ORIGINALS[0]}),
+                    Document(page_content="해고 예고 요약", metadata={"source": "근로기준법.pdf", "page": 0, "original_text": ORIGINALS[0]}),
+                    Document(page_content="금품 청산 요약", metadata={"source": "근로기준법.pdf", "page": 1, "original_text": ORIGINALS[1]}),
+                ]
+                checker.vector_store.add_documents(legacy, ids=["old-1", "old-2", "old-3"])
+                stats = await migrate(checker.vector_store, parents, batch_size, dry_run=False)
+                remaining = checker.vector_store.get(include=["metadatas"])
+                originals = await parents.get_many([m["parent_id"] for m in remaining["metadatas"]])
+                await engine.dispose()
+                return stats, remaining, originals
+
+        stats, remaining, originals = asyncio.run(scenario())
+        assert stats["legacy"] == 3 and stats["stored"] == 2, batch_size
+        assert len(remaining["ids"]) == 2 and not set(remaining["ids"]) & {"old-1", "old-2", "old-3"}, batch_size
+        assert not any("original_text" in m for m in remaining["metadatas"])
+        assert sorted(originals.values()) == sorted(ORIGINALS)
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"{name}: ok")
@@ -0,0 +1,114 @@
+"""
+파이프라인 단계 스케줄러 테스트
+의존성이 없는 단계가 동시에 실행되고 의존 단계는 선행 단계가 끝난 뒤 시작하는지,
+조건이 False인 단계가 None으로 기록되고 뒤 단계의 조건으로 건너뛰기가 전파되는지,
+한 단계의 예외가 진행 중인 다른 단계를 취소하고 그대로 전파되는지, 잘못된 그래프를 거부하는지 확인합니다.
+"""
+import asyncio
+
+from app.services.pipeline_scheduler import StageScheduler
+
+
+def _stage(value, delay: float = 0.0, log: list | None = None):
+    async def run(r):
+        await asyncio.sleep(delay)
+        if log is not None:
+            log.append(value)
+        return value
+    return run
+
+
+def test_dependencies_run_in_order_and_independent_stages_overlap():
+    events = []
+    scheduler = StageScheduler()
+    scheduler.add("a", _stage("a", 0.05))
+    scheduler.add("b", _stage("b", 0.05))
+    scheduler.add("c", lambda r: _stage(r["a"] + r["b"])(r), deps=("a", "b"))
+    scheduler.add("d", _stage("d", 0.01), deps=("c",))
+
+    results, report = asyncio.run(scheduler.run(on_stage_done=lambda name, value, timing: events.append(name)))
+    stages = report["stages"]
+    assert results["c"] == "ab" and results["d"] == "d"
+    # a와 b는 동시에 실행되고, c는 둘 다 끝난 뒤 시작
+    assert stages["b"]["start_ms"] < stages["a"]["end_ms"]
+    assert stages["c"]["start_ms"] >= max(stages["a"]["end_ms"], stages["b"]["end_ms"])
+    assert stages["d"]["start_ms"] >= stages["c"]["end_ms"]
+    assert report["critical_path"][-2:] == ["c", "d"] and report["critical_path"][0] in ("a", "b")
+    assert events.index("c") > max(events.index("a"), events.index("b"))
+
+
+def test_skipped_stage_propagates_through_conditions():
+    calls, events = [], []
+    scheduler = StageScheduler()
+    scheduler.add("cache", _stage({"hit": True}, log=calls))
+    scheduler.add("search", _stage("docs", log=calls), deps=("cache",), condition=lambda r: not r["cache"]["hit"])
+    scheduler.add("answer", _stage("answer", log=calls), deps=("search",), condition=lambda r: r["search"] is not None)
+    scheduler.add("report", lambda r: _stage(r["answer"] or "cached")(r), deps=("answer",))
+
+    results, report = asyncio.run(scheduler.run(on_stage_done=lambda name, value, timing: events.append(name)))
+    assert results["search"] is None and results["answer"] is None and results["report"] == "cached"
+    assert report["stages"]["search"]["skipped"] and report["stages"]["answer"]["skipped"]
+    assert calls == [{"hit": True}]
+    # 건너뛴 단계는 완료 콜백과 임계 경로에서 빠짐
+    assert events == ["cache", "report"]
+    assert not {"search", "answer"} & set(report["critical_path"])
+
+
+def test_failure_cancels_running_stages_and_propagates():
+    cancelled = []
+
+    async def slow(r):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append("slow")
+            raise
+
+    async def broken(r):
+        await asyncio.sleep(0.01)
+        raise ValueError("stage failed")
+
+    scheduler = StageScheduler()
+    scheduler.add("slow", slow)
+    scheduler.add("broken", broken)
+    scheduler.add("after", _stage("after"), deps=("broken",))
+
+    async def scenario():
+        try:
+            await scheduler.run()
+        except ValueError as e:
+            return str(e)
+        return None
+
+    assert asyncio.run(scenario()) == "stage failed"
+    assert cancelled == ["slow"]
+
+
+def test_invalid_graphs_are_rejected():
+    for build, message in (
+        (lambda s: s.add("a", _stage("a"), deps=("missing",)), "unknown stage"),
+        (lambda s: s.add("a", _stage("a"), deps=("b",)).add("b", _stage("b"), deps=("a",)), "Cycle"),
+    ):
+        scheduler = StageScheduler()
+        build(scheduler)
+        try:
+            asyncio.run(scheduler.run())
+        except ValueError as e:
+            assert message in str(e)
+        else:
+            raise AssertionError(f"expected ValueError: {message}")
+
+    scheduler = StageScheduler().add("a", _stage("a"))
+    try:
+        scheduler.add("a", _stage("a"))
+    except ValueError as e:
+        assert "Duplicate" in str(e)
+    else:
+        raise AssertionError("expected duplicate stage error")
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"{name}: ok")
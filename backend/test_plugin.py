@@ -22,7 +22,7 @@ async def test():
         
         plugin_context = ""
         if decision.get("requires_precedent_search") and intent.get("keywords"):
-            precedents = search_precedents(intent["keywords"])
+            precedents = await search_precedents(intent["keywords"])
             plugin_context += "\n[관련 판례/재결례 정보]\n" + json.dumps(precedents, ensure_ascii=False) + "\n"
             
         if decision.get("requires_calculator"):
@@ -0,0 +1,167 @@
+"""
+개정 법령 재인제스트 테스트
+같은 법령의 개정판 PDF를 다시 올리면 바뀐 조문만 새 개정본과 임베딩이 생기고,
+기존 개정본은 새 시행일에 시행 종료되며 조문 행이 중복되지 않는지 확인합니다.
+PDF 추출은 텍스트를 그대로 돌려주는 대역으로 바꾸므로 OpenAI API나 PDF 파일 없이 실행됩니다.
+"""
+import asyncio
+import tempfile
+from datetime import date
+
+from sqlalchemy import event, select, text
+
+from app.models import Law, LawArticle, LawArticleRevision
+from app.models.fulltext import FTS_TABLE
+from app.services.embedding_outbox import EmbeddingOutboxWorker
+from app.services.job_queue import IngestionJobQueue
+from testkit import fake_parser, temp_database
+
+ORIGINAL = """근로기준법
+[시행 2025. 2. 23.] [법률 제20520호, 2024. 10. 22., 일부개정]
+제1조(목적) 이 법은 근로조건의 기준을 정함을 목적으로 한다.
+제2조(정의) 이 법에서 사용하는 용어의 뜻은 다음과 같다.
+제3조(근로조건의 기준) 이 법에서 정하는 근로조건은 최저기준이다.
+제4조(근로조건의 결정) 근로조건은 근로자와 사용자가 동등한 지위에서 자유의사에 따라 결정하여야 한다.
+제5조(근로조건의 준수) 근로자와 사용자는 각자가 단체협약을 지키고 성실하게 이행할 의무가 있다.
+"""
+
+AMENDED = """근로기준법
+[시행 2026. 1. 1.] [법률 제21000호, 2025. 6. 1., 일부개정]
+제1조(목적) 이 법은 근로조건의 기준을 정함을 목적으로 한다.
+제2조(정의) 이 법에서 사용하는 용어의 뜻은 다음과 같이 정한다.
+제3조(근로조건의 기준) 이 법에서 정하는 근로조건은 최저기준이다.
+제4조 삭제 <2025. 6. 1.>
+제5조(근로조건의 준수) 근로자와 사용자는 각자가 단체협약을 지키고 성실하게 이행할 의무가 있다.
+제6조(균등한 처우) 사용자는 근로자에 대하여 성별을 이유로 차별적 대우를 하지 못한다.
+"""
+
+
+def _fake_pages(content):
+    async def pages(_):
+        yield content.decode("utf-8")
+
+    return pages
+
+
+async def _setup():
+    engine, session_factory = await temp_database(tempfile.mkdtemp(), "revisions.db")
+    async with session_factory() as db:
+        law = Law(name="근로기준법")
+        db.add(law)
+        await db.commit()
+    parser = fake_parser()
+    parser._iter_pages = lambda content: _fake_pages(content)(content)
+    return engine, session_factory, parser, law.id
+
+
+def test_reingest_creates_revisions_only_for_changed_articles():
+    async def scenario():
+        engine, session_factory, parser, law_id = await _setup()
+        async with session_factory() as db:
+            first = await parser.process_pdf(db, law_id, ORIGINAL.encode("utf-8"))
+        async with session_factory() as db:
+            second = await parser.process_pdf(db, law_id, AMENDED.encode("utf-8"))
+        async with session_factory() as db:
+            again = await parser.process_pdf(db, law_id, AMENDED.encode("utf-8"))
+        async with session_factory() as db:
+            article_rows = list(await db.scalars(select(LawArticle)))
+            revisions = list(await db.scalars(select(LawArticleRevision).order_by(LawArticleRevision.id)))
+            indexed = await db.scalar(text(f"SELECT count(*) FROM {FTS_TABLE}"))
+        await engine.dispose()
+        return first, second, again, article_rows, revisions, indexed
+
+    first, second, again, article_rows, revisions, indexed = asyncio.run(scenario())
+
+    assert (first["created"], first["updated"], first["unchanged"]) == (5, 0, 0)
+    assert all(rev["effective_start_date"] == date(2025, 2, 23) for rev in first["revisions"])
+
+    # 제2조 수정, 제4조 삭제, 제6조 신설 → 새 개정본(임베딩 대상)은 제2조·제6조뿐
+    assert (second["created"], second["updated"], second["unchanged"], second["removed"]) == (1, 1, 3, 1)
+    assert [rev["article_number"] for rev in second["revisions"]] == ["제2조", "제6조"]
+    assert all(rev["effective_start_date"] == date(2026, 1, 1) for rev in second["revisions"])
+    # 기존 제2조·제4조 개정본은 새 시행일에 시행 종료
+    assert sorted(rev["effective_end_date"] for rev in second["closed"]) == [date(2026, 1, 1)] * 2
+
+    # 같은 판을 다시 올리면 아무것도 바뀌지 않음
+    assert again["revisions"] == [] and again["closed"] == [] and again["unchanged"] == 5
+
+    articles = {article.article_number: article for article in article_rows}
+    assert len(articles) == len(article_rows) == 6
+    assert not articles["제4조"].is_active and articles["제6조"].is_active
+    assert len(revisions) == 7
+    # 대량 INSERT로 추가한 개정본도 전문 검색 인덱스에 반영
+    assert indexed == 7
+    open_revisions = [rev for rev in revisions if rev.effective_end_date is None]
+    assert len(open_revisions) == 5
+    assert "다음과 같이 정한다" in next(
+        rev.content for rev in open_revisions if rev.article_id == articles["제2조"].id
+    )
+
+
+def test_save_inserts_rows_in_bulk():
+    body = "\n".join(f"제{i}조(조문{i}) 이 법의 {i}번째 조문이다." for i in range(1, 121))
+    statements = []
+
+    async def scenario():
+        engine, session_factory, parser, law_id = await _setup()
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith(("INSERT INTO law_articles ", "INSERT INTO law_article_revisions ")):
+                statements.append(statement)
+
+        async with session_factory() as db:
+            report = await parser.process_pdf(db, law_id, body.encode("utf-8"))
+        await engine.dispose()
+        return report
+
+    report = asyncio.run(scenario())
+    assert report["created"] == 120 and len(report["revisions"]) == 120
+    assert [rev["article_number"] for rev in report["revisions"]][:3] == ["제1조", "제2조", "제3조"]
+    assert all(rev["revision_id"] and rev["article_id"] for rev in report["revisions"])
+    # 조문 120개를 행마다 flush하지 않고 테이블별 INSERT 한 번씩으로 저장
+    assert len(statements) == 2
+
+
+class RecordingChecker:
+    def __init__(self):
+        self.added = []
+        self.closed = []
+
+    async def add_revisions(self, revisions):
+        self.added.append(revisions)
+
+    def close_revisions(self, revisions):
+        self.closed.append(revisions)
+
+
+def test_reupload_job_embeds_only_changed_revisions():
+    async def scenario():
+        engine, session_factory, parser, law_id = await _setup()
+        checker = RecordingChecker()
+        queue = IngestionJobQueue(session_factory, parser, retry_delay_seconds=0)
+        outbox = EmbeddingOutboxWorker(session_factory, checker, retry_delay_seconds=0)
+        await queue.enqueue_pdf(law_id, "v1.pdf", ORIGINAL.encode("utf-8"))
+        await queue.run_once()
+        await outbox.drain()
+        job = await queue.enqueue_pdf(law_id, "v2.pdf", AMENDED.encode("utf-8"))
+        await queue.run_once()
+        await outbox.drain()
+        status = await queue.get(job["id"])
+        await engine.dispose()
+        return checker, status
+
+    checker, status = asyncio.run(scenario())
+    assert status["status"] == "succeeded"
+    assert status["embedded_revisions"] == 2 and status["closed_revisions"] == 2
+    assert status["article_counts"] == {"created": 1, "updated": 1, "unchanged": 3, "removed": 1}
+    assert [len(call) for call in checker.added] == [5, 2]
+    assert [rev["revision_id"] for rev in checker.closed[0]] == [2, 4]
+    assert checker.closed[0][0]["effective_end_date"] == date(2026, 1, 1)
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"{name}: ok")
@@ -0,0 +1,98 @@
+"""
+벡터 스토어 / SQL 정합성 검사 테스트
+임시 SQLite 파일, 임시 디렉터리의 Chroma, 결정적 가짜 임베딩으로 없는·본문이 바뀐·시행 기간이 어긋난·중복·고아 벡터를
+작은 페이지 크기로 찾아내고, 복구(아웃박스 재임베딩 + 삭제) 후 다시 검사하면 차이가 없는지,
+스크립트처럼 벡터 스토어를 초기화하지 않은 프로세스에서는 컬렉션 전체를 읽는 초기화 없이 검사하는지 확인합니다.
+"""
+import asyncio
+import os
+import tempfile
+from datetime import date
+
+from langchain_core.documents import Document
+
+from app.models import Law, LawArticle, LawArticleRevision
+from app.services.embedding_outbox import EmbeddingOutboxWorker
+from app.services.law_revisions import revision_payload
+from app.services.vector_consistency import KINDS, VectorConsistencyChecker
+from testkit import fake_checker, temp_database
+
+
+def test_consistency_check_and_repair():
+    async def scenario():
+        workdir = tempfile.mkdtemp()
+        engine, session_factory = await temp_database(workdir)
+        checker = fake_checker(os.path.join(workdir, "chroma"))
+
+        async with session_factory() as db:
+            law = Law(name="근로기준법")
+            db.add(law)
+            await db.flush()
+            pairs = []
+            for i in range(1, 6):
+                article = LawArticle(law_id=law.id, article_number=f"제{i}조")
+                revision = LawArticleRevision(content=f"제{i}조 본문", effective_start_date=date(2025, 1, 1))
+                article.revisions.append(revision)
+                db.add(article)
+                pairs.append((article, revision))
+            await db.flush()
+            # 제1~4조만 임베딩 (제5조는 임베딩 전에 장애가 난 상황)
+            await checker.add_revisions([revision_payload(law, a, r) for a, r in pairs[:4]])
+            ids = [r.id for _, r in pairs]
+            pairs[1][1].content = "제2조 개정된 본문"                   # 본문 변경이 벡터에 반영되지 않음
+            pairs[2][1].effective_end_date = date(2026, 1, 1)           # 시행 종료가 벡터에 반영되지 않음
+            await db.commit()
+
+        checker.vector_store.add_documents(
+            [
+                Document(page_content="제4조 본문", metadata={"revision_id": ids[3]}),   # 자동 ID 시절 중복 벡터
+                Document(page_content="삭제된 개정본", metadata={"revision_id": 999}),   # 고아 벡터
+                Document(page_content="퇴직금 안내", metadata={"source": "안내서"}),     # 개정본과 무관한 문서
+            ],
+            ids=["legacy-4", "revision-999", "doc-guide"],
+        )
+
+        consistency = VectorConsistencyChecker(session_factory, checker, page_size=2)
+        before = await consistency.run()
+        repaired = await consistency.run(repair=True)
+        await EmbeddingOutboxWorker(session_factory, checker).drain()
+        after = await consistency.run()
+        stored = checker.vector_store.get(include=["metadatas", "documents"])
+
+        fresh = fake_checker(embeddings=checker.embeddings)
+        fresh.vector_store_path = checker.vector_store_path
+
+        def full_load():
+            raise AssertionError("consistency check must not load the whole collection")
+
+        fresh.sync_effective_dates = fresh._rebuild_bm25_index = full_load
+        standalone = await VectorConsistencyChecker(session_factory, fresh, page_size=2).run()
+        await engine.dispose()
+        return ids, before, repaired, after, stored, standalone
+
+    ids, before, repaired, after, stored, standalone = asyncio.run(scenario())
+    assert (before["revisions_checked"], before["vectors_checked"]) == (5, 7)
+    assert {kind: before[kind] for kind in KINDS} == {
+        "missing": 1, "stale_content": 1, "stale_metadata": 1, "duplicates": 1, "orphans": 1, "queued": 0,
+    }
+    assert before["samples"]["missing"] == [ids[4]]
+    assert before["samples"]["stale_content"] == [ids[1]]
+    assert before["samples"]["orphans"] == ["revision-999"]
+    # 검사만 할 때는 아무것도 바꾸지 않음
+    assert before["deleted_vectors"] == 0 and before["queued_for_embedding"] == 0
+
+    assert (repaired["deleted_vectors"], repaired["queued_for_embedding"]) == (2, 3)
+    assert all(after[kind] == 0 for kind in KINDS)
+    assert all(standalone[kind] == 0 for kind in KINDS) and standalone["vectors_checked"] == 6
+
+    by_id = dict(zip(stored["ids"], zip(stored["metadatas"], stored["documents"])))
+    assert sorted(by_id) == sorted([f"revision-{rid}" for rid in ids] + ["doc-guide"])
+    assert by_id[f"revision-{ids[1]}"][1] == "제2조 개정된 본문"
+    assert by_id[f"revision-{ids[2]}"][0]["effective_end"] == 20260101
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"{name}: ok")
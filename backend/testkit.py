@@ -0,0 +1,67 @@
+"""
+테스트 공용 도구
+test_*.py에서 함께 쓰는 임시 SQLite 데이터베이스와, OpenAI API 키 없이 만들 수 있는
+가짜 임베딩/LLM 기반 LegalFactChecker·PDFLawParser를 제공합니다.
+"""
+import os
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.language_models import FakeListChatModel
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.models import Base
+from app.services.pdf_ingest_service import PDFLawParser
+from app.services.rag_service import LegalFactChecker
+
+
+async def temp_database(workdir: str | None = None, name: str = "test.db"):
+    """
+    모든 테이블을 만든 SQLite 엔진과 세션 팩토리를 반환합니다.
+    workdir가 주어지면 그 디렉터리의 파일 DB를, 없으면 커넥션 하나를 공유하는 인메모리 DB를 씁니다.
+    여러 세션이 동시에 DB를 쓰는 테스트(워커와 상태 조회 등)는 파일 DB를 사용해야 합니다.
+
+    Returns:
+        tuple: (AsyncEngine, async_sessionmaker)
+    """
+    if workdir is None:
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    else:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(workdir, name)}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return engine, async_sessionmaker(engine, expire_on_commit=False)
+
+
+class StubCompressor:
+    """LLM 없이 문서 본문을 그대로 이어 붙이는 ContextCompressor 대역"""
+
+    async def compress_documents(self, query: str, docs: list) -> str:
+        return "\n".join(d.page_content for d in docs)
+
+
+def fake_checker(
+    vector_store_path: str | None = None,
+    session_factory=None,
+    embeddings=None,
+    responses: list[str] | None = None,
+) -> LegalFactChecker:
+    """
+    결정적 가짜 임베딩(32차원)과 정해진 응답을 차례로 돌려주는 가짜 채팅 LLM을 쓰는 LegalFactChecker.
+    vector_store_path가 주어지면 그 경로의 Chroma를 엽니다.
+    """
+    checker = LegalFactChecker(
+        session_factory=session_factory,
+        embeddings=embeddings or DeterministicFakeEmbedding(size=32),
+        llm=FakeListChatModel(responses=responses or ["{}"]),
+        compressor=StubCompressor(),
+    )
+    if vector_store_path is not None:
+        checker.vector_store_path = vector_store_path
+        checker.initialize_vector_store()
+    return checker
+
+
+def fake_parser(responses: list[str] | None = None) -> PDFLawParser:
+    """규칙으로 나누지 못한 구간에 대해 정해진 응답을 돌려주는 가짜 LLM을 쓰는 PDFLawParser."""
+    return PDFLawParser(llm=FakeListChatModel(responses=responses or ['{"articles": []}']))